@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Chunk search recall@k and latency: IVF index vs exact brute force.
+
+Builds a synthetic clustered corpus the shape of a large chunk_embeddings
+table (384-dim, L2-normalized) and sweeps nprobe, so the default in
+ANN_DEFAULT_NPROBE can be checked against the recall it buys.
+
+Usage:
+    poetry run python benchmarks/bench_ann_recall.py [--chunks N] [--queries N] [--k N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from emdx.services.ann_index import IVFIndex
+from emdx.services.vector_index import EmbeddingMatrix
+
+DIM = 384
+
+
+def _corpus(n: int, clusters: int, seed: int) -> np.ndarray:
+    # Noise is deliberately large relative to the topic centers so neighbours
+    # straddle cells, i.e. a pessimistic case for IVF recall
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, DIM)).astype(np.float32)
+    vectors = centers[rng.integers(0, clusters, n)] + 2.0 * rng.standard_normal((n, DIM))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+def _p50_us(timings: list[float]) -> float:
+    return statistics.median(timings) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    # Queries come from the same topic clusters as the corpus, held out of it
+    vectors = _corpus(args.chunks + args.queries, 500, seed=0)
+    queries = vectors[args.chunks :]
+    ids = np.arange(args.chunks, dtype=np.int64)
+    matrix = EmbeddingMatrix(row_ids=ids, doc_ids=ids, vectors=vectors[: args.chunks], generation=0)
+
+    start = time.perf_counter()
+    index = IVFIndex.train(matrix)
+    elapsed = time.perf_counter() - start
+    print(f"trained nlist={index.nlist} on {args.chunks} chunks in {elapsed:.1f} s")
+
+    exact_results = []
+    exact_timings = []
+    for q in queries:
+        start = time.perf_counter()
+        positions, _ = matrix.top_k(q, args.k)
+        exact_timings.append(time.perf_counter() - start)
+        exact_results.append(set(positions.tolist()))
+    exact_p50 = _p50_us(exact_timings)
+    print(f"exact      p50 {exact_p50:9.1f} us   recall@{args.k} 1.000")
+
+    for nprobe in (1, 4, 8, 12, 24, 48):
+        timings = []
+        hits = 0
+        for q, truth in zip(queries, exact_results, strict=True):
+            start = time.perf_counter()
+            positions, _ = index.search(matrix, q, args.k, nprobe)
+            timings.append(time.perf_counter() - start)
+            hits += len(truth & set(positions.tolist()))
+        recall = hits / (args.k * len(queries))
+        p50 = _p50_us(timings)
+        print(
+            f"nprobe={nprobe:<3} p50 {p50:9.1f} us   recall@{args.k} {recall:.3f}   "
+            f"speedup {exact_p50 / p50:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Per-query connection overhead: one-connection-per-call vs the pool.
+
+Mirrors what a single ``emdx find`` / ``emdx context`` run does: many short
+``with db.get_connection()`` blocks, each running one small indexed query.
+
+Usage:
+    poetry run python benchmarks/bench_connection.py [--queries N] [--docs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import statistics
+import tempfile
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from emdx.database.connection import DatabaseConnection
+from emdx.database.migrations import run_migrations
+
+
+@contextmanager
+def unpooled_connection(db_path: Path) -> Generator[sqlite3.Connection, None, None]:
+    """The pre-pool get_connection(): fresh connect, adapters and pragmas per call."""
+    conn = sqlite3.connect(db_path, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    sqlite3.register_adapter(datetime, lambda dt: dt.isoformat())
+    sqlite3.register_converter("timestamp", lambda b: datetime.fromisoformat(b.decode()))
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def _seed(db_path: Path, docs: int) -> None:
+    run_migrations(db_path)
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO documents (title, content, project) VALUES (?, ?, ?)",
+        [(f"Doc {i}", f"content for document {i} " * 20, "bench") for i in range(docs)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def _time_queries(
+    connect: Callable[[], object],
+    queries: int,
+    docs: int,
+) -> list[float]:
+    timings: list[float] = []
+    for i in range(queries):
+        start = time.perf_counter()
+        with connect() as conn:  # type: ignore[attr-defined]
+            conn.execute(
+                "SELECT id, title, project FROM documents WHERE id = ?",
+                ((i % docs) + 1,),
+            ).fetchone()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(label: str, timings: list[float]) -> float:
+    us = sorted(t * 1e6 for t in timings)
+    p50 = statistics.median(us)
+    p95 = us[int(len(us) * 0.95) - 1]
+    print(f"{label:<10} p50 {p50:8.1f} us   p95 {p95:8.1f} us   total {sum(us) / 1e3:8.1f} ms")
+    return p50
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--docs", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        _seed(db_path, args.docs)
+        pooled = DatabaseConnection(db_path)
+
+        before = _report(
+            "before", _time_queries(lambda: unpooled_connection(db_path), args.queries, args.docs)
+        )
+        after = _report("after", _time_queries(pooled.get_connection, args.queries, args.docs))
+        print(f"speedup    {before / after:.1f}x per query (p50)")
+
+
+if __name__ == "__main__":
+    main()
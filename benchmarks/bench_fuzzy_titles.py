@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Fuzzy title lookup latency: top-1000 SequenceMatcher scan vs trigram index.
+
+Seeds a throwaway database with synthetic titles, then times palette-style
+lookups (whole words, prefixes, typos) through the previous implementation
+and through ``HybridSearchService.fuzzy_search_titles``. Also reports how
+often each finds a target title that is outside the 1000 most accessed.
+
+Usage:
+    poetry run python benchmarks/bench_fuzzy_titles.py [--docs N] [--queries N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+COMMON = (
+    "auth deploy kubernetes roadmap release notes refactor database migration "
+    "search index cache review design api gateway billing invoice onboarding "
+    "incident postmortem metrics alerting pipeline worker queue schema python "
+    "frontend backend latency storage backup cluster config secrets audit"
+).split()
+
+
+def _vocabulary(size: int, rng: random.Random) -> list[str]:
+    """Common words first, then pronounceable made-up words (names, jargon)."""
+    consonants, vowels = "bcdfghjklmnprstvwz", "aeiou"
+    words = list(COMMON)
+    while len(words) < size:
+        syllables = rng.randint(2, 4)
+        words.append("".join(rng.choice(consonants) + rng.choice(vowels) for _ in range(syllables)))
+    return words
+
+
+def _titles(n: int, rng: random.Random) -> list[str]:
+    """Titles of 2-6 words with Zipf-distributed word frequencies."""
+    vocab = _vocabulary(20_000, rng)
+    weights = [1 / (rank + 1) for rank in range(len(vocab))]
+    return [
+        " ".join(w.capitalize() for w in rng.choices(vocab, weights, k=rng.randint(2, 6)))
+        for _ in range(n)
+    ]
+
+
+def _typo(word: str, rng: random.Random) -> str:
+    i = rng.randrange(1, len(word))
+    return word[:i] + word[i + 1 :]
+
+
+def _legacy_search(conn: sqlite3.Connection, query: str, limit: int = 5) -> list[int]:
+    """The pre-index implementation: SequenceMatcher over the top 1000."""
+    rows = conn.execute(
+        "SELECT id, title FROM documents WHERE deleted_at IS NULL AND is_deleted = 0 "
+        "ORDER BY access_count DESC, updated_at DESC LIMIT 1000"
+    ).fetchall()
+    q = query.lower()
+    scored = []
+    for doc_id, title in rows:
+        t = title.lower()
+        full = SequenceMatcher(None, q, t).ratio()
+        boost = 0.3 if q in t else 0.0
+        words = [
+            max((SequenceMatcher(None, qw, tw).ratio() for tw in t.split()), default=0.0)
+            for qw in q.split()
+        ]
+        word = sum(words) / len(words) if words else 0.0
+        score = min(1.0, max(full, word) + boost)
+        if score >= 0.4:
+            scored.append((score, doc_id))
+    scored.sort(key=lambda x: -x[0])
+    return [doc_id for _, doc_id in scored[:limit]]
+
+
+def _report(label: str, timings: list[float], found: int, total: int) -> None:
+    ms = sorted(t * 1e3 for t in timings)
+    p95 = ms[int(len(ms) * 0.95) - 1]
+    print(
+        f"{label:<8} p50 {statistics.median(ms):7.2f} ms   p95 {p95:7.2f} ms   "
+        f"target found {found}/{total}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        os.environ["EMDX_DB"] = str(db_path)
+        from emdx.database import db
+        from emdx.database.migrations import run_migrations
+        from emdx.services.hybrid_search import HybridSearchService
+
+        run_migrations(db_path)
+        titles = _titles(args.docs, rng)
+        conn = sqlite3.connect(db_path)
+        conn.executemany(
+            "INSERT INTO documents (title, content, access_count) VALUES (?, '', ?)",
+            [(t, rng.randint(0, 100)) for t in titles],
+        )
+        conn.commit()
+
+        # Targets drawn from the whole KB, most of them outside the top 1000
+        targets = rng.sample(range(1, args.docs + 1), args.queries)
+        queries = []
+        for doc_id in targets:
+            words = titles[doc_id - 1].lower().split()
+            kind = rng.randrange(3)
+            if kind == 0:
+                queries.append(" ".join(words[:3]))
+            elif kind == 1:
+                queries.append(" ".join(words[:2])[:6])
+            else:
+                queries.append(" ".join(_typo(w, rng) for w in words[:3]))
+
+        service = HybridSearchService()
+        with db.get_connection():
+            pass  # open the pooled connection before timing
+
+        for label, run in (
+            ("before", lambda q: _legacy_search(conn, q)),
+            ("after", lambda q: [r.doc_id for r in service.fuzzy_search_titles(q, limit=5)]),
+        ):
+            timings, found = [], 0
+            for doc_id, query in zip(targets, queries, strict=True):
+                start = time.perf_counter()
+                ids = run(query)
+                timings.append(time.perf_counter() - start)
+                found += doc_id in ids
+            _report(label, timings, found, len(queries))
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Quantized embedding storage: size, scan latency and recall vs float32.
+
+Encodes a synthetic 384-dim corpus in each storage format exactly as the
+embedding tables store it, builds the search matrix from those blobs, and
+compares top-k results against full-precision float32 search. Quantized
+matrices rescore their candidates against the float32 originals, served
+here from memory instead of the embedding_originals table.
+
+Usage:
+    poetry run python benchmarks/bench_quantized.py [--vectors N] [--queries N] [--k N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from emdx.services.vector_index import (
+    FLOAT32,
+    STORAGE_FORMATS,
+    EmbeddingMatrix,
+    encode_vector,
+    stack_blobs,
+)
+
+DIM = 384
+
+
+def _corpus(n: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((200, DIM)).astype(np.float32)
+    vectors = centers[rng.integers(0, 200, n)] + 1.5 * rng.standard_normal((n, DIM))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+def _matrix(blobs: list[bytes], originals: np.ndarray) -> EmbeddingMatrix:
+    """Same layout _build_matrix produces for a homogeneous partition."""
+    vectors, scales = stack_blobs(blobs, DIM)
+    ids = np.arange(len(blobs), dtype=np.int64)
+    matrix = EmbeddingMatrix(row_ids=ids, doc_ids=ids, vectors=vectors, generation=0, scales=scales)
+    if matrix.quantized:
+        matrix.originals = lambda positions: (
+            np.ones(len(positions), dtype=bool),
+            originals[positions],
+        )
+    return matrix
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vectors", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    data = _corpus(args.vectors + args.queries, seed=0)
+    corpus, queries = data[: args.vectors], data[args.vectors :]
+
+    truth: list[set[int]] = []
+    baseline_bytes = 0
+    for fmt in STORAGE_FORMATS:
+        blobs = [encode_vector(v, fmt) for v in corpus]
+        size = sum(len(b) for b in blobs)
+        matrix = _matrix(blobs, corpus)
+
+        timings = []
+        hits = 0
+        for i, q in enumerate(queries):
+            start = time.perf_counter()
+            positions, _ = matrix.top_k(q, args.k)
+            timings.append(time.perf_counter() - start)
+            found = set(positions.tolist())
+            if fmt == FLOAT32:
+                truth.append(found)
+            hits += len(truth[i] & found)
+
+        if fmt == FLOAT32:
+            baseline_bytes = size
+        p50 = statistics.median(timings) * 1e3
+        print(
+            f"{fmt:<8} {size / 2**20:7.1f} MB ({baseline_bytes / size:.1f}x smaller)   "
+            f"p50 {p50:7.2f} ms   recall@{args.k} {hits / (args.k * len(queries)):.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""Search latency and memory across KB sizes, with baseline comparison.
+
+Builds reproducible synthetic knowledge bases (see ``benchmarks/corpus.py``)
+and times every search path against each: ``search_documents``,
+``HybridSearchService.search`` in keyword and hybrid mode,
+``search_by_tags``, ``fuzzy_search_titles`` and ``AskService`` retrieval.
+Reports p50/p95 latency and peak RSS per path. Each path runs in a fresh
+process after one untimed warm-up query, so its peak RSS is its own and
+lazy loads (embedding matrices, indexes) are not counted as query time.
+
+``--output`` writes the results as JSON; pass that file back as
+``--baseline`` on a later run to print the change per metric and exit 1
+when any regressed by more than ``--tolerance``.
+
+Usage:
+    poetry run python -m benchmarks.bench_search [--docs 1000,10000,100000] [--queries N]
+        [--paths hybrid,search_by_tags] [--corpus-dir DIR] [--output FILE] [--baseline FILE]
+
+Also runs, on a small corpus, under ``pytest -m benchmark``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import resource
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from benchmarks.corpus import Workload
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Metrics compared against a baseline, and the smallest change in each that
+# counts as a regression whatever the relative tolerance (timer noise)
+METRIC_FLOORS = {"p50_ms": 0.5, "p95_ms": 1.0, "peak_rss_mb": 8.0}
+
+
+def _search_documents(workload: Workload) -> list[Callable[[], object]]:
+    from emdx.database.search import search_documents
+
+    return [partial(search_documents, q, limit=10) for q in workload.text]
+
+
+def _hybrid(mode: str, workload: Workload) -> list[Callable[[], object]]:
+    from emdx.services.hybrid_search import HybridSearchService
+
+    service = HybridSearchService()
+    return [partial(service.search, q, limit=10, mode=mode) for q in workload.text]
+
+
+def _search_by_tags(workload: Workload) -> list[Callable[[], object]]:
+    from emdx.models.tags import search_by_tags
+
+    return [partial(search_by_tags, tags, limit=20) for tags in workload.tags]
+
+
+def _fuzzy_titles(workload: Workload) -> list[Callable[[], object]]:
+    from emdx.services.hybrid_search import HybridSearchService
+
+    service = HybridSearchService()
+    return [partial(service.fuzzy_search_titles, q, limit=10) for q in workload.titles]
+
+
+def _ask_retrieve(workload: Workload) -> list[Callable[[], object]]:
+    from emdx.services.ask_service import AskService
+
+    service = AskService()
+    return [partial(service._retrieve, q, 10) for q in workload.text]
+
+
+PATHS: dict[str, Callable[[Workload], list[Callable[[], object]]]] = {
+    "search_documents": _search_documents,
+    "hybrid_keyword": partial(_hybrid, "keyword"),
+    "hybrid": partial(_hybrid, "hybrid"),
+    "search_by_tags": _search_by_tags,
+    "fuzzy_search_titles": _fuzzy_titles,
+    "ask_retrieve": _ask_retrieve,
+}
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # KiB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def measure(db_path: Path, path: str, queries: int, seed: int = 0) -> dict[str, Any]:
+    """Time one search path against the corpus at ``db_path``.
+
+    Must run in a process whose database is ``db_path`` (EMDX_DB); the
+    query embedder is replaced by the corpus's fake one.
+    """
+    from benchmarks.corpus import fake_embedding, workload
+    from emdx.services import result_cache
+    from emdx.services.embedding_service import EmbeddingService
+
+    EmbeddingService.embed_text = lambda self, text: fake_embedding(text)  # type: ignore[method-assign]
+    result_cache.clear()
+
+    calls = PATHS[path](workload(db_path, queries + 1, seed))
+    calls[0]()  # warm-up: lazy imports, matrix and index loads
+    timings = []
+    for call in calls[1:]:
+        started = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[max(0, int(len(timings) * 0.95) - 1)], 3),
+        "peak_rss_mb": _peak_rss_mb(),
+        "queries": len(timings),
+    }
+
+
+def _child_env(db_path: Path) -> dict[str, str]:
+    env = {k: v for k, v in os.environ.items() if k != "EMDX_TEST_DB"}
+    env["EMDX_DB"] = str(db_path)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    return env
+
+
+def _in_child(db_path: Path, *args: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_search", *args],
+        env=_child_env(db_path),
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ""
+
+
+def corpus_path(corpus_dir: Path, docs: int, seed: int) -> Path:
+    """Database for a (size, seed) corpus, built on first use and reused after."""
+    db_path = corpus_dir / f"corpus-{docs}-{seed}.db"
+    if not db_path.exists():
+        _in_child(db_path, "--build", str(docs), "--seed", str(seed))
+    return db_path
+
+
+def run_suite(
+    sizes: list[int],
+    paths: list[str],
+    queries: int,
+    corpus_dir: Path,
+    seed: int = 0,
+    progress: Callable[[str], None] | None = None,
+) -> dict[str, Any]:
+    """Measure every path against a corpus of each size."""
+    results: dict[str, dict[str, Any]] = {}
+    for docs in sizes:
+        if progress:
+            progress(f"corpus of {docs:,} documents")
+        db_path = corpus_path(corpus_dir, docs, seed)
+        results[str(docs)] = {}
+        for path in paths:
+            line = _in_child(
+                db_path,
+                *("--measure", str(db_path), path),
+                *("--queries", str(queries), "--seed", str(seed)),
+            )
+            results[str(docs)][path] = json.loads(line)
+            if progress:
+                progress(f"  {path}")
+    return {
+        "meta": {
+            "seed": seed,
+            "queries": queries,
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], tolerance: float = 0.25
+) -> tuple[list[tuple[str, str, str, float, float]], list[str]]:
+    """Per-metric changes between two runs, and the ones that regressed.
+
+    Returns ``(rows, regressions)``: a ``(docs, path, metric, before,
+    after)`` row for every metric present in both runs, and a message for
+    each that grew by more than ``tolerance`` (relative) and by more than
+    its METRIC_FLOORS entry (absolute).
+    """
+    rows, regressions = [], []
+    for docs, paths in current["results"].items():
+        for path, metrics in paths.items():
+            before_metrics = baseline.get("results", {}).get(docs, {}).get(path)
+            if not before_metrics:
+                continue
+            for metric, floor in METRIC_FLOORS.items():
+                before, after = before_metrics.get(metric), metrics.get(metric)
+                if before is None or after is None:
+                    continue
+                rows.append((docs, path, metric, before, after))
+                if after > before * (1 + tolerance) and after - before > floor:
+                    regressions.append(
+                        f"{path} @ {int(docs):,} docs: {metric} {before} -> {after} "
+                        f"(+{(after / before - 1) * 100 if before else float('inf'):.0f}%)"
+                    )
+    return rows, regressions
+
+
+def _print_report(report: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    changes: dict[tuple[str, str, str], float] = {}
+    if baseline is not None:
+        for docs, path, metric, before, after in compare(baseline, report)[0]:
+            changes[(docs, path, metric)] = (after / before - 1) * 100 if before else 0.0
+
+    def cell(docs: str, path: str, metric: str, value: float) -> str:
+        change = changes.get((docs, path, metric))
+        return f"{value:9.2f}" + (f" ({change:+4.0f}%)" if change is not None else "")
+
+    for docs, paths in report["results"].items():
+        print(f"\n{int(docs):,} documents")
+        print(f"  {'path':<22}{'p50 ms':>18}{'p95 ms':>18}{'peak RSS MB':>18}")
+        for path, m in paths.items():
+            print(
+                f"  {path:<22}{cell(docs, path, 'p50_ms', m['p50_ms']):>18}"
+                f"{cell(docs, path, 'p95_ms', m['p95_ms']):>18}"
+                f"{cell(docs, path, 'peak_rss_mb', m['peak_rss_mb']):>18}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", default="1000,10000", help="Comma-separated corpus sizes")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--paths", default=",".join(PATHS), help="Comma-separated search paths")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--corpus-dir", type=Path, help="Keep generated corpora here for reuse")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="Compare against a previous --output")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--build", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--measure", nargs=2, metavar=("DB", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.build is not None:
+        from benchmarks.corpus import build_corpus
+        from emdx.services.embedding_service import EmbeddingService
+
+        build_corpus(
+            Path(os.environ["EMDX_DB"]), args.build, EmbeddingService().MODEL_NAME, args.seed
+        )
+        return
+    if args.measure:
+        db_path, path = args.measure
+        print(json.dumps(measure(Path(db_path), path, args.queries, args.seed)))
+        return
+
+    sizes = [int(n) for n in args.docs.split(",")]
+    paths = [p.strip() for p in args.paths.split(",") if p.strip()]
+    unknown = set(paths) - set(PATHS)
+    if unknown:
+        parser.error(
+            f"unknown paths: {', '.join(sorted(unknown))} (choose from {', '.join(PATHS)})"
+        )
+
+    def progress(message: str) -> None:
+        print(message, file=sys.stderr)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = args.corpus_dir or Path(tmp)
+        corpus_dir.mkdir(parents=True, exist_ok=True)
+        report = run_suite(sizes, paths, args.queries, corpus_dir, args.seed, progress)
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    _print_report(report, baseline)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    if baseline is not None:
+        regressions = compare(baseline, report, args.tolerance)[1]
+        if regressions:
+            print(f"\nRegressions beyond {args.tolerance:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
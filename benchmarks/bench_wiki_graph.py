@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Wiki topic graph construction: all-pairs scan vs entity inverted index.
+
+Builds synthetic entity sets for a KB of each size (documents drawn from
+topics, each topic with its own entity pool, plus Zipf-distributed entities
+shared across the KB), applies the same document-frequency filter as ``discover_topics``
+and times building the Leiden similarity graph both ways.
+
+The all-pairs scan is quadratic, so it is timed over the first
+``--sample`` rows (each compared with every later document) and
+extrapolated to the full pair count. Those rows' edges and weights are
+checked against the indexed build, which must match exactly.
+
+Usage:
+    poetry run python -m benchmarks.bench_wiki_graph [--docs 5000,20000] [--sample 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from emdx.services.wiki_clustering_service import (
+    MIN_EDGE_WEIGHT,
+    _build_similarity_graph,
+    _compute_idf_weighted_jaccard,
+    _filter_entities,
+)
+
+TOPIC_SIZE = 40  # documents per topic, on average
+TOPIC_ENTITIES = 30
+SHARED_ENTITIES = 2_000
+ENTITIES_PER_DOC = (4, 16)
+
+
+def _doc_entities(docs: int, rng: random.Random) -> dict[int, dict[str, float]]:
+    """{doc_id: {entity: confidence}} with topical and Zipf-shared entities."""
+    topics = max(1, docs // TOPIC_SIZE)
+    pools = [[f"t{t}-e{k}" for k in range(TOPIC_ENTITIES)] for t in range(topics)]
+    shared = [f"shared-{k}" for k in range(SHARED_ENTITIES)]
+    shared_weights = [1 / (rank + 1) for rank in range(SHARED_ENTITIES)]
+
+    result: dict[int, dict[str, float]] = {}
+    for doc_id in range(1, docs + 1):
+        pool = pools[rng.randrange(topics)]
+        k = rng.randint(*ENTITIES_PER_DOC)
+        names = rng.sample(pool, k * 2 // 3) + rng.choices(shared, shared_weights, k=k // 3)
+        result[doc_id] = {name: round(rng.uniform(0.5, 1.0), 2) for name in names}
+    return result
+
+
+def _all_pairs_rows(
+    doc_entities: dict[int, dict[str, float]], entity_idf: dict[str, float], rows: int
+) -> tuple[list[tuple[int, int]], list[float], int]:
+    """The previous nested-loop build, for the first ``rows`` nodes only."""
+    doc_ids = sorted(doc_entities)
+    n = len(doc_ids)
+    edges: list[tuple[int, int]] = []
+    weights: list[float] = []
+    pairs = 0
+    for i in range(min(rows, n)):
+        for j in range(i + 1, n):
+            sim = _compute_idf_weighted_jaccard(
+                doc_entities[doc_ids[i]], doc_entities[doc_ids[j]], entity_idf
+            )
+            pairs += 1
+            if sim >= MIN_EDGE_WEIGHT:
+                edges.append((i, j))
+                weights.append(sim)
+    return edges, weights, pairs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", default="5000,20000", help="Comma-separated KB sizes")
+    parser.add_argument("--sample", type=int, default=200, help="Rows timed for all-pairs")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for docs in (int(n) for n in args.docs.split(",")):
+        raw = _doc_entities(docs, random.Random(args.seed))
+        entity_doc_freq: dict[str, int] = {}
+        for entities in raw.values():
+            for entity in entities:
+                entity_doc_freq[entity] = entity_doc_freq.get(entity, 0) + 1
+        doc_entities, entity_idf = _filter_entities(raw, entity_doc_freq, len(raw))
+        n = len(doc_entities)
+
+        started = time.perf_counter()
+        _, edges, weights = _build_similarity_graph(doc_entities, entity_idf)
+        indexed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        sample_edges, sample_weights, pairs = _all_pairs_rows(doc_entities, entity_idf, args.sample)
+        all_pairs = (time.perf_counter() - started) * (n * (n - 1) / 2) / max(pairs, 1)
+
+        head = [(e, w) for e, w in zip(edges, weights, strict=True) if e[0] < args.sample]
+        identical = head == list(zip(sample_edges, sample_weights, strict=True))
+
+        print(f"\n{docs:,} documents ({n:,} with entities, {len(edges):,} edges)")
+        print(f"  all pairs (extrapolated) {all_pairs:10.2f} s")
+        print(f"  inverted index           {indexed:10.2f} s   ({all_pairs / indexed:.0f}x)")
+        print(f"  first {args.sample} rows identical: {'yes' if identical else 'NO'}")
+        if not identical:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Reproducible synthetic knowledge bases for the search benchmarks.
+
+A corpus is a migrated emdx database seeded from a fixed RNG seed: titles
+and bodies drawn from a Zipf-weighted vocabulary, a handful of projects,
+tags, auto links between documents, and document plus chunk embeddings.
+The embeddings are fake (clustered random unit vectors), so semantic
+paths can be timed without downloading a model; ``fake_embedding`` maps
+query text into the same space.
+
+The same ``(docs, seed)`` always produces the same database and the same
+query workload, so runs on different machines or commits are comparable.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from emdx.database.migrations import run_migrations
+from emdx.services.vector_index import encode_vector
+
+DIM = 384
+TOPICS = 64
+CHUNKS_PER_DOC = (1, 4)
+TAGS_PER_DOC = (0, 4)
+LINKS_PER_DOC = (0, 3)
+
+COMMON = (
+    "auth deploy kubernetes roadmap release notes refactor database migration "
+    "search index cache review design api gateway billing invoice onboarding "
+    "incident postmortem metrics alerting pipeline worker queue schema python "
+    "frontend backend latency storage backup cluster config secrets audit"
+).split()
+
+PROJECTS = ["platform", "web", "mobile", "data", "infra", "research", None]
+
+
+@dataclass
+class Workload:
+    """Queries for each search path, derived from the corpus itself."""
+
+    text: list[str]
+    tags: list[list[str]]
+    titles: list[str]
+
+
+def _vocabulary(size: int, rng: random.Random) -> list[str]:
+    """Common words first, then pronounceable made-up words (names, jargon)."""
+    consonants, vowels = "bcdfghjklmnprstvwz", "aeiou"
+    words = dict.fromkeys(COMMON)
+    while len(words) < size:
+        syllables = rng.randint(2, 4)
+        words["".join(rng.choice(consonants) + rng.choice(vowels) for _ in range(syllables))] = None
+    return list(words)
+
+
+def _unit(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    unit: np.ndarray = (vectors / np.maximum(norms, 1e-12)).astype(np.float32)
+    return unit
+
+
+def fake_embedding(text: str) -> np.ndarray:
+    """Deterministic unit vector for ``text``, standing in for the model."""
+    seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "little")
+    return _unit(np.random.default_rng(seed).standard_normal(DIM))
+
+
+def build_corpus(db_path: Path, docs: int, model_name: str, seed: int = 0) -> None:
+    """Create a migrated database at ``db_path`` holding ``docs`` synthetic documents.
+
+    Embeddings are stored under ``model_name`` so the search services pick
+    them up as their own index.
+    """
+    rng = random.Random(seed)
+    np_rng = np.random.default_rng(seed)
+    run_migrations(db_path)
+
+    vocab = _vocabulary(20_000, rng)
+    weights = [1 / (rank + 1) for rank in range(len(vocab))]
+    tag_names = rng.sample(vocab[:2_000], 200)
+    tag_weights = [1 / (rank + 1) for rank in range(len(tag_names))]
+    centers = np_rng.standard_normal((TOPICS, DIM)).astype(np.float32)
+
+    def words(k: int) -> list[str]:
+        return rng.choices(vocab, weights, k=k)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executemany("INSERT OR IGNORE INTO tags (name) VALUES (?)", [(t,) for t in tag_names])
+        tag_ids = dict(conn.execute("SELECT name, id FROM tags").fetchall())
+
+        documents, chunks, doc_vectors, doc_tags, links = [], [], [], [], []
+        for doc_id in range(1, docs + 1):
+            title = " ".join(w.capitalize() for w in words(rng.randint(2, 6)))
+            paragraphs = [
+                " ".join(words(rng.randint(20, 80))) for _ in range(rng.randint(*CHUNKS_PER_DOC))
+            ]
+            documents.append(
+                (
+                    doc_id,
+                    title,
+                    "\n\n".join(paragraphs),
+                    rng.choice(PROJECTS),
+                    rng.randint(0, 100),
+                    "wiki" if rng.random() < 0.05 else "user",
+                    f"2026-{rng.randint(1, 9):02d}-{rng.randint(1, 28):02d} 12:00:00",
+                )
+            )
+            topic = centers[rng.randrange(TOPICS)]
+            doc_vectors.append((doc_id, _unit(topic + np_rng.standard_normal(DIM))))
+            for index, paragraph in enumerate(paragraphs):
+                vector = _unit(topic + np_rng.standard_normal(DIM))
+                chunks.append((doc_id, index, f"Section {index + 1}", paragraph, vector))
+            for tag in set(rng.choices(tag_names, tag_weights, k=rng.randint(*TAGS_PER_DOC))):
+                doc_tags.append((doc_id, tag_ids[tag]))
+            if doc_id > 1:
+                for target in {
+                    rng.randint(1, doc_id - 1) for _ in range(rng.randint(*LINKS_PER_DOC))
+                }:
+                    links.append((doc_id, target, round(rng.random(), 3)))
+
+        conn.executemany(
+            "INSERT INTO documents "
+            "(id, title, content, project, access_count, doc_type, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?7)",
+            documents,
+        )
+        conn.executemany("INSERT INTO document_tags (document_id, tag_id) VALUES (?, ?)", doc_tags)
+        conn.execute(
+            "UPDATE tags SET usage_count = "
+            "(SELECT COUNT(*) FROM document_tags WHERE tag_id = tags.id)"
+        )
+        conn.executemany(
+            "INSERT INTO document_links (source_doc_id, target_doc_id, similarity_score) "
+            "VALUES (?, ?, ?)",
+            links,
+        )
+        conn.executemany(
+            "INSERT INTO document_embeddings (document_id, model_name, embedding, dimension) "
+            "VALUES (?, ?, ?, ?)",
+            [(doc_id, model_name, encode_vector(v), DIM) for doc_id, v in doc_vectors],
+        )
+        conn.executemany(
+            "INSERT INTO chunk_embeddings "
+            "(document_id, chunk_index, heading_path, text, model_name, embedding, dimension) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (doc_id, index, heading, text, model_name, encode_vector(v), DIM)
+                for doc_id, index, heading, text, v in chunks
+            ],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def workload(db_path: Path, queries: int, seed: int = 0) -> Workload:
+    """Queries drawn from random documents of the corpus at ``db_path``.
+
+    Text queries are two or three words of a document's body, tag queries
+    one or two of the 50 most used tags, and title queries a document's
+    first words with one letter dropped (a typo, as typed into a command
+    palette).
+    """
+    rng = random.Random(seed + 1)
+    conn = sqlite3.connect(db_path)
+    try:
+        (count,) = conn.execute("SELECT COUNT(*) FROM documents").fetchone()
+        ids = [rng.randint(1, count) for _ in range(queries)]
+        placeholders = ",".join("?" * len(ids))
+        rows = {
+            doc_id: (title, content)
+            for doc_id, title, content in conn.execute(
+                f"SELECT id, title, content FROM documents WHERE id IN ({placeholders})", ids
+            )
+        }
+        all_tags = [
+            name for (name,) in conn.execute("SELECT name FROM tags ORDER BY usage_count DESC, id")
+        ]
+    finally:
+        conn.close()
+
+    text, tags, titles = [], [], []
+    for doc_id in ids:
+        title, content = rows[doc_id]
+        body = content.split()
+        start = rng.randrange(max(1, len(body) - 3))
+        text.append(" ".join(body[start : start + rng.randint(2, 3)]))
+        tags.append(rng.sample(all_tags[:50], rng.randint(1, 2)))
+        head = " ".join(title.lower().split()[:2])
+        cut = rng.randrange(1, len(head))
+        titles.append(head[:cut] + head[cut + 1 :])
+    return Workload(text, tags, titles)
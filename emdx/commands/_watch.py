@@ -97,170 +97,62 @@ def get_standing_query(query_id: int) -> StandingQueryRow | None:
 
 # ── Check for new matches ────────────────────────────────────────────
 
+# Newest matches reported per query and check; older ones are dropped
+MAX_MATCHES_PER_QUERY = 50
+
 
 def check_standing_queries() -> list[StandingQueryMatch]:
-    """Check all standing queries for new documents since last check.
+    """Report documents matched by standing queries since the last check.
 
-    Updates last_checked_at and notify_count for queries that find
-    new matches.  Returns a list of matches found across all queries.
+    Documents are matched against the standing queries when they are
+    saved (see ``emdx.database.standing_queries``), so a check only drains
+    whatever is still queued and reads the pending matches. Updates
+    last_checked_at for every query and notify_count for those with new
+    matches.
     """
-    queries = list_standing_queries()
-    all_matches: list[StandingQueryMatch] = []
+    from emdx.database.standing_queries import percolate_pending
 
     with db_connection.get_connection() as conn:
-        for sq in queries:
-            last_checked = sq["last_checked_at"]
-            # Format for SQLite comparison
-            if last_checked is not None:
-                last_checked_str: str = last_checked.strftime(  # type: ignore[union-attr]
-                    "%Y-%m-%d %H:%M:%S"
-                )
-            else:
-                last_checked_str = "1970-01-01 00:00:00"
-
-            matches = _find_new_matches(conn, sq, last_checked_str)
-            if matches:
-                all_matches.extend(matches)
-                conn.execute(
-                    """
-                    UPDATE standing_queries
-                    SET last_checked_at = CURRENT_TIMESTAMP,
-                        notify_count = notify_count + ?
-                    WHERE id = ?
-                    """,
-                    (len(matches), sq["id"]),
-                )
-            else:
-                conn.execute(
-                    """
-                    UPDATE standing_queries
-                    SET last_checked_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                    """,
-                    (sq["id"],),
-                )
-
-        conn.commit()
-
-    return all_matches
-
-
-def _find_new_matches(
-    conn: object,
-    sq: StandingQueryRow,
-    last_checked_str: str,
-) -> list[StandingQueryMatch]:
-    """Find documents created after last_checked_str matching the query."""
-    import sqlite3
-
-    assert isinstance(conn, sqlite3.Connection)
-
-    query_text = sq["query"]
-    matches: list[StandingQueryMatch] = []
-
-    if query_text:
-        from emdx.database.search import escape_fts5_query
-
-        fts_query = escape_fts5_query(query_text)
-        sql = """
-            SELECT d.id, d.title, d.created_at
-            FROM documents d
-            JOIN documents_fts fts ON d.id = fts.rowid
-            WHERE fts.documents_fts MATCH ?
-              AND d.created_at > ?
-              AND d.is_deleted = 0
-              AND d.doc_type = 'user'
-        """
-        params: list[str | int] = [fts_query, last_checked_str]
-
-        if sq["project"]:
-            sql += " AND d.project = ?"
-            params.append(sq["project"])
-
-        sql += " ORDER BY d.created_at DESC LIMIT 50"
-
-        cursor = conn.execute(sql, params)
-        rows = cursor.fetchall()
-
-        if sq["tags"]:
-            tag_list = [t.strip() for t in sq["tags"].split(",") if t.strip()]
-            rows = _filter_rows_by_tags(conn, rows, tag_list)
-
-        for row in rows:
-            matches.append(
-                StandingQueryMatch(
-                    query_id=sq["id"],
-                    query=query_text,
-                    doc_id=row[0],
-                    doc_title=row[1],
-                    doc_created_at=row[2],
-                )
-            )
-
-    elif sq["tags"]:
-        tag_list = [t.strip() for t in sq["tags"].split(",") if t.strip()]
-        placeholders = ",".join("?" * len(tag_list))
-        sql = f"""
-            SELECT DISTINCT d.id, d.title, d.created_at
-            FROM documents d
-            JOIN document_tags dt ON d.id = dt.document_id
-            JOIN tags t ON dt.tag_id = t.id
-            WHERE t.name IN ({placeholders})
-              AND d.created_at > ?
-              AND d.is_deleted = 0
-              AND d.doc_type = 'user'
-        """
-        params_tags: list[str | int] = [*tag_list, last_checked_str]
-
-        if sq["project"]:
-            sql += " AND d.project = ?"
-            params_tags.append(sq["project"])
-
-        sql += " ORDER BY d.created_at DESC LIMIT 50"
-
-        cursor = conn.execute(sql, params_tags)
-        for row in cursor.fetchall():
-            matches.append(
+        percolate_pending(conn)
+        rows = conn.execute(
+            """
+            SELECT sq.id, sq.query, sq.tags, d.id, d.title, d.created_at
+            FROM standing_query_matches m
+            JOIN standing_queries sq ON sq.id = m.query_id
+            JOIN documents d ON d.id = m.document_id
+            WHERE d.is_deleted = 0
+            ORDER BY sq.created_at DESC, sq.id DESC, d.created_at DESC, d.id DESC
+            """
+        ).fetchall()
+
+        all_matches: list[StandingQueryMatch] = []
+        counts: dict[int, int] = {}
+        for query_id, query_text, tags, doc_id, title, created_at in rows:
+            if counts.get(query_id, 0) >= MAX_MATCHES_PER_QUERY:
+                continue
+            counts[query_id] = counts.get(query_id, 0) + 1
+            all_matches.append(
                 StandingQueryMatch(
-                    query_id=sq["id"],
-                    query=f"[tags: {sq['tags']}]",
-                    doc_id=row[0],
-                    doc_title=row[1],
-                    doc_created_at=row[2],
+                    query_id=query_id,
+                    query=query_text or f"[tags: {tags}]",
+                    doc_id=doc_id,
+                    doc_title=title,
+                    doc_created_at=created_at,
                 )
             )
 
-    return matches
-
-
-def _filter_rows_by_tags(
-    conn: object,
-    rows: list[object],
-    tag_list: list[str],
-) -> list[object]:
-    """Filter rows to only include docs that have all specified tags."""
-    import sqlite3
-
-    assert isinstance(conn, sqlite3.Connection)
-
-    filtered = []
-    for row in rows:
-        doc_id = row[0]  # type: ignore[index]
-        placeholders = ",".join("?" * len(tag_list))
-        cursor = conn.execute(
-            f"""
-            SELECT COUNT(DISTINCT t.name)
-            FROM document_tags dt
-            JOIN tags t ON dt.tag_id = t.id
-            WHERE dt.document_id = ?
-              AND t.name IN ({placeholders})
-            """,
-            [doc_id, *tag_list],
+        conn.executemany(
+            "DELETE FROM standing_query_matches WHERE query_id = ? AND document_id = ?",
+            [(row[0], row[3]) for row in rows],
         )
-        count = cursor.fetchone()[0]
-        if count == len(tag_list):
-            filtered.append(row)
-    return filtered
+        conn.execute("UPDATE standing_queries SET last_checked_at = CURRENT_TIMESTAMP")
+        conn.executemany(
+            "UPDATE standing_queries SET notify_count = notify_count + ? WHERE id = ?",
+            [(count, query_id) for query_id, count in counts.items()],
+        )
+        conn.commit()
+
+    return all_matches
 
 
 # ── Display helpers ──────────────────────────────────────────────────
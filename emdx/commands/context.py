@@ -17,8 +17,8 @@ from rich.console import Console
 
 from ..database import db
 from ..database.document_links import get_links_for_document
+from ..database.documents import get_document_summary
 from ..database.types import DocumentLinkDetail
-from ..models.document import Document
 
 if TYPE_CHECKING:
     from ..services.hybrid_search import HybridSearchResult
@@ -55,13 +55,13 @@ class ScoredDocument:
 
     doc_id: int
     title: str
-    content: str
     tokens: int
     hops: int
     score: float
     path: list[int] = field(default_factory=list)
     link_methods: list[str] = field(default_factory=list)
     reason: str = "seed"
+    content: str = ""
 
 
 # ── Token estimation ─────────────────────────────────────────────────
@@ -90,17 +90,25 @@ def compute_link_score(
 # ── Document fetching (no access tracking) ───────────────────────────
 
 
-def _fetch_document(doc_id: int) -> Document | None:
-    """Fetch a document by ID without updating access tracking."""
+def load_content(docs: list[ScoredDocument]) -> None:
+    """Fill in the content of ``docs`` with one query.
+
+    Traversal and packing only need titles and token estimates, so content
+    is read for the documents that made it into the bundle, not for every
+    document the walk reached.
+    """
+    if not docs:
+        return
+    placeholders = ",".join("?" * len(docs))
     with db.get_connection() as conn:
-        cursor = conn.execute(
-            "SELECT * FROM documents WHERE id = ? AND is_deleted = FALSE",
-            (doc_id,),
+        content = dict(
+            conn.execute(
+                f"SELECT id, content FROM documents WHERE id IN ({placeholders})",
+                [d.doc_id for d in docs],
+            ).fetchall()
         )
-        row = cursor.fetchone()
-        if row:
-            return Document.from_row(row)
-        return None
+    for doc in docs:
+        doc.content = content.get(doc.doc_id) or ""
 
 
 # ── Graph traversal ──────────────────────────────────────────────────
@@ -119,14 +127,13 @@ def traverse_graph(
 
     # Initialize seeds
     for sid in seed_ids:
-        doc = _fetch_document(sid)
+        doc = get_document_summary(sid)
         if doc is None:
             continue
         scored = ScoredDocument(
             doc_id=sid,
             title=doc.title,
-            content=doc.content,
-            tokens=estimate_tokens(doc.content),
+            tokens=doc.token_estimate,
             hops=0,
             score=1.0,
             path=[sid],
@@ -153,7 +160,7 @@ def traverse_graph(
                 hop_score = compute_link_score(link, depth, source.score)
 
                 if target_id not in visited or hop_score > visited[target_id].score:
-                    doc = _fetch_document(target_id)
+                    doc = get_document_summary(target_id)
                     if doc is None:
                         continue
 
@@ -162,8 +169,7 @@ def traverse_graph(
                     visited[target_id] = ScoredDocument(
                         doc_id=target_id,
                         title=doc.title,
-                        content=doc.content,
-                        tokens=estimate_tokens(doc.content),
+                        tokens=doc.token_estimate,
                         hops=depth,
                         score=hop_score,
                         path=source.path + [target_id],
@@ -427,8 +433,7 @@ def context(
     # Validate seed IDs exist
     valid_seeds: list[int] = []
     for sid in seed_ids:
-        doc = _fetch_document(sid)
-        if doc is None:
+        if get_document_summary(sid) is None:
             console.print(f"[yellow]Warning: document #{sid} not found, skipping[/yellow]")
         else:
             valid_seeds.append(sid)
@@ -447,6 +452,7 @@ def context(
 
     # Output
     if json_output:
+        load_content(included)
         print(_render_json(seed_ids, included, excluded, max_tokens, depth))
     else:
         print(
@@ -9,6 +9,7 @@ import os
 import sqlite3
 import subprocess
 import tempfile
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -31,6 +32,7 @@ from emdx.models.documents import (
     search_documents,
     update_document,
 )
+from emdx.models.search import SearchFacets
 from emdx.models.tags import (
     add_tags_to_document,
     get_document_tags,
@@ -433,7 +435,9 @@ def find(
         default=None, help="Search terms (optional if using --tags)"
     ),
     project: str | None = typer.Option(None, "--project", "-p", help="Filter by project"),
-    limit: int = typer.Option(10, "--limit", "-n", help="Maximum results to return"),
+    limit: int | None = typer.Option(
+        None, "--limit", "-n", help="Maximum results to return [default: 10; none with --stream]"
+    ),
     snippets: bool = typer.Option(False, "--snippets", "-s", help="Show content snippets"),
     fuzzy: bool = typer.Option(False, "--fuzzy", "-f", help="Use fuzzy search"),
     tags: str | None = typer.Option(
@@ -504,6 +508,27 @@ def find(
     all_types: bool = typer.Option(
         False, "--all-types", help="Show all document types (user, wiki, etc.)"
     ),
+    timings: bool = typer.Option(
+        False,
+        "--timings",
+        help="Report per-leg search timings (with --json, wraps results in an object)",
+    ),
+    page_size: int | None = typer.Option(
+        None,
+        "--page-size",
+        help="Return one page of N keyword, tag, date or --all results plus a cursor",
+    ),
+    cursor: str | None = typer.Option(
+        None, "--cursor", help="Continue a paged listing from the cursor of the previous page"
+    ),
+    stream: bool = typer.Option(
+        False, "--stream", help="Print every keyword, tag, date or --all match as NDJSON"
+    ),
+    facets: bool = typer.Option(
+        False,
+        "--facets",
+        help="Count matches per project, tag and doc type (with --json, wraps results)",
+    ),
 ) -> None:
     """Search the knowledge base with full-text search.
 
@@ -517,6 +542,9 @@ def find(
     Use --similar N to find documents similar to doc #N.
     Use --context to retrieve docs as plain text for piping to claude.
     Use --recent-days N to scope --context to docs from the last N days.
+    Use --page-size N / --cursor to page through keyword, tag, date or --all
+    listings, and --stream to print every match as NDJSON in constant memory.
+    Use --facets to count every match per project, tag and doc type.
 
     For AI-powered search, use: emdx labs ask, emdx labs wander, emdx labs watch.
 
@@ -528,6 +556,9 @@ def find(
         emdx find --recent 10                            # recently accessed
         emdx find --similar 42                           # docs similar to #42
         emdx find --context "auth" | claude              # pipe context to claude
+        emdx find "auth" --page-size 50 --json           # first page + next_cursor
+        emdx find --all --stream > all.ndjson            # export every document
+        emdx find "auth" --facets                        # where the matches live
     """
     search_query = " ".join(query) if query else ""
 
@@ -546,6 +577,52 @@ def find(
     else:
         doc_type = None
 
+    if facets and (
+        all_docs
+        or recent is not None
+        or similar is not None
+        or context
+        or page_size is not None
+        or cursor is not None
+        or stream
+    ):
+        console.print("[red]Error: --facets applies to search, tag and date queries[/red]")
+        raise typer.Exit(1)
+
+    if page_size is not None or cursor is not None or stream:
+        if recent is not None or similar is not None or context:
+            console.print(
+                "[red]Error: --page-size, --cursor and --stream apply to keyword, tag, "
+                "date and --all listings[/red]"
+            )
+            raise typer.Exit(1)
+        if page_size is not None and page_size < 1:
+            console.print("[red]Error: --page-size must be at least 1[/red]")
+            raise typer.Exit(1)
+        _find_paged(
+            search_query,
+            all_docs=all_docs,
+            project=project,
+            tags=tags,
+            any_tags=any_tags,
+            no_tags=no_tags,
+            created_after=created_after,
+            created_before=created_before,
+            modified_after=modified_after,
+            modified_before=modified_before,
+            doc_type=doc_type,
+            page_size=page_size,
+            cursor=cursor,
+            stream=stream,
+            limit=limit,
+            snippets=snippets,
+            ids_only=ids_only,
+            json_output=json_output,
+        )
+        return
+    if limit is None:
+        limit = 10
+
     try:
         # Handle --all: list all documents
         if all_docs:
@@ -603,6 +680,7 @@ def find(
                 modified_after,
                 modified_before,
                 doc_type=doc_type,
+                facets=facets,
             )
             return
 
@@ -617,7 +695,14 @@ def find(
             extract=extract,
             project=project,
             doc_type=doc_type,
+            facets=facets and not tags and not no_tags,
         )
+        report = hybrid_service.last_report
+        facet_counts = hybrid_service.last_facets if facets else None
+        if facets and facet_counts is None:
+            facet_counts = _find_facets(
+                search_query, project, tags, any_tags, no_tags, doc_type=doc_type
+            )
 
         # Apply tag filters if specified
         if tags:
@@ -670,8 +755,20 @@ def find(
                     output_result["chunk_heading"] = result.chunk_heading
                 if snippets or extract:
                     output_result["snippet"] = result.chunk_text or result.snippet
+                if report and report.degraded:
+                    output_result["degraded"] = True
                 output_results.append(output_result)
-            print(json.dumps(output_results, indent=2))
+            if (timings and report) or facet_counts is not None:
+                wrapped: dict[str, Any] = {"results": output_results}
+                if timings and report:
+                    wrapped["degraded"] = report.degraded
+                    wrapped["timed_out"] = report.timed_out
+                    wrapped["timings_ms"] = report.timings_ms
+                if facet_counts is not None:
+                    wrapped["facets"] = facet_counts.to_dict()
+                print(json.dumps(wrapped, indent=2))
+            else:
+                print(json.dumps(output_results, indent=2))
             return
 
         # Display human-readable results
@@ -680,6 +777,11 @@ def find(
             f"\n[bold]🔍 Found {len(hybrid_results)} results for "
             f"'[cyan]{search_query}[/cyan]' [dim]({mode_desc} search)[/dim][/bold]\n"
         )
+        if report and report.degraded:
+            console.print(
+                f"[yellow]{', '.join(report.timed_out).capitalize()} search timed out — "
+                f"showing partial results[/yellow]\n"
+            )
 
         for i, result in enumerate(hybrid_results, 1):
             # Display result header with chunk heading if available
@@ -724,6 +826,13 @@ def find(
             if i < len(hybrid_results):
                 console.print()
 
+        if facet_counts is not None:
+            _print_facets(facet_counts)
+
+        if timings and report:
+            legs = ", ".join(f"{name} {ms:.1f}ms" for name, ms in report.timings_ms.items())
+            console.print(f"\n[dim]⏱ {legs}[/dim]")
+
         console.print("\n[dim]💡 Use 'emdx view <id>' to view a document[/dim]")
 
     except Exception as e:
@@ -731,6 +840,213 @@ def find(
         raise typer.Exit(1) from e
 
 
+def _keyword_result_json(
+    result: dict[str, Any], doc_tags: list[str], snippets: bool
+) -> dict[str, Any]:
+    """Clean JSON object for a keyword, tag or listing result."""
+    output_result = {
+        "id": result["id"],
+        "title": result["title"],
+        "project": result.get("project"),
+        "created_at": str(result["created_at"] or ""),
+        "updated_at": str(result.get("updated_at") or result["created_at"] or ""),
+        "tags": doc_tags,
+        "access_count": result.get("access_count", 0),
+    }
+
+    # Add search-specific metadata if available
+    if "rank" in result:
+        output_result["relevance"] = result["rank"]
+    elif "score" in result:
+        output_result["similarity"] = result["score"]
+
+    if snippets and result.get("snippet"):
+        # Clean snippet of HTML tags
+        snippet = result["snippet"]
+        if snippet:
+            output_result["snippet"] = snippet.replace("<b>", "").replace("</b>", "")
+    return output_result
+
+
+def _find_facets(
+    search_query: str,
+    project: str | None,
+    tags: str | None,
+    any_tags: bool,
+    no_tags: str | None,
+    created_after: str | None = None,
+    created_before: str | None = None,
+    modified_after: str | None = None,
+    modified_before: str | None = None,
+    doc_type: str | None = "user",
+) -> SearchFacets:
+    """Facet counts over every keyword, tag or date match of a find query."""
+    from emdx.database.search import search_facets
+
+    return search_facets(
+        search_query or "*",
+        project=project,
+        created_after=created_after,
+        created_before=created_before,
+        modified_after=modified_after,
+        modified_before=modified_before,
+        doc_type=doc_type,
+        tags=[t.strip() for t in tags.split(",") if t.strip()] if tags else None,
+        tag_mode="any" if any_tags else "all",
+        exclude_tags=[t.strip() for t in no_tags.split(",") if t.strip()] if no_tags else None,
+    )
+
+
+def _print_facets(facet_counts: SearchFacets) -> None:
+    """Summarize facet counts below human-readable results."""
+    console.print(f"\n[bold]{facet_counts.total} matches[/bold]")
+    for label, counts in (
+        ("Projects", facet_counts.projects),
+        ("Types", facet_counts.doc_types),
+        ("Tags", facet_counts.tags),
+    ):
+        if counts:
+            summary = ", ".join(f"{value or '(none)'} {count}" for value, count in counts)
+            console.print(f"[dim]{label}: {summary}[/dim]")
+
+
+# Rows fetched per query when --stream is used without --page-size
+STREAM_PAGE_SIZE = 500
+
+
+def _find_paged(
+    search_query: str,
+    *,
+    all_docs: bool,
+    project: str | None,
+    tags: str | None,
+    any_tags: bool,
+    no_tags: str | None,
+    created_after: str | None,
+    created_before: str | None,
+    modified_after: str | None,
+    modified_before: str | None,
+    doc_type: str | None,
+    page_size: int | None,
+    cursor: str | None,
+    stream: bool,
+    limit: int | None,
+    snippets: bool,
+    ids_only: bool,
+    json_output: bool,
+) -> None:
+    """Keyset-paged keyword, tag, date or --all listing.
+
+    Pages are fetched by cursor rather than OFFSET, so each costs the same
+    however deep it is; --stream walks every page, printing NDJSON rows as
+    they arrive.
+    """
+    import sys
+
+    from emdx.database.documents import list_documents_page
+    from emdx.database.pagination import Page, iter_pages
+    from emdx.database.search import search_documents_page
+    from emdx.models.tags import search_by_tags_page
+
+    size = page_size or (STREAM_PAGE_SIZE if stream else limit or 10)
+    tag_list = [t.strip() for t in tags.split(",") if t.strip()] if tags else []
+    has_date_filters = any([created_after, created_before, modified_after, modified_before])
+
+    fetch: Callable[[str | None], Page[Any]]
+    if all_docs:
+
+        def fetch(after: str | None) -> Page[Any]:
+            return list_documents_page(project, size, after, doc_type=doc_type)
+    elif tag_list:
+        if search_query or has_date_filters:
+            console.print(
+                "[red]Error: paged tag listings cannot be combined with search terms "
+                "or date filters[/red]"
+            )
+            raise typer.Exit(1)
+
+        def fetch(after: str | None) -> Page[Any]:
+            mode = "any" if any_tags else "all"
+            return search_by_tags_page(tag_list, mode, project, size, after)
+    elif search_query or has_date_filters:
+
+        def fetch(after: str | None) -> Page[Any]:
+            return search_documents_page(
+                search_query or "*",
+                project=project,
+                page_size=size,
+                cursor=after,
+                created_after=created_after,
+                created_before=created_before,
+                modified_after=modified_after,
+                modified_before=modified_before,
+                doc_type=doc_type,
+            )
+    else:
+        console.print("[red]Error: Provide search terms, tags, date filters or --all[/red]")
+        raise typer.Exit(1)
+
+    excluded = [t.strip() for t in no_tags.split(",") if t.strip()] if no_tags else []
+
+    def rows(items: list[Any]) -> list[dict[str, Any]]:
+        """JSON rows for one page, minus documents carrying an excluded tag."""
+        results = [item if isinstance(item, dict) else item.to_dict() for item in items]
+        tags_map = get_tags_for_documents([r["id"] for r in results])
+        return [
+            _keyword_result_json(r, tags_map.get(r["id"], []), snippets)
+            for r in results
+            if not any(tag in tags_map.get(r["id"], []) for tag in excluded)
+        ]
+
+    try:
+        if stream:
+
+            def pages(after: str | None) -> Page[dict[str, Any]]:
+                page = fetch(after)
+                return Page(rows(page.items), page.next_cursor)
+
+            for count, row in enumerate(iter_pages(pages, cursor), 1):
+                print(row["id"] if ids_only else json.dumps(row), flush=True)
+                if limit is not None and count >= limit:
+                    break
+            return
+
+        page = fetch(cursor)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from None
+
+    results = rows(page.items)
+    if ids_only:
+        for result in results:
+            print(result["id"])
+        if page.next_cursor:
+            print(f"next cursor: {page.next_cursor}", file=sys.stderr)
+        return
+
+    if json_output:
+        print(json.dumps({"results": results, "next_cursor": page.next_cursor}, indent=2))
+        return
+
+    table = Table(title="Search results" if not all_docs else "Knowledge Base Documents")
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Title", style="magenta")
+    table.add_column("Project", style="green")
+    table.add_column("Created", style="yellow")
+    table.add_column("Tags", style="dim")
+    for result in results:
+        table.add_row(
+            str(result["id"]),
+            truncate_title(result["title"]),
+            result["project"] or "None",
+            result["created_at"][:10],
+            format_tags(result["tags"]),
+        )
+    console.print(table)
+    if page.next_cursor:
+        console.print(f"\n[dim]Next page: --cursor {page.next_cursor}[/dim]")
+
+
 def _find_list_all(
     project: str | None,
     limit: int,
@@ -949,8 +1265,25 @@ def _find_keyword_search(
     modified_after: str | None,
     modified_before: str | None,
     doc_type: str | None = "user",
+    facets: bool = False,
 ) -> None:
     """Original keyword-based search for tag/date filtered queries."""
+    facet_counts = (
+        _find_facets(
+            search_query,
+            project,
+            tags,
+            any_tags,
+            no_tags,
+            created_after,
+            created_before,
+            modified_after,
+            modified_before,
+            doc_type=doc_type,
+        )
+        if facets
+        else None
+    )
     # Handle tag-based search
     if tags:
         tag_list = [t.strip() for t in tags.split(",") if t.strip()]
@@ -1074,34 +1407,15 @@ def _find_keyword_search(
         for result in results:
             # Use batch-fetched tags
             doc_tags = all_tags_map.get(result["id"], [])
-
-            # Build clean result object
-            output_result = {
-                "id": result["id"],
-                "title": result["title"],
-                "project": result.get("project"),
-                "created_at": str(result["created_at"] or ""),
-                "updated_at": str(result.get("updated_at") or result["created_at"] or ""),
-                "tags": doc_tags,
-                "access_count": result.get("access_count", 0),
-            }
-
-            # Add search-specific metadata if available
-            if "rank" in result:
-                output_result["relevance"] = result["rank"]
-            elif "score" in result:
-                output_result["similarity"] = result["score"]
-
-            if snippets and result.get("snippet"):
-                # Clean snippet of HTML tags
-                snippet = result["snippet"]
-                if snippet:
-                    output_result["snippet"] = snippet.replace("<b>", "").replace("</b>", "")
-
-            output_results.append(output_result)
+            output_results.append(_keyword_result_json(result, doc_tags, snippets))
 
         # Output as JSON
-        print(json.dumps(output_results, indent=2))
+        if facet_counts is not None:
+            print(
+                json.dumps({"results": output_results, "facets": facet_counts.to_dict()}, indent=2)
+            )
+        else:
+            print(json.dumps(output_results, indent=2))
         return
 
     # Display results (default human-readable format)
@@ -1166,6 +1480,9 @@ def _find_keyword_search(
         if i < len(results):
             console.print()
 
+    if facet_counts is not None:
+        _print_facets(facet_counts)
+
     # Show tip for viewing documents
     if len(results) > 0:
         console.print("\n[dim]💡 Use 'emdx view <id>' to view a document[/dim]")
@@ -1,6 +1,7 @@
 """Database management commands for emdx."""
 
-import shutil
+import sqlite3
+from pathlib import Path
 
 import typer
 
@@ -45,7 +46,9 @@ def path() -> None:
 def copy_from_prod() -> None:
     """Copy the production database to the dev database.
 
-    Useful for working with real data locally during development.
+    Useful for working with real data locally during development. The copy
+    goes through the SQLite backup API so commits still sitting in the
+    production WAL are included.
     """
     prod_path = EMDX_CONFIG_DIR / "knowledge.db"
     dev_path = get_db_path()
@@ -65,5 +68,27 @@ def copy_from_prod() -> None:
         if not confirm:
             raise typer.Abort()
 
-    shutil.copy2(prod_path, dev_path)
+    from ..database.connection import close_pooled_connections
+
+    # A leftover dev -wal/-shm pair would be replayed against the new main
+    # file, so drop the old dev database entirely before copying.
+    close_pooled_connections(dev_path)
+    for stale in (dev_path, *_wal_files(dev_path)):
+        stale.unlink(missing_ok=True)
+
+    src = sqlite3.connect(f"{prod_path.as_uri()}?mode=ro", uri=True)
+    dst = sqlite3.connect(dev_path)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
     print(f"Copied {prod_path} -> {dev_path}")
+
+
+def _wal_files(db_path: Path) -> tuple[Path, Path]:
+    """The WAL and shared-memory files SQLite keeps next to ``db_path``."""
+    return (
+        db_path.with_name(db_path.name + "-wal"),
+        db_path.with_name(db_path.name + "-shm"),
+    )
@@ -454,7 +454,7 @@ def _run_wander(
 
     seed_doc_id: int | None = None
     if search_query:
-        seed_embedding = service.embed_text(search_query)
+        seed_embedding = service.embed_query(search_query)
     else:
         with db.get_connection() as conn:
             cursor = conn.cursor()
@@ -484,6 +484,8 @@ def _run_wander(
 
     try:
         import numpy as np
+
+        from emdx.services.vector_index import decode_blob
     except ImportError:
         console.print(
             "[red]numpy is required for wander. Install with: pip install 'emdx[ai]'[/red]"
@@ -515,7 +517,8 @@ def _run_wander(
         if doc_id == seed_doc_id:
             continue
 
-        doc_embedding = np.frombuffer(emb_bytes, dtype=np.float32)
+        # Stored vectors may be quantized; the seed shares their dimension
+        doc_embedding = decode_blob(emb_bytes, len(seed_embedding))
         similarity = float(np.dot(seed_embedding, doc_embedding))
 
         if goldilocks_min <= similarity <= goldilocks_max:
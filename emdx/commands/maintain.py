@@ -831,6 +831,7 @@ def compact_command(
 
     from ..config.settings import get_db_path
     from ..database import db
+    from ..database.search import SUBSTRING_INDEX, has_substring_index
 
     db_path = get_db_path()
     if not db_path.exists():
@@ -847,6 +848,8 @@ def compact_command(
     with db.get_connection() as conn:
         # Merge FTS5 b-tree segments into one (defragments the search index)
         conn.execute("INSERT INTO documents_fts(documents_fts) VALUES('optimize')")
+        if has_substring_index(conn):
+            conn.execute(f"INSERT INTO {SUBSTRING_INDEX}({SUBSTRING_INDEX}) VALUES('optimize')")
         conn.commit()
         # Refresh query-planner statistics
         conn.execute("PRAGMA optimize")
@@ -882,6 +885,97 @@ def compact_command(
 
 app.command(name="compact")(compact_command)
 
+
+def substring_index_command(
+    disable: bool = typer.Option(False, "--disable", help="Drop the index instead"),
+    json_output: bool = typer.Option(False, "--json", help="Structured JSON output"),
+) -> None:
+    """Enable (or drop) the trigram index for substring lookups.
+
+    Ticket references in ``emdx ask`` (e.g. ABC-123) and other substring
+    lookups scan every document's content without it. The index is kept
+    in sync by triggers and takes roughly three times the size of the
+    indexed text on disk.
+
+    Examples:
+        emdx maintain substring-index
+        emdx maintain substring-index --disable
+    """
+    import json as json_mod
+
+    from ..database.search import disable_substring_index, enable_substring_index
+
+    if disable:
+        changed = disable_substring_index()
+        enabled = False
+        msg = "Substring index dropped" if changed else "Substring index was not enabled"
+    else:
+        enabled = enable_substring_index()
+        msg = (
+            "Substring index enabled"
+            if enabled
+            else "SQLite lacks the FTS5 trigram tokenizer (needs 3.34+); index not created"
+        )
+
+    if json_output:
+        print(json_mod.dumps({"success": enabled != disable, "enabled": enabled, "message": msg}))
+    else:
+        print(msg)
+    if not disable and not enabled:
+        raise typer.Exit(code=1)
+
+
+app.command(name="substring-index")(substring_index_command)
+
+
+def llm_cache_command(
+    clear: bool = typer.Option(False, "--clear", help="Drop every cached response"),
+    json_output: bool = typer.Option(False, "--json", help="Structured JSON output"),
+) -> None:
+    """Show (or clear) the cache of LLM responses.
+
+    Wiki synthesis, topic labeling, quality review and LLM entity
+    extraction reuse a stored response when the same prompt goes to the
+    same model again. Set EMDX_LLM_CACHE=0 to turn the cache off.
+
+    Examples:
+        emdx maintain llm-cache
+        emdx maintain llm-cache --clear
+    """
+    import json as json_mod
+
+    from ..services import llm_cache
+
+    if clear:
+        removed = llm_cache.clear()
+        if json_output:
+            print(json_mod.dumps({"cleared": removed}))
+        else:
+            print(f"Cleared {removed} cached LLM response(s)")
+        return
+
+    stats = llm_cache.stats()
+    if json_output:
+        print(
+            json_mod.dumps(
+                {
+                    "enabled": llm_cache.enabled(),
+                    "entries": stats.entries,
+                    "size_bytes": stats.size_bytes,
+                    "hits": stats.total_hits,
+                }
+            )
+        )
+    else:
+        state = "enabled" if llm_cache.enabled() else f"disabled ({llm_cache.CACHE_ENV_VAR}=0)"
+        print(
+            f"LLM response cache {state}: {stats.entries} response(s), "
+            f"{stats.size_bytes / 1024:.1f}KB, served {stats.total_hits} hit(s)"
+        )
+
+
+app.command(name="llm-cache")(llm_cache_command)
+
 # Register index/link commands from maintain_index as direct subcommands
 from emdx.commands.maintain_index import (  # noqa: E402
     create_links,
@@ -11,7 +11,7 @@ import json
 import logging
 
 import typer
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 
 from ..utils.output import console, is_non_interactive
 
@@ -24,14 +24,20 @@ def index_embeddings(
     chunks: bool = typer.Option(True, "--chunks/--no-chunks", help="Also build chunk-level index"),
     stats_only: bool = typer.Option(False, "--stats", help="Show index stats only"),
     clear: bool = typer.Option(False, "--clear", help="Clear the embedding index"),
+    storage: str | None = typer.Option(
+        None,
+        "--storage",
+        help="Vector storage format: float32 (default), float16, or int8 (~4x smaller scans)",
+    ),
 ) -> None:
     """Build, update, or manage the semantic search index.
 
     Examples:
-        emdx maintain index              # Index new documents
+        emdx maintain index              # Index new and edited documents
         emdx maintain index --force      # Reindex everything
         emdx maintain index --stats      # Show index statistics
         emdx maintain index --clear      # Clear all embeddings
+        emdx maintain index --storage int8  # Quantize stored vectors
     """
     from rich.panel import Panel
     from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -53,6 +59,16 @@ def index_embeddings(
         console.print(f"[green]Cleared {count} embeddings[/green]")
         return
 
+    if storage is not None:
+        try:
+            converted = service.set_storage_format(storage)
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            raise typer.Exit(1) from None
+        console.print(f"[green]Storing vectors as {storage} ({converted} re-encoded)[/green]")
+        if converted:
+            console.print("[dim]Run 'emdx maintain compact' to reclaim the freed space[/dim]")
+
     idx_stats = service.stats()
 
     if stats_only:
@@ -87,34 +103,45 @@ def index_embeddings(
     )
     console.print(f"[dim]Chunk index: {idx_stats.indexed_chunks} chunks[/dim]")
 
-    needs_doc_index = idx_stats.indexed_documents < idx_stats.total_documents or force
-    needs_chunk_index = chunks and (idx_stats.indexed_chunks == 0 or force)
-
-    if not needs_doc_index and not needs_chunk_index:
-        console.print("[green]Index is already up to date![/green]")
-        return
-
-    if needs_doc_index:
+    # Both passes are incremental: only new or edited documents and changed
+    # chunks (by content hash) are re-embedded unless --force is given
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        task = progress.add_task("Indexing documents...", total=None)
+        doc_count = service.index_all(force=force, batch_size=batch_size)
+        progress.update(task, completed=True)
+
+    chunk_count = 0
+    if chunks:
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("{task.completed}/{task.total} documents"),
             console=console,
         ) as progress:
-            task = progress.add_task("Indexing documents...", total=None)
-            doc_count = service.index_all(force=force, batch_size=batch_size)
-            progress.update(task, completed=True)
+            task = progress.add_task("Indexing chunks...", total=None)
+            chunk_count = service.index_chunks(
+                force=force,
+                batch_size=batch_size,
+                progress_callback=lambda done, total: progress.update(
+                    task, completed=done, total=total
+                ),
+            )
+
+    if doc_count == 0 and chunk_count == 0:
+        console.print("[green]Index is already up to date![/green]")
+    else:
         console.print(f"[green]Indexed {doc_count} documents[/green]")
+        if chunks:
+            console.print(f"[green]Indexed {chunk_count} chunks[/green]")
 
-    if needs_chunk_index:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Indexing chunks...", total=None)
-            chunk_count = service.index_chunks(force=force, batch_size=batch_size)
-            progress.update(task, completed=True)
-        console.print(f"[green]Indexed {chunk_count} chunks[/green]")
+    # Prebuild the search matrices (and the chunk ANN index once the corpus is
+    # large enough) so the next semantic query memory-maps them
+    service.warm_search_index(force=force)
 
 
 def create_links(
@@ -317,6 +344,11 @@ def entities_command(
         "--model",
         help="LLM model: haiku (default), sonnet, opus, or full model ID",
     ),
+    no_llm_cache: bool = typer.Option(
+        False,
+        "--no-llm-cache",
+        help="With --llm, call the LLM even for documents with a cached response",
+    ),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
 ) -> None:
     """Extract entities from documents and create entity-match links.
@@ -328,6 +360,7 @@ def entities_command(
 
     Use --llm for Claude-powered extraction with richer entity types
     (person, organization, technology, etc.) and relationship discovery.
+    LLM responses are cached, so unchanged documents re-extract for free.
 
     Examples:
         emdx maintain entities 42              # Extract + link one doc
@@ -340,6 +373,9 @@ def entities_command(
         emdx maintain entities --all --llm     # LLM extraction (all docs)
         emdx maintain entities --llm --model sonnet  # Use Sonnet model
     """
+    from contextlib import nullcontext
+
+    from ..services import llm_cache
     from ..services.entity_service import (
         cleanup_noisy_entities,
         entity_match_wikify,
@@ -349,12 +385,13 @@ def entities_command(
 
     # LLM extraction branch -- separate path from heuristic extraction
     if llm:
-        _entities_llm(
-            doc_id=doc_id,
-            all_docs=all_docs,
-            model=model,
-            json_output=json_output,
-        )
+        with llm_cache.bypass() if no_llm_cache else nullcontext():
+            _entities_llm(
+                doc_id=doc_id,
+                all_docs=all_docs,
+                model=model,
+                json_output=json_output,
+            )
         return
 
     if cleanup:
@@ -9,6 +9,12 @@ Protocol:
   Response: {"id": 1, "result": [...]}
   Error:    {"id": 1, "error": {"code": -1, "message": "..."}}
 
+find.search and find.by_tags return a plain list unless the params carry
+"cursor" or "page_size"; then, like find.all, they return one keyset page:
+{"results": [...], "next_cursor": "..." | null}. With "facets": true they
+always return an object whose "facets" key counts every match per project,
+tag and doc_type.
+
 Start with: emdx serve
 """
 
@@ -25,12 +31,15 @@ from emdx.database import db
 from emdx.database.documents import (
     get_document,
     get_recent_documents,
+    list_documents_page,
     save_document,
 )
-from emdx.database.search import search_documents
+from emdx.database.pagination import Page
+from emdx.database.search import search_documents, search_documents_page, search_facets
 from emdx.models.tags import (
     list_all_tags,
     search_by_tags,
+    search_by_tags_page,
 )
 from emdx.models.tasks import (
     get_task_log,
@@ -58,21 +67,80 @@ def _find_recent(params: dict[str, Any]) -> list[dict[str, Any]]:
     return [r.to_dict() for r in rows]
 
 
-def _find_search(params: dict[str, Any]) -> list[dict[str, Any]]:
+def _is_paged(params: dict[str, Any]) -> bool:
+    """Whether the caller asked for a cursor page instead of a plain list."""
+    return "cursor" in params or "page_size" in params
+
+
+def _page_size(params: dict[str, Any]) -> int:
+    """The requested page size, defaulting to 100.
+
+    Raises:
+        ValueError: If "page_size" is not an integer of at least 1.
+    """
+    page_size = params.get("page_size", 100)
+    if isinstance(page_size, bool) or not isinstance(page_size, int) or page_size < 1:
+        raise ValueError(f"page_size must be an integer of at least 1, got {page_size!r}")
+    return page_size
+
+
+def _page_result(page: Page[Any]) -> dict[str, Any]:
+    return {
+        "results": [r if isinstance(r, dict) else r.to_dict() for r in page.items],
+        "next_cursor": page.next_cursor,
+    }
+
+
+def _with_facets(
+    result: list[dict[str, Any]] | dict[str, Any], params: dict[str, Any], **facet_filters: Any
+) -> list[dict[str, Any]] | dict[str, Any]:
+    """Attach match-set facet counts when the caller passed "facets": true."""
+    if not params.get("facets"):
+        return result
+    wrapped: dict[str, Any] = result if isinstance(result, dict) else {"results": result}
+    wrapped["facets"] = search_facets(**facet_filters).to_dict()
+    return wrapped
+
+
+def _find_search(params: dict[str, Any]) -> list[dict[str, Any]] | dict[str, Any]:
     query = params["query"]
-    limit = params.get("limit", 10)
-    rows = search_documents(query, limit=limit)
-    return [r.to_dict() for r in rows]
+    result: list[dict[str, Any]] | dict[str, Any]
+    if _is_paged(params):
+        page = search_documents_page(
+            query, page_size=_page_size(params), cursor=params.get("cursor")
+        )
+        result = _page_result(page)
+    else:
+        limit = params.get("limit", 10)
+        result = [r.to_dict() for r in search_documents(query, limit=limit)]
+    return _with_facets(result, params, query=query)
 
 
-def _find_by_tags(params: dict[str, Any]) -> list[dict[str, Any]]:
+def _find_by_tags(params: dict[str, Any]) -> list[dict[str, Any]] | dict[str, Any]:
     tags = params["tags"]
     if isinstance(tags, str):
         tags = [t.strip() for t in tags.split(",")]
     mode = params.get("mode", "all")
-    limit = params.get("limit", 20)
-    rows = search_by_tags(tags, mode=mode, limit=limit)
-    return [dict(r) for r in rows]
+    result: list[dict[str, Any]] | dict[str, Any]
+    if _is_paged(params):
+        page = search_by_tags_page(
+            tags, mode=mode, page_size=_page_size(params), cursor=params.get("cursor")
+        )
+        result = _page_result(page)
+    else:
+        limit = params.get("limit", 20)
+        result = [dict(r) for r in search_by_tags(tags, mode=mode, limit=limit)]
+    return _with_facets(result, params, query="*", doc_type=None, tags=tags, tag_mode=mode)
+
+
+def _find_all(params: dict[str, Any]) -> dict[str, Any]:
+    page = list_documents_page(
+        project=params.get("project"),
+        page_size=_page_size(params),
+        cursor=params.get("cursor"),
+        doc_type=None,
+    )
+    return _page_result(page)
 
 
 def _view_document(params: dict[str, Any]) -> dict[str, Any] | None:
@@ -164,6 +232,7 @@ METHODS: dict[str, Any] = {
     "find.recent": _find_recent,
     "find.search": _find_search,
     "find.by_tags": _find_by_tags,
+    "find.all": _find_all,
     "view": _view_document,
     "save": _save_document,
     "tag.list": _tag_list,
@@ -566,6 +566,12 @@ def wiki_generate(
     concurrency: int = typer.Option(
         1, "--concurrency", "-c", help="Max concurrent generations (default: 1 = sequential)"
     ),
+    resume: int | None = typer.Option(
+        None, "--resume", help="Finish an interrupted run (see 'wiki runs')"
+    ),
+    no_llm_cache: bool = typer.Option(
+        False, "--no-llm-cache", help="Call the LLM even for prompts with a cached response"
+    ),
 ) -> None:
     """Generate wiki articles from topic clusters.
 
@@ -573,179 +579,155 @@ def wiki_generate(
     memory-efficient streaming.  Use -c N to allow N concurrent
     generations.
 
+    Each run checkpoints its topics, so an interrupted run can be
+    finished with --resume RUN_ID (failed topics are retried). An --all
+    run started while another one with the same model and audience is
+    in progress joins it, and the two split the remaining topics.
+
+    LLM responses are cached, so re-running after an interruption only
+    pays for topics whose sources or prompts changed. --no-llm-cache
+    forces fresh calls (and refreshes the cache).
+
     Examples:
         emdx maintain wiki generate --dry-run        # Estimate costs
         emdx maintain wiki generate 5                # Generate for topic 5
         emdx maintain wiki generate --all -l 50      # Generate up to 50
         emdx maintain wiki generate --all -c 3       # 3 concurrent
         emdx maintain wiki generate --audience me    # Personal wiki mode
+        emdx maintain wiki generate --resume 12      # Finish run 12
     """
     import time as _time
+    from contextlib import nullcontext
 
+    from ..services import llm_cache
     from ..services.wiki_clustering_service import get_topics as _get_topics
     from ..services.wiki_synthesis_service import (
-        complete_wiki_run,
+        WikiArticleResult,
         create_wiki_run,
-        generate_article,
+        find_active_wiki_run,
+        get_wiki_run,
+        llm_concurrency,
+        process_wiki_run,
+        reopen_wiki_run,
     )
 
-    if not all_topics and topic_id is None:
-        if dry_run:
-            # --dry-run without --all or topic ID: default to all topics
-            all_topics = True
-        else:
-            console.print("[red]Provide a topic ID or use --all[/red]")
-            raise typer.Exit(1)
-
     if concurrency < 1:
         console.print("[red]--concurrency must be >= 1[/red]")
         raise typer.Exit(1)
 
-    # Build topic list
-    topic_list: list[int]
-    if topic_id is not None:
-        topic_list = [topic_id]
+    run_id: int | None = None
+    if resume is not None:
+        run = reopen_wiki_run(resume)
+        if run is None:
+            console.print(f"[red]Wiki run {resume} not found[/red]")
+            raise typer.Exit(1)
+        run_id = resume
+        audience = str(run["audience"])
+        model = str(run["model"]) or None
+        dry_run = bool(run["dry_run"])
+        console.print(
+            f"[dim]Resuming run #{run_id}: {run['done']} done, "
+            f"{cast(int, run['pending']) + cast(int, run['in_flight'])} left[/dim]"
+        )
     else:
-        topics_data = _get_topics()
-        topic_list = [cast(int, t["id"]) for t in topics_data]
+        if not all_topics and topic_id is None:
+            if dry_run:
+                # --dry-run without --all or topic ID: default to all topics
+                all_topics = True
+            else:
+                console.print("[red]Provide a topic ID or use --all[/red]")
+                raise typer.Exit(1)
 
-    # Apply limit to topic list upfront to avoid over-fetching
-    effective_topics = topic_list[:limit]
+        run_model = model or DEFAULT_LLM_MODEL
+        if topic_id is None and not dry_run:
+            run_id = find_active_wiki_run(run_model, audience)
+            if run_id is not None:
+                console.print(f"[dim]Joining run #{run_id} in progress elsewhere[/dim]")
+
+        if run_id is None:
+            # Build topic list
+            topic_list: list[int]
+            if topic_id is not None:
+                topic_list = [topic_id]
+            else:
+                topics_data = _get_topics()
+                topic_list = [cast(int, t["id"]) for t in topics_data]
 
-    # Create a run record
-    run_model = model or DEFAULT_LLM_MODEL
-    run_id = create_wiki_run(model=run_model, dry_run=dry_run)
+            # Apply limit to topic list upfront to avoid over-fetching
+            run_id = create_wiki_run(
+                model=run_model,
+                dry_run=dry_run,
+                topic_ids=topic_list[:limit],
+                audience=audience,
+            )
 
-    generated = 0
-    skipped = 0
-    total_input = 0
-    total_output = 0
-    total_cost = 0.0
-    topics_attempted = 0
-    total_count = len(effective_topics)
+    progress = get_wiki_run(run_id) or {}
+    total_count = cast(int, progress.get("pending", 0)) + cast(int, progress.get("in_flight", 0))
+    completed_count = 0
     batch_start = _time.time()
 
-    if concurrency == 1:
-        # Sequential processing — memory-efficient, streaming progress
-        for i, tid in enumerate(effective_topics):
-            topics_attempted += 1
-            start = _time.time()
-
-            result = generate_article(
-                topic_id=tid,
-                audience=audience,
-                model=model,
-                dry_run=dry_run,
+    def _report(
+        tid: int, result: WikiArticleResult | None, error: str | None, elapsed: float
+    ) -> None:
+        nonlocal completed_count
+        completed_count += 1
+        label = f"[{completed_count}/{total_count}]"
+
+        if result is None:
+            console.print(f"  {label} [red]Failed: topic {tid}[/red] — {error} ({elapsed:.1f}s)")
+        elif result.skipped and result.skip_reason != "dry run":
+            console.print(
+                f"  {label} [dim]Skipped: {result.topic_label or f'topic {tid}'}"
+                f" — {result.skip_reason} ({elapsed:.1f}s)[/dim]"
             )
-            elapsed = _time.time() - start
-
-            label = f"[{i + 1}/{total_count}]"
-            if result.skipped and result.skip_reason != "dry run":
-                skipped += 1
+        else:
+            if dry_run:
                 console.print(
-                    f"  {label} [dim]Skipped: {result.topic_label or f'topic {tid}'}"
-                    f" — {result.skip_reason} ({elapsed:.1f}s)[/dim]"
+                    f"  {label} [cyan]Would generate:[/cyan] "
+                    f"{result.topic_label[:50]} "
+                    f"(~${result.cost_usd:.2f})"
                 )
             else:
-                generated += 1
-                if dry_run:
-                    console.print(
-                        f"  {label} [cyan]Would generate:[/cyan] "
-                        f"{result.topic_label[:50]} "
-                        f"(~${result.cost_usd:.2f})"
-                    )
-                else:
-                    console.print(
-                        f"  {label} [green]Generated:[/green] "
-                        f"{result.topic_label[:50]} "
-                        f"({elapsed:.0f}s, ${result.cost_usd:.2f})"
-                    )
-                if result.warnings:
-                    for w in result.warnings:
-                        console.print(f"         [yellow]⚠ {w}[/yellow]")
-
-            total_input += result.input_tokens
-            total_output += result.output_tokens
-            total_cost += result.cost_usd
-    else:
-        # Concurrent processing with ThreadPoolExecutor
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        from ..services.wiki_synthesis_service import WikiArticleResult
-
-        # Track order of completion for progress labeling
-        completed_count = 0
-
-        def _gen_one(tid: int) -> tuple[int, WikiArticleResult, float]:
-            t0 = _time.time()
-            res = generate_article(
-                topic_id=tid,
-                audience=audience,
-                model=model,
-                dry_run=dry_run,
-            )
-            return tid, res, _time.time() - t0
-
-        with ThreadPoolExecutor(max_workers=concurrency) as pool:
-            futures = {pool.submit(_gen_one, tid): tid for tid in effective_topics}
-            topics_attempted = len(futures)
-
-            for future in as_completed(futures):
-                _tid, result, elapsed = future.result()
-                completed_count += 1
-                label = f"[{completed_count}/{total_count}]"
-
-                if result.skipped and result.skip_reason != "dry run":
-                    skipped += 1
-                    console.print(
-                        f"  {label} [dim]Skipped: "
-                        f"{result.topic_label or f'topic {_tid}'}"
-                        f" — {result.skip_reason} ({elapsed:.1f}s)[/dim]"
-                    )
-                else:
-                    generated += 1
-                    if dry_run:
-                        console.print(
-                            f"  {label} [cyan]Would generate:[/cyan] "
-                            f"{result.topic_label[:50]} "
-                            f"(~${result.cost_usd:.2f})"
-                        )
-                    else:
-                        console.print(
-                            f"  {label} [green]Generated:[/green] "
-                            f"{result.topic_label[:50]} "
-                            f"({elapsed:.0f}s, ${result.cost_usd:.2f})"
-                        )
-                    if result.warnings:
-                        for w in result.warnings:
-                            console.print(f"         [yellow]⚠ {w}[/yellow]")
-
-                total_input += result.input_tokens
-                total_output += result.output_tokens
-                total_cost += result.cost_usd
-
-    # Update run record with results
-    complete_wiki_run(
-        run_id,
-        topics_attempted=topics_attempted,
-        articles_generated=generated,
-        articles_skipped=skipped,
-        total_input_tokens=total_input,
-        total_output_tokens=total_output,
-        total_cost_usd=total_cost,
-    )
+                console.print(
+                    f"  {label} [green]Generated:[/green] "
+                    f"{result.topic_label[:50]} "
+                    f"({elapsed:.0f}s, ${result.cost_usd:.2f})"
+                )
+            if result.warnings:
+                for w in result.warnings:
+                    console.print(f"         [yellow]⚠ {w}[/yellow]")
+
+    # Article generations and their chunk summaries share one LLM call limit
+    with llm_concurrency(concurrency), llm_cache.bypass() if no_llm_cache else nullcontext():
+        batch = process_wiki_run(
+            run_id,
+            audience=audience,
+            model=model,
+            dry_run=dry_run,
+            concurrency=concurrency,
+            on_result=_report,
+        )
 
     total_elapsed = _time.time() - batch_start
     action = "Estimated" if dry_run else "Generated"
     mode = f" (concurrency={concurrency})" if concurrency > 1 else ""
     console.print(
-        f"\n[bold]{action} {generated} article(s)[/bold] "
-        f"(skipped {skipped}) in {total_elapsed:.1f}s{mode}\n"
-        f"  Total tokens: {total_input:,} in / {total_output:,} out\n"
-        f"  Total cost:   ${total_cost:.4f}\n"
+        f"\n[bold]{action} {batch.articles_generated} article(s)[/bold] "
+        f"(skipped {batch.articles_skipped}) in {total_elapsed:.1f}s{mode}\n"
+        f"  Total tokens: {batch.total_input_tokens:,} in / {batch.total_output_tokens:,} out\n"
+        f"  Total cost:   ${batch.total_cost_usd:.4f}\n"
         f"  Run ID:       {run_id}"
     )
 
+    final = get_wiki_run(run_id) or {}
+    if batch.articles_failed or final.get("pending") or final.get("in_flight"):
+        console.print(
+            f"  [yellow]{batch.articles_failed} failed, "
+            f"{cast(int, final.get('pending', 0)) + cast(int, final.get('in_flight', 0))} "
+            f"still pending or in progress[/yellow] — "
+            f"finish with: emdx wiki generate --resume {run_id}"
+        )
+
     if dry_run:
         console.print("\n[dim]Remove --dry-run to actually generate articles[/dim]")
 
@@ -913,6 +895,9 @@ def wiki_runs_command(
 ) -> None:
     """List recent wiki generation runs.
 
+    Topics shows attempted/total: red when some failed, yellow while the
+    run is unfinished (finish it with 'wiki generate --resume ID').
+
     Examples:
         emdx maintain wiki runs              # Recent runs
         emdx maintain wiki runs -l 20        # More history
@@ -930,6 +915,7 @@ def wiki_runs_command(
     table = Table(title="Wiki Generation Runs", box=box.SIMPLE)
     table.add_column("ID", style="dim", width=4)
     table.add_column("Date", style="cyan")
+    table.add_column("Topics", justify="right")
     table.add_column("Articles", justify="right")
     table.add_column("Skipped", justify="right", style="dim")
     table.add_column("Tokens (in/out)", justify="right")
@@ -945,9 +931,19 @@ def wiki_runs_command(
             parts = model_short.split("-")
             model_short = "-".join(parts[1:3]) if len(parts) > 2 else parts[-1]
         tokens = f"{run['total_input_tokens']:,}/{run['total_output_tokens']:,}"
+        # Attempted/total topics: red with failures, yellow while unfinished
+        # (runs recorded before topic checkpoints have no total)
+        topics = str(run["topics_attempted"])
+        if run["topics_total"]:
+            topics = f"{topics}/{run['topics_total']}"
+            if run["topics_failed"]:
+                topics = f"[red]{topics}[/red]"
+            elif not run["completed_at"]:
+                topics = f"[yellow]{topics}[/yellow]"
         table.add_row(
             str(run["id"]),
             started,
+            topics,
             str(run["articles_generated"]),
             str(run["articles_skipped"]),
             tokens,
@@ -35,6 +35,41 @@ DEFAULT_MAX_SUGGESTIONS = 5  # Max suggestions for auto-tagging, recommendations
 
 DEFAULT_TAGGING_CONFIDENCE = 0.75  # Default confidence for auto-tagging
 
+# =============================================================================
+# SEMANTIC SEARCH
+# =============================================================================
+
+# Chunk search switches from exact brute force to the IVF index at this size
+ANN_MIN_CHUNKS = 20000
+# Inverted lists probed per query; higher = better recall, slower.
+# Override with EMDX_ANN_NPROBE (0 forces exact search).
+ANN_DEFAULT_NPROBE = 12
+# Seconds the opt-in embedding daemon (EMDX_EMBED_DAEMON=1) keeps the model
+# resident without requests. Override with EMDX_EMBED_DAEMON_IDLE.
+EMBED_DAEMON_IDLE_TIMEOUT = 900
+# Query embeddings kept in the on-disk LRU cache (~1.5 KB each)
+QUERY_EMBEDDING_CACHE_SIZE = 2000
+# Neighbours per document in the persisted kNN graph (auto-link, contradictions)
+KNN_GRAPH_K = 10
+# Hybrid search runs its keyword and semantic legs concurrently; a leg still
+# running this many seconds after the search started is dropped and the
+# result is marked degraded. The semantic budget covers a cold model load.
+HYBRID_KEYWORD_BUDGET = 2.0
+HYBRID_SEMANTIC_BUDGET = 8.0
+# find/ask result sets kept in the on-disk LRU cache; entries go stale on
+# the next KB write
+SEARCH_RESULT_CACHE_SIZE = 500
+# FTS5 snippets kept per (query, document); the oldest go first, and a
+# document's are dropped when its content changes. Only documents of at
+# least SEARCH_SNIPPET_CACHE_MIN_CHARS are cached: below that, snippet()
+# is cheaper than the cache write
+SEARCH_SNIPPET_CACHE_SIZE = 5000
+SEARCH_SNIPPET_CACHE_MIN_CHARS = 20_000
+# LLM responses (wiki synthesis, topic labels, entity extraction) kept in the
+# on-disk cache: least recently used beyond the size, unused past the age
+LLM_CACHE_SIZE = 5000
+LLM_CACHE_MAX_AGE_DAYS = 90
+
 # =============================================================================
 # TASK & PRIORITY DEFAULTS
 # =============================================================================
@@ -1,8 +1,18 @@
 """
 Database connection management for emdx
+
+Connections are pooled per thread and per database file. Opening a SQLite
+connection, applying pragmas and warming the statement cache costs far more
+than the queries most commands run, and a single ``emdx find`` or
+``emdx context`` call goes through ``get_connection()`` dozens of times.
+
+Pooled connections run in WAL mode so readers (the TUI refresh loop) never
+block writers (agents saving documents) and vice versa.
 """
 
+import os
 import sqlite3
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
 from datetime import datetime
@@ -11,6 +21,170 @@ from pathlib import Path
 from ..config.settings import get_db_path
 from . import migrations
 
+# Pragmas applied once when a pooled connection is opened. journal_mode is
+# persistent in the file itself; the others are per-connection.
+CONNECTION_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA synchronous = NORMAL",  # Durable in WAL mode, avoids fsync per commit
+    "PRAGMA cache_size = -16000",  # 16 MB page cache (negative = KiB)
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",  # 256 MB memory-mapped reads
+)
+
+# Prepared statements kept per connection. The sqlite3 default is 128; emdx
+# issues a few hundred distinct statements across commands.
+STATEMENT_CACHE_SIZE = 256
+
+# Idle connections kept per thread. Nested get_connection() calls need one
+# connection per nesting level; deeper nesting than this is rare.
+MAX_IDLE_PER_THREAD = 4
+
+# Registered once at import instead of on every get_connection() call
+sqlite3.register_adapter(datetime, lambda dt: dt.isoformat())
+sqlite3.register_converter("timestamp", lambda b: datetime.fromisoformat(b.decode()))
+
+
+def _file_identity(db_path: Path) -> tuple[int, int] | None:
+    """Return (device, inode) for the database file, or None if it is missing."""
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def _open_connection(db_path: Path | str) -> sqlite3.Connection:
+    """Open and configure a new connection."""
+    conn = sqlite3.connect(
+        db_path,
+        detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
+    conn.row_factory = sqlite3.Row  # Enable column access by name
+    return conn
+
+
+class ConnectionPool:
+    """Per-thread pool of idle connections to a single database file.
+
+    Each thread keeps a small stack of idle connections. A checkout pops one
+    (or opens a new one); a release rolls back any uncommitted transaction and
+    pushes it back. Nested checkouts in the same thread get distinct
+    connections, which keeps the isolation the un-pooled code relied on.
+
+    Pooled connections are discarded when the file they were opened against
+    is replaced (backup restore, tests swapping files) or after a fork.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._pid = os.getpid()
+
+    def _idle(self) -> list[tuple[sqlite3.Connection, tuple[int, int]]]:
+        idle: list[tuple[sqlite3.Connection, tuple[int, int]]] | None = getattr(
+            self._local, "idle", None
+        )
+        if idle is None:
+            idle = []
+            self._local.idle = idle
+        return idle
+
+    def _checked_out(self) -> dict[int, tuple[int, int] | None]:
+        checked_out: dict[int, tuple[int, int] | None] | None = getattr(
+            self._local, "checked_out", None
+        )
+        if checked_out is None:
+            checked_out = {}
+            self._local.checked_out = checked_out
+        return checked_out
+
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a connection for the current thread."""
+        if os.getpid() != self._pid:
+            # Connections must not cross a fork; start over in the child
+            self._local = threading.local()
+            self._pid = os.getpid()
+
+        identity = _file_identity(self.db_path)
+        idle = self._idle()
+        while idle:
+            conn, conn_identity = idle.pop()
+            if identity is not None and conn_identity == identity:
+                self._checked_out()[id(conn)] = conn_identity
+                return conn
+            conn.close()
+
+        conn = _open_connection(self.db_path)
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+        except sqlite3.OperationalError:
+            pass  # Another process holds a lock; keep the current journal mode
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        # Identity of the file this connection actually opened (it may have
+        # just been created)
+        self._checked_out()[id(conn)] = _file_identity(self.db_path)
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the current thread's idle stack."""
+        identity = self._checked_out().pop(id(conn), None)
+        try:
+            if conn.in_transaction:
+                # Closing used to discard uncommitted work; keep that behaviour
+                conn.rollback()
+        except sqlite3.Error:
+            conn.close()
+            return
+
+        idle = self._idle()
+        if len(idle) >= MAX_IDLE_PER_THREAD or identity is None:
+            conn.close()
+            return
+        idle.append((conn, identity))
+
+    def close_thread_connections(self) -> None:
+        """Close the current thread's idle connections."""
+        idle = self._idle()
+        while idle:
+            conn, _ = idle.pop()
+            conn.close()
+
+
+_pools: dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: Path) -> ConnectionPool:
+    """Get (or create) the shared pool for a database file."""
+    key = str(db_path)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = ConnectionPool(db_path)
+                _pools[key] = pool
+    return pool
+
+
+def close_pooled_connections(db_path: Path | None = None) -> None:
+    """Close idle pooled connections in the current thread.
+
+    Call before replacing or deleting the database file so that no stale
+    WAL or shared-memory state survives the swap. With no path, every pool
+    is drained.
+    """
+    with _pools_lock:
+        if db_path is None:
+            pools = list(_pools.values())
+        else:
+            pool = _pools.get(str(db_path))
+            pools = [pool] if pool is not None else []
+    for pool in pools:
+        pool.close_thread_connections()
+
 
 class DatabaseConnection:
     """SQLite database connection manager for emdx"""
@@ -23,30 +197,43 @@ class DatabaseConnection:
 
     @contextmanager
     def get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Get a database connection with context manager"""
-        conn = sqlite3.connect(
-            self.db_path, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
-        )
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-
-        # Enable foreign key constraints for this connection
-        conn.execute("PRAGMA foreign_keys = ON")
+        """Get a pooled database connection with context manager.
 
-        # Register datetime adapter
-        sqlite3.register_adapter(datetime, lambda dt: dt.isoformat())
-        sqlite3.register_converter("timestamp", lambda b: datetime.fromisoformat(b.decode()))
+        Uncommitted changes are rolled back when the block exits, exactly as
+        if the connection had been closed. In-memory databases are never
+        pooled since each connection is its own database.
+        """
+        if str(self.db_path) == ":memory:":
+            conn = _open_connection(self.db_path)
+            conn.execute("PRAGMA foreign_keys = ON")
+            try:
+                yield conn
+            finally:
+                conn.close()
+            return
 
+        pool = get_pool(self.db_path)
+        conn = pool.acquire()
         try:
             yield conn
         finally:
-            conn.close()
+            pool.release(conn)
+
+    def close(self) -> None:
+        """Close this thread's idle pooled connections to the database."""
+        close_pooled_connections(self.db_path)
 
     def ensure_schema(self) -> None:
         """Ensure the database schema is up to date.
 
-        All schema creation is handled by the migrations system.
-        This method simply runs any pending migrations.
+        All schema creation is handled by the migrations system. When the
+        database's stored schema fingerprint matches this build, migration
+        discovery is skipped entirely; otherwise pending migrations are run.
         """
+        if str(self.db_path) != ":memory:" and Path(self.db_path).exists():
+            with self.get_connection() as conn:
+                if migrations.schema_is_current(conn):
+                    return
         migrations.run_migrations(self.db_path)
 
 
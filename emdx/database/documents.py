@@ -8,8 +8,10 @@ import logging
 import sqlite3
 from typing import Union, cast
 
-from ..models.document import Document
+from ..models.document import Document, DocumentSummary
 from .connection import db_connection
+from .pagination import Page, decode_cursor, page_from_rows
+from .standing_queries import percolate_pending
 from .types import (
     DatabaseStats,
     MostViewedDoc,
@@ -48,6 +50,7 @@ def save_document(
         # Get lastrowid before commit (required by SQLite)
         doc_id = cursor.lastrowid
         assert doc_id is not None
+        _record_word_count(conn, doc_id, content)
 
         # Add tags if provided - pass connection for atomic transaction
         if tags:
@@ -58,6 +61,9 @@ def save_document(
         # Commit after both document and tags are inserted (atomic transaction)
         conn.commit()
 
+    # Match the new document against standing queries (find --watch)
+    percolate_pending()
+
     # Record 'create' event (non-critical, best-effort)
     # Must be outside the connection context to avoid opening a second
     # connection while the first is still active (causes FTS5 corruption
@@ -125,6 +131,7 @@ def list_documents(
     parent_id: int | None = None,
     offset: int = 0,
     doc_type: str | None = "user",
+    before_id: int | None = None,
 ) -> list[Document]:
     """List documents with optional project and hierarchy filters.
 
@@ -137,6 +144,7 @@ def list_documents(
             - int > 0: Only children of specific parent
         offset: Starting offset for pagination (must be non-negative)
         doc_type: Filter by document type. 'user' (default), 'wiki', or None for all types.
+        before_id: Only documents with a smaller id (keyset pagination)
 
     Returns:
         List of Document objects
@@ -172,6 +180,10 @@ def list_documents(
             conditions.append("project = ?")
             params.append(project)
 
+        if before_id is not None:
+            conditions.append("id < ?")
+            params.append(before_id)
+
         where_clause = " AND ".join(conditions)
         params.extend([limit, offset])
 
@@ -190,6 +202,29 @@ def list_documents(
         return [Document.from_partial_row(row) for row in cursor.fetchall()]
 
 
+def list_documents_page(
+    project: str | None = None,
+    page_size: int = 100,
+    cursor: str | None = None,
+    parent_id: int | None = None,
+    doc_type: str | None = "user",
+) -> Page[Document]:
+    """One page of ``list_documents`` (newest first), continuing from ``cursor``.
+
+    Raises:
+        ValueError: If ``cursor`` is not a cursor from a document listing.
+    """
+    before_id = int(decode_cursor(cursor, 1)[0]) if cursor is not None else None
+    docs = list_documents(
+        project=project,
+        limit=page_size + 1,
+        parent_id=parent_id,
+        doc_type=doc_type,
+        before_id=before_id,
+    )
+    return page_from_rows(docs, page_size, lambda doc: (doc.id,))
+
+
 def count_documents(
     project: str | None = None,
     parent_id: int | None = None,
@@ -276,10 +311,14 @@ def update_document(doc_id: int, title: str, content: str) -> bool:
         """,
             (title, content, doc_id),
         )
+        _record_word_count(conn, doc_id, content)
 
         conn.commit()
         updated = cursor.rowcount > 0
 
+    if updated:
+        percolate_pending()
+
     # Record 'update' event (non-critical, best-effort)
     if updated:
         from emdx.models.events import record_event
@@ -749,10 +788,76 @@ def get_children(doc_id: int) -> list[Document]:
         return [Document.from_partial_row(row) for row in cursor.fetchall()]
 
 
+def _record_word_count(conn: sqlite3.Connection, doc_id: int, content: str) -> None:
+    """Store ``content``'s word count; the stats triggers handle the rest."""
+    conn.execute(
+        "UPDATE document_stats SET word_count = ? WHERE document_id = ?",
+        (len(content.split()), doc_id),
+    )
+
+
+# Listing columns: metadata and sizes from document_stats, never the content
+_SUMMARY_COLUMNS = """
+    d.id, d.title, d.project, d.created_at, d.updated_at, d.accessed_at,
+    d.access_count, d.parent_id, d.relationship, d.archived_at, d.doc_type,
+    s.word_count, s.char_count, s.token_estimate
+"""
+_SUMMARY_FROM = "FROM documents d LEFT JOIN document_stats s ON s.document_id = d.id"
+
+
+def _summaries(conn: sqlite3.Connection, rows: list[sqlite3.Row]) -> list[DocumentSummary]:
+    """Build summaries, recounting any document whose word count is unknown.
+
+    ``word_count`` is NULL after a content change that bypassed
+    ``save_document``/``update_document`` (imports, raw SQL); those few
+    documents are counted here and the counts stored for next time.
+    """
+    summaries = [DocumentSummary.from_row(row) for row in rows]
+    stale = {row["id"] for row in rows if row["word_count"] is None}
+    if not stale:
+        return summaries
+
+    placeholders = ",".join("?" * len(stale))
+    content = dict(
+        conn.execute(
+            f"SELECT id, content FROM documents WHERE id IN ({placeholders})", list(stale)
+        ).fetchall()
+    )
+    counts = []
+    for summary in summaries:
+        if summary.id in stale:
+            text = content.get(summary.id) or ""
+            summary.word_count = len(text.split())
+            summary.char_count = len(text)
+            summary.token_estimate = len(text) // 4
+            counts.append((summary.id, summary.word_count, summary.char_count))
+    try:
+        conn.executemany(
+            "INSERT OR REPLACE INTO document_stats "
+            "(document_id, word_count, char_count, token_estimate) VALUES (?1, ?2, ?3, ?3 / 4)",
+            counts,
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+        logger.debug("Could not store recounted document stats: %s", e)
+    return summaries
+
+
+def get_document_summary(doc_id: int) -> DocumentSummary | None:
+    """Get a document's metadata and size without loading its content."""
+    with db_connection.get_connection() as conn:
+        rows = conn.execute(
+            f"SELECT {_SUMMARY_COLUMNS} {_SUMMARY_FROM} WHERE d.id = ? AND d.is_deleted = FALSE",
+            (doc_id,),
+        ).fetchall()
+        summaries = _summaries(conn, rows)
+        return summaries[0] if summaries else None
+
+
 def list_recent_documents(
     limit: int = 100,
     days: int = 7,
-) -> list[Document]:
+) -> list[DocumentSummary]:
     """Get recent direct-save documents.
 
     Args:
@@ -760,15 +865,15 @@ def list_recent_documents(
         days: Only include documents from the last N days
 
     Returns:
-        List of Document objects
+        List of DocumentSummary objects
     """
     from datetime import datetime, timedelta
 
     cutoff = datetime.now() - timedelta(days=days)
 
     with db_connection.get_connection() as conn:
-        query = """
-            SELECT d.* FROM documents d
+        query = f"""
+            SELECT {_SUMMARY_COLUMNS} {_SUMMARY_FROM}
             WHERE d.parent_id IS NULL
               AND d.is_deleted = FALSE
               AND d.created_at > ?
@@ -777,10 +882,10 @@ def list_recent_documents(
         """
 
         cursor = conn.execute(query, (cutoff.isoformat(), limit))
-        return [Document.from_row(row) for row in cursor.fetchall()]
+        return _summaries(conn, cursor.fetchall())
 
 
-def get_docs_in_window(hours: int, limit: int = 100) -> list[Document]:
+def get_docs_in_window(hours: int, limit: int = 100) -> list[DocumentSummary]:
     """Get documents created within a time window.
 
     Args:
@@ -788,19 +893,17 @@ def get_docs_in_window(hours: int, limit: int = 100) -> list[Document]:
         limit: Maximum number of documents to return
 
     Returns:
-        List of documents created within the window
+        List of summaries of documents created within the window
     """
     with db_connection.get_connection() as conn:
         cursor = conn.execute(
-            """
-            SELECT id, title, project, created_at, access_count,
-                   parent_id, relationship, archived_at, accessed_at
-            FROM documents
-            WHERE is_deleted = 0
-            AND created_at > datetime('now', ? || ' hours')
-            ORDER BY created_at DESC
+            f"""
+            SELECT {_SUMMARY_COLUMNS} {_SUMMARY_FROM}
+            WHERE d.is_deleted = 0
+            AND d.created_at > datetime('now', ? || ' hours')
+            ORDER BY d.created_at DESC
             LIMIT ?
             """,
             (f"-{hours}", limit),
         )
-        return [Document.from_partial_row(row) for row in cursor.fetchall()]
+        return _summaries(conn, cursor.fetchall())
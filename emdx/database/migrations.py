@@ -3,10 +3,12 @@
 # SQL schema definitions contain long lines for readability; breaking them
 # would make the migration scripts harder to understand and maintain.
 
+import hashlib
 import logging
 import sqlite3
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 from ..config.settings import get_db_path
@@ -3102,6 +3104,623 @@ def migration_20260302_160000_add_wiki_quality_index(
     conn.commit()
 
 
+def migration_20261016_090000_add_index_generations(
+    conn: sqlite3.Connection,
+) -> None:
+    """Add index_generations counters maintained by triggers.
+
+    Each row counts writes to one derived-data source. Caches built from
+    that source (e.g. the in-memory embedding matrix) store the generation
+    they were built at and rebuild when it moves. Soft-deleting or restoring
+    a document bumps the embedding counters too, since searches exclude
+    deleted documents.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS index_generations (
+            name TEXT PRIMARY KEY,
+            generation INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    for table in ("document_embeddings", "chunk_embeddings"):
+        cursor.execute(
+            "INSERT OR IGNORE INTO index_generations (name, generation) VALUES (?, 0)",
+            (table,),
+        )
+        for suffix, event in (("ai", "INSERT"), ("au", "UPDATE"), ("ad", "DELETE")):
+            cursor.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_gen_{suffix} AFTER {event} ON {table} BEGIN
+                    UPDATE index_generations SET generation = generation + 1
+                    WHERE name = '{table}';
+                END
+                """
+            )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS documents_embedding_gen_au
+        AFTER UPDATE OF is_deleted ON documents
+        WHEN old.is_deleted IS NOT new.is_deleted BEGIN
+            UPDATE index_generations SET generation = generation + 1
+            WHERE name IN ('document_embeddings', 'chunk_embeddings');
+        END
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS documents_embedding_gen_ad AFTER DELETE ON documents BEGIN
+            UPDATE index_generations SET generation = generation + 1
+            WHERE name IN ('document_embeddings', 'chunk_embeddings');
+        END
+        """
+    )
+    conn.commit()
+
+
+def migration_20261016_100000_add_embedding_content_hash(
+    conn: sqlite3.Connection,
+) -> None:
+    """Record the SHA-256 of the text each embedding was built from.
+
+    ``emdx maintain index`` compares it with the current text to re-embed
+    only documents and chunks that changed. Chunk rows are backfilled from
+    their stored text; document rows only when the embedding is at least as
+    new as the document's last edit, so already-stale vectors stay NULL
+    (and get re-embedded on the next index run).
+    """
+    cursor = conn.cursor()
+    cursor.execute("ALTER TABLE document_embeddings ADD COLUMN content_hash TEXT")
+    cursor.execute("ALTER TABLE chunk_embeddings ADD COLUMN content_hash TEXT")
+
+    rows = cursor.execute(
+        """
+        SELECT e.id, d.title, d.content
+        FROM document_embeddings e
+        JOIN documents d ON e.document_id = d.id
+        WHERE d.updated_at IS NULL
+           OR julianday(e.updated_at) >= julianday(d.updated_at)
+        """
+    ).fetchall()
+    cursor.executemany(
+        "UPDATE document_embeddings SET content_hash = ? WHERE id = ?",
+        [
+            (hashlib.sha256(f"{title}\n\n{content}".encode()).hexdigest(), row_id)
+            for row_id, title, content in rows
+        ],
+    )
+
+    rows = cursor.execute("SELECT id, text FROM chunk_embeddings").fetchall()
+    cursor.executemany(
+        "UPDATE chunk_embeddings SET content_hash = ? WHERE id = ?",
+        [(hashlib.sha256(text.encode()).hexdigest(), row_id) for row_id, text in rows],
+    )
+    conn.commit()
+
+
+def migration_20261016_110000_add_query_embeddings(
+    conn: sqlite3.Connection,
+) -> None:
+    """Add an LRU cache of query embeddings.
+
+    Semantic searches look up the embedding of their (normalized) query
+    text here before running the model; the least recently used rows are
+    evicted once the cache exceeds QUERY_EMBEDDING_CACHE_SIZE entries.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS query_embeddings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            query TEXT NOT NULL,
+            model_name TEXT NOT NULL,
+            embedding BLOB NOT NULL,
+            last_used_at REAL NOT NULL,
+            UNIQUE(query, model_name)
+        )
+        """
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_query_embeddings_last_used "
+        "ON query_embeddings(last_used_at)"
+    )
+    conn.commit()
+
+
+def migration_20261016_120000_add_document_neighbours(
+    conn: sqlite3.Connection,
+) -> None:
+    """Add the persisted k-nearest-neighbour graph over document embeddings.
+
+    Each row is one of a document's top-k most similar documents for a
+    model, either across the whole KB (scope 'all') or within its own
+    project (scope 'project'). The graph is rebuilt when the
+    document_embeddings generation moves; moving a document to another
+    project now bumps that generation too, since it changes the
+    project-scoped neighbours.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS document_neighbours (
+            model_name TEXT NOT NULL,
+            scope TEXT NOT NULL,
+            document_id INTEGER NOT NULL,
+            rank INTEGER NOT NULL,
+            neighbour_id INTEGER NOT NULL,
+            similarity REAL NOT NULL,
+            PRIMARY KEY (model_name, scope, document_id, rank)
+        ) WITHOUT ROWID
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS documents_project_gen_au
+        AFTER UPDATE OF project ON documents
+        WHEN old.project IS NOT new.project BEGIN
+            UPDATE index_generations SET generation = generation + 1
+            WHERE name = 'document_embeddings';
+        END
+        """
+    )
+    conn.commit()
+
+
+def migration_20261016_130000_add_title_trigram_index(
+    conn: sqlite3.Connection,
+) -> None:
+    """Add an FTS5 trigram index over document titles.
+
+    Fuzzy title lookup (command palette, fuzzy search) gets its candidates
+    from this index across the whole KB instead of scanning the most
+    accessed 1000 titles; the fts5vocab table exposes per-trigram document
+    counts. Uses the same external-content delete+insert trigger pattern as
+    documents_fts. The trigram tokenizer needs SQLite
+    3.34+; on older builds the index is skipped and lookups keep scanning.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS documents_title_trigram USING fts5(
+                title, content=documents, content_rowid=id, tokenize='trigram'
+            )
+            """
+        )
+    except sqlite3.OperationalError as e:
+        logging.getLogger(__name__).warning(
+            "SQLite lacks the FTS5 trigram tokenizer; skipping title index: %s", e
+        )
+        return
+    # Per-trigram document counts, used to query only the rarest trigrams
+    cursor.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS documents_title_trigram_vocab
+        USING fts5vocab(documents_title_trigram, row)
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS documents_title_trigram_ai
+        AFTER INSERT ON documents BEGIN
+            INSERT INTO documents_title_trigram(rowid, title) VALUES (new.id, new.title);
+        END
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS documents_title_trigram_au
+        AFTER UPDATE OF title ON documents BEGIN
+            INSERT INTO documents_title_trigram(documents_title_trigram, rowid, title)
+            VALUES ('delete', old.id, old.title);
+            INSERT INTO documents_title_trigram(rowid, title) VALUES (new.id, new.title);
+        END
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS documents_title_trigram_ad
+        AFTER DELETE ON documents BEGIN
+            INSERT INTO documents_title_trigram(documents_title_trigram, rowid, title)
+            VALUES ('delete', old.id, old.title);
+        END
+        """
+    )
+    cursor.execute("INSERT INTO documents_title_trigram(documents_title_trigram) VALUES('rebuild')")
+    conn.commit()
+
+
+def migration_20261016_140000_add_search_result_cache(
+    conn: sqlite3.Connection,
+) -> None:
+    """Add an LRU cache of find/ask result sets and a KB write counter.
+
+    Each cached row is stamped with the ``documents``, ``document_embeddings``
+    and ``chunk_embeddings`` generations it was computed at and is ignored
+    once any of them moves. The new ``documents`` counter is bumped by
+    inserts, deletes, edits of searchable columns (not view counts), and
+    tag changes, since tags are part of results and filters.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS search_result_cache (
+            key TEXT PRIMARY KEY,
+            generations TEXT NOT NULL,
+            results TEXT NOT NULL,
+            last_used_at REAL NOT NULL
+        )
+        """
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_search_result_cache_last_used "
+        "ON search_result_cache(last_used_at)"
+    )
+    cursor.execute(
+        "INSERT OR IGNORE INTO index_generations (name, generation) VALUES ('documents', 0)"
+    )
+    bump = "UPDATE index_generations SET generation = generation + 1 WHERE name = 'documents';"
+    for name, event in (
+        ("documents_gen_ai", "AFTER INSERT ON documents"),
+        (
+            "documents_gen_au",
+            "AFTER UPDATE OF title, content, project, created_at, updated_at, deleted_at, "
+            "is_deleted, parent_id, archived_at, doc_type ON documents",
+        ),
+        ("documents_gen_ad", "AFTER DELETE ON documents"),
+        ("document_tags_gen_ai", "AFTER INSERT ON document_tags"),
+        ("document_tags_gen_ad", "AFTER DELETE ON document_tags"),
+        ("tags_gen_au", "AFTER UPDATE OF name ON tags"),
+    ):
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {event} BEGIN {bump} END")
+    conn.commit()
+
+
+def migration_20261016_150000_add_standing_query_percolation(
+    conn: sqlite3.Connection,
+) -> None:
+    """Match documents against standing queries when they are written.
+
+    ``standing_query_terms`` is an FTS5 index over the standing query text
+    (same tokenizer as ``documents_fts``), so the queries a document could
+    match are found by looking its words up in it rather than by running
+    every query. Triggers queue documents that are saved, edited or tagged
+    while any standing query exists; the queue is drained at save time and
+    hits land in ``standing_query_matches`` until ``find --watch-check``
+    reads them. Documents already due to existing queries are queued so
+    their first check after the upgrade still reports them.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS standing_query_terms USING fts5(
+            query, tokenize='porter unicode61'
+        )
+        """
+    )
+    cursor.execute(
+        """
+        INSERT INTO standing_query_terms (rowid, query)
+        SELECT id, query FROM standing_queries WHERE query != ''
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS standing_query_matches (
+            query_id INTEGER NOT NULL,
+            document_id INTEGER NOT NULL,
+            matched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (query_id, document_id),
+            FOREIGN KEY (query_id) REFERENCES standing_queries(id) ON DELETE CASCADE,
+            FOREIGN KEY (document_id) REFERENCES documents(id) ON DELETE CASCADE
+        )
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS standing_query_queue (
+            document_id INTEGER PRIMARY KEY
+        )
+        """
+    )
+    cursor.execute(
+        """
+        INSERT OR IGNORE INTO standing_query_queue (document_id)
+        SELECT id FROM documents
+        WHERE created_at > (SELECT MIN(last_checked_at) FROM standing_queries)
+        """
+    )
+
+    for name, event, sql in (
+        (
+            "standing_query_terms_ai",
+            "AFTER INSERT ON standing_queries WHEN new.query != ''",
+            "INSERT INTO standing_query_terms (rowid, query) VALUES (new.id, new.query);",
+        ),
+        (
+            "standing_query_terms_ad",
+            "AFTER DELETE ON standing_queries",
+            "DELETE FROM standing_query_terms WHERE rowid = old.id; "
+            # Also without foreign key enforcement (PRAGMA foreign_keys is per connection)
+            "DELETE FROM standing_query_matches WHERE query_id = old.id;",
+        ),
+        (
+            "standing_query_terms_au",
+            "AFTER UPDATE OF query ON standing_queries",
+            "DELETE FROM standing_query_terms WHERE rowid = old.id; "
+            "INSERT INTO standing_query_terms (rowid, query) "
+            "SELECT new.id, new.query WHERE new.query != '';",
+        ),
+    ):
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {event} BEGIN {sql} END")
+
+    enqueue = "INSERT OR IGNORE INTO standing_query_queue (document_id) VALUES ({});"
+    any_queries = "WHEN EXISTS (SELECT 1 FROM standing_queries)"
+    for name, event, doc_id in (
+        ("standing_query_queue_ai", "AFTER INSERT ON documents", "new.id"),
+        (
+            "standing_query_queue_au",
+            "AFTER UPDATE OF title, content, project, doc_type ON documents",
+            "new.id",
+        ),
+        ("standing_query_queue_tags_ai", "AFTER INSERT ON document_tags", "new.document_id"),
+    ):
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {name} {event} {any_queries} "
+            f"BEGIN {enqueue.format(doc_id)} END"
+        )
+    conn.commit()
+
+
+def migration_20261016_160000_add_search_snippets(
+    conn: sqlite3.Connection,
+) -> None:
+    """Add precomputed lead snippets and a cache of FTS5 search snippets.
+
+    ``document_leads`` holds the first 150 characters of each document,
+    flattened to one line, for semantic results; it lives outside
+    ``documents`` so reading it never touches a long document's overflow
+    pages. ``search_snippet_cache`` keeps the FTS5 ``snippet()`` of a
+    document for a query. Triggers refresh the lead and drop cached
+    snippets whenever a document's content changes.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS document_leads (
+            document_id INTEGER PRIMARY KEY,
+            lead TEXT NOT NULL,
+            FOREIGN KEY (document_id) REFERENCES documents(id) ON DELETE CASCADE
+        )
+        """
+    )
+    lead = (
+        "CASE WHEN {c} IS NULL OR {c} = '' THEN '' "
+        "ELSE REPLACE(SUBSTR({c}, 1, 150), char(10), ' ') || '...' END"
+    )
+    cursor.execute(
+        "INSERT OR REPLACE INTO document_leads (document_id, lead) "
+        f"SELECT id, {lead.format(c='content')} FROM documents"
+    )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS search_snippet_cache (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            document_id INTEGER NOT NULL,
+            terms TEXT NOT NULL,
+            snippet TEXT NOT NULL,
+            UNIQUE (terms, document_id),
+            FOREIGN KEY (document_id) REFERENCES documents(id) ON DELETE CASCADE
+        )
+        """
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_search_snippet_cache_document "
+        "ON search_snippet_cache(document_id)"
+    )
+    refresh = (
+        "INSERT OR REPLACE INTO document_leads (document_id, lead) "
+        f"VALUES (new.id, {lead.format(c='new.content')});"
+    )
+    forget = (
+        "DELETE FROM search_snippet_cache WHERE document_id = old.id; "
+        "DELETE FROM document_leads WHERE document_id = old.id;"
+    )
+    for name, event, sql in (
+        ("document_leads_ai", "AFTER INSERT ON documents", refresh),
+        (
+            "document_leads_au",
+            "AFTER UPDATE OF content ON documents",
+            f"DELETE FROM search_snippet_cache WHERE document_id = old.id; {refresh}",
+        ),
+        ("document_leads_ad", "AFTER DELETE ON documents", forget),
+    ):
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {event} BEGIN {sql} END")
+    conn.commit()
+
+
+def migration_20261016_170000_add_document_stats(
+    conn: sqlite3.Connection,
+) -> None:
+    """Add per-document word, character and token counts.
+
+    Listings show document sizes without reading bodies from
+    ``document_stats``, kept beside ``document_leads`` for the same reason.
+    Triggers maintain ``char_count`` and ``token_estimate`` (characters / 4,
+    as ``emdx context`` budgets). SQLite cannot split words, so
+    ``word_count`` is written by ``save_document``/``update_document``; a
+    content change made any other way leaves it NULL until a listing
+    recounts it.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS document_stats (
+            document_id INTEGER PRIMARY KEY,
+            word_count INTEGER,
+            char_count INTEGER NOT NULL,
+            token_estimate INTEGER NOT NULL,
+            FOREIGN KEY (document_id) REFERENCES documents(id) ON DELETE CASCADE
+        )
+        """
+    )
+    rows = cursor.execute("SELECT id, content FROM documents")
+    while batch := rows.fetchmany(500):
+        conn.executemany(
+            "INSERT OR REPLACE INTO document_stats "
+            "(document_id, word_count, char_count, token_estimate) VALUES (?, ?, ?, ?)",
+            [
+                (doc_id, len(content.split()), len(content), len(content) // 4)
+                for doc_id, content in ((r[0], r[1] or "") for r in batch)
+            ],
+        )
+    recount = (
+        "INSERT OR REPLACE INTO document_stats "
+        "(document_id, word_count, char_count, token_estimate) "
+        "VALUES (new.id, NULL, length(new.content), length(new.content) / 4);"
+    )
+    for name, event, sql in (
+        ("document_stats_ai", "AFTER INSERT ON documents", recount),
+        ("document_stats_au", "AFTER UPDATE OF content ON documents", recount),
+        (
+            "document_stats_ad",
+            "AFTER DELETE ON documents",
+            "DELETE FROM document_stats WHERE document_id = old.id;",
+        ),
+    ):
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {event} BEGIN {sql} END")
+    conn.commit()
+
+
+def migration_20261016_180000_add_llm_response_cache(
+    conn: sqlite3.Connection,
+) -> None:
+    """Add the LLM response cache (see emdx.services.llm_cache).
+
+    Responses are keyed by a hash of (model, system prompt, user message
+    hash), so a re-run of wiki generation or entity extraction over
+    unchanged input reuses them instead of calling the model again.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS llm_response_cache (
+            key TEXT PRIMARY KEY,
+            model TEXT NOT NULL,
+            response TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            last_used_at REAL NOT NULL,
+            hits INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_llm_response_cache_last_used "
+        "ON llm_response_cache(last_used_at)"
+    )
+    conn.commit()
+
+
+def migration_20261016_190000_add_wiki_run_topics(
+    conn: sqlite3.Connection,
+) -> None:
+    """Add per-topic checkpoints to wiki generation runs.
+
+    Each run records its topic list in ``wiki_run_topics`` with a status
+    (pending, in_flight, done, failed) and the worker that claimed it, so
+    an interrupted run can be resumed and concurrent ``wiki generate``
+    invocations can share one run's topics. ``wiki_runs`` gains the
+    audience, so a resumed run generates with the original settings.
+    """
+    cursor = conn.cursor()
+    cursor.execute("ALTER TABLE wiki_runs ADD COLUMN audience TEXT DEFAULT 'team'")
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS wiki_run_topics (
+            run_id INTEGER NOT NULL,
+            topic_id INTEGER NOT NULL,
+            position INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending'
+                CHECK (status IN ('pending', 'in_flight', 'done', 'failed')),
+            claimed_by TEXT,
+            claimed_at REAL,
+            finished_at REAL,
+            skipped BOOLEAN DEFAULT FALSE,
+            error TEXT,
+            input_tokens INTEGER DEFAULT 0,
+            output_tokens INTEGER DEFAULT 0,
+            cost_usd REAL DEFAULT 0.0,
+            PRIMARY KEY (run_id, topic_id),
+            FOREIGN KEY (run_id) REFERENCES wiki_runs(id) ON DELETE CASCADE
+        )
+        """
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_wiki_run_topics_status "
+        "ON wiki_run_topics(run_id, status, position)"
+    )
+    conn.commit()
+
+
+def migration_20261016_200000_add_index_generation_tokens(
+    conn: sqlite3.Connection,
+) -> None:
+    """Give each index_generations counter a random token.
+
+    Restoring a backup rolls the counters back, and later writes can bring
+    one to a generation a surviving cache file was built at from different
+    data. The token is redrawn whenever its counter moves, so caches keyed
+    on (generation, token) never match a rolled-back database.
+    """
+    cursor = conn.cursor()
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(index_generations)")}
+    if "token" not in columns:
+        cursor.execute("ALTER TABLE index_generations ADD COLUMN token INTEGER NOT NULL DEFAULT 0")
+    cursor.execute("UPDATE index_generations SET token = random()")
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS index_generations_token_au
+        AFTER UPDATE OF generation ON index_generations BEGIN
+            UPDATE index_generations SET token = random() WHERE name = new.name;
+        END
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS index_generations_token_ai
+        AFTER INSERT ON index_generations BEGIN
+            UPDATE index_generations SET token = random() WHERE name = new.name;
+        END
+        """
+    )
+    conn.commit()
+
+
+def migration_20261016_210000_add_embedding_originals(
+    conn: sqlite3.Connection,
+) -> None:
+    """Add embedding_originals for rescoring quantized embeddings.
+
+    Partitions stored as float16 or int8 keep the float32 vector of each
+    embedding here, keyed by the content hash of the text it embeds, so
+    chunk rows can be rewritten without losing them. Search scans only the
+    compact vectors and reads originals for its top candidates.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS embedding_originals (
+            source TEXT NOT NULL,
+            model_name TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            embedding BLOB NOT NULL,
+            PRIMARY KEY (source, model_name, content_hash)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.commit()
+
+
 # List of all migrations in order
 MIGRATIONS: list[tuple[str, str, Callable]] = [
     ("0", "Create documents table", migration_000_create_documents_table),
@@ -3188,15 +3807,105 @@ MIGRATIONS: list[tuple[str, str, Callable]] = [
         "Add index on wiki_articles.quality_score",
         migration_20260302_160000_add_wiki_quality_index,
     ),
+    (
+        "20261016_090000",
+        "Add index generation counters",
+        migration_20261016_090000_add_index_generations,
+    ),
+    (
+        "20261016_100000",
+        "Add content hashes to embeddings",
+        migration_20261016_100000_add_embedding_content_hash,
+    ),
+    (
+        "20261016_110000",
+        "Add query embedding cache",
+        migration_20261016_110000_add_query_embeddings,
+    ),
+    (
+        "20261016_120000",
+        "Add document neighbour graph",
+        migration_20261016_120000_add_document_neighbours,
+    ),
+    (
+        "20261016_130000",
+        "Add title trigram index",
+        migration_20261016_130000_add_title_trigram_index,
+    ),
+    (
+        "20261016_140000",
+        "Add search result cache",
+        migration_20261016_140000_add_search_result_cache,
+    ),
+    (
+        "20261016_150000",
+        "Add save-time standing query matching",
+        migration_20261016_150000_add_standing_query_percolation,
+    ),
+    (
+        "20261016_160000",
+        "Add lead snippets and search snippet cache",
+        migration_20261016_160000_add_search_snippets,
+    ),
+    (
+        "20261016_170000",
+        "Add document word, character and token counts",
+        migration_20261016_170000_add_document_stats,
+    ),
+    (
+        "20261016_180000",
+        "Add LLM response cache",
+        migration_20261016_180000_add_llm_response_cache,
+    ),
+    (
+        "20261016_190000",
+        "Add wiki run topic checkpoints",
+        migration_20261016_190000_add_wiki_run_topics,
+    ),
+    (
+        "20261016_200000",
+        "Add index generation tokens",
+        migration_20261016_200000_add_index_generation_tokens,
+    ),
+    (
+        "20261016_210000",
+        "Add full-precision embedding originals",
+        migration_20261016_210000_add_embedding_originals,
+    ),
 ]
 
 
+@lru_cache(maxsize=1)
+def schema_fingerprint() -> int:
+    """Fingerprint of the MIGRATIONS list, stored in PRAGMA user_version.
+
+    A database whose user_version matches has had every migration in this
+    build applied, so startup can skip reading schema_migrations and walking
+    the list. user_version is a signed 32-bit integer; the fingerprint is
+    kept positive and non-zero (0 is the value of a fresh database).
+    """
+    digest = hashlib.blake2b(
+        "\n".join(f"{version}:{description}" for version, description, _ in MIGRATIONS).encode(),
+        digest_size=4,
+    ).digest()
+    return (int.from_bytes(digest, "big") & 0x7FFFFFFF) or 1
+
+
+def schema_is_current(conn: sqlite3.Connection) -> bool:
+    """Check the schema fingerprint without touching the migration tables."""
+    row = conn.execute("PRAGMA user_version").fetchone()
+    return row is not None and row[0] == schema_fingerprint()
+
+
 def run_migrations(db_path: str | Path | None = None) -> None:
     """Run all pending migrations.
 
     Uses set-based tracking: each migration is identified by a string version
     and only runs if it hasn't been applied yet. This prevents collisions when
     branches diverge (unlike sequential integer max-based tracking).
+
+    On success the schema fingerprint is stamped into PRAGMA user_version so
+    later startups can take the schema_is_current() fast path.
     """
     if db_path is None:
         db_path = get_db_path()
@@ -3219,6 +3928,10 @@ def run_migrations(db_path: str | Path | None = None) -> None:
                 record_migration(conn, version)
                 logging.getLogger(__name__).info("Migration %s completed", version)
 
+        # PRAGMA does not accept bound parameters; the value is an int we computed
+        conn.execute(f"PRAGMA user_version = {schema_fingerprint()}")
+        conn.commit()
+
     finally:
         if conn is not None:
             conn.close()
@@ -0,0 +1,84 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Listings page by the sort key of the last row returned instead of by
+OFFSET, so every page costs the same however deep into the result set it
+is, and rows are neither skipped nor repeated when documents are added
+between pages. A cursor is an opaque URL-safe string wrapping that key.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+CursorKey = list[float | int | str]
+
+
+@dataclass
+class Page(Generic[_T]):
+    """One page of a listing and the cursor for the next (None at the end)."""
+
+    items: list[_T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def encode_cursor(*key: float | int | str) -> str:
+    """Opaque cursor for a row's sort key."""
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, arity: int) -> CursorKey:
+    """Sort key wrapped by ``cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued by a listing
+            with a different sort key.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError(f"Invalid cursor: {cursor!r}") from None
+    if (
+        not isinstance(key, list)
+        or len(key) != arity
+        or not all(isinstance(v, (int, float, str)) for v in key)
+    ):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return key
+
+
+def page_from_rows(
+    rows: list[_T], page_size: int, key: Callable[[_T], tuple[float | int | str, ...]]
+) -> Page[_T]:
+    """Build a page from up to ``page_size + 1`` fetched rows.
+
+    Queries fetch one row beyond the page so the last page is recognised
+    without another round-trip.
+
+    Raises:
+        ValueError: If ``page_size`` is less than 1.
+    """
+    if page_size < 1:
+        raise ValueError(f"page_size must be at least 1, got {page_size}")
+    if len(rows) <= page_size:
+        return Page(rows, None)
+    items = rows[:page_size]
+    return Page(items, encode_cursor(*key(items[-1])))
+
+
+def iter_pages(fetch: Callable[[str | None], Page[_T]], cursor: str | None = None) -> Iterator[_T]:
+    """Yield every row of a listing, fetching one page at a time."""
+    while True:
+        page = fetch(cursor)
+        yield from page.items
+        if page.next_cursor is None:
+            return
+        cursor = page.next_cursor
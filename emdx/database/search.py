@@ -4,8 +4,22 @@ Search functionality for emdx documents using FTS5
 
 from __future__ import annotations
 
-from ..models.search import SearchHit
+import logging
+import sqlite3
+from typing import Any
+
+from ..config.constants import SEARCH_SNIPPET_CACHE_MIN_CHARS, SEARCH_SNIPPET_CACHE_SIZE
+from ..models.search import SearchFacets, SearchHit
 from .connection import db_connection
+from .pagination import Page, decode_cursor, page_from_rows
+
+logger = logging.getLogger(__name__)
+
+# Opt-in trigram index over document content, for substring lookups
+SUBSTRING_INDEX = "documents_trigram"
+
+# The trigram tokenizer cannot match needles shorter than one trigram
+_MIN_TRIGRAM_NEEDLE = 3
 
 
 def escape_fts5_query(query: str) -> str:
@@ -37,6 +51,132 @@ def escape_fts5_query(query: str) -> str:
     return " ".join(quoted_terms)
 
 
+_HIT_COLUMNS = """d.id, d.title, d.project, d.created_at, d.updated_at,
+                {snippet} as snippet,
+                {rank} as rank,
+                d.doc_type"""
+_FTS_SNIPPET = "snippet(documents_fts, 1, '<b>', '</b>', '...', 30)"
+# Cached snippet of a hit for the query, which is always parameter ?1
+_CACHED_SNIPPET = (
+    "SELECT s.snippet FROM search_snippet_cache s WHERE s.terms = ?1 AND s.document_id = d.id"
+)
+
+
+def _text_hit_columns() -> str:
+    """Hit columns of a text search: a cached snippet, else a fresh one.
+
+    ``cache_snippet`` flags fresh snippets of documents long enough to be
+    worth caching; COALESCE and CASE stop at the first hit, so a cached
+    snippet is neither regenerated nor its document's content read.
+    """
+    return (
+        _HIT_COLUMNS.format(snippet=f"COALESCE(({_CACHED_SNIPPET}), {_FTS_SNIPPET})", rank="rank")
+        + f""",
+                CASE WHEN EXISTS ({_CACHED_SNIPPET}) THEN 0
+                     WHEN length(d.content) >= {int(SEARCH_SNIPPET_CACHE_MIN_CHARS)} THEN 1
+                     ELSE 0 END as cache_snippet"""
+    )
+
+
+def _hits(conn: sqlite3.Connection, rows: list[sqlite3.Row], terms: str) -> list[SearchHit]:
+    """SearchHits of text search rows, caching the snippets flagged for it.
+
+    The cache is best effort, like the result cache: a failed write is
+    logged and the hits returned regardless.
+    """
+    hits = [SearchHit.from_row(row) for row in rows]
+    fresh = [
+        (hit.id, terms, hit.snippet)
+        for hit, row in zip(hits, rows, strict=True)
+        if row["cache_snippet"]
+    ]
+    if fresh:
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO search_snippet_cache (document_id, terms, snippet) "
+                "VALUES (?, ?, ?)",
+                fresh,
+            )
+            conn.execute(
+                "DELETE FROM search_snippet_cache "
+                "WHERE id <= (SELECT MAX(id) FROM search_snippet_cache) - ?",
+                (SEARCH_SNIPPET_CACHE_SIZE,),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.debug("Could not cache search snippets: %s", e)
+            conn.rollback()
+    return hits
+
+
+def _search_query(
+    query: str,
+    project: str | None,
+    created_after: str | None,
+    created_before: str | None,
+    modified_after: str | None,
+    modified_before: str | None,
+    doc_type: str | None,
+    columns: str | None = None,
+) -> tuple[str, list[str | int | float | None]]:
+    """SELECT and WHERE clauses of a document search, without ORDER BY.
+
+    ``columns`` replaces the default select list (hit fields, snippet, rank).
+    """
+    # Handle special case where we only have date filters (no text search)
+    if query == "*":
+        base_query = f"""
+            SELECT
+                {columns or _HIT_COLUMNS.format(snippet="NULL", rank="0")}
+            FROM documents d
+            WHERE d.deleted_at IS NULL
+        """
+        params: list[str | int | float | None] = []
+    else:
+        base_query = f"""
+            SELECT
+                {columns or _text_hit_columns()}
+            FROM documents d
+            JOIN documents_fts ON d.id = documents_fts.rowid
+            WHERE documents_fts MATCH ?1 AND d.deleted_at IS NULL
+        """
+        params = [escape_fts5_query(query)]
+
+    conditions = []
+
+    # Add doc_type filter
+    if doc_type is not None:
+        conditions.append("d.doc_type = ?")
+        params.append(doc_type)
+
+    # Add project filter
+    if project:
+        conditions.append("d.project = ?")
+        params.append(project)
+
+    # Add date filters
+    if created_after:
+        conditions.append("d.created_at >= ?")
+        params.append(created_after)
+
+    if created_before:
+        conditions.append("d.created_at <= ?")
+        params.append(created_before)
+
+    if modified_after:
+        conditions.append("d.updated_at >= ?")
+        params.append(modified_after)
+
+    if modified_before:
+        conditions.append("d.updated_at <= ?")
+        params.append(modified_before)
+
+    # Combine conditions
+    if conditions:
+        base_query += " AND " + " AND ".join(conditions)
+    return base_query, params
+
+
 def search_documents(
     query: str,
     project: str | None = None,
@@ -60,73 +200,272 @@ def search_documents(
     Returns:
         List of SearchHit objects with document data, snippets, and ranking
     """
+    base_query, params = _search_query(
+        query, project, created_after, created_before, modified_after, modified_before, doc_type
+    )
     with db_connection.get_connection() as conn:
-        # Build dynamic query with date filters
-        # Handle special case where we only have date filters (no text search)
+        # Order by rank for text searches, by id for date-only searches
         if query == "*":
-            base_query = """
-                SELECT
-                    d.id, d.title, d.project, d.created_at, d.updated_at,
-                    NULL as snippet,
-                    0 as rank,
-                    d.doc_type
-                FROM documents d
-                WHERE d.deleted_at IS NULL
-            """
-            params: list[str | int | None] = []
+            base_query += " ORDER BY d.id DESC LIMIT ?"
         else:
-            base_query = """
-                SELECT
-                    d.id, d.title, d.project, d.created_at, d.updated_at,
-                    snippet(documents_fts, 1, '<b>', '</b>', '...', 30) as snippet,
-                    rank as rank,
-                    d.doc_type
-                FROM documents d
-                JOIN documents_fts ON d.id = documents_fts.rowid
-                WHERE documents_fts MATCH ? AND d.deleted_at IS NULL
+            base_query += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+
+        rows = conn.execute(base_query, params).fetchall()
+        if query == "*":
+            return [SearchHit.from_row(row) for row in rows]
+        return _hits(conn, rows, str(params[0]))
+
+
+def search_documents_page(
+    query: str,
+    project: str | None = None,
+    page_size: int = 100,
+    cursor: str | None = None,
+    created_after: str | None = None,
+    created_before: str | None = None,
+    modified_after: str | None = None,
+    modified_before: str | None = None,
+    doc_type: str | None = "user",
+) -> Page[SearchHit]:
+    """One page of ``search_documents`` results, continuing from ``cursor``.
+
+    Text searches page by (rank, id), date-only searches (``query == "*"``)
+    by id, newest first.
+
+    Raises:
+        ValueError: If ``cursor`` is not a cursor from this kind of search.
+    """
+    base_query, params = _search_query(
+        query, project, created_after, created_before, modified_after, modified_before, doc_type
+    )
+    if query == "*":
+        if cursor is not None:
+            (last_id,) = decode_cursor(cursor, 1)
+            base_query += " AND d.id < ?"
+            params.append(int(last_id))
+        base_query += " ORDER BY d.id DESC LIMIT ?"
+    else:
+        if cursor is not None:
+            last_rank, last_id = decode_cursor(cursor, 2)
+            base_query += " AND (rank > ? OR (rank = ? AND d.id > ?))"
+            params.extend([float(last_rank), float(last_rank), int(last_id)])
+        base_query += " ORDER BY rank, d.id LIMIT ?"
+    params.append(page_size + 1)
+
+    with db_connection.get_connection() as conn:
+        rows = conn.execute(base_query, params).fetchall()
+        if query == "*":
+            hits = [SearchHit.from_row(row) for row in rows]
+            return page_from_rows(hits, page_size, lambda hit: (hit.id,))
+        hits = _hits(conn, rows, str(params[0]))
+    return page_from_rows(hits, page_size, lambda hit: (hit.rank, hit.id))
+
+
+def _tag_conditions(
+    tags: list[str] | None, tag_mode: str, exclude_tags: list[str] | None
+) -> tuple[list[str], list[str]]:
+    """WHERE conditions for tag filters, matching ``search_by_tags``.
+
+    Requested tags match by prefix ('workflow' matches 'workflow-output'),
+    excluded tags exactly.
+    """
+    tagged = "SELECT dt.document_id FROM document_tags dt JOIN tags t ON t.id = dt.tag_id"
+    conditions: list[str] = []
+    params: list[str] = []
+    names = [t.lower().strip() for t in tags or [] if t.strip()]
+    if names:
+        joiner = " AND " if tag_mode == "all" else " OR "
+        conditions.append(
+            "(" + joiner.join(f"d.id IN ({tagged} WHERE t.name LIKE ?)" for _ in names) + ")"
+        )
+        params.extend(f"{name}%" for name in names)
+    excluded = [t.lower().strip() for t in exclude_tags or [] if t.strip()]
+    if excluded:
+        placeholders = ",".join("?" * len(excluded))
+        conditions.append(f"d.id NOT IN ({tagged} WHERE t.name IN ({placeholders}))")
+        params.extend(excluded)
+    return conditions, params
+
+
+def search_facets(
+    query: str,
+    project: str | None = None,
+    created_after: str | None = None,
+    created_before: str | None = None,
+    modified_after: str | None = None,
+    modified_before: str | None = None,
+    doc_type: str | None = "user",
+    tags: list[str] | None = None,
+    tag_mode: str = "all",
+    exclude_tags: list[str] | None = None,
+    top: int = 20,
+) -> SearchFacets:
+    """Per-project, per-tag and per-doc_type counts over every match of a search.
+
+    Takes the same filters as ``search_documents`` (``query == "*"`` for
+    filter-only searches) plus the tag filters of ``emdx find``, and
+    counts all three facets in one statement over the match set. Each facet
+    keeps its ``top`` most frequent values.
+    """
+    base_query, params = _search_query(
+        query,
+        project,
+        created_after,
+        created_before,
+        modified_after,
+        modified_before,
+        doc_type,
+        columns="d.id, d.project, d.doc_type",
+    )
+    conditions, tag_params = _tag_conditions(tags, tag_mode, exclude_tags)
+    if conditions:
+        base_query += " AND " + " AND ".join(conditions)
+        params.extend(tag_params)
+
+    facets = SearchFacets()
+    with db_connection.get_connection() as conn:
+        rows = conn.execute(
+            f"""
+            WITH m AS ({base_query})
+            SELECT 'project', project, COUNT(*) FROM m GROUP BY project
+            UNION ALL
+            SELECT 'doc_type', doc_type, COUNT(*) FROM m GROUP BY doc_type
+            UNION ALL
+            SELECT 'tag', t.name, COUNT(*)
+            FROM m
+            JOIN document_tags dt ON dt.document_id = m.id
+            JOIN tags t ON t.id = dt.tag_id
+            GROUP BY t.name
+            """,
+            params,
+        ).fetchall()
+    by_facet: dict[str, list[tuple[Any, int]]] = {"project": [], "doc_type": [], "tag": []}
+    for facet, value, count in rows:
+        by_facet[facet].append((value, count))
+    for pairs in by_facet.values():
+        pairs.sort(key=lambda pair: (-pair[1], str(pair[0] or "")))
+    facets.total = sum(count for _, count in by_facet["doc_type"])
+    facets.projects = by_facet["project"][:top]
+    facets.doc_types = by_facet["doc_type"][:top]
+    facets.tags = by_facet["tag"][:top]
+    return facets
+
+
+def has_substring_index(conn: sqlite3.Connection) -> bool:
+    """Whether the trigram substring index has been enabled."""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (SUBSTRING_INDEX,)
+    ).fetchone()
+    return row is not None
+
+
+def enable_substring_index() -> bool:
+    """Create and populate the trigram substring index over document content.
+
+    The index is an external-content FTS5 table kept in sync by triggers,
+    the same pattern as documents_fts. It costs roughly three times the
+    size of the indexed text, so it is opt-in. Returns False when SQLite
+    lacks the trigram tokenizer (3.34+), leaving substring search on the
+    unindexed scan.
+    """
+    with db_connection.get_connection() as conn:
+        if has_substring_index(conn):
+            return True
+        try:
+            conn.execute(
+                f"""
+                CREATE VIRTUAL TABLE {SUBSTRING_INDEX} USING fts5(
+                    content, content=documents, content_rowid=id, tokenize='trigram'
+                )
+                """
+            )
+        except sqlite3.OperationalError as e:
+            logger.warning("SQLite lacks the FTS5 trigram tokenizer: %s", e)
+            return False
+        conn.execute(
+            f"""
+            CREATE TRIGGER {SUBSTRING_INDEX}_ai AFTER INSERT ON documents BEGIN
+                INSERT INTO {SUBSTRING_INDEX}(rowid, content) VALUES (new.id, new.content);
+            END
+            """
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER {SUBSTRING_INDEX}_au AFTER UPDATE OF content ON documents BEGIN
+                INSERT INTO {SUBSTRING_INDEX}({SUBSTRING_INDEX}, rowid, content)
+                VALUES ('delete', old.id, old.content);
+                INSERT INTO {SUBSTRING_INDEX}(rowid, content) VALUES (new.id, new.content);
+            END
             """
-            params = [escape_fts5_query(query)]
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER {SUBSTRING_INDEX}_ad AFTER DELETE ON documents BEGIN
+                INSERT INTO {SUBSTRING_INDEX}({SUBSTRING_INDEX}, rowid, content)
+                VALUES ('delete', old.id, old.content);
+            END
+            """
+        )
+        conn.execute(f"INSERT INTO {SUBSTRING_INDEX}({SUBSTRING_INDEX}) VALUES('rebuild')")
+        conn.commit()
+    return True
 
-        conditions = []
 
-        # Add doc_type filter
-        if doc_type is not None:
-            conditions.append("d.doc_type = ?")
-            params.append(doc_type)
+def disable_substring_index() -> bool:
+    """Drop the trigram substring index and its triggers.
 
-        # Add project filter
-        if project:
-            conditions.append("d.project = ?")
-            params.append(project)
+    Returns whether an index was dropped.
+    """
+    with db_connection.get_connection() as conn:
+        if not has_substring_index(conn):
+            return False
+        for suffix in ("ai", "au", "ad"):
+            conn.execute(f"DROP TRIGGER IF EXISTS {SUBSTRING_INDEX}_{suffix}")
+        conn.execute(f"DROP TABLE {SUBSTRING_INDEX}")
+        conn.commit()
+    return True
 
-        # Add date filters
-        if created_after:
-            conditions.append("d.created_at >= ?")
-            params.append(created_after)
 
-        if created_before:
-            conditions.append("d.created_at <= ?")
-            params.append(created_before)
+def _escape_like(needle: str) -> str:
+    return needle.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
-        if modified_after:
-            conditions.append("d.updated_at >= ?")
-            params.append(modified_after)
 
-        if modified_before:
-            conditions.append("d.updated_at <= ?")
-            params.append(modified_before)
+def search_substring(
+    needle: str,
+    project: str | None = None,
+    limit: int = 10,
+) -> list[tuple[int, str, str]]:
+    """Find live documents whose content contains ``needle``, newest first.
 
-        # Combine conditions
-        if conditions:
-            base_query += " AND " + " AND ".join(conditions)
+    Matching is case-insensitive for ASCII, like ``LIKE``. With the
+    substring index enabled and a needle of at least three characters,
+    candidates come from a trigram phrase match; otherwise every document
+    is scanned.
 
-        # Order by rank for text searches, by id for date-only searches
-        if query == "*":
-            base_query += " ORDER BY d.id DESC LIMIT ?"
+    Returns:
+        List of (id, title, content) tuples.
+    """
+    if not needle:
+        return []
+    with db_connection.get_connection() as conn:
+        params: list[str | int] = []
+        if len(needle) >= _MIN_TRIGRAM_NEEDLE and has_substring_index(conn):
+            query = f"""
+                SELECT d.id, d.title, d.content FROM {SUBSTRING_INDEX} t
+                JOIN documents d ON d.id = t.rowid
+                WHERE {SUBSTRING_INDEX} MATCH ? AND d.is_deleted = 0
+            """
+            params.append('"' + needle.replace('"', '""') + '"')
         else:
-            base_query += " ORDER BY rank LIMIT ?"
+            query = """
+                SELECT d.id, d.title, d.content FROM documents d
+                WHERE d.content LIKE ? ESCAPE '\\' AND d.is_deleted = 0
+            """
+            params.append(f"%{_escape_like(needle)}%")
+        if project:
+            query += " AND d.project = ?"
+            params.append(project)
+        query += " ORDER BY d.id DESC LIMIT ?"
         params.append(limit)
-
-        cursor = conn.execute(base_query, params)
-
-        return [SearchHit.from_row(row) for row in cursor.fetchall()]
+        return [(row[0], row[1], row[2]) for row in conn.execute(query, params)]
@@ -0,0 +1,155 @@
+"""
+Save-time matching of documents against standing queries (find --watch).
+
+Instead of re-running every standing query over every new document at
+check time, each document is matched once, when it is written, against
+the standing queries it could satisfy:
+
+1. Triggers queue every document that is inserted, edited or tagged while
+   a standing query exists (``standing_query_queue``).
+2. ``percolate_pending`` drains the queue. The document's words are looked
+   up in ``standing_query_terms``, an FTS5 index over the query text, so
+   only queries sharing a term with the document are considered; each is
+   confirmed with its real FTS5 query restricted to the document's rowid.
+   Tag-only queries are matched against the document's tags.
+3. Hits are appended to ``standing_query_matches`` and read (then cleared)
+   by ``emdx find --watch-check``.
+
+A document matches a query only if it was created after the query was
+last checked, as with the previous check-time evaluation.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import sqlite3
+
+from . import connection
+from .search import escape_fts5_query
+
+logger = logging.getLogger(__name__)
+
+# Document words per lookup in the query term index
+_TERM_BATCH = 500
+
+# Runs of letters and digits; finer than (never across) unicode61 tokens
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def _tag_list(tags: str | None) -> list[str]:
+    return [t.strip() for t in tags.split(",") if t.strip()] if tags else []
+
+
+def _candidate_queries(conn: sqlite3.Connection, text: str) -> set[int]:
+    """Ids of text queries sharing at least one term with ``text``."""
+    words = sorted({w.lower() for w in _WORD_RE.findall(text)})
+    candidates: set[int] = set()
+    for start in range(0, len(words), _TERM_BATCH):
+        match = " OR ".join(f'"{w}"' for w in words[start : start + _TERM_BATCH])
+        candidates.update(
+            row[0]
+            for row in conn.execute(
+                "SELECT rowid FROM standing_query_terms WHERE standing_query_terms MATCH ?",
+                (match,),
+            )
+        )
+    return candidates
+
+
+def _percolate_document(conn: sqlite3.Connection, doc_id: int) -> int:
+    """Record the standing queries ``doc_id`` matches. Returns count added."""
+    doc = conn.execute(
+        """
+        SELECT title, content, project FROM documents
+        WHERE id = ? AND is_deleted = 0 AND doc_type = 'user'
+        """,
+        (doc_id,),
+    ).fetchone()
+    if doc is None:
+        return 0
+    title, content, project = doc
+
+    candidates = _candidate_queries(conn, f"{title} {content} {project or ''}")
+    placeholders = ",".join("?" * len(candidates))
+    queries = conn.execute(
+        f"""
+        SELECT id, query, tags FROM standing_queries
+        WHERE (query = '' OR id IN ({placeholders}))
+          AND (project IS NULL OR project = '' OR project = ?)
+          AND (
+            last_checked_at IS NULL
+            OR last_checked_at < (SELECT created_at FROM documents WHERE id = ?)
+          )
+        """,
+        [*candidates, project, doc_id],
+    ).fetchall()
+    if not queries:
+        return 0
+
+    doc_tags = {
+        row[0]
+        for row in conn.execute(
+            """
+            SELECT t.name FROM document_tags dt JOIN tags t ON dt.tag_id = t.id
+            WHERE dt.document_id = ?
+            """,
+            (doc_id,),
+        )
+    }
+
+    added = 0
+    for query_id, query_text, tags in queries:
+        wanted = _tag_list(tags)
+        if query_text:
+            # Text queries need every tag; tag-only queries need any of them
+            if not doc_tags.issuperset(wanted):
+                continue
+            try:
+                hit = conn.execute(
+                    "SELECT 1 FROM documents_fts WHERE rowid = ? AND documents_fts MATCH ?",
+                    (doc_id, escape_fts5_query(query_text)),
+                ).fetchone()
+            except sqlite3.OperationalError as e:
+                logger.debug("Standing query %d is not a valid FTS5 query: %s", query_id, e)
+                continue
+            if hit is None:
+                continue
+        elif not doc_tags.intersection(wanted):
+            continue
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO standing_query_matches (query_id, document_id) VALUES (?, ?)",
+            (query_id, doc_id),
+        )
+        added += cursor.rowcount
+    return added
+
+
+def percolate_pending(conn: sqlite3.Connection | None = None) -> int:
+    """Match every queued document against the standing queries.
+
+    Returns the number of new matches. With ``conn`` the caller commits;
+    otherwise this commits, and a database error is logged rather than
+    raised, since the queue keeps the documents for the next attempt.
+    """
+    if conn is None:
+        try:
+            with connection.db_connection.get_connection() as own_conn:
+                added = percolate_pending(own_conn)
+                own_conn.commit()
+                return added
+        except sqlite3.Error as e:
+            logger.debug("Could not match standing queries: %s", e)
+            return 0
+
+    doc_ids = [row[0] for row in conn.execute("SELECT document_id FROM standing_query_queue")]
+    if not doc_ids:
+        return 0
+    added = 0
+    if conn.execute("SELECT 1 FROM standing_queries LIMIT 1").fetchone() is not None:
+        for doc_id in doc_ids:
+            added += _percolate_document(conn, doc_id)
+    conn.executemany(
+        "DELETE FROM standing_query_queue WHERE document_id = ?", [(d,) for d in doc_ids]
+    )
+    return added
@@ -82,19 +82,7 @@ class Document:
     @classmethod
     def _from_dict(cls, raw: dict[str, Any]) -> Document:
         """Internal: build a Document from a raw dict, parsing datetimes."""
-        known = frozenset(f.name for f in fields(cls))
-        kwargs: dict[str, Any] = {}
-        for key, value in raw.items():
-            if key not in known:
-                continue
-            if key in _DATETIME_FIELDS and isinstance(value, str):
-                kwargs[key] = parse_datetime(value)
-            elif key == "is_deleted":
-                # SQLite stores boolean as 0/1 int
-                kwargs[key] = bool(value)
-            else:
-                kwargs[key] = value
-        return cls(**kwargs)
+        return cls(**_field_values(cls, raw))
 
     # ── Serialization ─────────────────────────────────────────────────
 
@@ -103,9 +91,64 @@ class Document:
 
         Datetime fields are formatted as ISO 8601 strings.
         """
-        result = asdict(self)
-        for key in _DATETIME_FIELDS:
-            val = result.get(key)
-            if isinstance(val, datetime):
-                result[key] = val.isoformat()
-        return result
+        return _to_dict(self)
+
+
+@dataclass(slots=True)
+class DocumentSummary:
+    """A document's metadata and size, without its content.
+
+    Returned by listings (recent documents, briefing windows, context
+    traversal) that show titles and sizes but never the body. The counts
+    come from the ``document_stats`` table maintained on write.
+    """
+
+    id: int
+    title: str
+    project: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    accessed_at: datetime | None = None
+    access_count: int = 0
+    parent_id: int | None = None
+    relationship: str | None = None
+    archived_at: datetime | None = None
+    doc_type: str = "user"
+    word_count: int = 0
+    char_count: int = 0
+    token_estimate: int = 0
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row | dict[str, Any]) -> DocumentSummary:
+        """Construct from a listing row; unknown columns are ignored."""
+        return cls(**_field_values(cls, dict(row)))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain dict, datetimes as ISO 8601 strings."""
+        return _to_dict(self)
+
+
+def _field_values(cls: type, raw: dict[str, Any]) -> dict[str, Any]:
+    """Constructor arguments for ``cls`` from a row dict, parsing datetimes."""
+    known = frozenset(f.name for f in fields(cls))
+    kwargs: dict[str, Any] = {}
+    for key, value in raw.items():
+        if key not in known:
+            continue
+        if key in _DATETIME_FIELDS and isinstance(value, str):
+            kwargs[key] = parse_datetime(value)
+        elif key == "is_deleted":
+            # SQLite stores boolean as 0/1 int
+            kwargs[key] = bool(value)
+        else:
+            kwargs[key] = value
+    return kwargs
+
+
+def _to_dict(obj: Document | DocumentSummary) -> dict[str, Any]:
+    result = asdict(obj)
+    for key in _DATETIME_FIELDS:
+        val = result.get(key)
+        if isinstance(val, datetime):
+            result[key] = val.isoformat()
+    return result
@@ -1,13 +1,14 @@
-"""Search result domain model for emdx.
+"""Search result domain models for emdx.
 
-Wraps a Document with search-specific metadata (snippet, rank).
-Forwards attribute access to the inner Document via __getattr__.
+SearchHit wraps a Document with search-specific metadata (snippet, rank)
+and forwards attribute access to the inner Document via __getattr__.
+SearchFacets holds per-project, per-tag and per-doc_type match counts.
 """
 
 from __future__ import annotations
 
 import sqlite3
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from .document import Document
@@ -64,3 +65,30 @@ class SearchHit:
         result["snippet"] = self.snippet
         result["rank"] = self.rank
         return result
+
+
+@dataclass(slots=True)
+class SearchFacets:
+    """How a search's full match set splits across projects, tags and doc types.
+
+    Each facet lists ``(value, count)`` pairs, most frequent first. Documents
+    without a project count under ``None``; a document counts once per tag.
+    """
+
+    total: int = 0
+    projects: list[tuple[str | None, int]] = field(default_factory=list)
+    tags: list[tuple[str, int]] = field(default_factory=list)
+    doc_types: list[tuple[str, int]] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to plain dict for JSON serialization."""
+
+        def counts(pairs: list[tuple[Any, int]]) -> list[dict[str, Any]]:
+            return [{"value": value, "count": count} for value, count in pairs]
+
+        return {
+            "total": self.total,
+            "projects": counts(self.projects),
+            "tags": counts(self.tags),
+            "doc_types": counts(self.doc_types),
+        }
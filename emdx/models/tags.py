@@ -4,6 +4,8 @@ import sqlite3
 from typing import cast
 
 from emdx.database import db
+from emdx.database.pagination import Page, decode_cursor, page_from_rows
+from emdx.database.standing_queries import percolate_pending
 from emdx.models.types import TagSearchResultDict, TagStatsDict
 from emdx.utils.datetime_utils import parse_datetime
 
@@ -76,7 +78,10 @@ def add_tags_to_document(
         with db.get_connection() as new_conn:
             result = _add_tags(new_conn)
             new_conn.commit()
-            return result
+        if result:
+            # A new tag can satisfy a tag-filtered standing query
+            percolate_pending()
+        return result
 
 
 def remove_tags_from_document(doc_id: int, tag_names: list[str]) -> list[str]:
@@ -227,8 +232,9 @@ def search_by_tags(
     project: str | None = None,
     limit: int = 20,
     prefix_match: bool = True,
+    before_id: int | None = None,
 ) -> list[TagSearchResultDict]:
-    """Search documents by tags.
+    """Search documents by tags, newest first.
 
     Args:
         tag_names: List of tag names to search for
@@ -236,6 +242,7 @@ def search_by_tags(
         project: Optional project filter
         limit: Maximum results to return
         prefix_match: If True, 'workflow' matches 'workflow-output' etc.
+        before_id: Only documents with a smaller id (keyset pagination)
     """
     with db.get_connection() as conn:
         tag_names_lower = [tag.lower().strip() for tag in tag_names]
@@ -322,6 +329,10 @@ def search_by_tags(
             query += " AND d.project = ?"
             params.append(project)
 
+        if before_id is not None:
+            query += " AND d.id < ?"
+            params.append(before_id)
+
         query += " GROUP BY d.id ORDER BY d.id DESC LIMIT ?"
         params.append(limit)
 
@@ -341,6 +352,25 @@ def search_by_tags(
         return docs
 
 
+def search_by_tags_page(
+    tag_names: list[str],
+    mode: str = "all",
+    project: str | None = None,
+    page_size: int = 100,
+    cursor: str | None = None,
+) -> Page[TagSearchResultDict]:
+    """One page of ``search_by_tags`` results, continuing from ``cursor``.
+
+    Raises:
+        ValueError: If ``cursor`` is not a cursor from a tag search.
+    """
+    before_id = int(decode_cursor(cursor, 1)[0]) if cursor is not None else None
+    docs = search_by_tags(
+        tag_names, mode=mode, project=project, limit=page_size + 1, before_id=before_id
+    )
+    return page_from_rows(docs, page_size, lambda doc: (doc["id"],))
+
+
 def rename_tag(old_name: str, new_name: str) -> bool:
     """Rename a tag globally."""
     with db.get_connection() as conn:
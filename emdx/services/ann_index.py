@@ -0,0 +1,340 @@
+"""
+Approximate nearest-neighbour (IVF) index for chunk-level semantic search.
+
+``chunk_embeddings`` grows roughly 10x faster than ``documents``, so exact
+brute force over it eventually dominates ``find`` latency. This is a
+pure-NumPy inverted-file index: spherical k-means partitions the chunk
+vectors into ``nlist`` cells, and a query scores only the rows in the
+``nprobe`` cells whose centroids are closest to it.
+
+The index is stored next to the database (``<db>.vectors/*.ivf.npz``) as
+centroids plus a (chunk row id -> cell) assignment, so it survives matrix
+rebuilds. ``emdx maintain index`` refreshes it incrementally: new chunks are
+assigned to the existing centroids and deleted chunks drop out; k-means is
+only re-run when the corpus has doubled or halved since training.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+    HAS_NUMPY = False
+
+from ..config.constants import ANN_DEFAULT_NPROBE, ANN_MIN_CHUNKS
+from ..database import db
+from .vector_index import (
+    UNKNOWN_GENERATION,
+    EmbeddingMatrix,
+    sidecar_dir,
+    sidecar_stem,
+)
+
+logger = logging.getLogger(__name__)
+
+NPROBE_ENV_VAR = "EMDX_ANN_NPROBE"
+
+# k-means is trained on a sample of at most this many rows per cell
+_TRAIN_ROWS_PER_LIST = 64
+_TRAIN_ITERATIONS = 12
+# Rows scored against the centroids per block, bounding (rows x nlist) memory
+_ASSIGN_BLOCK = 8192
+
+_cache: dict[tuple[str, str, str], IVFIndex] = {}
+
+
+def default_nprobe() -> int:
+    """Resolve the recall/latency knob from EMDX_ANN_NPROBE or the default."""
+    raw = os.environ.get(NPROBE_ENV_VAR)
+    if raw:
+        try:
+            return max(0, int(raw))
+        except ValueError:
+            logger.warning("Invalid %s=%r — using %d", NPROBE_ENV_VAR, raw, ANN_DEFAULT_NPROBE)
+    return ANN_DEFAULT_NPROBE
+
+
+def _nlist_for(n: int) -> int:
+    """Number of cells: ~sqrt(n), the usual IVF balance of probe vs scan cost."""
+    return int(min(4096, max(1, round(n**0.5))))
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Nearest centroid (by dot product) for every row, in bounded blocks.
+
+    Rows may be quantized codes: per-row positive scaling never changes the
+    argmax, so they need no dequantization here.
+    """
+    out = np.empty(vectors.shape[0], dtype=np.int32)
+    for start in range(0, vectors.shape[0], _ASSIGN_BLOCK):
+        block = np.asarray(vectors[start : start + _ASSIGN_BLOCK], dtype=np.float32)
+        out[start : start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return out
+
+
+def _normalize(rows: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(rows, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    result: np.ndarray = rows / norms
+    return result
+
+
+def train_centroids(vectors: np.ndarray, nlist: int, seed: int = 0) -> np.ndarray:
+    """Spherical k-means over a sample of the rows."""
+    rng = np.random.default_rng(seed)
+    n = vectors.shape[0]
+    sample_size = min(n, nlist * _TRAIN_ROWS_PER_LIST)
+    sample_idx = np.sort(rng.choice(n, size=sample_size, replace=False))
+    sample = _normalize(np.asarray(vectors[sample_idx], dtype=np.float32))
+
+    centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+    for _ in range(_TRAIN_ITERATIONS):
+        labels = _assign(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, sample)
+        counts = np.bincount(labels, minlength=nlist)
+        empty = counts == 0
+        if empty.any():
+            # Re-seed empty cells from random sample rows
+            sums[empty] = sample[rng.choice(sample_size, size=int(empty.sum()))]
+        centroids = _normalize(sums)
+    return centroids
+
+
+@dataclass
+class IVFIndex:
+    """Inverted-file index over one embedding matrix partition."""
+
+    centroids: np.ndarray  # float32, (nlist, dim)
+    row_ids: np.ndarray  # int64, chunk row ids covered by the index
+    list_ids: np.ndarray  # int32, cell of each row id
+    generation: int  # matrix generation the assignment matches
+    trained_rows: int  # corpus size when centroids were trained
+    token: int = 0  # matrix generation token the assignment matches
+    # Derived per matrix: positions into the matrix grouped by cell
+    _order: np.ndarray | None = field(default=None, repr=False)
+    _offsets: np.ndarray | None = field(default=None, repr=False)
+
+    @property
+    def nlist(self) -> int:
+        return int(self.centroids.shape[0])
+
+    @classmethod
+    def train(cls, matrix: EmbeddingMatrix, nlist: int | None = None) -> IVFIndex:
+        """Train centroids on the matrix and assign every row."""
+        n = len(matrix)
+        centroids = train_centroids(matrix.vectors, nlist or _nlist_for(n))
+        index = cls(
+            centroids=centroids,
+            row_ids=np.asarray(matrix.row_ids, dtype=np.int64),
+            list_ids=_assign(matrix.vectors, centroids),
+            generation=matrix.generation,
+            trained_rows=n,
+            token=matrix.token,
+        )
+        index._bind()
+        return index
+
+    def needs_retrain(self, matrix: EmbeddingMatrix) -> bool:
+        """Centroids drift out of balance once the corpus doubles or halves."""
+        n = len(matrix)
+        if matrix.vectors.shape[1] != self.centroids.shape[1]:
+            return True
+        return n >= 2 * self.trained_rows or n * 2 <= self.trained_rows
+
+    def refreshed(self, matrix: EmbeddingMatrix) -> IVFIndex:
+        """Align the assignment with a newer matrix, keeping the centroids.
+
+        Rows already in the index keep their cell, rows that no longer exist
+        are dropped, and only new rows are scored against the centroids.
+        """
+        # matrix.row_ids is sorted (loaded ORDER BY id); self.row_ids is too
+        known = np.isin(matrix.row_ids, self.row_ids, assume_unique=True)
+        list_ids = np.empty(len(matrix), dtype=np.int32)
+        if known.any():
+            keep = np.isin(self.row_ids, matrix.row_ids, assume_unique=True)
+            list_ids[known] = self.list_ids[keep]
+        new_positions = np.flatnonzero(~known)
+        if len(new_positions):
+            list_ids[new_positions] = _assign(matrix.vectors[new_positions], self.centroids)
+
+        index = IVFIndex(
+            centroids=self.centroids,
+            row_ids=np.asarray(matrix.row_ids, dtype=np.int64),
+            list_ids=list_ids,
+            generation=matrix.generation,
+            trained_rows=self.trained_rows,
+            token=matrix.token,
+        )
+        index._bind()
+        return index
+
+    def _bind(self) -> None:
+        """Group matrix positions by cell (the index is aligned to the matrix)."""
+        self._order = np.argsort(self.list_ids, kind="stable")
+        self._offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(self.list_ids, minlength=self.nlist))]
+        )
+
+    def search(
+        self,
+        matrix: EmbeddingMatrix,
+        query: np.ndarray,
+        k: int,
+        nprobe: int,
+        threshold: float | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Approximate top-k: same contract as EmbeddingMatrix.top_k."""
+        if self._order is None or self._offsets is None:
+            self._bind()
+        assert self._order is not None and self._offsets is not None
+        if len(matrix) == 0 or k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        query = np.asarray(query, dtype=np.float32)
+        nprobe = min(nprobe, self.nlist)
+        centroid_scores = self.centroids @ query
+        probe = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+        candidates = np.concatenate(
+            [self._order[self._offsets[c] : self._offsets[c + 1]] for c in probe]
+        )
+        if len(candidates) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        return matrix.top_k_among(candidates, query, k, threshold=threshold)
+
+
+def _index_path(db_path: Path, source: str, model_name: str) -> Path:
+    return sidecar_dir(db_path) / f"{sidecar_stem(source, model_name)}.ivf.npz"
+
+
+def _index_matches(index: IVFIndex, matrix: EmbeddingMatrix) -> bool:
+    """Whether the index's cell assignment was made for exactly this matrix."""
+    return index.generation == matrix.generation and index.token == matrix.token
+
+
+def _read_index(path: Path) -> IVFIndex | None:
+    if not path.exists():
+        return None
+    try:
+        with np.load(path) as data:
+            return IVFIndex(
+                centroids=data["centroids"],
+                row_ids=data["row_ids"],
+                list_ids=data["list_ids"],
+                generation=int(data["generation"]),
+                trained_rows=int(data["trained_rows"]),
+                token=int(data["token"]) if "token" in data else 0,
+            )
+    except (OSError, ValueError, KeyError) as e:
+        logger.debug("Ignoring unreadable ANN index %s: %s", path, e)
+        return None
+
+
+def _write_index(path: Path, index: IVFIndex) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.savez(
+                f,
+                centroids=index.centroids,
+                row_ids=index.row_ids,
+                list_ids=index.list_ids,
+                generation=np.int64(index.generation),
+                trained_rows=np.int64(index.trained_rows),
+                token=np.int64(index.token),
+            )
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug("Could not write ANN index %s: %s", path, e)
+
+
+def load_index(
+    source: str, model_name: str, matrix: EmbeddingMatrix, persist: bool = False
+) -> IVFIndex | None:
+    """Get an IVF index aligned with ``matrix``, or None if none was built.
+
+    A stale on-disk index is refreshed incrementally in memory; with
+    ``persist`` the refreshed assignment is written back.
+    """
+    db_path = Path(db.db_path)
+    key = (str(db_path), source, model_name)
+    cached = _cache.get(key)
+    if cached is not None and _index_matches(cached, matrix):
+        return cached
+
+    path = _index_path(db_path, source, model_name)
+    index = cached or _read_index(path)
+    if index is None or index.centroids.shape[1] != matrix.vectors.shape[1]:
+        return None
+    if not _index_matches(index, matrix):
+        index = index.refreshed(matrix)
+        if persist:
+            _write_index(path, index)
+    else:
+        index._bind()
+    if matrix.generation != UNKNOWN_GENERATION:
+        _cache[key] = index
+    return index
+
+
+def build_index(
+    source: str, model_name: str, matrix: EmbeddingMatrix, force: bool = False
+) -> IVFIndex | None:
+    """Create or incrementally refresh the persisted index for a partition.
+
+    Returns None (and removes any stale index) when the partition is below
+    ANN_MIN_CHUNKS, where exact search is already fast.
+    """
+    db_path = Path(db.db_path)
+    path = _index_path(db_path, source, model_name)
+    if len(matrix) < ANN_MIN_CHUNKS:
+        path.unlink(missing_ok=True)
+        _cache.pop((str(db_path), source, model_name), None)
+        return None
+
+    existing = None if force else load_index(source, model_name, matrix)
+    if existing is not None and not existing.needs_retrain(matrix):
+        index = existing
+    else:
+        index = IVFIndex.train(matrix)
+    _write_index(path, index)
+    if matrix.generation != UNKNOWN_GENERATION:
+        _cache[(str(db_path), source, model_name)] = index
+    return index
+
+
+def search(
+    source: str,
+    model_name: str,
+    matrix: EmbeddingMatrix,
+    query: np.ndarray,
+    k: int,
+    threshold: float | None = None,
+    nprobe: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Top-k over a matrix, through the IVF index when one applies.
+
+    Falls back to exact search when the partition is small, no index has
+    been built, or ``nprobe`` is 0.
+    """
+    nprobe = default_nprobe() if nprobe is None else nprobe
+    if nprobe > 0 and len(matrix) >= ANN_MIN_CHUNKS:
+        index = load_index(source, model_name, matrix)
+        if index is not None:
+            return index.search(matrix, query, k, nprobe, threshold=threshold)
+    return matrix.top_k(query, k, threshold=threshold)
+
+
+def clear_cache() -> None:
+    """Drop in-process indexes."""
+    _cache.clear()
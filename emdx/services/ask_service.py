@@ -20,7 +20,9 @@ from typing import TYPE_CHECKING
 
 from ..config.cli_config import DEFAULT_LLM_MODEL
 from ..database import db
+from ..database.search import search_substring
 from ..utils.environment import get_subprocess_env
+from . import result_cache
 
 if TYPE_CHECKING:
     from .embedding_service import ChunkMatch, EmbeddingService
@@ -346,23 +348,14 @@ class AskService:
         if mode in (AskMode.THINK, AskMode.CHALLENGE):
             effective_limit = max(limit, 20)
 
-        # Choose retrieval method
-        if force_keyword or not self._has_embeddings():
-            docs, method = self._retrieve_keyword(
-                question,
-                effective_limit,
-                project,
-                tags=tags,
-                recent_days=recent_days,
-            )
-        else:
-            docs, method = self._retrieve_semantic(
-                question,
-                effective_limit,
-                project,
-                tags=tags,
-                recent_days=recent_days,
-            )
+        docs, method = self._retrieve(
+            question,
+            effective_limit,
+            project,
+            force_keyword=force_keyword,
+            tags=tags,
+            recent_days=recent_days,
+        )
 
         # Optionally retrieve chunks for cite mode
         chunks: list[ChunkMatch] = []
@@ -400,6 +393,57 @@ class AskService:
             cited_ids=cited_ids,
         )
 
+    def _retrieve(
+        self,
+        question: str,
+        limit: int,
+        project: str | None = None,
+        force_keyword: bool = False,
+        tags: str | None = None,
+        recent_days: int | None = None,
+    ) -> tuple[list[tuple[int, str, str]], str]:
+        """Retrieve documents, reusing a cached result set when the KB is unchanged.
+
+        Only document ids are cached; titles and content are re-read. Queries
+        with ``recent_days`` bypass the cache, since their window moves with
+        the clock rather than with KB writes.
+        """
+        embedding_service = None if force_keyword else self._get_embedding_service()
+        key = result_cache.make_key(
+            "ask",
+            question,
+            limit=limit,
+            project=project,
+            force_keyword=force_keyword,
+            tags=tags,
+            model=embedding_service.MODEL_NAME if embedding_service else None,
+        )
+        stamp, cached = (None, None) if recent_days else result_cache.get(key)
+        if cached is not None:
+            docs = _load_docs(cached["ids"])
+            if len(docs) == len(cached["ids"]):
+                return docs, cached["method"]
+
+        # Choose retrieval method
+        if force_keyword or not self._has_embeddings():
+            docs, method = self._retrieve_keyword(
+                question,
+                limit,
+                project,
+                tags=tags,
+                recent_days=recent_days,
+            )
+        else:
+            docs, method = self._retrieve_semantic(
+                question,
+                limit,
+                project,
+                tags=tags,
+                recent_days=recent_days,
+            )
+        result_cache.put(key, stamp, {"ids": [d[0] for d in docs], "method": method})
+        return docs, method
+
     def _calculate_confidence_signals(
         self,
         question: str,
@@ -590,21 +634,7 @@ class AskService:
                     pass
 
             for ticket in ticket_refs:
-                query = (
-                    "SELECT id, title, content "
-                    "FROM documents "
-                    "WHERE content LIKE ? AND is_deleted = 0"
-                )
-                params: list[SqlParam] = [f"%{ticket}%"]
-
-                if project:
-                    query += " AND project = ?"
-                    params.append(project)
-
-                query += " LIMIT 3"
-                cursor.execute(query, params)
-
-                for row in cursor.fetchall():
+                for row in search_substring(ticket, project=project, limit=3):
                     if row[0] not in seen and passes_filter(row[0]):
                         docs.append(row)
                         seen.add(row[0])
@@ -800,6 +830,21 @@ class AskService:
 # ── Helper functions ───────────────────────────────────────────────────
 
 
+def _load_docs(doc_ids: list[int]) -> list[tuple[int, str, str]]:
+    """(id, title, content) of live documents, in the order given."""
+    if not doc_ids:
+        return []
+    placeholders = ",".join("?" * len(doc_ids))
+    with db.get_connection() as conn:
+        rows = conn.execute(
+            f"SELECT id, title, content FROM documents "
+            f"WHERE id IN ({placeholders}) AND is_deleted = 0",
+            doc_ids,
+        ).fetchall()
+    by_id = {row[0]: (row[0], row[1], row[2]) for row in rows}
+    return [by_id[doc_id] for doc_id in doc_ids if doc_id in by_id]
+
+
 def _build_doc_context(
     docs: list[tuple[int, str, str]],
     budget: int,
@@ -23,6 +23,7 @@ from ..config.constants import (
     BACKUP_YEARLY_DAYS,
     EMDX_BACKUP_DIR,
 )
+from ..database.connection import close_pooled_connections
 
 logger = logging.getLogger(__name__)
 
@@ -187,6 +188,17 @@ class BackupService:
             if integrity != "ok":
                 raise RuntimeError(f"backup failed integrity check: {integrity}")
 
+            # Pooled connections would keep the old file (and its WAL) alive
+            # across the swap; close them and fold the WAL into the main file
+            # so the safety copy is complete and no stale -wal outlives it.
+            close_pooled_connections(self.db_path)
+            if self.db_path.exists():
+                live = sqlite3.connect(self.db_path)
+                try:
+                    live.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                finally:
+                    live.close()
+
             # Keep a safety copy of the current DB, then swap in the validated copy
             if self.db_path.exists():
                 pre_restore = self.db_path.parent / f"{self.db_path.name}.pre-restore"
@@ -323,22 +323,19 @@ class ContradictionService:
         doc_titles = {row[0]: row[1] for row in docs}
         doc_ids = list(doc_titles.keys())
 
-        # Use find_similar for each doc to get high-similarity pairs
+        # Neighbours of every doc from one all-pairs pass (persisted graph)
+        graph = svc.neighbour_graph(k=10, by_project=bool(project))
         seen_pairs: set[tuple[int, int]] = set()
         pairs: list[tuple[int, int, float, str, str]] = []
 
         for doc_id in doc_ids:
-            if len(pairs) >= limit:
-                break
-
-            similar = svc.find_similar(doc_id, limit=10, project=project)
-            for match in similar:
-                if match.similarity < threshold:
-                    continue
+            for neighbour_id, similarity in graph.get(doc_id, []):
+                if similarity < threshold:
+                    break
 
                 pair_key = (
-                    min(doc_id, match.doc_id),
-                    max(doc_id, match.doc_id),
+                    min(doc_id, neighbour_id),
+                    max(doc_id, neighbour_id),
                 )
                 if pair_key in seen_pairs:
                     continue
@@ -347,16 +344,13 @@ class ContradictionService:
                 pairs.append(
                     (
                         doc_id,
-                        match.doc_id,
-                        match.similarity,
+                        neighbour_id,
+                        similarity,
                         doc_titles.get(doc_id, ""),
-                        match.title,
+                        doc_titles.get(neighbour_id, ""),
                     )
                 )
 
-                if len(pairs) >= limit:
-                    break
-
         # Sort by similarity descending
         pairs.sort(key=lambda x: x[2], reverse=True)
         return pairs[:limit]
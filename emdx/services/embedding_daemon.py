@@ -0,0 +1,299 @@
+"""
+Opt-in background worker that keeps the embedding model resident.
+
+Every CLI process that embeds text (semantic ``find``, ``ask``, auto-link on
+save) otherwise pays the model load itself. With ``EMDX_EMBED_DAEMON=1`` the
+first such process spawns this worker and carries on in-process; later
+processes send their texts over a Unix socket instead of loading the model.
+The worker exits after ``EMBED_DAEMON_IDLE_TIMEOUT`` seconds without
+requests.
+
+Protocol (one request per connection):
+  Request:  {"texts": ["...", ...]}\\n
+  Response: {"shape": [n, dim]}\\n followed by n * dim float32 values
+  Error:    {"error": "..."}\\n
+
+Run in the foreground with: python -m emdx.services.embedding_daemon
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import logging
+import os
+import socket
+import subprocess
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Protocol
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+    HAS_NUMPY = False
+
+from ..config.constants import EMBED_DAEMON_IDLE_TIMEOUT, EMDX_CONFIG_DIR
+
+logger = logging.getLogger(__name__)
+
+DAEMON_ENV_VAR = "EMDX_EMBED_DAEMON"
+IDLE_ENV_VAR = "EMDX_EMBED_DAEMON_IDLE"
+
+# Client-side limit for one request; batch indexing sends up to ~100 texts
+_REQUEST_TIMEOUT = 120.0
+
+
+class _Encoder(Protocol):
+    def encode(self, texts: str | list[str]) -> np.ndarray: ...
+
+
+def enabled() -> bool:
+    """Whether the user opted in (and the platform has Unix sockets)."""
+    flag = os.environ.get(DAEMON_ENV_VAR, "").strip().lower()
+    return flag in ("1", "true", "yes", "on") and hasattr(socket, "AF_UNIX")
+
+
+def idle_timeout() -> float:
+    """Idle timeout from EMDX_EMBED_DAEMON_IDLE or the default."""
+    raw = os.environ.get(IDLE_ENV_VAR)
+    if raw:
+        try:
+            return max(1.0, float(raw))
+        except ValueError:
+            logger.warning("Invalid %s=%r — using %d", IDLE_ENV_VAR, raw, EMBED_DAEMON_IDLE_TIMEOUT)
+    return float(EMBED_DAEMON_IDLE_TIMEOUT)
+
+
+def runtime_dir() -> Path:
+    """Directory holding daemon sockets and lock files."""
+    return EMDX_CONFIG_DIR / "run"
+
+
+def socket_path(backend: str) -> Path:
+    """One daemon per backend, since each backend has its own vector space."""
+    return runtime_dir() / f"embed-{backend}.sock"
+
+
+def _lock_path(backend: str) -> Path:
+    return runtime_dir() / f"embed-{backend}.lock"
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+class DaemonModel:
+    """Model adapter that embeds through the daemon.
+
+    Same ``encode()`` contract as the in-process adapters. If the daemon
+    goes away (e.g. it idled out), the texts are embedded with the model
+    returned by ``fallback``, which is then used for the rest of the process.
+    """
+
+    def __init__(self, path: Path, fallback: Callable[[], _Encoder]) -> None:
+        self._path = path
+        self._fallback_factory = fallback
+        self._fallback: _Encoder | None = None
+
+    def encode(self, texts: str | list[str]) -> np.ndarray:
+        if self._fallback is None:
+            try:
+                return self._remote_encode(texts)
+            except (OSError, ValueError) as e:
+                logger.info("Embedding daemon unavailable (%s); loading model in-process", e)
+                self._fallback = self._fallback_factory()
+        return self._fallback.encode(texts)
+
+    def _remote_encode(self, texts: str | list[str]) -> np.ndarray:
+        single = isinstance(texts, str)
+        inputs = [texts] if isinstance(texts, str) else list(texts)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_REQUEST_TIMEOUT)
+            sock.connect(str(self._path))
+            with sock.makefile("rwb") as stream:
+                stream.write(json.dumps({"texts": inputs}).encode() + b"\n")
+                stream.flush()
+                header = json.loads(stream.readline() or b"{}")
+                if "error" in header:
+                    raise ValueError(header["error"])
+                if "shape" not in header:
+                    raise ValueError("truncated response")
+                rows, dim = header["shape"]
+                payload = stream.read(rows * dim * 4)
+        if len(payload) != rows * dim * 4:
+            raise ValueError("truncated response")
+        vectors = np.frombuffer(payload, dtype=np.float32).reshape(rows, dim)
+        return vectors[0] if single else vectors
+
+
+def _is_listening(path: Path) -> bool:
+    if not path.exists():
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(1.0)
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+def _spawn(backend: str) -> None:
+    """Start a detached daemon; it exits at once if another one holds the lock."""
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", "emdx.services.embedding_daemon", "--backend", backend],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            close_fds=True,
+        )
+    except OSError as e:
+        logger.debug("Could not start embedding daemon: %s", e)
+
+
+def connect(backend: str, fallback: Callable[[], _Encoder]) -> DaemonModel | None:
+    """Return a daemon-backed model, or None after starting a daemon.
+
+    The caller loads the model in-process when this returns None; the
+    daemon warms up in the background for the next invocation.
+    """
+    path = socket_path(backend)
+    if _is_listening(path):
+        return DaemonModel(path, fallback)
+    _spawn(backend)
+    return None
+
+
+def stop(backend: str) -> bool:
+    """Ask a running daemon to exit. Returns whether one was running."""
+    path = socket_path(backend)
+    if not _is_listening(path):
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(5.0)
+        sock.connect(str(path))
+        sock.sendall(b'{"op": "shutdown"}\n')
+        sock.recv(64)
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+
+def _handle(conn: socket.socket, model: _Encoder) -> bool:
+    """Serve one request. Returns False when asked to shut down."""
+    conn.settimeout(_REQUEST_TIMEOUT)
+    try:
+        with conn, conn.makefile("rwb") as stream:
+            return _dispatch(stream, model)
+    except OSError as e:
+        # Client went away mid-reply; nothing to clean up
+        logger.debug("Embedding daemon connection dropped: %s", e)
+        return True
+
+
+def _dispatch(stream: io.BufferedIOBase, model: _Encoder) -> bool:
+    line = stream.readline()
+    if not line:
+        # Liveness probe: connected and closed without a request
+        return True
+    try:
+        request = json.loads(line)
+    except ValueError:
+        request = None
+    if not isinstance(request, dict):
+        _reply(stream, {"error": "invalid request"})
+        return True
+    if request.get("op") == "shutdown":
+        _reply(stream, {"ok": True})
+        return False
+
+    texts = request.get("texts")
+    if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+        _reply(stream, {"error": "expected {'texts': [str, ...]}"})
+        return True
+    try:
+        vectors = np.asarray(model.encode(texts), dtype=np.float32).reshape(len(texts), -1)
+    except Exception as e:
+        logger.exception("Embedding request failed")
+        _reply(stream, {"error": str(e)})
+        return True
+    _reply(stream, {"shape": list(vectors.shape)}, vectors.tobytes())
+    return True
+
+
+def _reply(stream: io.BufferedIOBase, header: dict[str, object], payload: bytes = b"") -> None:
+    stream.write(json.dumps(header).encode() + b"\n" + payload)
+    stream.flush()
+
+
+def serve(backend: str, model_factory: Callable[[], _Encoder], idle: float) -> None:
+    """Load the model and answer requests until idle for ``idle`` seconds."""
+    import fcntl
+
+    directory = runtime_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = socket_path(backend)
+
+    with open(_lock_path(backend), "w") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            logger.info("Embedding daemon for %s already running", backend)
+            return
+
+        model = model_factory()
+        # Holding the lock, any existing socket file is stale
+        path.unlink(missing_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(str(path))
+            os.chmod(path, 0o600)
+            server.listen(16)
+            server.settimeout(idle)
+            logger.info("Embedding daemon for %s listening on %s", backend, path)
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except TimeoutError:
+                    logger.info("Embedding daemon idle for %ss; exiting", idle)
+                    break
+                if not _handle(conn, model):
+                    break
+        finally:
+            server.close()
+            path.unlink(missing_ok=True)
+
+
+def main(argv: list[str] | None = None) -> None:
+    from .embedding_service import BACKEND_ENV_VAR, _backend_name, _load_local_model
+
+    parser = argparse.ArgumentParser(description="emdx embedding daemon")
+    parser.add_argument("--backend", default=None, help="Embedding backend (default: auto)")
+    parser.add_argument("--idle-timeout", type=float, default=None)
+    parser.add_argument("--stop", action="store_true", help="Stop a running daemon")
+    args = parser.parse_args(argv)
+
+    backend = args.backend or _backend_name()
+    if args.stop:
+        print("stopped" if stop(backend) else "not running")
+        return
+    # The daemon always loads its model locally, whatever the backend
+    # override in its environment says
+    os.environ[BACKEND_ENV_VAR] = backend
+    serve(backend, _load_local_model, args.idle_timeout or idle_timeout())
+
+
+if __name__ == "__main__":
+    main()
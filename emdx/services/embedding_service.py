@@ -11,11 +11,12 @@ fastembed is not installed. Override with EMDX_EMBEDDING_BACKEND.
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import importlib.util
 import logging
 import os
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, TypeVar
 
@@ -23,6 +24,8 @@ if TYPE_CHECKING:
     from fastembed import TextEmbedding
     from sentence_transformers import SentenceTransformer
 
+    from ..utils.chunk_splitter import Chunk
+
 try:
     import numpy as np
 
@@ -31,18 +34,46 @@ except ImportError:
     np = None  # type: ignore[assignment]
     HAS_NUMPY = False
 
+from ..config.constants import KNN_GRAPH_K
 from ..database import db
+from . import ann_index, embedding_daemon, knn_graph, query_cache
+from .embedding_daemon import DaemonModel
+from .vector_index import (
+    CHUNK_EMBEDDINGS,
+    DOCUMENT_EMBEDDINGS,
+    FLOAT32,
+    decode_blob,
+    encode_vector,
+    get_storage_format,
+    load_matrix,
+    prune_originals,
+    save_originals,
+    set_storage_format,
+)
 
 logger = logging.getLogger(__name__)
 
 _T = TypeVar("_T")
 
+
+def _content_hash(text: str) -> str:
+    """Hash of the exact text an embedding was computed from."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+# Chunk indexing pipeline: documents read per page, chunk rows per write
+# transaction, and the run size below which splitting stays in-process
+_CHUNK_PAGE_SIZE = 500
+_CHUNK_WRITE_ROWS = 2000
+_CHUNK_POOL_MIN_DOCS = 200
+_CHUNK_RESUME_FLAG = "chunk_reindex_resume:{model_name}"
+
 BACKEND_ENV_VAR = "EMDX_EMBEDDING_BACKEND"
 _BACKEND_FASTEMBED = "fastembed"
 _BACKEND_SENTENCE_TRANSFORMERS = "sentence-transformers"
 
 # Lazy load — the model is ~90MB and loading it is the dominant startup cost
-_model: _FastembedModel | _SentenceTransformerModel | None = None
+_model: _FastembedModel | _SentenceTransformerModel | DaemonModel | None = None
 
 # Loggers that emit noise during model loading
 _NOISY_LOGGERS = (
@@ -138,45 +169,72 @@ def _load_model_silently(factory: Callable[[], _T]) -> _T:
             logging.getLogger(name).setLevel(level)
 
 
-def _get_model() -> _FastembedModel | _SentenceTransformerModel:
-    """Lazy load the embedding model on the resolved backend."""
+def _get_model() -> _FastembedModel | _SentenceTransformerModel | DaemonModel:
+    """Lazy load the embedding model on the resolved backend.
+
+    With EMDX_EMBED_DAEMON=1 this returns a client for the shared embedding
+    daemon when one is running (starting one otherwise) and only loads the
+    model in-process as a fallback.
+    """
     global _model
     if _model is None:
         if not HAS_NUMPY:
             raise ImportError(
                 "numpy is required for embedding features. Install it with: pip install 'emdx[ai]'"
             ) from None
-
-        # all-MiniLM-L6-v2: good balance of speed/quality
-        # ~90MB download, ~80ms per doc, 384 dimensions
-        backend = _backend_name()
-        if backend == _BACKEND_FASTEMBED:
-            try:
-                from fastembed import TextEmbedding
-            except ImportError:
-                raise ImportError(
-                    "fastembed is required for embedding features "
-                    f"(requested via {BACKEND_ENV_VAR} or auto-detected). "
-                    "Install it with: pip install fastembed"
-                ) from None
-            _model = _load_model_silently(
-                lambda: _FastembedModel(TextEmbedding("sentence-transformers/all-MiniLM-L6-v2"))
-            )
-        else:
-            try:
-                from sentence_transformers import SentenceTransformer
-            except ImportError:
-                raise ImportError(
-                    "sentence-transformers is required for embedding features. "
-                    "Install it with: pip install 'emdx[ai]'"
-                ) from None
-            _model = _load_model_silently(
-                lambda: _SentenceTransformerModel(SentenceTransformer("all-MiniLM-L6-v2"))
-            )
-        logger.info("Loaded embedding model: all-MiniLM-L6-v2 (backend: %s)", backend)
+        if embedding_daemon.enabled():
+            _model = embedding_daemon.connect(_backend_name(), _load_local_model)
+        if _model is None:
+            _model = _load_local_model()
     return _model
 
 
+def _load_local_model() -> _FastembedModel | _SentenceTransformerModel:
+    """Load the embedding model into this process."""
+    # all-MiniLM-L6-v2: good balance of speed/quality
+    # ~90MB download, ~80ms per doc, 384 dimensions
+    backend = _backend_name()
+    model: _FastembedModel | _SentenceTransformerModel
+    if backend == _BACKEND_FASTEMBED:
+        try:
+            from fastembed import TextEmbedding
+        except ImportError:
+            raise ImportError(
+                "fastembed is required for embedding features "
+                f"(requested via {BACKEND_ENV_VAR} or auto-detected). "
+                "Install it with: pip install fastembed"
+            ) from None
+        model = _load_model_silently(
+            lambda: _FastembedModel(TextEmbedding("sentence-transformers/all-MiniLM-L6-v2"))
+        )
+    else:
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ImportError(
+                "sentence-transformers is required for embedding features. "
+                "Install it with: pip install 'emdx[ai]'"
+            ) from None
+        model = _load_model_silently(
+            lambda: _SentenceTransformerModel(SentenceTransformer("all-MiniLM-L6-v2"))
+        )
+    logger.info("Loaded embedding model: all-MiniLM-L6-v2 (backend: %s)", backend)
+    return model
+
+
+@dataclass
+class _PendingChunks:
+    """A document's new chunk rows, waiting for their missing vectors."""
+
+    doc_id: int
+    chunks: list[Chunk]
+    hashes: list[str]
+    blobs: list[bytes | None]
+    missing: int = 0
+    # float32 vectors of newly encoded chunks in a quantized partition, by position
+    originals: dict[int, np.ndarray] = field(default_factory=dict)
+
+
 @dataclass
 class SemanticMatch:
     """A semantically similar document."""
@@ -244,15 +302,18 @@ class EmbeddingService:
         model = _get_model()
         return model.encode(text)
 
-    def embed_document(self, doc_id: int, force: bool = False) -> np.ndarray:
-        """Embed a document (cached in database)."""
-        # Check cache first
-        if not force:
-            cached = self._get_cached_embedding(doc_id)
-            if cached is not None:
-                return cached
+    def embed_query(self, query: str) -> np.ndarray:
+        """Embed a search query, consulting the on-disk query cache first."""
+        normalized = query_cache.normalize(query)
+        cached = query_cache.get(normalized, self.MODEL_NAME)
+        if cached is not None:
+            return cached
+        embedding = self.embed_text(normalized)
+        query_cache.put(normalized, self.MODEL_NAME, embedding)
+        return embedding
 
-        # Fetch document content
+    def embed_document(self, doc_id: int, force: bool = False) -> np.ndarray:
+        """Embed a document (cached in database until its text changes)."""
         with db.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
@@ -267,68 +328,93 @@ class EmbeddingService:
 
         # Combine title and content for richer embedding
         text = f"{title}\n\n{content}"
+        content_hash = _content_hash(text)
+
+        # Reuse the stored vector while the text it was built from is unchanged
+        if not force:
+            cached = self._get_cached_embedding(doc_id, content_hash)
+            if cached is not None:
+                return cached
+
         embedding = self.embed_text(text)
 
         # Cache it
-        self._save_embedding(doc_id, embedding)
+        self._save_embedding(doc_id, embedding, content_hash)
 
         return embedding
 
-    def _get_cached_embedding(self, doc_id: int) -> np.ndarray | None:
-        """Get cached embedding from database."""
+    def _get_cached_embedding(self, doc_id: int, content_hash: str) -> np.ndarray | None:
+        """Get cached embedding from database if it matches ``content_hash``."""
         with db.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT embedding FROM document_embeddings WHERE document_id = ? AND model_name = ?",  # noqa: E501
-                (doc_id, self.MODEL_NAME),
+                "SELECT e.embedding, e.dimension, e.content_hash, o.embedding "
+                "FROM document_embeddings e "
+                "LEFT JOIN embedding_originals o ON o.source = ? "
+                "AND o.model_name = e.model_name AND o.content_hash = e.content_hash "
+                "WHERE e.document_id = ? AND e.model_name = ?",
+                (DOCUMENT_EMBEDDINGS, doc_id, self.MODEL_NAME),
             )
             row = cursor.fetchone()
-            if row:
-                return np.frombuffer(row[0], dtype=np.float32)
+            if row and row[2] == content_hash:
+                if row[3] is not None:
+                    return np.frombuffer(row[3], dtype=np.float32)
+                return decode_blob(row[0], row[1])
         return None
 
-    def _save_embedding(self, doc_id: int, embedding: np.ndarray) -> None:
+    def _save_embedding(self, doc_id: int, embedding: np.ndarray, content_hash: str) -> None:
         """Cache embedding to database."""
         with db.get_connection() as conn:
+            storage_format = get_storage_format(conn, DOCUMENT_EMBEDDINGS, self.MODEL_NAME)
             cursor = conn.cursor()
             cursor.execute(
                 """
                 INSERT OR REPLACE INTO document_embeddings
-                (document_id, model_name, embedding, dimension, updated_at)
-                VALUES (?, ?, ?, ?, ?)
+                (document_id, model_name, embedding, dimension, content_hash, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
             """,
                 (
                     doc_id,
                     self.MODEL_NAME,
-                    embedding.tobytes(),
+                    encode_vector(embedding, storage_format),
                     self.EMBEDDING_DIM,
+                    content_hash,
                     datetime.utcnow().isoformat(),
                 ),
             )
+            if storage_format != FLOAT32:
+                save_originals(
+                    conn, DOCUMENT_EMBEDDINGS, self.MODEL_NAME, [(content_hash, embedding)]
+                )
             conn.commit()
 
     def index_all(self, force: bool = False, batch_size: int = 50) -> int:
-        """Index all unembedded documents. Returns count of newly indexed docs."""
+        """Embed new and edited documents. Returns count of (re)indexed docs.
+
+        A document is skipped when its stored embedding was built from the
+        same title and content (by content hash); ``force`` re-embeds all.
+        """
         with db.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT d.id, d.title, d.content, e.content_hash
+                FROM documents d
+                LEFT JOIN document_embeddings e
+                    ON d.id = e.document_id AND e.model_name = ?
+                WHERE d.is_deleted = 0
+            """,
+                (self.MODEL_NAME,),
+            )
+            rows = cursor.fetchall()
+            storage_format = get_storage_format(conn, DOCUMENT_EMBEDDINGS, self.MODEL_NAME)
 
-            if force:
-                # Get all documents
-                cursor.execute("SELECT id, title, content FROM documents WHERE is_deleted = 0")
-            else:
-                # Only get documents without embeddings
-                cursor.execute(
-                    """
-                    SELECT d.id, d.title, d.content
-                    FROM documents d
-                    LEFT JOIN document_embeddings e
-                        ON d.id = e.document_id AND e.model_name = ?
-                    WHERE d.is_deleted = 0 AND e.id IS NULL
-                """,
-                    (self.MODEL_NAME,),
-                )
-
-            docs = cursor.fetchall()
+        docs = []
+        for doc_id, title, content, stored_hash in rows:
+            text = f"{title}\n\n{content}"
+            content_hash = _content_hash(text)
+            if force or stored_hash != content_hash:
+                docs.append((doc_id, text, content_hash))
 
         if not docs:
             return 0
@@ -339,7 +425,7 @@ class EmbeddingService:
         # Process in batches for efficiency
         for i in range(0, len(docs), batch_size):
             batch = docs[i : i + batch_size]
-            texts = [f"{title}\n\n{content}" for _, title, content in batch]
+            texts = [text for _, text, _ in batch]
 
             # Batch encode
             embeddings = model.encode(texts)
@@ -347,26 +433,38 @@ class EmbeddingService:
             # Save all embeddings in batch
             with db.get_connection() as conn:
                 cursor = conn.cursor()
-                for (doc_id, _, _), embedding in zip(batch, embeddings, strict=False):
+                for (doc_id, _, content_hash), embedding in zip(batch, embeddings, strict=False):
                     cursor.execute(
                         """
                         INSERT OR REPLACE INTO document_embeddings
-                        (document_id, model_name, embedding, dimension, updated_at)
-                        VALUES (?, ?, ?, ?, ?)
+                        (document_id, model_name, embedding, dimension, content_hash, updated_at)
+                        VALUES (?, ?, ?, ?, ?, ?)
                     """,
                         (
                             doc_id,
                             self.MODEL_NAME,
-                            embedding.tobytes(),
+                            encode_vector(embedding, storage_format),
                             self.EMBEDDING_DIM,
+                            content_hash,
                             datetime.utcnow().isoformat(),
                         ),
                     )
+                if storage_format != FLOAT32:
+                    save_originals(
+                        conn,
+                        DOCUMENT_EMBEDDINGS,
+                        self.MODEL_NAME,
+                        [(h, e) for (_, _, h), e in zip(batch, embeddings, strict=False)],
+                    )
                 conn.commit()
 
             count += len(batch)
             logger.info(f"Indexed {count}/{len(docs)} documents")
 
+        if storage_format != FLOAT32:
+            with db.get_connection() as conn:
+                prune_originals(conn, DOCUMENT_EMBEDDINGS, self.MODEL_NAME)
+                conn.commit()
         return count
 
     def search(self, query: str, limit: int = 10, threshold: float = 0.3) -> list[SemanticMatch]:
@@ -377,47 +475,11 @@ class EmbeddingService:
         self, query: str, limit: int = 10, threshold: float = 0.3
     ) -> list[SemanticMatch]:
         """Internal synchronous search implementation."""
-        query_embedding = self.embed_text(query)
+        query_embedding = self.embed_query(query)
 
-        # Load all embeddings from database
-        with db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT e.document_id, e.embedding, d.title, d.project,
-                       SUBSTR(d.content, 1, 200) as snippet
-                FROM document_embeddings e
-                JOIN documents d ON e.document_id = d.id
-                WHERE e.model_name = ? AND d.is_deleted = 0
-            """,
-                (self.MODEL_NAME,),
-            )
-            rows = cursor.fetchall()
-
-        if not rows:
-            return []
-
-        # Compute similarities
-        results = []
-        for doc_id, emb_bytes, title, project, snippet in rows:
-            doc_embedding = np.frombuffer(emb_bytes, dtype=np.float32)
-            # Dot product of normalized vectors = cosine similarity
-            similarity = float(np.dot(query_embedding, doc_embedding))
-
-            if similarity >= threshold:
-                results.append(
-                    SemanticMatch(
-                        doc_id=doc_id,
-                        title=title,
-                        project=project,
-                        similarity=similarity,
-                        snippet=snippet.replace("\n", " ")[:150] + "..." if snippet else "",
-                    )
-                )
-
-        # Sort by similarity descending
-        results.sort(key=lambda x: x.similarity, reverse=True)
-        return results[:limit]
+        matrix = load_matrix(DOCUMENT_EMBEDDINGS, self.MODEL_NAME)
+        positions, scores = matrix.top_k(query_embedding, limit, threshold=threshold)
+        return self._hydrate_matches(matrix.doc_ids[positions], scores)
 
     def find_similar(
         self, doc_id: int, limit: int = 5, project: str | None = None
@@ -431,50 +493,76 @@ class EmbeddingService:
         """
         doc_embedding = self.embed_document(doc_id)
 
-        with db.get_connection() as conn:
-            cursor = conn.cursor()
-            if project is not None:
-                cursor.execute(
-                    """
-                    SELECT e.document_id, e.embedding, d.title, d.project,
-                           SUBSTR(d.content, 1, 200) as snippet
-                    FROM document_embeddings e
-                    JOIN documents d ON e.document_id = d.id
-                    WHERE e.model_name = ? AND d.is_deleted = 0
-                          AND e.document_id != ? AND d.project = ?
-                    """,
-                    (self.MODEL_NAME, doc_id, project),
-                )
-            else:
-                cursor.execute(
-                    """
-                    SELECT e.document_id, e.embedding, d.title, d.project,
-                           SUBSTR(d.content, 1, 200) as snippet
-                    FROM document_embeddings e
-                    JOIN documents d ON e.document_id = d.id
-                    WHERE e.model_name = ? AND d.is_deleted = 0 AND e.document_id != ?
-                    """,
-                    (self.MODEL_NAME, doc_id),
+        matrix = load_matrix(DOCUMENT_EMBEDDINGS, self.MODEL_NAME)
+        mask = matrix.doc_ids != doc_id
+        if project is not None:
+            with db.get_connection() as conn:
+                cursor = conn.execute(
+                    "SELECT id FROM documents WHERE project = ? AND is_deleted = 0",
+                    (project,),
                 )
-            rows = cursor.fetchall()
+                project_ids = np.fromiter((row[0] for row in cursor), dtype=np.int64)
+            mask &= np.isin(matrix.doc_ids, project_ids)
 
-        results = []
-        for other_id, emb_bytes, title, doc_project, snippet in rows:
-            other_embedding = np.frombuffer(emb_bytes, dtype=np.float32)
-            similarity = float(np.dot(doc_embedding, other_embedding))
+        positions, scores = matrix.top_k(doc_embedding, limit, mask=mask)
+        return self._hydrate_matches(matrix.doc_ids[positions], scores)
+
+    def neighbour_graph(
+        self, k: int = KNN_GRAPH_K, by_project: bool = False
+    ) -> knn_graph.Neighbours:
+        """Top-k similar documents for every indexed document at once.
+
+        Equivalent to calling ``find_similar`` for each document (scoped to
+        its own project when ``by_project``), but computed in one blocked
+        pass and persisted until the embeddings change.
+        """
+        scope = knn_graph.SCOPE_PROJECT if by_project else knn_graph.SCOPE_ALL
+        return knn_graph.neighbours(self.MODEL_NAME, k, scope)
+
+    def _hydrate_matches(self, doc_ids: np.ndarray, scores: np.ndarray) -> list[SemanticMatch]:
+        """Fetch display fields for ranked document ids, preserving rank order."""
+        if len(doc_ids) == 0:
+            return []
 
+        ids = [int(i) for i in doc_ids]
+        with db.get_connection() as conn:
+            placeholders = ",".join("?" * len(ids))
+            cursor = conn.execute(
+                f"""
+                SELECT d.id, d.title, d.project, l.lead
+                FROM documents d
+                LEFT JOIN document_leads l ON l.document_id = d.id
+                WHERE d.id IN ({placeholders}) AND d.is_deleted = 0
+                """,
+                ids,
+            )
+            rows = {row[0]: row for row in cursor.fetchall()}
+
+        results = []
+        for doc_id, similarity in zip(ids, scores, strict=True):
+            row = rows.get(doc_id)
+            if row is None:
+                continue
+            _, title, project, lead = row
             results.append(
                 SemanticMatch(
-                    doc_id=other_id,
+                    doc_id=doc_id,
                     title=title,
-                    project=doc_project,
-                    similarity=similarity,
-                    snippet=snippet.replace("\n", " ")[:150] + "..." if snippet else "",
+                    project=project,
+                    similarity=float(similarity),
+                    snippet=lead or "",
                 )
             )
+        return results
 
-        results.sort(key=lambda x: x.similarity, reverse=True)
-        return results[:limit]
+    def warm_search_index(self, force: bool = False) -> None:
+        """Build (or refresh) the search matrices and the chunk ANN index.
+
+        The ANN index is updated incrementally unless ``force`` retrains it.
+        """
+        load_matrix(DOCUMENT_EMBEDDINGS, self.MODEL_NAME)
+        chunks = load_matrix(CHUNK_EMBEDDINGS, self.MODEL_NAME)
+        ann_index.build_index(CHUNK_EMBEDDINGS, self.MODEL_NAME, chunks, force=force)
 
     def stats(self) -> EmbeddingStats:
         """Get embedding index statistics."""
@@ -529,6 +617,20 @@ class EmbeddingService:
             chunk_index_size_bytes=chunk_size,
         )
 
+    def set_storage_format(self, storage_format: str) -> int:
+        """Store this model's document and chunk vectors as float32/float16/int8.
+
+        Existing rows are re-encoded in place (no re-embedding). Returns the
+        number of rows converted.
+        """
+        with db.get_connection() as conn:
+            converted = sum(
+                set_storage_format(conn, source, self.MODEL_NAME, storage_format)
+                for source in (DOCUMENT_EMBEDDINGS, CHUNK_EMBEDDINGS)
+            )
+            conn.commit()
+        return converted
+
     def clear_index(self) -> int:
         """Clear all embeddings. Returns count deleted."""
         with db.get_connection() as conn:
@@ -537,135 +639,313 @@ class EmbeddingService:
             doc_count = cursor.rowcount
             cursor.execute("DELETE FROM chunk_embeddings")
             chunk_count = cursor.rowcount
+            cursor.execute("DELETE FROM embedding_originals")
             conn.commit()
             return doc_count + chunk_count
 
     # ========== Chunk-level indexing and search ==========
 
-    def index_chunks(self, force: bool = False, batch_size: int = 100) -> int:
-        """Index all document chunks. Returns count of newly indexed chunks."""
-        from ..utils.chunk_splitter import split_into_chunks
+    def index_chunks(
+        self,
+        force: bool = False,
+        batch_size: int = 100,
+        workers: int | None = None,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> int:
+        """Embed new and changed chunks. Returns count of chunks embedded.
+
+        Runs as a pipeline: documents are streamed in pages, split in a
+        process pool (``workers``, default all cores, used for large runs
+        only), and chunks needing a vector are encoded in ``batch_size``
+        batches that span document boundaries. Finished documents are
+        written in large transactions.
+
+        A document whose stored chunks match its current split (by text
+        hash) is skipped; otherwise only chunks with new text are encoded
+        and vectors of unchanged chunks are reused, even if they moved.
+        ``force`` re-embeds everything; an interrupted forced run resumes
+        after the last committed document, unless a full pass (forced or
+        not) completes in between.
+
+        ``progress_callback(done, total)`` is called as documents finish.
+        """
+        from ..utils.chunk_splitter import split_document
 
+        resume_key = _CHUNK_RESUME_FLAG.format(model_name=self.MODEL_NAME)
         with db.get_connection() as conn:
-            cursor = conn.cursor()
-
+            total = conn.execute("SELECT COUNT(*) FROM documents WHERE is_deleted = 0").fetchone()[
+                0
+            ]
+            storage_format = get_storage_format(conn, CHUNK_EMBEDDINGS, self.MODEL_NAME)
+            resume_after = 0
             if force:
-                # Get all documents
-                cursor.execute("SELECT id, title, content FROM documents WHERE is_deleted = 0")
-            else:
-                # Only get documents without chunk embeddings
-                cursor.execute(
-                    """
-                    SELECT d.id, d.title, d.content
-                    FROM documents d
-                    WHERE d.is_deleted = 0
-                      AND NOT EXISTS (
-                          SELECT 1 FROM chunk_embeddings c
-                          WHERE c.document_id = d.id AND c.model_name = ?
-                      )
-                    """,
-                    (self.MODEL_NAME,),
-                )
-
-            docs = cursor.fetchall()
-
-        if not docs:
-            return 0
-
-        model = _get_model()
-        total_chunks = 0
-
-        for doc_id, title, content in docs:
-            # Split document into chunks
-            chunks = split_into_chunks(content, title)
-
-            if not chunks:
-                continue
-
-            # Embed all chunks for this document
-            texts = [chunk.text for chunk in chunks]
-            embeddings = model.encode(texts)
+                row = conn.execute(
+                    "SELECT value FROM schema_flags WHERE key = ?", (resume_key,)
+                ).fetchone()
+                resume_after = int(row[0]) if row else 0
+            done = 0
+            if resume_after:
+                logger.info(f"Resuming forced chunk reindex after document {resume_after}")
+                done = conn.execute(
+                    "SELECT COUNT(*) FROM documents WHERE is_deleted = 0 AND id <= ?",
+                    (resume_after,),
+                ).fetchone()[0]
+
+        model = None
+        embedded = 0
+        # Documents waiting on embeddings (in id order) and their queued chunks
+        pending: list[_PendingChunks] = []
+        queue: list[tuple[_PendingChunks, int]] = []
+
+        def encode(batch: list[tuple[_PendingChunks, int]]) -> None:
+            nonlocal model, embedded
+            if model is None:
+                model = _get_model()
+            embeddings = model.encode([doc.chunks[i].text for doc, i in batch])
+            for (doc, i), embedding in zip(batch, embeddings, strict=False):
+                doc.blobs[i] = encode_vector(embedding, storage_format)
+                if storage_format != FLOAT32:
+                    doc.originals[i] = embedding
+                doc.missing -= 1
+            embedded += len(batch)
+
+        def flush(final: bool = False) -> None:
+            nonlocal done
+            ready = 0
+            while ready < len(pending) and pending[ready].missing == 0:
+                ready += 1
+            rows = sum(len(doc.chunks) for doc in pending[:ready])
+            if ready == 0 or (not final and rows < _CHUNK_WRITE_ROWS):
+                return
+            self._write_chunks(pending[:ready], resume_key if force else None)
+            done += ready
+            del pending[:ready]
+            if progress_callback:
+                progress_callback(done, total)
+
+        workers = workers or os.cpu_count() or 1
+        with contextlib.ExitStack() as stack:
+            pool = None
+            if workers > 1 and total - done >= _CHUNK_POOL_MIN_DOCS:
+                from concurrent.futures import ProcessPoolExecutor
+
+                pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+
+            for page in self._document_pages(after=resume_after):
+                stored = {} if force else self._stored_chunks(page[0][0], page[-1][0])
+                if pool is not None:
+                    splits = pool.map(
+                        split_document, page, chunksize=max(1, len(page) // (workers * 4))
+                    )
+                else:
+                    splits = map(split_document, page)
+
+                for doc_id, chunks in splits:
+                    hashes = [_content_hash(chunk.text) for chunk in chunks]
+                    existing = stored.get(doc_id, [])
+                    layout = [
+                        (c.index, c.heading_path, h) for c, h in zip(chunks, hashes, strict=True)
+                    ]
+                    if not force and [(i, path, h) for i, path, h, _ in existing] == layout:
+                        done += 1
+                        continue
+
+                    # Reuse vectors of chunks whose text is unchanged; queue the rest
+                    reusable = {h: blob for _, _, h, blob in existing if h is not None}
+                    doc = _PendingChunks(
+                        doc_id=doc_id,
+                        chunks=chunks,
+                        hashes=hashes,
+                        blobs=[reusable.get(h) for h in hashes],
+                    )
+                    doc.missing = sum(blob is None for blob in doc.blobs)
+                    pending.append(doc)
+                    queue.extend((doc, i) for i, blob in enumerate(doc.blobs) if blob is None)
+
+                    while len(queue) >= batch_size:
+                        encode(queue[:batch_size])
+                        del queue[:batch_size]
+                        flush()
+
+            if queue:
+                encode(queue)
+                queue.clear()
+            flush(final=True)
+
+        # Any completed pass leaves nothing to resume; a flag left over from
+        # an interrupted forced run would make the next forced run skip ahead
+        with db.get_connection() as conn:
+            conn.execute("DELETE FROM schema_flags WHERE key = ?", (resume_key,))
+            if storage_format != FLOAT32:
+                prune_originals(conn, CHUNK_EMBEDDINGS, self.MODEL_NAME)
+            conn.commit()
+        if progress_callback:
+            progress_callback(total, total)
+        return embedded
 
-            # Save chunk embeddings
+    def _document_pages(self, after: int = 0) -> Iterator[list[tuple[int, str, str]]]:
+        """Live documents in id order, one page per read."""
+        while True:
             with db.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Clear existing chunks for this document if force
-                if force:
-                    cursor.execute(
-                        "DELETE FROM chunk_embeddings WHERE document_id = ? AND model_name = ?",
-                        (doc_id, self.MODEL_NAME),
+                page = [
+                    (row[0], row[1], row[2])
+                    for row in conn.execute(
+                        "SELECT id, title, content FROM documents "
+                        "WHERE is_deleted = 0 AND id > ? ORDER BY id LIMIT ?",
+                        (after, _CHUNK_PAGE_SIZE),
                     )
+                ]
+            if not page:
+                return
+            yield page
+            after = page[-1][0]
+
+    def _stored_chunks(
+        self, first_id: int, last_id: int
+    ) -> dict[int, list[tuple[int, str, str | None, bytes]]]:
+        """Existing chunk rows (index, heading, hash, blob) per document in an id range."""
+        stored: dict[int, list[tuple[int, str, str | None, bytes]]] = {}
+        with db.get_connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT document_id, chunk_index, heading_path, content_hash, embedding
+                FROM chunk_embeddings
+                WHERE model_name = ? AND document_id BETWEEN ? AND ?
+                ORDER BY document_id, chunk_index
+                """,
+                (self.MODEL_NAME, first_id, last_id),
+            )
+            for doc_id, chunk_index, heading_path, content_hash, blob in cursor:
+                stored.setdefault(doc_id, []).append(
+                    (chunk_index, heading_path, content_hash, blob)
+                )
+        return stored
 
-                for chunk, embedding in zip(chunks, embeddings, strict=False):
-                    cursor.execute(
-                        """
-                        INSERT OR REPLACE INTO chunk_embeddings
-                        (document_id, chunk_index, heading_path, text,
-                         model_name, embedding, dimension, updated_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            doc_id,
-                            chunk.index,
-                            chunk.heading_path,
-                            chunk.text,
-                            self.MODEL_NAME,
-                            embedding.tobytes(),
-                            self.EMBEDDING_DIM,
-                            datetime.utcnow().isoformat(),
-                        ),
+    def _write_chunks(self, docs: list[_PendingChunks], resume_key: str | None) -> None:
+        """Replace the chunk rows of finished documents in one transaction."""
+        now = datetime.utcnow().isoformat()
+        with db.get_connection() as conn:
+            conn.executemany(
+                "DELETE FROM chunk_embeddings WHERE document_id = ? AND model_name = ?",
+                [(doc.doc_id, self.MODEL_NAME) for doc in docs],
+            )
+            conn.executemany(
+                """
+                INSERT INTO chunk_embeddings
+                (document_id, chunk_index, heading_path, text,
+                 model_name, embedding, dimension, content_hash, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        doc.doc_id,
+                        chunk.index,
+                        chunk.heading_path,
+                        chunk.text,
+                        self.MODEL_NAME,
+                        blob,
+                        self.EMBEDDING_DIM,
+                        content_hash,
+                        now,
                     )
-                conn.commit()
-
-            total_chunks += len(chunks)
-            logger.info(f"Indexed {len(chunks)} chunks for document {doc_id}")
-
-        return total_chunks
+                    for doc in docs
+                    for chunk, blob, content_hash in zip(
+                        doc.chunks, doc.blobs, doc.hashes, strict=True
+                    )
+                ],
+            )
+            save_originals(
+                conn,
+                CHUNK_EMBEDDINGS,
+                self.MODEL_NAME,
+                [(doc.hashes[i], vector) for doc in docs for i, vector in doc.originals.items()],
+            )
+            if resume_key:
+                conn.execute(
+                    "INSERT OR REPLACE INTO schema_flags (key, value) VALUES (?, ?)",
+                    (resume_key, str(docs[-1].doc_id)),
+                )
+            conn.commit()
+        logger.info(f"Wrote chunks for {len(docs)} documents (through {docs[-1].doc_id})")
 
     def search_chunks(
-        self, query: str, limit: int = 10, threshold: float = 0.3
+        self,
+        query: str,
+        limit: int = 10,
+        threshold: float = 0.3,
+        nprobe: int | None = None,
+        with_text: bool = True,
     ) -> list[ChunkMatch]:
-        """Semantic search at chunk level - returns relevant paragraphs."""
-        query_embedding = self.embed_text(query)
+        """Semantic search at chunk level - returns relevant paragraphs.
+
+        Large chunk indexes are searched through the IVF index built by
+        ``emdx maintain index``. ``nprobe`` trades recall for latency
+        (more cells probed = closer to exact); 0 forces exact search and
+        None uses EMDX_ANN_NPROBE or the default. Without ``with_text``
+        each match's ``chunk_text`` is left empty, for callers that fetch
+        it with ``chunk_texts`` only for the matches they show.
+        """
+        query_embedding = self.embed_query(query)
+
+        matrix = load_matrix(CHUNK_EMBEDDINGS, self.MODEL_NAME)
+        positions, scores = ann_index.search(
+            CHUNK_EMBEDDINGS,
+            self.MODEL_NAME,
+            matrix,
+            query_embedding,
+            limit,
+            threshold=threshold,
+            nprobe=nprobe,
+        )
+        if len(positions) == 0:
+            return []
 
-        # Load all chunk embeddings from database
+        row_ids = [int(i) for i in matrix.row_ids[positions]]
         with db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT c.document_id, c.chunk_index, c.heading_path, c.text, c.embedding,
-                       d.title, d.project
+            placeholders = ",".join("?" * len(row_ids))
+            cursor = conn.execute(
+                f"""
+                SELECT c.id, c.document_id, c.chunk_index, c.heading_path,
+                       {"c.text" if with_text else "''"}, d.title, d.project
                 FROM chunk_embeddings c
                 JOIN documents d ON c.document_id = d.id
-                WHERE c.model_name = ? AND d.is_deleted = 0
+                WHERE c.id IN ({placeholders}) AND d.is_deleted = 0
                 """,
-                (self.MODEL_NAME,),
+                row_ids,
             )
-            rows = cursor.fetchall()
-
-        if not rows:
-            return []
+            rows = {row[0]: row for row in cursor.fetchall()}
 
-        # Compute similarities
         results = []
-        for doc_id, chunk_index, heading_path, text, emb_bytes, title, project in rows:
-            chunk_embedding = np.frombuffer(emb_bytes, dtype=np.float32)
-            similarity = float(np.dot(query_embedding, chunk_embedding))
-
-            if similarity >= threshold:
-                results.append(
-                    ChunkMatch(
-                        doc_id=doc_id,
-                        title=title,
-                        project=project,
-                        chunk_index=chunk_index,
-                        heading_path=heading_path,
-                        similarity=similarity,
-                        chunk_text=text,
-                    )
+        for row_id, similarity in zip(row_ids, scores, strict=True):
+            row = rows.get(row_id)
+            if row is None:
+                continue
+            _, doc_id, chunk_index, heading_path, text, title, project = row
+            results.append(
+                ChunkMatch(
+                    doc_id=doc_id,
+                    title=title,
+                    project=project,
+                    chunk_index=chunk_index,
+                    heading_path=heading_path,
+                    similarity=float(similarity),
+                    chunk_text=text,
                 )
+            )
+        return results
 
-        # Sort by similarity descending
-        results.sort(key=lambda x: x.similarity, reverse=True)
-        return results[:limit]
+    def chunk_texts(self, keys: list[tuple[int, int]]) -> dict[tuple[int, int], str]:
+        """Text of indexed chunks by ``(doc_id, chunk_index)``."""
+        wanted = sorted(set(keys))
+        if not wanted:
+            return {}
+        with db.get_connection() as conn:
+            placeholders = ",".join("(?, ?)" for _ in wanted)
+            cursor = conn.execute(
+                f"""
+                SELECT document_id, chunk_index, text FROM chunk_embeddings
+                WHERE model_name = ? AND (document_id, chunk_index) IN (VALUES {placeholders})
+                """,
+                [self.MODEL_NAME, *(value for key in wanted for value in key)],
+            )
+            return {(doc_id, index): text for doc_id, index, text in cursor}
@@ -24,6 +24,7 @@ from typing import TypedDict
 
 from ..database import db, document_links
 from ..utils.environment import get_subprocess_env
+from . import llm_cache
 
 logger = logging.getLogger(__name__)
 
@@ -990,6 +991,12 @@ def _call_claude_for_entities(
     full_model = resolve_model(model)
     prompt = _build_extraction_prompt(content, title)
 
+    # Unchanged documents re-extract from the LLM response cache
+    key = llm_cache.make_key(full_model, "", prompt)
+    cached = llm_cache.get(key)
+    if cached is not None:
+        return _parse_llm_response(cached)
+
     try:
         result = subprocess.run(
             ["claude", "--print", "--model", full_model, prompt],
@@ -1007,7 +1014,9 @@ def _call_claude_for_entities(
         stderr = result.stderr.strip()
         raise RuntimeError(f"Claude CLI failed: {stderr}") from None
 
-    return _parse_llm_response(result.stdout)
+    parsed = _parse_llm_response(result.stdout)
+    llm_cache.put(key, full_model, result.stdout)
+    return parsed
 
 
 def _save_llm_entities(
@@ -11,22 +11,32 @@ and convenience methods for the TUI (recent documents, popular tags, etc.).
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from difflib import SequenceMatcher
 from enum import Enum
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, TypedDict, TypeVar
 
+from ..config.constants import HYBRID_KEYWORD_BUDGET, HYBRID_SEMANTIC_BUDGET
 from ..database import db
-from ..database.search import search_documents
+from ..database.search import search_documents, search_facets
+from ..models.search import SearchFacets
 from ..models.tags import get_tags_for_documents, search_by_tags
 from ..utils.datetime_utils import parse_datetime
+from . import result_cache
 
 if TYPE_CHECKING:
     from .embedding_service import EmbeddingService, SemanticMatch
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 # ── TypedDicts ───────────────────────────────────────────────────────
 
@@ -92,11 +102,25 @@ class HybridSearchResult:
     # Chunk-level data (populated when extract=True or from semantic search)
     chunk_heading: str | None = None
     chunk_text: str | None = None
+    chunk_index: int | None = None
     # Timestamps (populated by query-parsing search path and utility methods)
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
 
+@dataclass
+class SearchReport:
+    """How a search ran: wall time per leg and legs dropped at their deadline."""
+
+    timings_ms: dict[str, float] = field(default_factory=dict)
+    timed_out: list[str] = field(default_factory=list)
+
+    @property
+    def degraded(self) -> bool:
+        """True when a leg missed its budget and its results are missing."""
+        return bool(self.timed_out)
+
+
 # ── Constants ────────────────────────────────────────────────────────
 
 # Reciprocal Rank Fusion constant (standard default from Cormack et al.)
@@ -172,6 +196,182 @@ def rrf_score(
     return score
 
 
+def _chunk_preview(text: str) -> str:
+    """Snippet shown for a chunk match: its first 200 characters."""
+    return text[:200] + "..." if len(text) > 200 else text
+
+
+# ── Fuzzy title matching ─────────────────────────────────────────────
+
+# Titles scored per fuzzy lookup, best trigram-index matches first
+FUZZY_CANDIDATES = 100
+# Index postings a lookup may touch: the query's rarest trigrams are used
+# until their combined document counts reach this
+_FUZZY_POSTINGS_BUDGET = 1000
+
+_FUZZY_COLUMNS = "d.id, d.title, d.project, d.created_at, d.updated_at"
+
+
+def _trigrams(text: str) -> set[str]:
+    """Padded character trigrams, so short words and word edges still match."""
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _dice(a: set[str], b: set[str]) -> float:
+    return 2 * len(a & b) / (len(a) + len(b)) if a or b else 0.0
+
+
+def _title_score(
+    query: str, query_grams: set[str], query_word_grams: list[set[str]], title: str
+) -> float:
+    """Similarity of a lower-cased title to a lower-cased query, 0-1.
+
+    The better of whole-string trigram overlap and the mean best per-word
+    overlap, plus a boost when the query appears verbatim.
+    """
+    full_score = _dice(query_grams, _trigrams(title))
+    contains_boost = 0.3 if query in title else 0.0
+
+    title_word_grams = [_trigrams(w) for w in title.split()]
+    word_scores = [
+        max((_dice(qw, tw) for tw in title_word_grams), default=0.0) for qw in query_word_grams
+    ]
+    word_score = sum(word_scores) / len(word_scores) if word_scores else 0.0
+    return min(1.0, max(full_score, word_score) + contains_boost)
+
+
+def _rare_trigrams(conn: sqlite3.Connection, needle: str) -> list[str]:
+    """The query's rarest indexed trigrams, within the postings budget."""
+    grams = sorted({needle[i : i + 3] for i in range(len(needle) - 2)})
+    placeholders = ",".join("?" * len(grams))
+    counts = conn.execute(
+        f"SELECT term, doc FROM documents_title_trigram_vocab WHERE term IN ({placeholders})",
+        grams,
+    ).fetchall()
+    chosen: list[str] = []
+    total = 0
+    for term, count in sorted(counts, key=lambda row: row[1]):
+        if chosen and total + count > _FUZZY_POSTINGS_BUDGET:
+            break
+        chosen.append(term)
+        total += count
+    return chosen
+
+
+def _fuzzy_title_candidates(query: str) -> list[tuple]:
+    """Titles worth scoring for a fuzzy query.
+
+    Queries of 3+ characters OR together their rarest trigrams against the
+    FTS5 trigram title index, ranked by bm25, so any title in the KB that
+    shares distinctive trigrams with the query is a candidate. Common
+    trigrams ("ion", "the") are skipped: they match most of the KB and
+    dominate lookup time without telling titles apart. Shorter queries fall
+    back to a substring scan. Databases without the index (SQLite < 3.34)
+    scan the most accessed titles.
+    """
+    needle = query.lower().strip()
+    with db.get_connection() as conn:
+        if len(needle) >= 3:
+            try:
+                grams = _rare_trigrams(conn, needle)
+                if not grams:
+                    return []
+                match = " OR ".join('"' + g.replace('"', '""') + '"' for g in grams)
+                return conn.execute(
+                    f"""
+                    SELECT {_FUZZY_COLUMNS}
+                    FROM documents_title_trigram t
+                    JOIN documents d ON d.id = t.rowid
+                    WHERE documents_title_trigram MATCH ?
+                      AND d.deleted_at IS NULL AND d.is_deleted = 0
+                    ORDER BY t.rank
+                    LIMIT ?
+                    """,
+                    (match, FUZZY_CANDIDATES),
+                ).fetchall()
+            except sqlite3.OperationalError as e:
+                logger.debug("Title trigram index unavailable: %s", e)
+                return conn.execute(
+                    f"""
+                    SELECT {_FUZZY_COLUMNS}
+                    FROM documents d
+                    WHERE d.deleted_at IS NULL AND d.is_deleted = 0
+                    ORDER BY d.access_count DESC, d.updated_at DESC
+                    LIMIT 1000
+                    """
+                ).fetchall()
+
+        escaped = needle.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return conn.execute(
+            f"""
+            SELECT {_FUZZY_COLUMNS}
+            FROM documents d
+            WHERE LOWER(d.title) LIKE ? ESCAPE '\\'
+              AND d.deleted_at IS NULL AND d.is_deleted = 0
+            ORDER BY d.access_count DESC, d.updated_at DESC
+            LIMIT ?
+            """,
+            (f"%{escaped}%", FUZZY_CANDIDATES),
+        ).fetchall()
+
+
+def _start_leg(fn: Callable[[], _T]) -> Future[tuple[_T, float]]:
+    """Run one search leg in the background; resolves to (result, seconds).
+
+    Uses a daemon thread rather than a ThreadPoolExecutor: executor workers
+    are joined at interpreter exit, so a leg abandoned after its deadline
+    (e.g. a cold model load) would still hold up the CLI process.
+    """
+    future: Future[tuple[_T, float]] = Future()
+
+    def run() -> None:
+        started = time.perf_counter()
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result((result, time.perf_counter() - started))
+
+    threading.Thread(target=run, name="emdx-search-leg", daemon=True).start()
+    return future
+
+
+def _await_leg(
+    leg: Future[tuple[list[HybridSearchResult], float]],
+    name: str,
+    deadline: float,
+    report: SearchReport,
+) -> list[HybridSearchResult]:
+    """Results of a leg, or [] (recorded as timed out) once its deadline passes."""
+    waited_from = time.perf_counter()
+    try:
+        results, elapsed = leg.result(timeout=max(0.0, deadline - waited_from))
+    except FutureTimeoutError:
+        logger.info("Search leg %r missed its deadline; returning without it", name)
+        report.timed_out.append(name)
+        report.timings_ms[name] = round((time.perf_counter() - waited_from) * 1000, 2)
+        return []
+    report.timings_ms[name] = round(elapsed * 1000, 2)
+    return results
+
+
+def _result_to_json(result: HybridSearchResult) -> dict[str, object]:
+    data = asdict(result)
+    for name in ("created_at", "updated_at"):
+        if data[name] is not None:
+            data[name] = data[name].isoformat()
+    return data
+
+
+def _result_from_json(data: dict) -> HybridSearchResult:
+    for name in ("created_at", "updated_at"):
+        if data.get(name) is not None:
+            data[name] = datetime.fromisoformat(data[name])
+    return HybridSearchResult(**data)
+
+
 # ── Service ──────────────────────────────────────────────────────────
 
 
@@ -183,8 +383,18 @@ class HybridSearchService:
     - ``search_unified(SearchQuery)`` — the query-parsing path used by the TUI
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        keyword_budget: float = HYBRID_KEYWORD_BUDGET,
+        semantic_budget: float = HYBRID_SEMANTIC_BUDGET,
+    ) -> None:
         self._embedding_service: EmbeddingService | None = None
+        self.keyword_budget = keyword_budget
+        self.semantic_budget = semantic_budget
+        # Timings of the most recent search() call
+        self.last_report: SearchReport | None = None
+        # Facet counts of the most recent search(facets=True) call
+        self.last_facets: SearchFacets | None = None
 
     @property
     def embedding_service(self) -> EmbeddingService | None:
@@ -246,6 +456,7 @@ class HybridSearchService:
         extract: bool = False,
         project: str | None = None,
         doc_type: str | None = "user",
+        facets: bool = False,
     ) -> list[HybridSearchResult]:
         """Execute hybrid search combining keyword and semantic search.
 
@@ -256,18 +467,73 @@ class HybridSearchService:
             extract: If True, include chunk-level text in results
             project: Filter by project name
             doc_type: Filter by document type. 'user' (default), 'wiki', or None for all.
+            facets: If True, also count the keyword match set per project,
+                tag and doc_type into ``last_facets``, alongside the search.
 
         Returns:
             List of HybridSearchResult sorted by combined score
         """
         search_mode = self.determine_mode(mode)
+        self.last_facets = None
+        facets_leg = (
+            _start_leg(lambda: search_facets(query, project=project, doc_type=doc_type))
+            if facets
+            else None
+        )
+        results = self._search_ranked(query, limit, search_mode, extract, project, doc_type)
+        if facets_leg is not None:
+            # Facets are auxiliary: a failed count must not cost the results
+            try:
+                self.last_facets = facets_leg.result()[0]
+            except Exception as e:
+                logger.warning(f"Facet counts failed: {e}")
+        return results
 
-        if search_mode == SearchMode.KEYWORD:
-            return self._search_keyword(query, limit, project, doc_type=doc_type)
-        elif search_mode == SearchMode.SEMANTIC:
-            return self._search_semantic(query, limit, project, extract, doc_type=doc_type)
-        else:  # HYBRID
-            return self._search_hybrid(query, limit, project, extract, doc_type=doc_type)
+    def _search_ranked(
+        self,
+        query: str,
+        limit: int,
+        search_mode: SearchMode,
+        extract: bool,
+        project: str | None,
+        doc_type: str | None,
+    ) -> list[HybridSearchResult]:
+        """Ranked results of search(), served from the result cache when valid."""
+        started = time.perf_counter()
+
+        model_name = None
+        if search_mode != SearchMode.KEYWORD and self.embedding_service is not None:
+            model_name = self.embedding_service.MODEL_NAME
+        key = result_cache.make_key(
+            "find",
+            query,
+            limit=limit,
+            mode=search_mode.value,
+            extract=extract,
+            project=project,
+            doc_type=doc_type,
+            model=model_name,
+        )
+        stamp, cached = result_cache.get(key)
+        if cached is not None:
+            elapsed = round((time.perf_counter() - started) * 1000, 2)
+            self.last_report = SearchReport(timings_ms={"cache": elapsed, "total": elapsed})
+            return [_result_from_json(r) for r in cached]
+
+        if search_mode == SearchMode.HYBRID:
+            results = self._search_hybrid(query, limit, project, extract, doc_type=doc_type)
+        else:
+            if search_mode == SearchMode.KEYWORD:
+                results = self._search_keyword(query, limit, project, doc_type=doc_type)
+            else:
+                results = self._search_semantic(query, limit, project, extract, doc_type=doc_type)
+            elapsed = round((time.perf_counter() - started) * 1000, 2)
+            self.last_report = SearchReport(
+                timings_ms={search_mode.value: elapsed, "total": elapsed}
+            )
+        if self.last_report is not None and not self.last_report.degraded:
+            result_cache.put(key, stamp, [_result_to_json(r) for r in results])
+        return results
 
     # ── Query-parsing search (TUI path) ──────────────────────────────
 
@@ -478,27 +744,18 @@ class HybridSearchService:
         threshold: float = 0.4,
         exclude_ids: set[int] | None = None,
     ) -> list[HybridSearchResult]:
-        """Fuzzy search document titles using SequenceMatcher.
+        """Fuzzy search document titles across the whole KB.
 
         Useful for command palette quick lookups where the user might
-        not type exact words but expects partial matches.
+        not type exact words but expects partial matches. Candidates come
+        from the title trigram index; only those are scored.
         """
         exclude_ids = exclude_ids or set()
-
-        with db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT id, title, project, created_at, updated_at
-                FROM documents
-                WHERE deleted_at IS NULL AND is_deleted = 0
-                ORDER BY access_count DESC, updated_at DESC
-                LIMIT 1000
-            """
-            )
-            rows = cursor.fetchall()
+        rows = _fuzzy_title_candidates(query)
 
         query_lower = query.lower()
+        query_grams = _trigrams(query_lower)
+        query_word_grams = [_trigrams(w) for w in query_lower.split()]
         scored: list[tuple[float, FuzzyMatchDoc]] = []
 
         for row in rows:
@@ -507,23 +764,7 @@ class HybridSearchService:
                 continue
 
             title = row[1]
-            title_lower = title.lower()
-
-            full_score = SequenceMatcher(None, query_lower, title_lower).ratio()
-            contains_boost = 0.3 if query_lower in title_lower else 0.0
-
-            query_words = query_lower.split()
-            title_words = title_lower.split()
-            word_scores = []
-            for qw in query_words:
-                best_word_score = max(
-                    (SequenceMatcher(None, qw, tw).ratio() for tw in title_words),
-                    default=0.0,
-                )
-                word_scores.append(best_word_score)
-
-            word_score = sum(word_scores) / len(word_scores) if word_scores else 0.0
-            score = min(1.0, max(full_score, word_score) + contains_boost)
+            score = _title_score(query_lower, query_grams, query_word_grams, title.lower())
 
             if score >= threshold:
                 scored.append(
@@ -665,6 +906,7 @@ class HybridSearchService:
         limit: int,
         project: str | None,
         doc_type: str | None = "user",
+        hydrate: bool = True,
     ) -> list[HybridSearchResult]:
         """Execute FTS5 keyword search only."""
         docs = search_documents(query=query, project=project, limit=limit, doc_type=doc_type)
@@ -692,8 +934,8 @@ class HybridSearchService:
         for r in results:
             r.score = r.keyword_score
 
-        # Fetch tags
-        self._populate_tags(results)
+        if hydrate:
+            self._populate_tags(results)
         return results
 
     def _search_semantic(
@@ -703,6 +945,7 @@ class HybridSearchService:
         project: str | None,
         extract: bool,
         doc_type: str | None = "user",
+        hydrate: bool = True,
     ) -> list[HybridSearchResult]:
         """Execute semantic search using chunks or documents."""
         if not self.embedding_service:
@@ -710,7 +953,9 @@ class HybridSearchService:
 
         # Prefer chunk search if available
         if self.has_chunk_index():
-            return self._search_chunks(query, limit, project, extract, doc_type=doc_type)
+            return self._search_chunks(
+                query, limit, project, extract, doc_type=doc_type, hydrate=hydrate
+            )
 
         # Fall back to document-level semantic search
         try:
@@ -743,8 +988,9 @@ class HybridSearchService:
                 )
             )
 
-        self._populate_tags(results)
-        self._populate_doc_types(results)
+        if hydrate:
+            self._populate_tags(results)
+            self._populate_doc_types(results)
         return results
 
     def _search_chunks(
@@ -754,6 +1000,7 @@ class HybridSearchService:
         project: str | None,
         extract: bool,
         doc_type: str | None = "user",
+        hydrate: bool = True,
     ) -> list[HybridSearchResult]:
         """Search at chunk level for more precise results."""
         if not self.embedding_service:
@@ -764,6 +1011,7 @@ class HybridSearchService:
                 query,
                 limit=limit * 2,
                 threshold=0.3,  # Get more, then dedupe
+                with_text=hydrate,
             )
         except Exception as e:
             logger.debug(f"Chunk search unavailable: {e}")
@@ -794,10 +1042,6 @@ class HybridSearchService:
 
             seen_docs.add(match.doc_id)
 
-            chunk_preview = (
-                match.chunk_text[:200] + "..." if len(match.chunk_text) > 200 else match.chunk_text
-            )
-
             results.append(
                 HybridSearchResult(
                     doc_id=match.doc_id,
@@ -807,17 +1051,19 @@ class HybridSearchService:
                     keyword_score=0.0,
                     semantic_score=match.similarity,
                     source="semantic",
-                    snippet=chunk_preview,
+                    snippet=_chunk_preview(match.chunk_text),
                     chunk_heading=match.heading_path,
-                    chunk_text=(match.chunk_text if extract else None),
+                    chunk_text=(match.chunk_text if extract and hydrate else None),
+                    chunk_index=match.chunk_index,
                 )
             )
 
             if len(results) >= limit:
                 break
 
-        self._populate_tags(results)
-        self._populate_doc_types(results)
+        if hydrate:
+            self._populate_tags(results)
+            self._populate_doc_types(results)
         return results
 
     def _search_hybrid(
@@ -828,10 +1074,29 @@ class HybridSearchService:
         extract: bool,
         doc_type: str | None = "user",
     ) -> list[HybridSearchResult]:
-        """Combine keyword and semantic results with Reciprocal Rank Fusion."""
-        keyword_results = self._search_keyword(query, limit * 2, project, doc_type=doc_type)
-        semantic_results = self._search_semantic(
-            query, limit * 2, project, extract, doc_type=doc_type
+        """Combine keyword and semantic results with Reciprocal Rank Fusion.
+
+        The keyword and semantic legs run concurrently, each against its own
+        budget measured from the start of the search. A leg that misses its
+        budget is dropped (``last_report.degraded``), so a slow model load
+        yields keyword-only results instead of a stalled search. Tags and
+        doc types are fetched once, for the merged page only.
+        """
+        started = time.perf_counter()
+        report = SearchReport()
+        keyword_leg = _start_leg(
+            lambda: self._search_keyword(
+                query, limit * 2, project, doc_type=doc_type, hydrate=False
+            )
+        )
+        semantic_leg = _start_leg(
+            lambda: self._search_semantic(
+                query, limit * 2, project, extract, doc_type=doc_type, hydrate=False
+            )
+        )
+        keyword_results = _await_leg(keyword_leg, "keyword", started + self.keyword_budget, report)
+        semantic_results = _await_leg(
+            semantic_leg, "semantic", started + self.semantic_budget, report
         )
 
         # Build rank maps (1-based)
@@ -898,6 +1163,7 @@ class HybridSearchService:
                     doc_type=dtype,
                     chunk_heading=(sem_result.chunk_heading if sem_result else None),
                     chunk_text=(sem_result.chunk_text if sem_result else None),
+                    chunk_index=(sem_result.chunk_index if sem_result else None),
                 )
             )
 
@@ -908,8 +1174,17 @@ class HybridSearchService:
             if max_rrf > 0:
                 for r in merged:
                     r.score = r.score / max_rrf
-
-        return merged[:limit]
+        merged = merged[:limit]
+
+        hydrate_started = time.perf_counter()
+        tags_leg = _start_leg(lambda: self._populate_tags(merged))
+        self._populate_doc_types(merged)
+        self._populate_chunk_text(merged, extract)
+        tags_leg.result()
+        report.timings_ms["hydrate"] = round((time.perf_counter() - hydrate_started) * 1000, 2)
+        report.timings_ms["total"] = round((time.perf_counter() - started) * 1000, 2)
+        self.last_report = report
+        return merged
 
     # ── Internal helpers ─────────────────────────────────────────────
 
@@ -925,6 +1200,24 @@ class HybridSearchService:
             )
             return {row[0] for row in cursor.fetchall()}
 
+    def _populate_chunk_text(self, results: list[HybridSearchResult], extract: bool) -> None:
+        """Load the chunk previews (and text, when ``extract``) of chunk matches.
+
+        The semantic leg of a hybrid search leaves them out so that only
+        the chunks of the merged page are read.
+        """
+        keys = [(r.doc_id, r.chunk_index) for r in results if r.chunk_index is not None]
+        if not keys or not self.embedding_service:
+            return
+        texts = self.embedding_service.chunk_texts(keys)
+        for r in results:
+            text = texts.get((r.doc_id, r.chunk_index)) if r.chunk_index is not None else None
+            if text is None:
+                continue
+            r.snippet = _chunk_preview(text)
+            if extract:
+                r.chunk_text = text
+
     def _populate_tags(self, results: list[HybridSearchResult]) -> None:
         """Fetch and populate tags for all results."""
         if not results:
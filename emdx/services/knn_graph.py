@@ -0,0 +1,191 @@
+"""
+All-pairs k-nearest-neighbour graph over document embeddings.
+
+Batch consumers (auto-linking every document, contradiction candidate
+pairs) used to call ``find_similar`` once per document: n matrix scans and
+n SQL round-trips. This module computes every document's top-k neighbours
+in one pass of blocked matrix multiplies. Memory stays bounded by the tile
+size, not the corpus: each step scores one ``_BLOCK`` x ``_BLOCK`` tile and
+merges it into the running per-row top-k.
+
+The result is persisted in ``document_neighbours`` and stamped (in
+``schema_flags``) with the ``document_embeddings`` generation it was built
+at, so later callers read the table until an embedding write, soft-delete
+or project move invalidates it.
+
+Two scopes are kept: ``all`` ranks against every document, ``project``
+only against documents in the same project (documents without a project
+still rank against everything, as ``find_similar(project=None)`` does).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+    HAS_NUMPY = False
+
+from ..config.constants import KNN_GRAPH_K
+from ..database import db
+from .vector_index import (
+    DOCUMENT_EMBEDDINGS,
+    UNKNOWN_GENERATION,
+    EmbeddingMatrix,
+    get_generation,
+    load_matrix,
+)
+
+logger = logging.getLogger(__name__)
+
+SCOPE_ALL = "all"
+SCOPE_PROJECT = "project"
+
+_GRAPH_FLAG = "knn_graph:{scope}:{model_name}"
+
+# Rows and columns per scored tile: 2048 x 2048 float32 scores = 16 MB
+_BLOCK = 2048
+
+Neighbours = dict[int, list[tuple[int, float]]]
+
+
+def compute(
+    matrix: EmbeddingMatrix,
+    k: int,
+    groups: np.ndarray | None = None,
+    block: int = _BLOCK,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Top-k neighbours of every row, best first.
+
+    Returns ``(positions, scores)``, both shaped ``(n, k)``. A row never
+    neighbours itself. With ``groups``, a row with a non-negative group only
+    ranks rows of the same group; a negative group ranks every row. Slots
+    left without a candidate hold position -1 and score -inf.
+    """
+    n = len(matrix)
+    k = max(0, min(k, n - 1))
+    positions = np.full((n, k), -1, dtype=np.int64)
+    scores = np.full((n, k), -np.inf, dtype=np.float32)
+    if k == 0:
+        return positions, scores
+
+    for r0 in range(0, n, block):
+        rows = matrix.rows(slice(r0, r0 + block))
+        count = len(rows)
+        best_pos = np.full((count, k), -1, dtype=np.int64)
+        best = np.full((count, k), -np.inf, dtype=np.float32)
+
+        for c0 in range(0, n, block):
+            cols = matrix.rows(slice(c0, c0 + block))
+            tile = rows @ cols.T
+            diagonal = np.arange(count)
+            inside = (diagonal + r0 >= c0) & (diagonal + r0 < c0 + len(cols))
+            tile[diagonal[inside], diagonal[inside] + r0 - c0] = -np.inf
+            if groups is not None:
+                row_groups = groups[r0 : r0 + count, None]
+                col_groups = groups[None, c0 : c0 + len(cols)]
+                tile[(row_groups >= 0) & (row_groups != col_groups)] = -np.inf
+
+            merged = np.concatenate([best, tile], axis=1)
+            merged_pos = np.concatenate(
+                [best_pos, np.broadcast_to(np.arange(c0, c0 + len(cols)), tile.shape)], axis=1
+            )
+            part = np.argpartition(-merged, k - 1, axis=1)[:, :k]
+            best = np.take_along_axis(merged, part, axis=1)
+            best_pos = np.take_along_axis(merged_pos, part, axis=1)
+
+        order = np.argsort(-best, axis=1, kind="stable")
+        best = np.take_along_axis(best, order, axis=1)
+        best_pos = np.take_along_axis(best_pos, order, axis=1)
+        best_pos[np.isneginf(best)] = -1
+        positions[r0 : r0 + count] = best_pos
+        scores[r0 : r0 + count] = best
+    return positions, scores
+
+
+def _project_groups(doc_ids: np.ndarray) -> np.ndarray:
+    """Small-integer group per row from its document's project (-1 = none)."""
+    with db.get_connection() as conn:
+        rows = conn.execute(
+            "SELECT id, project FROM documents WHERE is_deleted = 0 AND project IS NOT NULL"
+        ).fetchall()
+    codes: dict[str, int] = {}
+    project_of = {doc_id: codes.setdefault(project, len(codes)) for doc_id, project in rows}
+    return np.fromiter(
+        (project_of.get(int(d), -1) for d in doc_ids), dtype=np.int64, count=len(doc_ids)
+    )
+
+
+def build(model_name: str, k: int = KNN_GRAPH_K, scope: str = SCOPE_ALL) -> int:
+    """Recompute and persist the graph for one model and scope.
+
+    Returns the number of neighbour rows written.
+    """
+    matrix = load_matrix(DOCUMENT_EMBEDDINGS, model_name)
+    groups = _project_groups(matrix.doc_ids) if scope == SCOPE_PROJECT else None
+    positions, scores = compute(matrix, k, groups)
+
+    rows = [
+        (model_name, scope, int(matrix.doc_ids[i]), rank, int(matrix.doc_ids[p]), float(s))
+        for i in range(len(matrix))
+        for rank, (p, s) in enumerate(zip(positions[i], scores[i], strict=True))
+        if p >= 0
+    ]
+    with db.get_connection() as conn:
+        conn.execute(
+            "DELETE FROM document_neighbours WHERE model_name = ? AND scope = ?",
+            (model_name, scope),
+        )
+        conn.executemany(
+            "INSERT INTO document_neighbours "
+            "(model_name, scope, document_id, rank, neighbour_id, similarity) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO schema_flags (key, value) VALUES (?, ?)",
+            (_GRAPH_FLAG.format(scope=scope, model_name=model_name), f"{matrix.generation}:{k}"),
+        )
+        conn.commit()
+    logger.info("Built %s kNN graph for %s: %d documents, k=%d", scope, model_name, len(matrix), k)
+    return len(rows)
+
+
+def _is_current(model_name: str, k: int, scope: str) -> bool:
+    with db.get_connection() as conn:
+        generation = get_generation(conn, DOCUMENT_EMBEDDINGS)
+        row = conn.execute(
+            "SELECT value FROM schema_flags WHERE key = ?",
+            (_GRAPH_FLAG.format(scope=scope, model_name=model_name),),
+        ).fetchone()
+    if row is None or generation == UNKNOWN_GENERATION:
+        return False
+    built_generation, _, built_k = row[0].partition(":")
+    return built_generation == str(generation) and int(built_k or 0) >= k
+
+
+def neighbours(model_name: str, k: int = KNN_GRAPH_K, scope: str = SCOPE_ALL) -> Neighbours:
+    """Each document's top-k ``(neighbour id, similarity)``, best first.
+
+    Rebuilds the persisted graph first when it is stale or was built with
+    a smaller k.
+    """
+    if not _is_current(model_name, k, scope):
+        build(model_name, max(k, KNN_GRAPH_K), scope)
+
+    graph: Neighbours = defaultdict(list)
+    with db.get_connection() as conn:
+        cursor = conn.execute(
+            "SELECT document_id, neighbour_id, similarity FROM document_neighbours "
+            "WHERE model_name = ? AND scope = ? AND rank < ? "
+            "ORDER BY document_id, rank",
+            (model_name, scope, k),
+        )
+        for doc_id, neighbour_id, similarity in cursor:
+            graph[doc_id].append((neighbour_id, similarity))
+    return dict(graph)
@@ -67,8 +67,12 @@ def auto_link_document(
     similar = service.find_similar(doc_id, limit=max_links, project=project)
 
     # Filter by threshold
-    candidates = [m for m in similar if m.similarity >= threshold]
+    candidates = [(m.doc_id, m.similarity) for m in similar if m.similarity >= threshold]
+    return _link_candidates(doc_id, candidates)
 
+
+def _link_candidates(doc_id: int, candidates: list[tuple[int, float]]) -> AutoLinkResult:
+    """Create auto links from doc_id to (target id, score) pairs not yet linked."""
     if not candidates:
         return AutoLinkResult(doc_id=doc_id, links_created=0, linked_doc_ids=[], scores=[])
 
@@ -76,9 +80,9 @@ def auto_link_document(
     existing = set(document_links.get_linked_doc_ids(doc_id))
 
     links_to_create: list[tuple[int, int, float, str]] = []
-    for match in candidates:
-        if match.doc_id not in existing:
-            links_to_create.append((doc_id, match.doc_id, match.similarity, "auto"))
+    for target_id, similarity in candidates:
+        if target_id not in existing:
+            links_to_create.append((doc_id, target_id, similarity, "auto"))
 
     if not links_to_create:
         return AutoLinkResult(doc_id=doc_id, links_created=0, linked_doc_ids=[], scores=[])
@@ -107,7 +111,6 @@ def auto_link_all(
 
     Returns total number of links created.
     """
-    from ..database import db
     from .embedding_service import EmbeddingService
 
     service = EmbeddingService()
@@ -115,24 +118,12 @@ def auto_link_all(
     if stats.indexed_documents == 0:
         return 0
 
-    # Get all indexed document IDs and their projects
-    with db.get_connection() as conn:
-        cursor = conn.execute(
-            """
-            SELECT DISTINCT e.document_id, d.project
-            FROM document_embeddings e
-            JOIN documents d ON e.document_id = d.id
-            WHERE d.is_deleted = 0
-            """
-        )
-        docs = [(row[0], row[1]) for row in cursor.fetchall()]
+    # One blocked all-pairs pass instead of a find_similar scan per document
+    graph = service.neighbour_graph(k=max_links, by_project=not cross_project)
 
     total_created = 0
-    for did, doc_project in docs:
-        scope_project = None if cross_project else doc_project
-        result = auto_link_document(
-            did, threshold=threshold, max_links=max_links, project=scope_project
-        )
-        total_created += result.links_created
+    for did, neighbours in graph.items():
+        candidates = [(nid, score) for nid, score in neighbours if score >= threshold]
+        total_created += _link_candidates(did, candidates).links_created
 
     return total_created
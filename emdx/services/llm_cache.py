@@ -0,0 +1,164 @@
+"""
+On-disk cache of LLM responses.
+
+Wiki synthesis, topic labeling, quality review and LLM entity extraction
+all shell out to the Claude CLI. A re-run over unchanged input, such as
+``emdx wiki generate`` after a crash or ``maintain entities --llm`` over
+documents that did not change, would otherwise pay full latency and cost
+again. Responses are stored in the ``llm_response_cache`` table, keyed by
+a hash of (model, system prompt, hash of the user message). Any change to
+the sources or the prompt changes the key, so entries never go stale; they
+only age out. Entries unused for ``LLM_CACHE_MAX_AGE_DAYS`` are dropped,
+and past ``LLM_CACHE_SIZE`` entries the least recently used go first.
+
+``bypass()`` (the ``--no-llm-cache`` flags) skips lookups but still stores
+the fresh responses; ``EMDX_LLM_CACHE=0`` disables the cache entirely.
+Like the other caches this is best effort: a database error is logged and
+treated as a miss. Failed calls are never cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from ..config.constants import LLM_CACHE_MAX_AGE_DAYS, LLM_CACHE_SIZE
+from ..database import db
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENV_VAR = "EMDX_LLM_CACHE"
+
+_lock = threading.Lock()
+_bypass_depth = 0
+_hits = 0
+_misses = 0
+
+
+@dataclass
+class CacheStats:
+    """Size of the cache and how well it is serving."""
+
+    entries: int
+    size_bytes: int
+    total_hits: int  # over the stored entries' lifetimes
+    hits: int  # in this process
+    misses: int  # in this process
+
+
+def enabled() -> bool:
+    """Whether the cache is on (``EMDX_LLM_CACHE`` is not 0/off/false/no)."""
+    return os.environ.get(CACHE_ENV_VAR, "").strip().lower() not in {"0", "off", "false", "no"}
+
+
+@contextmanager
+def bypass() -> Iterator[None]:
+    """Skip cached responses (process-wide) while still storing fresh ones."""
+    global _bypass_depth
+    with _lock:
+        _bypass_depth += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _bypass_depth -= 1
+
+
+def make_key(model: str | None, system_prompt: str, user_message: str) -> str:
+    """Cache key for one prompt to one model."""
+    message_hash = hashlib.sha256(user_message.encode()).hexdigest()
+    raw = json.dumps([model or "", system_prompt, message_hash])
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _count(hit: bool) -> None:
+    global _hits, _misses
+    with _lock:
+        if hit:
+            _hits += 1
+        else:
+            _misses += 1
+
+
+def get(key: str) -> str | None:
+    """The cached response for ``key``, or None on a miss or bypass."""
+    if not enabled() or _bypass_depth:
+        return None
+    try:
+        with db.get_connection() as conn:
+            row = conn.execute(
+                "SELECT response FROM llm_response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE llm_response_cache SET last_used_at = ?, hits = hits + 1 WHERE key = ?",
+                    (time.time(), key),
+                )
+                conn.commit()
+    except sqlite3.Error as e:
+        logger.debug("LLM response cache unavailable: %s", e)
+        return None
+    _count(row is not None)
+    return row[0] if row is not None else None
+
+
+def put(
+    key: str,
+    model: str | None,
+    response: str,
+    max_entries: int = LLM_CACHE_SIZE,
+    max_age_days: float = LLM_CACHE_MAX_AGE_DAYS,
+) -> None:
+    """Store a successful response, evicting old and excess entries."""
+    if not enabled():
+        return
+    now = time.time()
+    try:
+        with db.get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_response_cache "
+                "(key, model, response, created_at, last_used_at) VALUES (?, ?, ?, ?, ?)",
+                (key, model or "", response, now, now),
+            )
+            conn.execute(
+                "DELETE FROM llm_response_cache WHERE last_used_at < ?",
+                (now - max_age_days * 86400,),
+            )
+            (count,) = conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()
+            if count > max_entries:
+                conn.execute(
+                    "DELETE FROM llm_response_cache WHERE key IN ("
+                    "SELECT key FROM llm_response_cache ORDER BY last_used_at LIMIT ?)",
+                    (count - max_entries,),
+                )
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.debug("Could not cache LLM response: %s", e)
+
+
+def clear() -> int:
+    """Drop every cached response. Returns count deleted."""
+    with db.get_connection() as conn:
+        cursor = conn.execute("DELETE FROM llm_response_cache")
+        conn.commit()
+        return cursor.rowcount
+
+
+def stats() -> CacheStats:
+    """Entries, stored size and hit counts."""
+    with db.get_connection() as conn:
+        entries, size, total_hits = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(CAST(response AS BLOB))), 0), "
+            "COALESCE(SUM(hits), 0) FROM llm_response_cache"
+        ).fetchone()
+    return CacheStats(
+        entries=entries, size_bytes=size, total_hits=total_hits, hits=_hits, misses=_misses
+    )
@@ -0,0 +1,97 @@
+"""
+On-disk LRU cache of query embeddings.
+
+Agents repeat the same ``find``/``ask`` questions constantly, and each one
+would otherwise run the embedding model again. Query vectors are stored in
+the ``query_embeddings`` table keyed by (normalized query, model name), so a
+repeated semantic query costs one indexed SQLite lookup. Each hit refreshes
+the row's ``last_used_at``; once the table grows past
+``QUERY_EMBEDDING_CACHE_SIZE`` rows the least recently used are evicted.
+
+The cache is best effort: a database error (old schema, read-only file) is
+logged and treated as a miss.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import time
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+    HAS_NUMPY = False
+
+from ..config.constants import QUERY_EMBEDDING_CACHE_SIZE
+from ..database import db
+
+logger = logging.getLogger(__name__)
+
+
+def normalize(query: str) -> str:
+    """Canonical form of a query: collapsed whitespace, lower case.
+
+    The MiniLM tokenizer is uncased and ignores whitespace runs, so the
+    normalized text embeds to the same vector as the original.
+    """
+    return " ".join(query.split()).lower()
+
+
+def get(query: str, model_name: str) -> np.ndarray | None:
+    """Cached embedding of an already-normalized query, or None."""
+    try:
+        with db.get_connection() as conn:
+            row = conn.execute(
+                "SELECT id, embedding FROM query_embeddings WHERE query = ? AND model_name = ?",
+                (query, model_name),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE query_embeddings SET last_used_at = ? WHERE id = ?",
+                (time.time(), row[0]),
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.debug("Query embedding cache unavailable: %s", e)
+        return None
+    return np.frombuffer(row[1], dtype=np.float32).copy()
+
+
+def put(
+    query: str,
+    model_name: str,
+    embedding: np.ndarray,
+    max_entries: int = QUERY_EMBEDDING_CACHE_SIZE,
+) -> None:
+    """Store a query embedding and evict beyond ``max_entries`` rows."""
+    blob = np.asarray(embedding, dtype=np.float32).tobytes()
+    try:
+        with db.get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO query_embeddings "
+                "(query, model_name, embedding, last_used_at) VALUES (?, ?, ?, ?)",
+                (query, model_name, blob, time.time()),
+            )
+            (count,) = conn.execute("SELECT COUNT(*) FROM query_embeddings").fetchone()
+            if count > max_entries:
+                conn.execute(
+                    "DELETE FROM query_embeddings WHERE id IN ("
+                    "SELECT id FROM query_embeddings ORDER BY last_used_at LIMIT ?)",
+                    (count - max_entries,),
+                )
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.debug("Could not cache query embedding: %s", e)
+
+
+def clear() -> int:
+    """Drop every cached query embedding. Returns count deleted."""
+    with db.get_connection() as conn:
+        cursor = conn.execute("DELETE FROM query_embeddings")
+        conn.commit()
+        return cursor.rowcount
@@ -0,0 +1,129 @@
+"""
+On-disk cache of find/ask result sets.
+
+Agents loop over the same ``find`` and ``ask`` questions, re-running FTS,
+semantic scoring and hydration each time although the KB has not changed.
+Result sets are stored in the ``search_result_cache`` table keyed by the
+normalized query plus every filter and mode that shapes the result, so a
+repeat costs one indexed SQLite lookup in any process.
+
+Each row is stamped with the trigger-maintained ``index_generations``
+counters for documents and embeddings at the time the search *started*.
+A lookup whose stamp no longer matches is a miss, so any document, tag or
+embedding write invalidates the whole cache without touching it. Once the
+table grows past ``SEARCH_RESULT_CACHE_SIZE`` rows the least recently used
+are evicted.
+
+Like the query embedding cache this is best effort: a database error is
+logged and treated as a miss.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import time
+from typing import Any
+
+from ..config.constants import SEARCH_RESULT_CACHE_SIZE
+from ..database import db
+
+logger = logging.getLogger(__name__)
+
+# Write counters a cached result set depends on
+GENERATIONS = ("documents", "document_embeddings", "chunk_embeddings")
+
+
+def make_key(kind: str, query: str, **filters: Any) -> str:
+    """Cache key for a query of one kind (e.g. "find", "ask") and its filters.
+
+    The query is whitespace-collapsed and lower-cased; FTS5 and the
+    embedding model both ignore those differences.
+    """
+    normalized = " ".join(query.split()).lower()
+    return json.dumps([kind, normalized, sorted(filters.items())], default=str)
+
+
+def _stamp(conn: sqlite3.Connection) -> str | None:
+    placeholders = ",".join("?" * len(GENERATIONS))
+    rows = dict(
+        conn.execute(
+            f"SELECT name, generation FROM index_generations WHERE name IN ({placeholders})",
+            GENERATIONS,
+        ).fetchall()
+    )
+    if len(rows) != len(GENERATIONS):
+        return None
+    return ":".join(str(rows[name]) for name in GENERATIONS)
+
+
+def get(key: str) -> tuple[str | None, Any]:
+    """Look up a result set.
+
+    Returns ``(stamp, results)``: the current generation stamp, to hand
+    back to :func:`put` once a missed search has run, and the cached
+    results (None on a miss). A None stamp means the cache is unavailable.
+    """
+    try:
+        with db.get_connection() as conn:
+            stamp = _stamp(conn)
+            if stamp is None:
+                return None, None
+            row = conn.execute(
+                "SELECT results FROM search_result_cache WHERE key = ? AND generations = ?",
+                (key, stamp),
+            ).fetchone()
+            if row is None:
+                return stamp, None
+            conn.execute(
+                "UPDATE search_result_cache SET last_used_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.debug("Search result cache unavailable: %s", e)
+        return None, None
+    return stamp, json.loads(row[0])
+
+
+def put(
+    key: str,
+    stamp: str | None,
+    results: Any,
+    max_entries: int = SEARCH_RESULT_CACHE_SIZE,
+) -> None:
+    """Store JSON-serializable results computed at ``stamp``.
+
+    Nothing is stored when the KB changed since ``stamp`` was read, since
+    the results may predate that write.
+    """
+    if stamp is None:
+        return
+    try:
+        with db.get_connection() as conn:
+            if _stamp(conn) != stamp:
+                return
+            conn.execute(
+                "INSERT OR REPLACE INTO search_result_cache "
+                "(key, generations, results, last_used_at) VALUES (?, ?, ?, ?)",
+                (key, stamp, json.dumps(results), time.time()),
+            )
+            (count,) = conn.execute("SELECT COUNT(*) FROM search_result_cache").fetchone()
+            if count > max_entries:
+                conn.execute(
+                    "DELETE FROM search_result_cache WHERE key IN ("
+                    "SELECT key FROM search_result_cache ORDER BY last_used_at LIMIT ?)",
+                    (count - max_entries,),
+                )
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.debug("Could not cache search results: %s", e)
+
+
+def clear() -> int:
+    """Drop every cached result set. Returns count deleted."""
+    with db.get_connection() as conn:
+        cursor = conn.execute("DELETE FROM search_result_cache")
+        conn.commit()
+        return cursor.rowcount
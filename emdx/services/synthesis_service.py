@@ -19,6 +19,7 @@ from typing import Any
 from ..config.cli_config import DEFAULT_LLM_MODEL, DEFAULT_OPUS_MODEL
 from ..database import db
 from ..utils.environment import get_subprocess_env
+from . import llm_cache
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +46,8 @@ def _execute_prompt(
     """Execute a synthesis prompt via the Claude CLI --print mode.
 
     Combines system and user messages into a single prompt for --print mode.
+    Responses are served from and stored in the LLM response cache, so
+    repeating a prompt (e.g. re-running wiki generation) costs nothing.
 
     Args:
         system_prompt: System-level instructions
@@ -58,6 +61,11 @@ def _execute_prompt(
     Raises:
         RuntimeError: If the CLI execution fails
     """
+    key = llm_cache.make_key(model, system_prompt, user_message)
+    cached = llm_cache.get(key)
+    if cached is not None:
+        return PromptResult(success=True, output_content=cached)
+
     prompt = f"<system>\n{system_prompt}\n</system>\n\n{user_message}"
 
     # Pass the prompt via stdin, never argv: process arguments are
@@ -81,9 +89,11 @@ def _execute_prompt(
             error_msg = result.stderr.strip() or f"Exit code {result.returncode}"
             raise RuntimeError(f"Synthesis failed: {error_msg}")
 
+        output = result.stdout.strip()
+        llm_cache.put(key, model, output)
         return PromptResult(
             success=True,
-            output_content=result.stdout.strip(),
+            output_content=output,
         )
     except subprocess.TimeoutExpired as e:
         raise RuntimeError(f"Synthesis timed out after {SYNTHESIS_TIMEOUT}s") from e
@@ -0,0 +1,573 @@
+"""
+Contiguous embedding matrices for semantic search.
+
+Loading every embedding blob from SQLite and scoring it with a Python loop
+makes semantic search linear in Python-level work. This module keeps each
+(embedding table, model) partition as one float32 matrix so a query is a
+single matrix-vector product plus an ``argpartition`` top-k.
+
+Matrices are cached at two levels:
+
+- in-process, for long-lived callers (TUI, ``serve``, batch linking)
+- as ``.npy`` sidecar files next to the database, memory-mapped on load,
+  so one-shot CLI invocations skip the SQLite blob scan
+
+Both are keyed by the ``index_generations`` counter for the table, which
+triggers bump on every embedding write and on document soft-delete/restore,
+so a stale matrix is never served. The key also carries the counter's
+random token, redrawn on every bump, so a database restored from a backup
+never reaches a generation a surviving sidecar was built at.
+
+Each partition can store its vectors as ``float16`` or as ``int8`` codes
+with a per-vector scale, shrinking the embedding tables 2x or 4x. The
+float32 originals of quantized vectors go to ``embedding_originals``, keyed
+by content hash and never read by the scan. Quantized partitions of either
+format are held in memory and in sidecars as int8 codes (NumPy widens
+float16 too slowly to scan it), next to one float32 factor per row that
+maps the codes back onto the unit sphere. ``top_k`` scores the codes in
+cache-sized blocks, then rescores the best ``k * RESCORE_OVERSAMPLE`` rows
+against their originals before applying threshold and cut-off. Rows with no
+original (quantized before originals were kept) rescore on their
+dequantized vector.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import sqlite3
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+    HAS_NUMPY = False
+
+from ..database import db
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_EMBEDDINGS = "document_embeddings"
+CHUNK_EMBEDDINGS = "chunk_embeddings"
+
+# Generation reported when the counters table is missing (pre-migration DB).
+# Matrices built at this generation are never cached.
+UNKNOWN_GENERATION = -1
+
+# Blob storage formats. Blobs are told apart by length (4*dim, 2*dim, dim+4)
+# so partitions can be converted in place and old rows still decode.
+FLOAT32 = "float32"
+FLOAT16 = "float16"
+INT8 = "int8"
+STORAGE_FORMATS = (FLOAT32, FLOAT16, INT8)
+
+_FORMAT_FLAG = "embedding_format:{source}:{model_name}"
+
+# Quantized search rescores this many candidates per requested result
+RESCORE_OVERSAMPLE = 4
+# Rows dequantized per block during a quantized scan; small enough that the
+# float32 copy of a block stays in cache
+_SCAN_BLOCK = 1024
+
+_LOAD_SQL = {
+    DOCUMENT_EMBEDDINGS: """
+        SELECT e.id, e.document_id, e.embedding, e.dimension
+        FROM document_embeddings e
+        JOIN documents d ON e.document_id = d.id
+        WHERE e.model_name = ? AND d.is_deleted = 0
+        ORDER BY e.id
+    """,
+    CHUNK_EMBEDDINGS: """
+        SELECT c.id, c.document_id, c.embedding, c.dimension
+        FROM chunk_embeddings c
+        JOIN documents d ON c.document_id = d.id
+        WHERE c.model_name = ? AND d.is_deleted = 0
+        ORDER BY c.id
+    """,
+}
+
+_cache: dict[tuple[str, str, str], EmbeddingMatrix] = {}
+
+
+@dataclass
+class EmbeddingMatrix:
+    """All embeddings of one table/model partition as a dense matrix.
+
+    Row ``i`` of ``vectors`` is the embedding stored in row ``row_ids[i]`` of
+    the source table, belonging to document ``doc_ids[i]``.
+    """
+
+    row_ids: np.ndarray  # int64, primary keys in the embeddings table
+    doc_ids: np.ndarray  # int64
+    vectors: np.ndarray  # shape (n, dim): float32 unit rows or int8 codes
+    generation: int
+    scales: np.ndarray | None = None  # float32 per-row factor to unit length (int8)
+    token: int = 0  # index_generations token the generation was read with
+    # Full-precision lookup for rescoring: row positions -> (found mask, found rows)
+    originals: Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]] | None = None
+
+    def __len__(self) -> int:
+        return int(self.row_ids.shape[0])
+
+    @property
+    def quantized(self) -> bool:
+        return self.vectors.dtype != np.float32
+
+    def rows(self, index: slice | np.ndarray) -> np.ndarray:
+        """Selected rows as float32 unit vectors (dequantized if needed)."""
+        rows = np.asarray(self.vectors[index], dtype=np.float32)
+        if self.scales is None:
+            return rows
+        result: np.ndarray = rows * self.scales[index, None]
+        return result
+
+    def scores(self, query: np.ndarray, index: slice | np.ndarray | None = None) -> np.ndarray:
+        """Dot products of ``query`` with the selected rows (all by default)."""
+        if index is not None:
+            result: np.ndarray = self.rows(index) @ query
+            return result
+        if not self.quantized:
+            result = self.vectors @ query
+            return result
+        scores = np.empty(len(self), dtype=np.float32)
+        for start in range(0, len(self), _SCAN_BLOCK):
+            block = np.asarray(self.vectors[start : start + _SCAN_BLOCK], dtype=np.float32)
+            scores[start : start + len(block)] = block @ query
+        if self.scales is not None:
+            scores *= self.scales
+        return scores
+
+    def top_k(
+        self,
+        query: np.ndarray,
+        k: int,
+        threshold: float | None = None,
+        mask: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return (row positions, scores) of the k best rows, best first.
+
+        Scores are dot products, i.e. cosine similarity for normalized
+        vectors; quantized partitions report full-precision scores for the
+        rows they return. Rows below ``threshold`` or excluded by the
+        boolean ``mask`` are never returned.
+        """
+        if len(self) == 0 or k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        query = np.asarray(query, dtype=np.float32)
+        scores = self.scores(query)
+        candidates = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        return self._best(candidates, scores[candidates], query, k, threshold)
+
+    def top_k_among(
+        self,
+        candidates: np.ndarray,
+        query: np.ndarray,
+        k: int,
+        threshold: float | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Like ``top_k``, scoring only the given candidate positions."""
+        query = np.asarray(query, dtype=np.float32)
+        return self._best(candidates, self.scores(query, candidates), query, k, threshold)
+
+    def full_precision_scores(self, positions: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Scores of the selected rows against their float32 originals where kept."""
+        rows = self.rows(positions)
+        if self.originals is not None and len(positions):
+            found, originals = self.originals(positions)
+            if found.any():
+                rows[found] = originals
+        result: np.ndarray = rows @ query
+        return result
+
+    def _best(
+        self,
+        candidates: np.ndarray,
+        scores: np.ndarray,
+        query: np.ndarray,
+        k: int,
+        threshold: float | None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Top k of scored candidates, rescoring quantized ones first."""
+        if self.quantized:
+            budget = k * RESCORE_OVERSAMPLE
+            if len(candidates) > budget:
+                part = np.argpartition(-scores, budget - 1)[:budget]
+                candidates = candidates[part]
+            scores = self.full_precision_scores(candidates, query)
+        if threshold is not None:
+            above = scores >= threshold
+            candidates, scores = candidates[above], scores[above]
+        if len(candidates) > k:
+            part = np.argpartition(-scores, k - 1)[:k]
+            candidates, scores = candidates[part], scores[part]
+        order = np.argsort(-scores, kind="stable")
+        return candidates[order].astype(np.int64), scores[order]
+
+
+def encode_vector(vector: np.ndarray, storage_format: str = FLOAT32) -> bytes:
+    """Serialize an embedding for the given storage format."""
+    vector = np.asarray(vector, dtype=np.float32)
+    if storage_format == FLOAT16:
+        return vector.astype(np.float16).tobytes()
+    if storage_format == INT8:
+        peak = float(np.abs(vector).max()) if vector.size else 0.0
+        scale = peak / 127.0 if peak > 0 else 1.0
+        codes = np.clip(np.rint(vector / scale), -127, 127).astype(np.int8)
+        return codes.tobytes() + np.float32(scale).tobytes()
+    return vector.tobytes()
+
+
+def blob_format(blob: bytes, dimension: int) -> str:
+    """Storage format of a blob, from its length."""
+    size = len(blob)
+    if size == 4 * dimension:
+        return FLOAT32
+    if size == 2 * dimension:
+        return FLOAT16
+    if size == dimension + 4:
+        return INT8
+    raise ValueError(f"Embedding blob of {size} bytes does not match dimension {dimension}")
+
+
+def decode_blob(blob: bytes, dimension: int) -> np.ndarray:
+    """Deserialize a stored embedding of any format to a float32 vector."""
+    storage_format = blob_format(blob, dimension)
+    if storage_format == FLOAT16:
+        return np.frombuffer(blob, dtype=np.float16).astype(np.float32)
+    if storage_format == INT8:
+        codes = np.frombuffer(blob, dtype=np.int8, count=dimension)
+        scale = np.frombuffer(blob, dtype=np.float32, offset=dimension)[0]
+        result: np.ndarray = codes.astype(np.float32) * scale
+        return result
+    return np.frombuffer(blob, dtype=np.float32)
+
+
+def stack_blobs(blobs: list[bytes], dimension: int) -> tuple[np.ndarray, np.ndarray | None]:
+    """Search matrix rows and per-row unit factors for equal-length blobs.
+
+    float32 blobs are returned as-is, without factors. int8 blobs keep their
+    codes and float16 blobs are re-quantized to int8 codes; the factor is
+    the inverse norm of the codes, so each row's own scale cancels out.
+    """
+    width = len(blobs[0])
+    raw = np.frombuffer(b"".join(blobs), dtype=np.uint8).reshape(len(blobs), width)
+    storage_format = blob_format(blobs[0], dimension)
+    if storage_format == FLOAT32:
+        return raw.view(np.float32), None
+    if storage_format == FLOAT16:
+        rows = raw.view(np.float16).astype(np.float32)
+        peaks = np.abs(rows).max(axis=1, keepdims=True)
+        peaks[peaks == 0] = 1.0
+        codes = np.rint(rows * (127.0 / peaks)).astype(np.int8)
+    else:
+        codes = np.ascontiguousarray(raw[:, :dimension].view(np.int8))
+    norms = np.linalg.norm(codes.astype(np.float32), axis=1)
+    norms[norms == 0] = 1.0
+    return codes, (1.0 / norms).astype(np.float32)
+
+
+def save_originals(
+    conn: sqlite3.Connection,
+    source: str,
+    model_name: str,
+    vectors: Iterable[tuple[str, np.ndarray]],
+) -> None:
+    """Keep float32 originals of quantized vectors, by content hash. The caller commits."""
+    conn.executemany(
+        "INSERT OR REPLACE INTO embedding_originals "
+        "(source, model_name, content_hash, embedding) VALUES (?, ?, ?, ?)",
+        [
+            (source, model_name, content_hash, np.asarray(vector, dtype=np.float32).tobytes())
+            for content_hash, vector in vectors
+        ],
+    )
+
+
+def prune_originals(conn: sqlite3.Connection, source: str, model_name: str) -> int:
+    """Drop originals no row of the partition refers to. The caller commits."""
+    cursor = conn.execute(
+        f"""
+        DELETE FROM embedding_originals
+        WHERE source = ? AND model_name = ? AND content_hash NOT IN (
+            SELECT content_hash FROM {source}
+            WHERE model_name = ? AND content_hash IS NOT NULL
+        )
+        """,
+        (source, model_name, model_name),
+    )
+    return cursor.rowcount
+
+
+def _original_fetcher(
+    source: str, model_name: str, row_ids: np.ndarray
+) -> Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]:
+    """Look up the float32 originals of a matrix's rows by position."""
+
+    def fetch(positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        ids = [int(i) for i in row_ids[positions]]
+        with db.get_connection() as conn:
+            stored = dict(
+                conn.execute(
+                    f"""
+                    SELECT e.id, o.embedding
+                    FROM {source} e
+                    JOIN embedding_originals o
+                        ON o.source = ? AND o.model_name = e.model_name
+                        AND o.content_hash = e.content_hash
+                    WHERE e.model_name = ? AND e.id IN ({",".join("?" * len(ids))})
+                    """,
+                    (source, model_name, *ids),
+                ).fetchall()
+            )
+        found = np.array([i in stored for i in ids], dtype=bool)
+        rows = [np.frombuffer(stored[i], dtype=np.float32) for i in ids if i in stored]
+        dim = 0 if not rows else len(rows[0])
+        return found, np.stack(rows) if rows else np.empty((0, dim), dtype=np.float32)
+
+    return fetch
+
+
+def get_storage_format(conn: sqlite3.Connection, source: str, model_name: str) -> str:
+    """Storage format selected for a partition (float32 unless configured)."""
+    try:
+        row = conn.execute(
+            "SELECT value FROM schema_flags WHERE key = ?",
+            (_FORMAT_FLAG.format(source=source, model_name=model_name),),
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return FLOAT32
+    return row[0] if row and row[0] in STORAGE_FORMATS else FLOAT32
+
+
+def set_storage_format(
+    conn: sqlite3.Connection, source: str, model_name: str, storage_format: str
+) -> int:
+    """Select a partition's storage format and re-encode its existing rows.
+
+    Converting float32 rows to a quantized format keeps their originals for
+    rescoring; rows are re-encoded from their originals where kept, and
+    switching back to float32 restores them and drops the originals.
+    Returns the number of rows converted. The caller commits. Freed pages
+    are only returned to the filesystem by ``VACUUM``.
+    """
+    if storage_format not in STORAGE_FORMATS:
+        raise ValueError(
+            f"Unknown storage format {storage_format!r}; "
+            f"expected one of {', '.join(STORAGE_FORMATS)}"
+        )
+    conn.execute(
+        "INSERT OR REPLACE INTO schema_flags (key, value) VALUES (?, ?)",
+        (_FORMAT_FLAG.format(source=source, model_name=model_name), storage_format),
+    )
+    rows = conn.execute(
+        f"SELECT id, embedding, dimension, content_hash FROM {source} WHERE model_name = ?",
+        (model_name,),
+    ).fetchall()
+    kept = dict(
+        conn.execute(
+            "SELECT content_hash, embedding FROM embedding_originals "
+            "WHERE source = ? AND model_name = ?",
+            (source, model_name),
+        ).fetchall()
+    )
+    updates = []
+    new_originals = {}
+    for row_id, blob, dim, content_hash in rows:
+        current = blob_format(blob, dim)
+        if current == storage_format:
+            continue
+        if content_hash in kept:
+            vector = np.frombuffer(kept[content_hash], dtype=np.float32)
+        else:
+            vector = decode_blob(blob, dim)
+            if current == FLOAT32 and content_hash is not None:
+                new_originals[content_hash] = vector
+        updates.append((encode_vector(vector, storage_format), row_id))
+    conn.executemany(f"UPDATE {source} SET embedding = ? WHERE id = ?", updates)
+    if storage_format == FLOAT32:
+        conn.execute(
+            "DELETE FROM embedding_originals WHERE source = ? AND model_name = ?",
+            (source, model_name),
+        )
+    else:
+        save_originals(conn, source, model_name, new_originals.items())
+        prune_originals(conn, source, model_name)
+    return len(updates)
+
+
+def get_generation(conn: sqlite3.Connection, name: str) -> int:
+    """Read a write counter from index_generations."""
+    try:
+        row = conn.execute(
+            "SELECT generation FROM index_generations WHERE name = ?", (name,)
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return UNKNOWN_GENERATION
+    return int(row[0]) if row else UNKNOWN_GENERATION
+
+
+def get_generation_token(conn: sqlite3.Connection, name: str) -> int:
+    """Read the random token redrawn whenever a counter moves (0 if untracked)."""
+    try:
+        row = conn.execute("SELECT token FROM index_generations WHERE name = ?", (name,)).fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return int(row[0]) if row else 0
+
+
+def sidecar_dir(db_path: Path) -> Path:
+    """Directory holding derived vector files for a database."""
+    return db_path.parent / f"{db_path.name}.vectors"
+
+
+def sidecar_stem(source: str, model_name: str) -> str:
+    """Filesystem-safe file stem for one table/model partition."""
+    return f"{source}-{re.sub(r'[^A-Za-z0-9_.-]', '_', model_name)}"
+
+
+def _sidecar_name(stem: str, generation: int, token: int) -> str:
+    return f"{stem}-g{generation}-{token & 0xFFFFFFFFFFFFFFFF:016x}"
+
+
+def _read_sidecar(
+    db_path: Path, source: str, model_name: str, generation: int, token: int
+) -> EmbeddingMatrix | None:
+    """Memory-map a sidecar written at exactly this generation and token, if present."""
+    base = sidecar_dir(db_path) / _sidecar_name(sidecar_stem(source, model_name), generation, token)
+    ids_path = base.with_name(base.name + ".ids.npy")
+    vec_path = base.with_name(base.name + ".vectors.npy")
+    scales_path = base.with_name(base.name + ".unit-scales.npy")
+    if not ids_path.exists() or not vec_path.exists():
+        return None
+    try:
+        ids = np.load(ids_path)
+        vectors = np.load(vec_path, mmap_mode="r")
+        scales = np.load(scales_path) if vectors.dtype == np.int8 else None
+    except (OSError, ValueError) as e:
+        logger.debug("Ignoring unreadable vector sidecar %s: %s", base, e)
+        return None
+    if ids.ndim != 2 or vectors.ndim != 2 or ids.shape[0] != vectors.shape[0]:
+        return None
+    return EmbeddingMatrix(
+        row_ids=ids[:, 0],
+        doc_ids=ids[:, 1],
+        vectors=vectors,
+        generation=generation,
+        scales=scales,
+        token=token,
+    )
+
+
+def _write_sidecar(db_path: Path, source: str, model_name: str, matrix: EmbeddingMatrix) -> None:
+    """Persist a matrix for other processes; replaces older generations."""
+    directory = sidecar_dir(db_path)
+    stem = sidecar_stem(source, model_name)
+    base = _sidecar_name(stem, matrix.generation, matrix.token)
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        # ids last: readers require them, so a reader never sees ids without
+        # the matching vectors (and scales)
+        arrays = [(".vectors.npy", matrix.vectors)]
+        if matrix.scales is not None:
+            arrays.append((".unit-scales.npy", matrix.scales))
+        arrays.append((".ids.npy", np.stack([matrix.row_ids, matrix.doc_ids], axis=1)))
+        for suffix, array in arrays:
+            tmp = directory / f".{base}{suffix}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp, directory / f"{base}{suffix}")
+        for old in directory.glob(f"{stem}-g*.npy"):
+            if not old.name.startswith(f"{base}."):
+                old.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug("Could not write vector sidecar for %s: %s", stem, e)
+
+
+def _build_matrix(conn: sqlite3.Connection, source: str, model_name: str) -> EmbeddingMatrix:
+    """Read one partition from SQLite in a single snapshot."""
+    conn.execute("BEGIN")
+    try:
+        generation = get_generation(conn, source)
+        token = get_generation_token(conn, source)
+        rows = conn.execute(_LOAD_SQL[source], (model_name,)).fetchall()
+    finally:
+        conn.rollback()
+
+    # Skip rows whose dimension disagrees with the first, or whose blob
+    # matches no storage format (foreign/corrupt rows)
+    if rows:
+        dim = rows[0][3]
+        rows = [r for r in rows if r[3] == dim and len(r[2]) in (4 * dim, 2 * dim, dim + 4)]
+    if not rows:
+        return EmbeddingMatrix(
+            row_ids=np.empty(0, dtype=np.int64),
+            doc_ids=np.empty(0, dtype=np.int64),
+            vectors=np.empty((0, 0), dtype=np.float32),
+            generation=generation,
+            token=token,
+        )
+
+    width = len(rows[0][2])
+    scales = None
+    if all(len(r[2]) == width for r in rows):
+        vectors, scales = stack_blobs([r[2] for r in rows], dim)
+    else:
+        # Mixed formats (e.g. a conversion was interrupted): decode everything
+        vectors = np.stack([decode_blob(r[2], dim) for r in rows])
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        vectors = (vectors / norms).astype(np.float32)
+    return EmbeddingMatrix(
+        row_ids=np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows)),
+        doc_ids=np.fromiter((r[1] for r in rows), dtype=np.int64, count=len(rows)),
+        vectors=np.ascontiguousarray(vectors),
+        generation=generation,
+        scales=scales,
+        token=token,
+    )
+
+
+def load_matrix(source: str, model_name: str) -> EmbeddingMatrix:
+    """Get the current matrix for an embeddings table and model partition.
+
+    Costs one counter read when the in-process copy is current, a memory-map
+    when another process already wrote the sidecar, and a full blob scan
+    otherwise.
+    """
+    db_path = Path(db.db_path)
+    key = (str(db_path), source, model_name)
+    persist = str(db_path) != ":memory:"
+
+    with db.get_connection() as conn:
+        generation = get_generation(conn, source)
+        token = get_generation_token(conn, source)
+        cached = _cache.get(key)
+        if cached is not None and generation != UNKNOWN_GENERATION:
+            if cached.generation == generation and cached.token == token:
+                return cached
+
+        matrix = None
+        if persist and generation != UNKNOWN_GENERATION:
+            matrix = _read_sidecar(db_path, source, model_name, generation, token)
+        if matrix is None:
+            matrix = _build_matrix(conn, source, model_name)
+            if persist and matrix.generation != UNKNOWN_GENERATION:
+                _write_sidecar(db_path, source, model_name, matrix)
+
+    if matrix.quantized:
+        matrix.originals = _original_fetcher(source, model_name, matrix.row_ids)
+    if matrix.generation != UNKNOWN_GENERATION:
+        _cache[key] = matrix
+    return matrix
+
+
+def clear_cache() -> None:
+    """Drop in-process matrices (sidecars are left for generation checks)."""
+    _cache.clear()
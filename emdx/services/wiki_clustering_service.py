@@ -15,10 +15,12 @@ import logging
 import math
 import shutil
 import subprocess
+from bisect import bisect_right
 from dataclasses import dataclass
 
 from ..database import db
 from ..utils.environment import get_subprocess_env
+from . import llm_cache
 
 logger = logging.getLogger(__name__)
 
@@ -135,6 +137,88 @@ def _compute_idf_weighted_jaccard(
     return shared_weight / union_weight
 
 
+def _filter_entities(
+    doc_entities: dict[int, dict[str, float]],
+    entity_doc_freq: dict[str, int],
+    total_docs: int,
+    min_df: int = MIN_ENTITY_DF,
+) -> tuple[dict[int, dict[str, float]], dict[str, float]]:
+    """Drop entities too rare or too common to link documents.
+
+    Returns (filtered_doc_entities, entity_idf); documents left with no
+    entity are omitted.
+    """
+    max_df = max(int(total_docs * MAX_ENTITY_DF_RATIO), 5)
+    useful_entities = {e for e, df in entity_doc_freq.items() if min_df <= df <= max_df}
+
+    filtered_doc_entities: dict[int, dict[str, float]] = {}
+    for doc_id, entities in doc_entities.items():
+        filtered = {e: c for e, c in entities.items() if e in useful_entities}
+        if filtered:
+            filtered_doc_entities[doc_id] = filtered
+
+    entity_idf: dict[str, float] = {}
+    for entity in useful_entities:
+        df = entity_doc_freq.get(entity, 1)
+        entity_idf[entity] = math.log(1 + total_docs / max(df, 1))
+
+    return filtered_doc_entities, entity_idf
+
+
+def _build_similarity_graph(
+    doc_entities: dict[int, dict[str, float]],
+    entity_idf: dict[str, float],
+) -> tuple[list[int], list[tuple[int, int]], list[float]]:
+    """Edges between documents whose similarity reaches MIN_EDGE_WEIGHT.
+
+    Returns (doc_ids, edges, weights): nodes are indexes into the sorted
+    ``doc_ids``, and each edge ``(i, j)`` has ``i < j``, in ascending order.
+
+    Only pairs sharing an entity can be similar, so rather than scoring all
+    n² pairs, each document walks the entity -> documents index for the
+    later documents it shares entities with, accumulating the shared and
+    union weights of the Jaccard as it goes. Pairs whose accumulated score
+    could reach the threshold are then scored with
+    ``_compute_idf_weighted_jaccard`` itself, so the edges and weights are
+    exactly those of the all-pairs scan.
+    """
+    doc_ids = sorted(doc_entities)
+    postings: dict[str, tuple[list[int], list[float]]] = {}
+    for node, doc_id in enumerate(doc_ids):
+        for entity, confidence in doc_entities[doc_id].items():
+            nodes, confidences = postings.setdefault(entity, ([], []))
+            nodes.append(node)
+            confidences.append(confidence)
+    idf_totals = [sum(entity_idf.get(e, 1.0) for e in doc_entities[d]) for d in doc_ids]
+    # Summation order differs from the exact score; leave room for rounding
+    cutoff = MIN_EDGE_WEIGHT * (1 - 1e-9)
+
+    edges: list[tuple[int, int]] = []
+    weights: list[float] = []
+    for i, doc_id in enumerate(doc_ids):
+        entities = doc_entities[doc_id]
+        shared_weight: dict[int, float] = {}
+        shared_idf: dict[int, float] = {}
+        for entity, confidence in entities.items():
+            nodes, confidences = postings[entity]
+            idf = entity_idf.get(entity, 1.0)
+            # Postings are ascending: only the nodes after i are new pairs
+            start = bisect_right(nodes, i)
+            for j, other in zip(nodes[start:], confidences[start:], strict=True):
+                shared_weight[j] = shared_weight.get(j, 0.0) + idf * max(confidence, other)
+                shared_idf[j] = shared_idf.get(j, 0.0) + idf
+        for j in sorted(shared_weight):
+            union_weight = idf_totals[i] + idf_totals[j] - shared_idf[j]
+            if union_weight <= 0 or shared_weight[j] < cutoff * union_weight:
+                continue
+            sim = _compute_idf_weighted_jaccard(entities, doc_entities[doc_ids[j]], entity_idf)
+            if sim >= MIN_EDGE_WEIGHT:
+                edges.append((i, j))
+                weights.append(sim)
+
+    return doc_ids, edges, weights
+
+
 def _slugify(label: str) -> str:
     """Convert a label to a URL-friendly slug."""
     import re
@@ -258,41 +342,15 @@ def discover_topics(
             resolution=resolution,
         )
 
-    # 2. Filter entities by document frequency
-    max_df = max(int(total_docs * MAX_ENTITY_DF_RATIO), 5)
-    useful_entities = {e for e, df in entity_doc_freq.items() if min_df <= df <= max_df}
-
-    # Filter doc_entities to only useful entities
-    filtered_doc_entities: dict[int, dict[str, float]] = {}
-    for doc_id, entities in doc_entities.items():
-        filtered = {e: c for e, c in entities.items() if e in useful_entities}
-        if filtered:
-            filtered_doc_entities[doc_id] = filtered
-
-    # 3. Compute IDF for useful entities
-    entity_idf: dict[str, float] = {}
-    for entity in useful_entities:
-        df = entity_doc_freq.get(entity, 1)
-        entity_idf[entity] = math.log(1 + total_docs / max(df, 1))
+    # 2-3. Keep entities with a useful document frequency, weighted by IDF
+    filtered_doc_entities, entity_idf = _filter_entities(
+        doc_entities, entity_doc_freq, total_docs, min_df
+    )
 
     # 4. Build similarity graph
-    doc_ids = sorted(filtered_doc_entities.keys())
+    doc_ids, edges, weights = _build_similarity_graph(filtered_doc_entities, entity_idf)
     n = len(doc_ids)
 
-    edges: list[tuple[int, int]] = []
-    weights: list[float] = []
-
-    for i in range(n):
-        for j in range(i + 1, n):
-            sim = _compute_idf_weighted_jaccard(
-                filtered_doc_entities[doc_ids[i]],
-                filtered_doc_entities[doc_ids[j]],
-                entity_idf,
-            )
-            if sim >= MIN_EDGE_WEIGHT:
-                edges.append((i, j))
-                weights.append(sim)
-
     logger.info(
         "Built graph: %d nodes, %d edges (%.1f%% density)",
         n,
@@ -523,6 +581,10 @@ def auto_label_cluster(cluster: TopicCluster) -> str:
         "Reply with ONLY the topic name, nothing else. "
         "No quotes, no explanation, no punctuation at the end."
     )
+    key = llm_cache.make_key(None, "", prompt)
+    cached = llm_cache.get(key)
+    if cached is not None:
+        return cached
 
     try:
         result = subprocess.run(
@@ -536,6 +598,7 @@ def auto_label_cluster(cluster: TopicCluster) -> str:
             label = result.stdout.strip().strip('"').strip("'")
             # Sanity check: reject labels that are too long or empty
             if 1 <= len(label) <= 80:
+                llm_cache.put(key, None, label)
                 return label
             logger.warning(
                 "Claude CLI returned invalid label length (%d): %s",
@@ -18,8 +18,14 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
 import re
+import socket
+import threading
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 
 from ..config.cli_config import DEFAULT_LLM_MODEL
@@ -52,6 +58,72 @@ WIKI_ARTICLE_TAG = "wiki-article"
 # Max articles to generate in one batch
 DEFAULT_BATCH_LIMIT = 10
 
+# Sources per chunk, and chunks summarized in parallel, in hierarchical synthesis
+HIERARCHICAL_CHUNK_SIZE = 5
+HIERARCHICAL_CHUNK_WORKERS = 4
+
+# Seconds before another worker may take over a topic claimed in a wiki
+# run, unless the claimer is known to have exited (same host, dead pid)
+WIKI_RUN_CLAIM_TIMEOUT = 3600
+
+# Checkpoint states of a run's topics (wiki_run_topics.status)
+RUN_TOPIC_STATUSES = ("pending", "in_flight", "done", "failed")
+
+
+class _LLMLimiter:
+    """Caps the LLM calls in flight across every article being generated.
+
+    Article generations and their chunk summaries run in nested thread
+    pools; each LLM call takes a slot here, so the total stays bounded
+    however the pools are sized. Slots are held only for the duration of
+    a call, never while waiting on other work, so nesting cannot deadlock.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._active = 0
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        with self._cond:
+            self._cond.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify()
+
+    @contextmanager
+    def limit(self, limit: int) -> Iterator[None]:
+        with self._cond:
+            previous, self._limit = self._limit, max(1, limit)
+            self._cond.notify_all()
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._limit = previous
+                self._cond.notify_all()
+
+
+_llm_limiter = _LLMLimiter(HIERARCHICAL_CHUNK_WORKERS)
+
+
+@contextmanager
+def llm_concurrency(concurrency: int) -> Iterator[None]:
+    """Allow ``concurrency`` concurrent article generations' worth of LLM calls.
+
+    A batch of N concurrent articles gets N call slots (at least
+    HIERARCHICAL_CHUNK_WORKERS, so one hierarchical article can still
+    summarize its chunks in parallel), shared by the articles and their
+    chunk summaries.
+    """
+    with _llm_limiter.limit(max(concurrency, HIERARCHICAL_CHUNK_WORKERS)):
+        yield
+
 
 @dataclass
 class ArticleSource:
@@ -104,9 +176,14 @@ class WikiGenerationResult:
     total_input_tokens: int
     total_output_tokens: int
     total_cost_usd: float
+    articles_failed: int = 0
     results: list[WikiArticleResult] = field(default_factory=list)
 
 
+# Progress callback for process_wiki_run: (topic_id, result, error, seconds)
+ArticleCallback = Callable[[int, "WikiArticleResult | None", "str | None", float], None]
+
+
 # ── Step 1: PREPARE ──────────────────────────────────────────────────
 
 
@@ -305,12 +382,13 @@ def _synthesize_article(
         outline, sources, audience, editorial_prompt=editorial_prompt
     )
 
-    result = _execute_prompt(
-        system_prompt=system_prompt,
-        user_message=user_message,
-        title=f"Wiki: {outline.suggested_title}",
-        model=model or DEFAULT_MODEL,
-    )
+    with _llm_limiter.slot():
+        result = _execute_prompt(
+            system_prompt=system_prompt,
+            user_message=user_message,
+            title=f"Wiki: {outline.suggested_title}",
+            model=model or DEFAULT_MODEL,
+        )
 
     content = result.output_content or ""
 
@@ -342,21 +420,21 @@ def _synthesize_hierarchical(
 ) -> tuple[str, int, int, float]:
     """Hierarchical synthesis for large clusters.
 
-    Splits sources into chunks, synthesizes each chunk, then
-    merges the chunk summaries into a final article.
+    Splits sources into chunks and summarizes them in parallel (up to
+    HIERARCHICAL_CHUNK_WORKERS at a time, within the shared LLM call
+    limit), then merges the chunk summaries into a final article.
     """
-    from .synthesis_service import _execute_prompt
+    from .synthesis_service import PromptResult, _execute_prompt
 
-    chunk_size = 5
+    chunk_size = HIERARCHICAL_CHUNK_SIZE
     chunks = [sources[i : i + chunk_size] for i in range(0, len(sources), chunk_size)]
 
-    chunk_summaries: list[str] = []
     total_input = 0
     total_output = 0
     total_cost = 0.0
 
     # Phase 1: Summarize each chunk
-    for i, chunk in enumerate(chunks):
+    def _summarize(i: int, chunk: list[ArticleSource]) -> PromptResult:
         system_prompt = (
             "Summarize these documents into a concise overview, "
             "preserving key facts, code snippets, and decisions. "
@@ -368,16 +446,28 @@ def _synthesize_hierarchical(
         source_parts = [f"### Source #{s.doc_id}: {s.title}\n\n{s.content}" for s in chunk]
         user_message = "\n\n---\n\n".join(source_parts)
 
-        result = _execute_prompt(
-            system_prompt=system_prompt,
-            user_message=user_message,
-            title=f"Wiki chunk {i + 1}/{len(chunks)}: {outline.topic_label}",
-            model=model or DEFAULT_MODEL,
-        )
+        with _llm_limiter.slot():
+            return _execute_prompt(
+                system_prompt=system_prompt,
+                user_message=user_message,
+                title=f"Wiki chunk {i + 1}/{len(chunks)}: {outline.topic_label}",
+                model=model or DEFAULT_MODEL,
+            )
 
-        chunk_summaries.append(result.output_content or "")
-        total_input += result.input_tokens
-        total_output += result.output_tokens
+    t0 = time.monotonic()
+    workers = max(1, min(len(chunks), HIERARCHICAL_CHUNK_WORKERS))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        chunk_results = list(pool.map(_summarize, range(len(chunks)), chunks))
+    logger.info(
+        "%s — summarized %d chunk(s) in %.1fs",
+        outline.topic_label,
+        len(chunks),
+        time.monotonic() - t0,
+    )
+
+    chunk_summaries = [result.output_content or "" for result in chunk_results]
+    total_input += sum(result.input_tokens for result in chunk_results)
+    total_output += sum(result.output_tokens for result in chunk_results)
 
     # Phase 2: Merge chunk summaries into final article
     merge_sources = [
@@ -391,9 +481,11 @@ def _synthesize_hierarchical(
         for i, summary in enumerate(chunk_summaries)
     ]
 
+    t0 = time.monotonic()
     content, merge_input, merge_output, merge_cost = _synthesize_article(
         outline, merge_sources, audience, model, editorial_prompt=editorial_prompt
     )
+    logger.info("%s — merged summaries in %.1fs", outline.topic_label, time.monotonic() - t0)
 
     total_input += merge_input
     total_output += merge_output
@@ -936,12 +1028,14 @@ def generate_wiki(
     dry_run: bool = False,
     topic_ids: list[int] | None = None,
     concurrency: int = 1,
+    run_id: int | None = None,
 ) -> WikiGenerationResult:
     """Generate wiki articles for multiple topics.
 
-    Processes topics sequentially by default (concurrency=1) for
-    memory-efficient streaming.  Set concurrency > 1 to allow
-    N concurrent generations via a thread pool.
+    Records the topic list as a checkpointed wiki run and works through
+    it with process_wiki_run(). Processes topics sequentially by default
+    (concurrency=1) for memory-efficient streaming.  Set concurrency > 1
+    to allow N concurrent generations via a thread pool.
 
     Args:
         audience: Privacy audience mode ("me", "team", "public").
@@ -950,91 +1044,155 @@ def generate_wiki(
         dry_run: If True, estimate costs without calling LLM.
         topic_ids: Specific topic IDs to generate (None = all).
         concurrency: Max concurrent article generations (default 1).
+        run_id: Resume this run (with its own audience, model and
+            topics) instead of starting a new one.
 
     Returns:
         WikiGenerationResult with batch statistics.
     """
-    if topic_ids is not None:
-        topics = []
-        for tid in topic_ids:
-            with db.get_connection() as conn:
-                row = conn.execute(
-                    "SELECT id, topic_label FROM wiki_topics WHERE id = ?",
-                    (tid,),
-                ).fetchone()
-            if row:
-                topics.append({"id": row[0], "label": row[1]})
+    if run_id is not None:
+        run = reopen_wiki_run(run_id)
+        if run is None:
+            raise ValueError(f"Wiki run {run_id} not found")
+        audience = str(run["audience"])
+        model = str(run["model"]) or None
+        dry_run = bool(run["dry_run"])
     else:
-        topics = get_topics()
-
-    # Apply limit upfront to avoid over-fetching
-    effective_topics = topics[:limit]
-
-    results: list[WikiArticleResult] = []
-    generated = 0
-    skipped = 0
-    total_input = 0
-    total_output = 0
-    total_cost = 0.0
+        if topic_ids is not None:
+            topics = []
+            for tid in topic_ids:
+                with db.get_connection() as conn:
+                    row = conn.execute(
+                        "SELECT id, topic_label FROM wiki_topics WHERE id = ?",
+                        (tid,),
+                    ).fetchone()
+                if row:
+                    topics.append({"id": row[0], "label": row[1]})
+        else:
+            topics = get_topics()
 
-    if concurrency <= 1:
-        # Sequential — memory-efficient, one topic at a time
-        for topic in effective_topics:
-            topic_id = topic["id"]
-            assert isinstance(topic_id, int)
+        # Apply limit upfront to avoid over-fetching
+        effective_ids = [tid for t in topics[:limit] if isinstance(tid := t["id"], int)]
+        run_id = create_wiki_run(
+            model=model or DEFAULT_MODEL,
+            dry_run=dry_run,
+            topic_ids=effective_ids,
+            audience=audience,
+        )
 
-            result = generate_article(
-                topic_id=topic_id,
-                audience=audience,
-                model=model,
-                dry_run=dry_run,
-            )
-            results.append(result)
+    with llm_concurrency(concurrency):
+        return process_wiki_run(run_id, audience, model, dry_run, concurrency)
 
-            if result.skipped and result.skip_reason != "dry run":
-                skipped += 1
-            else:
-                generated += 1
 
-            total_input += result.input_tokens
-            total_output += result.output_tokens
-            total_cost += result.cost_usd
-    else:
-        # Concurrent processing with ThreadPoolExecutor
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        def _gen(t: dict[str, object]) -> WikiArticleResult:
-            tid = t["id"]
-            assert isinstance(tid, int)
-            return generate_article(
-                topic_id=tid,
-                audience=audience,
-                model=model,
-                dry_run=dry_run,
-            )
+def process_wiki_run(
+    run_id: int,
+    audience: str,
+    model: str | None,
+    dry_run: bool,
+    concurrency: int = 1,
+    on_result: ArticleCallback | None = None,
+) -> WikiGenerationResult:
+    """Generate a run's remaining topics, ``concurrency`` at a time.
 
-        with ThreadPoolExecutor(max_workers=concurrency) as pool:
-            futures = {pool.submit(_gen, t): t for t in effective_topics}
+    Topics are claimed one at a time from the run's checkpoints, so any
+    number of processes can work on the same run and each topic is
+    generated once. A topic whose generation raises is marked failed and
+    the run carries on. On an interrupt, no new topics are claimed and
+    every topic still being generated goes back to pending.
 
-            for future in as_completed(futures):
-                result = future.result()
-                results.append(result)
+    Args:
+        run_id: The wiki run to work on.
+        audience: Privacy audience mode ("me", "team", "public").
+        model: LLM model override.
+        dry_run: If True, estimate costs without calling LLM.
+        concurrency: Max concurrent article generations (default 1).
+        on_result: Called with (topic_id, result, error, elapsed seconds)
+            after each topic, one call at a time.
 
-                if result.skipped and result.skip_reason != "dry run":
-                    skipped += 1
+    Returns:
+        WikiGenerationResult for the topics this call generated.
+    """
+    worker = _worker_id()
+    results: list[WikiArticleResult] = []
+    failed = 0
+    lock = threading.Lock()
+    stop = threading.Event()
+    in_flight: set[int] = set()
+
+    def _work() -> None:
+        nonlocal failed
+        while not stop.is_set():
+            with lock:
+                topic_id = claim_run_topic(run_id, worker)
+                if topic_id is None:
+                    return
+                in_flight.add(topic_id)
+
+            start = time.time()
+            result: WikiArticleResult | None = None
+            error: str | None = None
+            try:
+                result = generate_article(
+                    topic_id=topic_id,
+                    audience=audience,
+                    model=model,
+                    dry_run=dry_run,
+                )
+            except Exception as e:
+                logger.warning("Wiki generation failed for topic %d: %s", topic_id, e)
+                error = str(e) or type(e).__name__
+
+            with lock:
+                if topic_id not in in_flight:
+                    return  # released by an interrupt while generating
+                in_flight.discard(topic_id)
+                finish_run_topic(run_id, topic_id, result, error)
+                if result is not None:
+                    results.append(result)
                 else:
-                    generated += 1
+                    failed += 1
+                if on_result is not None:
+                    on_result(topic_id, result, error, time.time() - start)
 
-                total_input += result.input_tokens
-                total_output += result.output_tokens
-                total_cost += result.cost_usd
+    def _release_in_flight() -> None:
+        stop.set()
+        with lock:
+            for topic_id in in_flight:
+                release_run_topic(run_id, topic_id)
+            in_flight.clear()
 
+    try:
+        if concurrency <= 1:
+            # Sequential — memory-efficient, one topic at a time
+            try:
+                _work()
+            except BaseException:
+                _release_in_flight()
+                raise
+        else:
+            # Not a with-block: on Ctrl-C its exit would wait for the workers
+            pool = ThreadPoolExecutor(max_workers=concurrency)
+            try:
+                for future in [pool.submit(_work) for _ in range(concurrency)]:
+                    future.result()
+            except BaseException:
+                # Workers finish their current article, then see the stop
+                # flag instead of claiming more; their topics go back now.
+                _release_in_flight()
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+            pool.shutdown()
+    finally:
+        complete_wiki_run(run_id)
+
+    generated = sum(1 for r in results if not r.skipped or r.skip_reason == "dry run")
     return WikiGenerationResult(
         articles_generated=generated,
-        articles_skipped=skipped,
-        total_input_tokens=total_input,
-        total_output_tokens=total_output,
-        total_cost_usd=total_cost,
+        articles_skipped=len(results) - generated,
+        total_input_tokens=sum(r.input_tokens for r in results),
+        total_output_tokens=sum(r.output_tokens for r in results),
+        total_cost_usd=sum(r.cost_usd for r in results),
+        articles_failed=failed,
         results=results,
     )
 
@@ -1109,49 +1267,225 @@ def mark_stale(doc_id: int, reason: str = "source_updated") -> bool:
 # ── Wiki run tracking ────────────────────────────────────────────────
 
 
-def create_wiki_run(model: str, dry_run: bool = False) -> int:
-    """Create a new wiki run record and return its ID."""
+def create_wiki_run(
+    model: str,
+    dry_run: bool = False,
+    topic_ids: list[int] | None = None,
+    audience: str = "team",
+) -> int:
+    """Create a new wiki run record, with a pending checkpoint per topic."""
     with db.get_connection() as conn:
         cursor = conn.execute(
-            "INSERT INTO wiki_runs (model, dry_run) VALUES (?, ?)",
-            (model, dry_run),
+            "INSERT INTO wiki_runs (model, dry_run, audience) VALUES (?, ?, ?)",
+            (model, dry_run, audience),
         )
-        conn.commit()
         run_id: int = cursor.lastrowid  # type: ignore[assignment]
+        conn.executemany(
+            "INSERT OR IGNORE INTO wiki_run_topics (run_id, topic_id, position) VALUES (?, ?, ?)",
+            [(run_id, topic_id, i) for i, topic_id in enumerate(topic_ids or [])],
+        )
+        conn.commit()
     return run_id
 
 
-def complete_wiki_run(
+def _worker_id() -> str:
+    """Identify this process in topic claims (``host:pid``)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # exists but belongs to someone else
+    return True
+
+
+def _claim_is_stale(claimed_by: str | None, claimed_at: float | None, now: float) -> bool:
+    """Whether an in-flight claim was abandoned and may be taken over.
+
+    Claims by a process on this host that has exited are abandoned at
+    once; claims from elsewhere only after WIKI_RUN_CLAIM_TIMEOUT.
+    """
+    if claimed_at is None or now - claimed_at > WIKI_RUN_CLAIM_TIMEOUT:
+        return True
+    host, _, pid = (claimed_by or "").rpartition(":")
+    if host != socket.gethostname() or not pid.isdigit():
+        return False
+    return int(pid) != os.getpid() and not _pid_alive(int(pid))
+
+
+def claim_run_topic(run_id: int, worker: str | None = None) -> int | None:
+    """Claim the run's next pending (or abandoned) topic for ``worker``.
+
+    Runs in an immediate transaction, so concurrent claimers never get
+    the same topic. Returns None once nothing is left to claim.
+    """
+    now = time.time()
+    with db.get_connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute(
+            "SELECT topic_id FROM wiki_run_topics "
+            "WHERE run_id = ? AND status = 'pending' ORDER BY position LIMIT 1",
+            (run_id,),
+        ).fetchone()
+        topic_id: int | None = row[0] if row else None
+        if topic_id is None:
+            in_flight = conn.execute(
+                "SELECT topic_id, claimed_by, claimed_at FROM wiki_run_topics "
+                "WHERE run_id = ? AND status = 'in_flight' ORDER BY position",
+                (run_id,),
+            ).fetchall()
+            topic_id = next(
+                (r[0] for r in in_flight if _claim_is_stale(r[1], r[2], now)),
+                None,
+            )
+        if topic_id is not None:
+            conn.execute(
+                "UPDATE wiki_run_topics SET status = 'in_flight', claimed_by = ?, "
+                "claimed_at = ? WHERE run_id = ? AND topic_id = ?",
+                (worker or _worker_id(), now, run_id, topic_id),
+            )
+        conn.commit()
+    return topic_id
+
+
+def finish_run_topic(
     run_id: int,
-    *,
-    topics_attempted: int,
-    articles_generated: int,
-    articles_skipped: int,
-    total_input_tokens: int,
-    total_output_tokens: int,
-    total_cost_usd: float,
+    topic_id: int,
+    result: WikiArticleResult | None,
+    error: str | None = None,
 ) -> None:
-    """Update a wiki run with completion data."""
+    """Checkpoint a claimed topic as done (with its result) or failed."""
+    skipped = result is not None and result.skipped and result.skip_reason != "dry run"
+    with db.get_connection() as conn:
+        conn.execute(
+            "UPDATE wiki_run_topics SET status = ?, finished_at = ?, skipped = ?, error = ?, "
+            "input_tokens = ?, output_tokens = ?, cost_usd = ? "
+            "WHERE run_id = ? AND topic_id = ?",
+            (
+                "failed" if result is None else "done",
+                time.time(),
+                skipped,
+                error,
+                result.input_tokens if result else 0,
+                result.output_tokens if result else 0,
+                result.cost_usd if result else 0.0,
+                run_id,
+                topic_id,
+            ),
+        )
+        conn.commit()
+
+
+def release_run_topic(run_id: int, topic_id: int) -> None:
+    """Return an interrupted topic to pending so another worker picks it up."""
+    with db.get_connection() as conn:
+        conn.execute(
+            "UPDATE wiki_run_topics SET status = 'pending', claimed_by = NULL, "
+            "claimed_at = NULL WHERE run_id = ? AND topic_id = ? AND status = 'in_flight'",
+            (run_id, topic_id),
+        )
+        conn.commit()
+
+
+def get_wiki_run(run_id: int) -> dict[str, object] | None:
+    """A run's settings and per-status topic counts, or None if not found."""
+    with db.get_connection() as conn:
+        row = conn.execute(
+            "SELECT id, started_at, completed_at, model, audience, dry_run "
+            "FROM wiki_runs WHERE id = ?",
+            (run_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        counts = dict(
+            conn.execute(
+                "SELECT status, COUNT(*) FROM wiki_run_topics WHERE run_id = ? GROUP BY status",
+                (run_id,),
+            ).fetchall()
+        )
+    run: dict[str, object] = dict(row)
+    for status in RUN_TOPIC_STATUSES:
+        run[status] = counts.get(status, 0)
+    return run
+
+
+def reopen_wiki_run(run_id: int) -> dict[str, object] | None:
+    """Prepare a run for ``--resume``: retry its failed topics.
+
+    Returns the run as get_wiki_run() does, or None if it does not exist.
+    """
     with db.get_connection() as conn:
+        conn.execute(
+            "UPDATE wiki_run_topics SET status = 'pending', claimed_by = NULL, "
+            "claimed_at = NULL, error = NULL WHERE run_id = ? AND status = 'failed'",
+            (run_id,),
+        )
+        conn.execute("UPDATE wiki_runs SET completed_at = NULL WHERE id = ?", (run_id,))
+        conn.commit()
+    return get_wiki_run(run_id)
+
+
+def find_active_wiki_run(model: str, audience: str) -> int | None:
+    """The most recent live run with these settings that still has pending topics.
+
+    A run is live while some topic is claimed by a worker that has not
+    abandoned it, i.e. another ``wiki generate`` is working through it.
+    A new invocation joins such a run instead of duplicating its topics.
+    """
+    now = time.time()
+    with db.get_connection() as conn:
+        runs = conn.execute(
+            "SELECT r.id FROM wiki_runs r WHERE r.completed_at IS NULL AND r.dry_run = 0 "
+            "AND r.model = ? AND r.audience = ? AND EXISTS ("
+            "SELECT 1 FROM wiki_run_topics t WHERE t.run_id = r.id AND t.status = 'pending'"
+            ") ORDER BY r.id DESC",
+            (model, audience),
+        ).fetchall()
+        for (run_id,) in runs:
+            claims = conn.execute(
+                "SELECT claimed_by, claimed_at FROM wiki_run_topics "
+                "WHERE run_id = ? AND status = 'in_flight'",
+                (run_id,),
+            ).fetchall()
+            if any(not _claim_is_stale(by, at, now) for by, at in claims):
+                return int(run_id)
+    return None
+
+
+def complete_wiki_run(run_id: int) -> None:
+    """Total a run's checkpoints into its record.
+
+    Marks the run completed once no topic is pending or in flight.
+    """
+    with db.get_connection() as conn:
+        totals = conn.execute(
+            "SELECT "
+            "COALESCE(SUM(status IN ('done', 'failed')), 0), "
+            "COALESCE(SUM(status = 'done' AND NOT skipped), 0), "
+            "COALESCE(SUM(status = 'done' AND skipped), 0), "
+            "COALESCE(SUM(input_tokens), 0), "
+            "COALESCE(SUM(output_tokens), 0), "
+            "COALESCE(SUM(cost_usd), 0.0), "
+            "COALESCE(SUM(status IN ('pending', 'in_flight')), 0) "
+            "FROM wiki_run_topics WHERE run_id = ?",
+            (run_id,),
+        ).fetchone()
         conn.execute(
             "UPDATE wiki_runs SET "
-            "completed_at = CURRENT_TIMESTAMP, "
             "topics_attempted = ?, "
             "articles_generated = ?, "
             "articles_skipped = ?, "
             "total_input_tokens = ?, "
             "total_output_tokens = ?, "
-            "total_cost_usd = ? "
+            "total_cost_usd = ?, "
+            "completed_at = CASE WHEN ? = 0 "
+            "THEN COALESCE(completed_at, CURRENT_TIMESTAMP) END "
             "WHERE id = ?",
-            (
-                topics_attempted,
-                articles_generated,
-                articles_skipped,
-                total_input_tokens,
-                total_output_tokens,
-                total_cost_usd,
-                run_id,
-            ),
+            (*totals, run_id),
         )
         conn.commit()
 
@@ -1166,7 +1500,11 @@ def list_wiki_runs(limit: int = 10) -> list[dict[str, object]]:
             "SELECT id, started_at, completed_at, topics_attempted, "
             "articles_generated, articles_skipped, "
             "total_input_tokens, total_output_tokens, "
-            "total_cost_usd, model, dry_run "
+            "total_cost_usd, model, dry_run, "
+            "(SELECT COUNT(*) FROM wiki_run_topics t WHERE t.run_id = wiki_runs.id) "
+            "AS topics_total, "
+            "(SELECT COUNT(*) FROM wiki_run_topics t WHERE t.run_id = wiki_runs.id "
+            "AND t.status = 'failed') AS topics_failed "
             "FROM wiki_runs ORDER BY id DESC LIMIT ?",
             (limit,),
         ).fetchall()
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections import deque
 from dataclasses import dataclass, field
 
 from ..database import db, document_links
@@ -56,7 +57,7 @@ class TitleCandidate:
     doc_id: int
     title: str
     normalized: str
-    pattern: re.Pattern[str]
+    project: str | None = None
 
 
 @dataclass
@@ -81,14 +82,74 @@ def _normalize_title(title: str) -> str:
     return normalized
 
 
-def _build_title_pattern(normalized_title: str) -> re.Pattern[str]:
-    r"""Build a word-boundary regex pattern for a title.
+def _is_word_char(ch: str) -> bool:
+    r"""Whether ``ch`` is a regex ``\w`` character."""
+    return ch.isalnum() or ch == "_"
 
-    Uses \b word boundaries so "auth" doesn't match "authorization"
-    but "auth module" matches "the auth module broke".
+
+class TitleMatcher:
+    r"""Finds whole-word mentions of many titles in one pass over a text.
+
+    An Aho–Corasick automaton over the candidates' normalized titles, so
+    matching a document costs one scan of its content however many titles
+    there are, instead of one regex search per title. A hit counts only
+    at word boundaries, as ``\b`` would: "auth" does not match
+    "authorization", but "auth module" matches "the auth module broke".
     """
-    escaped = re.escape(normalized_title)
-    return re.compile(r"\b" + escaped + r"\b", re.IGNORECASE)
+
+    def __init__(self, candidates: list[TitleCandidate]) -> None:
+        self.candidates = candidates
+        self._lengths = [len(c.normalized) for c in candidates]
+        # Whether each title starts/ends with a word character, for \b checks
+        self._edges = [
+            (_is_word_char(c.normalized[0]), _is_word_char(c.normalized[-1])) for c in candidates
+        ]
+        self._goto: list[dict[str, int]] = [{}]
+        # Candidate indexes whose title ends at each state, fail links included
+        self._outputs: list[list[int]] = [[]]
+        for index, candidate in enumerate(candidates):
+            state = 0
+            for ch in candidate.normalized:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][ch] = next_state
+                    self._goto.append({})
+                    self._outputs.append([])
+                state = next_state
+            self._outputs[state].append(index)
+
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(ch, 0)
+                self._outputs[next_state].extend(self._outputs[self._fail[next_state]])
+
+    def find(self, text: str) -> list[TitleCandidate]:
+        """Candidates mentioned in ``text`` (already lowercased), in candidate order."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        hits: set[int] = set()
+        state = 0
+        for end, ch in enumerate(text, 1):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in outputs[state]:
+                if index in hits:
+                    continue
+                start = end - self._lengths[index]
+                first_is_word, last_is_word = self._edges[index]
+                before = start > 0 and _is_word_char(text[start - 1])
+                after = end < len(text) and _is_word_char(text[end])
+                if before != first_is_word and after != last_is_word:
+                    hits.add(index)
+        return [self.candidates[index] for index in sorted(hits)]
 
 
 def _load_title_candidates(
@@ -110,11 +171,11 @@ def _load_title_candidates(
     with db.get_connection() as conn:
         if project is not None:
             cursor = conn.execute(
-                "SELECT id, title FROM documents WHERE is_deleted = 0 AND project = ?",
+                "SELECT id, title, project FROM documents WHERE is_deleted = 0 AND project = ?",
                 (project,),
             )
         else:
-            cursor = conn.execute("SELECT id, title FROM documents WHERE is_deleted = 0")
+            cursor = conn.execute("SELECT id, title, project FROM documents WHERE is_deleted = 0")
         rows = cursor.fetchall()
 
     candidates: list[TitleCandidate] = []
@@ -133,13 +194,12 @@ def _load_title_candidates(
         if normalized in STOPWORD_TITLES:
             continue
 
-        pattern = _build_title_pattern(normalized)
         candidates.append(
             TitleCandidate(
                 doc_id=doc_id,
                 title=title,
                 normalized=normalized,
-                pattern=pattern,
+                project=row[2],
             )
         )
 
@@ -198,8 +258,7 @@ def title_match_wikify(
     if not cross_project:
         scope_project = _get_document_project(doc_id)
 
-    content_lower = content.lower()
-    candidates = _load_title_candidates(exclude_doc_id=doc_id, project=scope_project)
+    matcher = TitleMatcher(_load_title_candidates(exclude_doc_id=doc_id, project=scope_project))
 
     # Get existing links to avoid duplicates
     existing = set(document_links.get_linked_doc_ids(doc_id))
@@ -207,12 +266,11 @@ def title_match_wikify(
     matches: list[tuple[int, str]] = []
     skipped = 0
 
-    for candidate in candidates:
-        if candidate.pattern.search(content_lower):
-            if candidate.doc_id in existing:
-                skipped += 1
-                continue
-            matches.append((candidate.doc_id, candidate.title))
+    for candidate in matcher.find(content.lower()):
+        if candidate.doc_id in existing:
+            skipped += 1
+            continue
+        matches.append((candidate.doc_id, candidate.title))
 
     if dry_run:
         return WikifyResult(
@@ -247,6 +305,11 @@ def wikify_all(
 ) -> tuple[int, int]:
     """Backfill title-match wikification for all documents.
 
+    Titles are loaded and compiled into one ``TitleMatcher`` for the whole
+    run, and every link is created in a single transaction at the end.
+    Links found for earlier documents count as existing for later ones,
+    exactly as if each document had been wikified in turn.
+
     Args:
         dry_run: If True, report matches without creating links.
         cross_project: If True, match titles across all projects.
@@ -254,16 +317,39 @@ def wikify_all(
     Returns:
         Tuple of (total_links_created_or_would_create, documents_processed).
     """
+    matcher = TitleMatcher(_load_title_candidates())
+
     with db.get_connection() as conn:
-        cursor = conn.execute("SELECT id FROM documents WHERE is_deleted = 0")
-        doc_ids = [row[0] for row in cursor.fetchall()]
+        linked: dict[int, set[int]] = {}
+        for source_id, target_id in conn.execute(
+            "SELECT source_doc_id, target_doc_id FROM document_links"
+        ):
+            linked.setdefault(source_id, set()).add(target_id)
+            linked.setdefault(target_id, set()).add(source_id)
+
+        links: list[tuple[int, int, float, str]] = []
+        docs_processed = 0
+        cursor = conn.execute("SELECT id, content, project FROM documents WHERE is_deleted = 0")
+        while rows := cursor.fetchmany(500):
+            for did, content, project in rows:
+                docs_processed += 1
+                # Documents without a project match every title, as in title_match_wikify
+                scope = None if cross_project else project
+                existing = linked.setdefault(did, set())
+                for candidate in matcher.find(content.lower()):
+                    if candidate.doc_id == did or candidate.doc_id in existing:
+                        continue
+                    if scope is not None and candidate.project != scope:
+                        continue
+                    links.append((did, candidate.doc_id, 1.0, "title_match"))
+                    if not dry_run:
+                        existing.add(candidate.doc_id)
+                        linked.setdefault(candidate.doc_id, set()).add(did)
 
-    total = 0
-    for did in doc_ids:
-        result = title_match_wikify(did, dry_run=dry_run, cross_project=cross_project)
         if dry_run:
-            total += len(result.dry_run_matches)
-        else:
-            total += result.links_created
+            return len(links), docs_processed
+
+        created = document_links.create_links_batch(links, conn=conn)
+        conn.commit()
 
-    return total, len(doc_ids)
+    return created, docs_processed
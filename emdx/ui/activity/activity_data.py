@@ -90,10 +90,6 @@ class ActivityDataLoader:
                 if doc_type_filter != "all" and doc_type != doc_type_filter:
                     continue
 
-                # Compute word count from content
-                content = doc.content
-                word_count = len(content.split()) if content else 0
-
                 item = DocumentItem(
                     item_id=doc_id,
                     title=title or "Untitled",
@@ -104,7 +100,7 @@ class ActivityDataLoader:
                     project=doc.project or "",
                     tags=doc_tags.get(doc_id),
                     access_count=doc.access_count or 0,
-                    word_count=word_count,
+                    word_count=doc.word_count,
                     updated_at=parse_datetime(doc.updated_at),
                     accessed_at=parse_datetime(doc.accessed_at),
                     parent_id=doc.parent_id,
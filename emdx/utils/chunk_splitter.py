@@ -86,6 +86,12 @@ def split_into_chunks(content: str, title: str = "") -> list[Chunk]:
     return chunks
 
 
+def split_document(doc: tuple[int, str, str]) -> tuple[int, list[Chunk]]:
+    """Split an ``(id, title, content)`` row; a picklable worker for process pools."""
+    doc_id, title, content = doc
+    return doc_id, split_into_chunks(content, title)
+
+
 def _split_by_headings(content: str, title: str) -> list[Chunk]:
     """Split content by markdown headings, preserving heading hierarchy."""
     # Match markdown headings: ## Heading, ### Subheading, etc.
@@ -106,6 +106,22 @@ def isolate_test_database(
         os.environ["EMDX_TEST_DB"] = old_env
 
 
+@pytest.fixture(autouse=True)
+def clear_search_result_cache(isolate_test_database: Path) -> None:
+    """Keep cached find/ask results from leaking into tests that mock search."""
+    from emdx.services import result_cache
+
+    result_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_llm_response_cache(isolate_test_database: Path) -> None:
+    """Keep cached LLM responses from answering tests that mock the CLI."""
+    from emdx.services import llm_cache
+
+    llm_cache.clear()
+
+
 @pytest.fixture(scope="function")
 def temp_db() -> Generator[DatabaseForTesting, None, None]:
     """Create a temporary in-memory SQLite database for testing."""
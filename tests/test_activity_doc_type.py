@@ -9,7 +9,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from textual.app import App, ComposeResult
 
-from emdx.models.document import Document
+from emdx.models.document import DocumentSummary
 from emdx.ui.activity.activity_data import ActivityDataLoader
 from emdx.ui.activity.activity_items import DocumentItem
 from emdx.ui.activity.activity_table import ActivityTable
@@ -25,25 +25,24 @@ def make_doc_row(
     title: str = "Test doc",
     doc_type: str = "user",
     created_at: str = "2025-01-20T12:00:00",
-) -> Document:
-    """Create a fake Document matching the Document dataclass shape."""
-    return Document.from_row(
+) -> DocumentSummary:
+    """Create a fake DocumentSummary as list_recent_documents returns."""
+    return DocumentSummary.from_row(
         {
             "id": id,
             "title": title,
-            "content": "some content",
             "project": None,
             "created_at": created_at,
             "updated_at": None,
             "accessed_at": None,
             "access_count": 1,
-            "deleted_at": None,
-            "is_deleted": 0,
             "parent_id": None,
             "relationship": None,
             "archived_at": None,
-            "stage": None,
             "doc_type": doc_type,
+            "word_count": 2,
+            "char_count": 12,
+            "token_estimate": 3,
         }
     )
 
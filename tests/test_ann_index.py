@@ -0,0 +1,140 @@
+"""Tests for the IVF approximate nearest-neighbour chunk index."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from emdx.services import ann_index, vector_index  # noqa: E402
+from emdx.services.ann_index import IVFIndex  # noqa: E402
+from emdx.services.vector_index import CHUNK_EMBEDDINGS, EmbeddingMatrix  # noqa: E402
+
+DIM = 16
+MODEL = "test-model"
+
+
+def _clustered(n: int, clusters: int = 20, seed: int = 0, start_id: int = 1) -> EmbeddingMatrix:
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, DIM)).astype(np.float32)
+    vectors = centers[rng.integers(0, clusters, n)] + 0.2 * rng.standard_normal((n, DIM))
+    vectors = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+    ids = np.arange(start_id, start_id + n, dtype=np.int64)
+    return EmbeddingMatrix(row_ids=ids, doc_ids=ids, vectors=vectors, generation=1)
+
+
+def _recall(index: IVFIndex, matrix: EmbeddingMatrix, nprobe: int, k: int = 10) -> float:
+    queries = _clustered(50, seed=99).vectors
+    hits = 0
+    for q in queries:
+        exact, _ = matrix.top_k(q, k)
+        approx, _ = index.search(matrix, q, k, nprobe)
+        hits += len(set(exact.tolist()) & set(approx.tolist()))
+    return hits / (k * len(queries))
+
+
+@pytest.fixture(autouse=True)
+def _clean_caches():
+    ann_index.clear_cache()
+    vector_index.clear_cache()
+    yield
+    ann_index.clear_cache()
+    vector_index.clear_cache()
+
+
+class TestIVFIndex:
+    def test_full_probe_matches_exact(self):
+        matrix = _clustered(2000)
+        index = IVFIndex.train(matrix)
+        query = matrix.vectors[5]
+        exact_pos, exact_scores = matrix.top_k(query, 10)
+        approx_pos, approx_scores = index.search(matrix, query, 10, nprobe=index.nlist)
+        assert list(approx_pos) == list(exact_pos)
+        np.testing.assert_allclose(approx_scores, exact_scores, rtol=1e-5)
+
+    def test_recall_grows_with_nprobe(self):
+        matrix = _clustered(3000)
+        index = IVFIndex.train(matrix)
+        low = _recall(index, matrix, nprobe=1)
+        high = _recall(index, matrix, nprobe=12)
+        assert high >= low
+        assert high > 0.9
+
+    def test_threshold_applies(self):
+        matrix = _clustered(500)
+        index = IVFIndex.train(matrix)
+        _, scores = index.search(matrix, matrix.vectors[0], 50, nprobe=index.nlist, threshold=0.9)
+        assert len(scores) > 0 and (scores >= 0.9).all()
+
+    def test_refresh_keeps_assignments_and_adds_rows(self):
+        base = _clustered(1000)
+        index = IVFIndex.train(base)
+
+        extra = _clustered(200, seed=5, start_id=5000)
+        # Drop the first 100 rows and append new ones
+        grown = EmbeddingMatrix(
+            row_ids=np.concatenate([base.row_ids[100:], extra.row_ids]),
+            doc_ids=np.concatenate([base.doc_ids[100:], extra.doc_ids]),
+            vectors=np.concatenate([base.vectors[100:], extra.vectors]),
+            generation=2,
+        )
+        refreshed = index.refreshed(grown)
+
+        assert refreshed.generation == 2
+        assert list(refreshed.row_ids) == list(grown.row_ids)
+        assert (refreshed.list_ids[:900] == index.list_ids[100:]).all()
+        assert refreshed.centroids is index.centroids
+        assert not refreshed.needs_retrain(grown)
+
+    def test_needs_retrain_when_corpus_doubles(self):
+        index = IVFIndex.train(_clustered(500))
+        assert index.needs_retrain(_clustered(1000))
+        assert index.needs_retrain(_clustered(250))
+        assert not index.needs_retrain(_clustered(700))
+
+
+class TestPersistedIndex:
+    def test_search_falls_back_to_exact_below_threshold(self):
+        matrix = _clustered(200)
+        with patch.object(ann_index, "load_index") as mock_load:
+            positions, _ = ann_index.search(CHUNK_EMBEDDINGS, MODEL, matrix, matrix.vectors[0], 3)
+        mock_load.assert_not_called()
+        assert positions[0] == 0
+
+    def test_build_persist_and_reload(self):
+        matrix = _clustered(1000)
+        with patch.object(ann_index, "ANN_MIN_CHUNKS", 100):
+            built = ann_index.build_index(CHUNK_EMBEDDINGS, MODEL, matrix)
+            assert built is not None
+            ann_index.clear_cache()  # simulate a fresh CLI process
+
+            with patch.object(IVFIndex, "train") as mock_train:
+                loaded = ann_index.load_index(CHUNK_EMBEDDINGS, MODEL, matrix)
+            mock_train.assert_not_called()
+            assert loaded is not None
+            np.testing.assert_array_equal(loaded.centroids, built.centroids)
+
+            positions, _ = ann_index.search(
+                CHUNK_EMBEDDINGS, MODEL, matrix, matrix.vectors[7], 1, nprobe=loaded.nlist
+            )
+            assert positions[0] == 7
+
+            # Shrinking below the threshold removes the index
+            assert ann_index.build_index(CHUNK_EMBEDDINGS, MODEL, _clustered(50)) is None
+            assert ann_index.load_index(CHUNK_EMBEDDINGS, MODEL, matrix) is None
+
+    def test_nprobe_zero_forces_exact(self):
+        matrix = _clustered(1000)
+        with patch.object(ann_index, "ANN_MIN_CHUNKS", 100):
+            ann_index.build_index(CHUNK_EMBEDDINGS, MODEL, matrix)
+            with patch.object(IVFIndex, "search") as mock_search:
+                ann_index.search(CHUNK_EMBEDDINGS, MODEL, matrix, matrix.vectors[0], 5, nprobe=0)
+            mock_search.assert_not_called()
+
+    def test_default_nprobe_env(self, monkeypatch):
+        monkeypatch.setenv(ann_index.NPROBE_ENV_VAR, "3")
+        assert ann_index.default_nprobe() == 3
+        monkeypatch.setenv(ann_index.NPROBE_ENV_VAR, "bogus")
+        assert ann_index.default_nprobe() == ann_index.ANN_DEFAULT_NPROBE
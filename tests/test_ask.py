@@ -152,6 +152,19 @@ class TestRetrieveWithFilters:
         doc_ids = [d[0] for d in docs]
         assert doc_id in doc_ids
 
+    def test_keyword_retrieval_finds_ticket_reference(self) -> None:
+        """Ticket references resolve through the substring index when enabled."""
+        from emdx.database.search import disable_substring_index, enable_substring_index
+        from emdx.models.documents import save_document
+
+        doc_id = save_document("Incident notes", "Rolled back after QZX-4711 regressed", None)
+        enable_substring_index()
+        try:
+            docs, _ = AskService()._retrieve_keyword("What happened with QZX-4711?", 10)
+        finally:
+            disable_substring_index()
+        assert docs[0][0] == doc_id
+
 
 class TestSourceTitles:
     """Tests for source title extraction."""
@@ -0,0 +1,68 @@
+"""Tests for the search benchmark suite and its synthetic corpus."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from benchmarks.bench_search import PATHS, compare, run_suite
+from benchmarks.corpus import build_corpus, fake_embedding, workload
+
+
+def _report(**metrics: float) -> dict:
+    return {"results": {"1000": {"hybrid": metrics}}}
+
+
+class TestCorpus:
+    def test_same_seed_same_corpus_and_workload(self, tmp_path):
+        first, second = tmp_path / "a.db", tmp_path / "b.db"
+        build_corpus(first, 50, "test-model", seed=3)
+        build_corpus(second, 50, "test-model", seed=3)
+
+        dump = "SELECT title, content, project FROM documents ORDER BY id"
+        with sqlite3.connect(first) as a, sqlite3.connect(second) as b:
+            assert a.execute(dump).fetchall() == b.execute(dump).fetchall()
+            (chunks,) = a.execute(
+                "SELECT COUNT(*) FROM chunk_embeddings WHERE model_name = 'test-model'"
+            ).fetchone()
+            assert chunks >= 50
+            assert a.execute("SELECT COUNT(*) FROM document_embeddings").fetchone() == (50,)
+            assert a.execute("SELECT COUNT(*) FROM document_tags").fetchone()[0] > 0
+
+        assert workload(first, 5, seed=3) == workload(second, 5, seed=3)
+
+    def test_fake_embedding_is_deterministic_unit_vector(self):
+        vector = fake_embedding("deploy steps")
+        assert vector.shape == (384,)
+        assert abs(float((vector**2).sum()) - 1.0) < 1e-5
+        assert (vector == fake_embedding("deploy steps")).all()
+
+
+class TestCompare:
+    def test_flags_relative_and_absolute_growth_only(self):
+        baseline = _report(p50_ms=10.0, p95_ms=20.0, peak_rss_mb=100.0)
+        current = _report(p50_ms=14.0, p95_ms=22.0, peak_rss_mb=104.0)
+        rows, regressions = compare(baseline, current, tolerance=0.25)
+
+        assert len(rows) == 3
+        assert len(regressions) == 1 and regressions[0].startswith("hybrid @ 1,000 docs: p50_ms")
+
+    def test_small_absolute_changes_are_noise(self):
+        baseline = _report(p50_ms=0.2, p95_ms=0.4)
+        current = _report(p50_ms=0.4, p95_ms=0.9)
+        assert compare(baseline, current)[1] == []
+
+    def test_paths_missing_from_baseline_are_skipped(self):
+        assert compare({"results": {}}, _report(p50_ms=1.0)) == ([], [])
+
+
+@pytest.mark.benchmark
+def test_suite_measures_every_path(tmp_path):
+    report = run_suite([300], list(PATHS), queries=10, corpus_dir=tmp_path)
+    results = report["results"]["300"]
+    assert set(results) == set(PATHS)
+    for metrics in results.values():
+        assert metrics["queries"] == 10
+        assert 0 < metrics["p50_ms"] <= metrics["p95_ms"]
+        assert metrics["peak_rss_mb"] > 0
@@ -472,6 +472,42 @@ class TestFindCommand:
         assert result.exit_code == 0
         mock_search_tags.assert_called_once_with(["python"], mode="all", project=None, limit=10)
 
+    @patch("emdx.services.hybrid_search.HybridSearchService")
+    def test_find_json_timings_reports_degraded_legs(self, mock_service_cls):
+        """--json --timings wraps results with per-leg timings and degradation."""
+        from emdx.services.hybrid_search import HybridSearchResult, SearchReport
+
+        service = mock_service_cls.return_value
+        service.search.return_value = [
+            HybridSearchResult(
+                doc_id=7,
+                title="Kw",
+                project=None,
+                score=1.0,
+                keyword_score=1.0,
+                semantic_score=0.0,
+                source="keyword",
+                snippet="",
+            )
+        ]
+        service.last_report = SearchReport(
+            timings_ms={"keyword": 3.0, "semantic": 8000.0, "hydrate": 1.0, "total": 8004.0},
+            timed_out=["semantic"],
+        )
+
+        result = runner.invoke(app, ["find", "auth", "--json", "--timings"])
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert data["degraded"] is True
+        assert data["timed_out"] == ["semantic"]
+        assert data["timings_ms"]["keyword"] == 3.0
+        assert data["results"][0]["id"] == 7
+        assert data["results"][0]["degraded"] is True
+
+        # Without --timings the output stays a plain array
+        result = runner.invoke(app, ["find", "auth", "--json"])
+        assert json.loads(result.stdout)[0]["id"] == 7
+
 
 # ---------------------------------------------------------------------------
 # view command
@@ -0,0 +1,102 @@
+"""Tests for the pooled DatabaseConnection."""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+from emdx.database.connection import DatabaseConnection, close_pooled_connections
+
+
+def _make_db(tmp_path: Path) -> DatabaseConnection:
+    db = DatabaseConnection(tmp_path / "pool.db")
+    with db.get_connection() as conn:
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.commit()
+    return db
+
+
+class TestConnectionPool:
+    def test_sequential_checkouts_reuse_connection(self, tmp_path):
+        db = _make_db(tmp_path)
+        with db.get_connection() as first:
+            pass
+        with db.get_connection() as second:
+            pass
+        assert first is second
+
+    def test_nested_checkouts_get_distinct_connections(self, tmp_path):
+        db = _make_db(tmp_path)
+        with db.get_connection() as outer:
+            with db.get_connection() as inner:
+                assert outer is not inner
+
+    def test_wal_and_pragmas_applied(self, tmp_path):
+        db = _make_db(tmp_path)
+        with db.get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert isinstance(conn.execute("SELECT 1 AS x").fetchone(), sqlite3.Row)
+
+    def test_uncommitted_changes_rolled_back_on_release(self, tmp_path):
+        db = _make_db(tmp_path)
+        with db.get_connection() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('lost')")
+        with db.get_connection() as conn:
+            assert not conn.in_transaction
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+    def test_committed_changes_visible_to_other_connections(self, tmp_path):
+        db = _make_db(tmp_path)
+        with db.get_connection() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('kept')")
+            conn.commit()
+        raw = sqlite3.connect(tmp_path / "pool.db")
+        try:
+            assert raw.execute("SELECT name FROM items").fetchall() == [("kept",)]
+        finally:
+            raw.close()
+
+    def test_replaced_file_discards_pooled_connection(self, tmp_path):
+        db = _make_db(tmp_path)
+        with db.get_connection() as stale:
+            pass
+
+        replacement = tmp_path / "replacement.db"
+        other = sqlite3.connect(replacement)
+        other.execute("CREATE TABLE marker (x INTEGER)")
+        other.commit()
+        other.close()
+        close_pooled_connections(tmp_path / "pool.db")
+        os.replace(replacement, tmp_path / "pool.db")
+
+        with db.get_connection() as fresh:
+            tables = {r[0] for r in fresh.execute("SELECT name FROM sqlite_master")}
+        assert fresh is not stale
+        assert "marker" in tables
+
+    def test_threads_use_separate_connections(self, tmp_path):
+        db = _make_db(tmp_path)
+
+        def worker() -> None:
+            with db.get_connection() as conn:
+                conn.execute("INSERT INTO items (name) VALUES ('t')")
+                conn.commit()
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        with db.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 4
+
+    def test_memory_database_not_pooled(self):
+        db = DatabaseConnection(Path(":memory:"))
+        with db.get_connection() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+        with db.get_connection() as conn:
+            tables = conn.execute("SELECT name FROM sqlite_master").fetchall()
+        assert tables == []
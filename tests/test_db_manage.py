@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import sqlite3
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
@@ -84,11 +85,8 @@ class TestDbCopyFromProd:
             # Should exit with error code
             assert result.exit_code != 0 or "Already using" in result.output
 
-    @patch("emdx.commands.db_manage.shutil.copy2")
     @patch("emdx.commands.db_manage.get_db_path")
-    def test_copy_from_prod_no_prod_db(
-        self, mock_get_path: Any, mock_copy: Any, tmp_path: Path
-    ) -> None:
+    def test_copy_from_prod_no_prod_db(self, mock_get_path: Any, tmp_path: Path) -> None:
         """copy-from-prod errors when production database doesn't exist."""
         mock_get_path.return_value = tmp_path / "dev.db"
 
@@ -99,6 +97,44 @@ class TestDbCopyFromProd:
             result = runner.invoke(main_app, ["db", "copy-from-prod"])
             assert result.exit_code != 0 or "not found" in result.output
 
+    @patch("emdx.commands.db_manage.get_db_path")
+    def test_copy_from_prod_includes_wal_and_drops_stale_dev_wal(
+        self, mock_get_path: Any, tmp_path: Path
+    ) -> None:
+        """Commits still in the prod WAL are copied; stale dev WAL files are removed."""
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        prod_path = config_dir / "knowledge.db"
+        dev_path = tmp_path / "dev" / "knowledge.db"
+        dev_path.parent.mkdir()
+        dev_path.write_bytes(b"old dev db")
+        stale_wal = dev_path.with_name("knowledge.db-wal")
+        stale_wal.write_bytes(b"stale wal")
+        mock_get_path.return_value = dev_path
+
+        # Keep the writer open with autocheckpoint off so the row lives only in the WAL
+        prod = sqlite3.connect(prod_path)
+        try:
+            prod.execute("PRAGMA journal_mode=WAL")
+            prod.execute("PRAGMA wal_autocheckpoint=0")
+            prod.execute("CREATE TABLE t (x INTEGER)")
+            prod.execute("INSERT INTO t VALUES (42)")
+            prod.commit()
+            assert prod_path.with_name("knowledge.db-wal").stat().st_size > 0
+
+            with patch("emdx.commands.db_manage.EMDX_CONFIG_DIR", config_dir):
+                result = runner.invoke(main_app, ["db", "copy-from-prod"], input="y\n")
+        finally:
+            prod.close()
+
+        assert result.exit_code == 0, result.output
+        assert not stale_wal.exists()
+        dev = sqlite3.connect(dev_path)
+        try:
+            assert dev.execute("SELECT x FROM t").fetchall() == [(42,)]
+        finally:
+            dev.close()
+
 
 # ---------------------------------------------------------------------------
 # db --help
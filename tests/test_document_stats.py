@@ -0,0 +1,109 @@
+"""Tests for stored document sizes and content-free document summaries."""
+
+from __future__ import annotations
+
+import json
+import uuid
+
+from emdx.commands.context import ScoredDocument, load_content, traverse_graph
+from emdx.database import db
+from emdx.database.documents import (
+    get_docs_in_window,
+    get_document_summary,
+    list_recent_documents,
+)
+from emdx.models.document import DocumentSummary
+from emdx.models.documents import delete_document, save_document, update_document
+
+
+def _stats(doc_id: int) -> tuple[int | None, int, int] | None:
+    with db.get_connection() as conn:
+        row = conn.execute(
+            "SELECT word_count, char_count, token_estimate FROM document_stats "
+            "WHERE document_id = ?",
+            (doc_id,),
+        ).fetchone()
+        return tuple(row) if row else None
+
+
+class TestDocumentStats:
+    def test_maintained_on_save_and_update(self):
+        doc_id = save_document("Sizes", "one two three")
+        assert _stats(doc_id) == (3, 13, 3)
+
+        update_document(doc_id, "Sizes", "one two three four five " * 4)
+        assert _stats(doc_id) == (20, 96, 24)
+
+    def test_removed_with_document(self):
+        doc_id = save_document("Doomed", "short lived")
+        delete_document(doc_id, hard_delete=True)
+        assert _stats(doc_id) is None
+
+    def test_raw_content_change_is_recounted_on_listing(self):
+        doc_id = save_document("Raw", "alpha beta")
+        with db.get_connection() as conn:
+            conn.execute(
+                "UPDATE documents SET content = 'alpha beta gamma delta' WHERE id = ?", (doc_id,)
+            )
+            conn.commit()
+        assert _stats(doc_id) == (None, 22, 5)
+
+        summary = get_document_summary(doc_id)
+        assert summary is not None and summary.word_count == 4
+        assert _stats(doc_id) == (4, 22, 5)
+
+
+class TestSummaries:
+    def test_summary_has_metadata_and_sizes(self):
+        project = f"proj-{uuid.uuid4().hex[:8]}"
+        doc_id = save_document("Summary", "a b c d", project, doc_type="wiki")
+
+        summary = get_document_summary(doc_id)
+        assert isinstance(summary, DocumentSummary)
+        assert (summary.title, summary.project, summary.doc_type) == ("Summary", project, "wiki")
+        assert (summary.word_count, summary.char_count, summary.token_estimate) == (4, 7, 1)
+        assert summary.created_at is not None
+        assert summary.to_dict()["created_at"] == summary.created_at.isoformat()
+
+    def test_listings_return_summaries(self):
+        doc_id = save_document("Recent", "lots of words in this body")
+
+        (recent,) = [d for d in list_recent_documents(limit=1000) if d.id == doc_id]
+        assert recent.word_count == 6
+        (windowed,) = [d for d in get_docs_in_window(24, limit=1000) if d.id == doc_id]
+        assert windowed.title == "Recent" and windowed.char_count == 26
+
+    def test_deleted_document_has_no_summary(self):
+        doc_id = save_document("Gone", "soon deleted")
+        delete_document(doc_id)
+        assert get_document_summary(doc_id) is None
+
+
+class TestContextContent:
+    def test_traversal_uses_stored_token_estimate(self):
+        doc_id = save_document("Seed", "x" * 400)
+        (scored,) = traverse_graph([doc_id], max_depth=1)
+        assert scored.tokens == 100
+        assert scored.content == ""
+
+    def test_load_content_fills_included_documents(self):
+        first = save_document("First", "first body")
+        second = save_document("Second", "second body")
+        docs = [
+            ScoredDocument(doc_id=d, title="t", tokens=1, hops=0, score=1.0)
+            for d in (first, second)
+        ]
+        load_content(docs)
+        assert [d.content for d in docs] == ["first body", "second body"]
+
+    def test_json_output_includes_content(self, isolate_test_database):
+        from typer.testing import CliRunner
+
+        from emdx.main import app
+
+        doc_id = save_document("Bundle", "bundle body text")
+        result = CliRunner().invoke(app, ["context", str(doc_id), "--json"])
+        assert result.exit_code == 0, result.stdout
+        (doc,) = json.loads(result.stdout)["documents"]
+        assert doc["content"] == "bundle body text"
+        assert doc["tokens"] == len("bundle body text") // 4
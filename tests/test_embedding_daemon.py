@@ -0,0 +1,121 @@
+"""Tests for the opt-in embedding daemon.
+
+The daemon runs in a thread with a fake model; no real model or subprocess
+is involved.
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from emdx.services import embedding_daemon, embedding_service  # noqa: E402
+from emdx.services.embedding_daemon import DaemonModel  # noqa: E402
+
+DIM = 4
+
+
+class FakeModel:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def encode(self, texts: str | list[str]) -> np.ndarray:
+        self.calls += 1
+        batch = [texts] if isinstance(texts, str) else texts
+        vectors = np.array([[len(t), 1.0, 0.0, 0.0] for t in batch], dtype=np.float32)
+        return vectors[0] if isinstance(texts, str) else vectors
+
+
+@pytest.fixture
+def run_dir(monkeypatch):
+    # Short path: Unix socket paths are limited to ~100 bytes
+    path = Path(tempfile.mkdtemp(prefix="emdx-", dir="/tmp"))
+    monkeypatch.setattr(embedding_daemon, "runtime_dir", lambda: path)
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(run_dir):
+    model = FakeModel()
+    thread = threading.Thread(
+        target=embedding_daemon.serve, args=("fake", lambda: model, 30.0), daemon=True
+    )
+    thread.start()
+    path = embedding_daemon.socket_path("fake")
+    deadline = time.monotonic() + 5
+    while not embedding_daemon._is_listening(path):
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.01)
+    yield model
+    embedding_daemon.stop("fake")
+    thread.join(timeout=5)
+
+
+def test_enabled_requires_opt_in(monkeypatch):
+    monkeypatch.delenv(embedding_daemon.DAEMON_ENV_VAR, raising=False)
+    assert not embedding_daemon.enabled()
+    monkeypatch.setenv(embedding_daemon.DAEMON_ENV_VAR, "1")
+    assert embedding_daemon.enabled()
+
+
+def test_encode_through_daemon(daemon):
+    client = embedding_daemon.connect("fake", fallback=MagicMock())
+    assert isinstance(client, DaemonModel)
+
+    single = client.encode("abc")
+    assert single.shape == (DIM,)
+    assert single[0] == 3
+
+    batch = client.encode(["a", "bb"])
+    assert batch.shape == (2, DIM)
+    assert list(batch[:, 0]) == [1, 2]
+    assert daemon.calls == 2
+
+
+def test_connect_spawns_when_absent(run_dir):
+    with patch.object(embedding_daemon, "_spawn") as mock_spawn:
+        assert embedding_daemon.connect("fake", fallback=MagicMock()) is None
+    mock_spawn.assert_called_once_with("fake")
+
+
+def test_falls_back_when_daemon_disappears(daemon):
+    local = FakeModel()
+    client = embedding_daemon.connect("fake", fallback=lambda: local)
+    assert client is not None
+    embedding_daemon.stop("fake")
+    time.sleep(0.05)
+
+    assert client.encode("abcd")[0] == 4
+    assert local.calls == 1
+    client.encode("again")
+    assert local.calls == 2
+
+
+def test_second_daemon_exits_when_locked(daemon):
+    factory = MagicMock()
+    embedding_daemon.serve("fake", factory, 30.0)
+    factory.assert_not_called()
+
+
+def test_idle_timeout_exits_and_removes_socket(run_dir):
+    embedding_daemon.serve("fake", FakeModel, 0.1)
+    assert not embedding_daemon.socket_path("fake").exists()
+
+
+def test_service_uses_daemon_when_enabled(daemon, monkeypatch):
+    monkeypatch.setenv(embedding_daemon.DAEMON_ENV_VAR, "1")
+    monkeypatch.setattr(embedding_service, "_model", None)
+    monkeypatch.setattr(embedding_service, "_backend_name", lambda: "fake")
+    with patch.object(embedding_service, "_load_local_model") as mock_load:
+        vector = embedding_service.EmbeddingService().embed_text("hello")
+    mock_load.assert_not_called()
+    assert vector[0] == 5
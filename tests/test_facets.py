@@ -0,0 +1,175 @@
+"""Tests for one-pass facet counts on find and serve."""
+
+from __future__ import annotations
+
+import json
+import re
+import uuid
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from emdx.commands.serve import _handle_request
+from emdx.database.search import search_facets
+from emdx.main import app
+from emdx.models.documents import save_document
+from emdx.services.hybrid_search import HybridSearchService, SearchMode
+
+runner = CliRunner()
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+@pytest.fixture
+def corpus():
+    """Five matching documents over two projects and two doc types, plus a decoy."""
+    suffix = uuid.uuid4().hex[:8]
+    word, alpha, beta = f"facet{suffix}", f"alpha-{suffix}", f"beta-{suffix}"
+    save_document("A1", f"{word} one", alpha, tags=["red", "blue"], doc_type="user")
+    save_document("A2", f"{word} two", alpha, tags=["red"], doc_type="user")
+    save_document("A3", f"{word} three", alpha, tags=["green"], doc_type="wiki")
+    save_document("B1", f"{word} four", beta, tags=["red"], doc_type="user")
+    save_document("B2", f"{word} five", None, doc_type="user")
+    save_document("Decoy", "unrelated", alpha, tags=["red"], doc_type="user")
+    return word, alpha, beta
+
+
+class TestSearchFacets:
+    def test_counts_full_match_set(self, corpus):
+        word, alpha, beta = corpus
+        facets = search_facets(word, doc_type=None)
+
+        assert facets.total == 5
+        assert facets.projects[0] == (alpha, 3)
+        assert sorted(facets.projects[1:], key=str) == sorted([(beta, 1), (None, 1)], key=str)
+        assert facets.doc_types == [("user", 4), ("wiki", 1)]
+        assert dict(facets.tags) == {"red": 3, "blue": 1, "green": 1}
+        assert facets.tags[0] == ("red", 3)
+
+    def test_filters_narrow_counts(self, corpus):
+        word, alpha, _ = corpus
+        facets = search_facets(word, project=alpha)
+        assert facets.total == 2
+        assert dict(facets.tags) == {"red": 2, "blue": 1}
+
+        facets = search_facets(word, doc_type=None, tags=["red"], exclude_tags=["blue"])
+        assert facets.total == 2
+
+        facets = search_facets(word, doc_type=None, tags=["blue", "green"], tag_mode="any")
+        assert facets.total == 2
+
+    def test_top_caps_each_facet(self, corpus):
+        word, _, _ = corpus
+        facets = search_facets(word, doc_type=None, top=1)
+        assert facets.tags == [("red", 3)]
+        assert len(facets.projects) == 1
+        assert facets.total == 5
+
+    def test_to_dict(self, corpus):
+        word, alpha, _ = corpus
+        data = search_facets(word, project=alpha).to_dict()
+        assert data["total"] == 2
+        assert data["projects"] == [{"value": alpha, "count": 2}]
+        assert data["doc_types"] == [{"value": "user", "count": 2}]
+
+
+class TestHybridService:
+    def test_facets_computed_alongside_search(self, corpus):
+        word, _, _ = corpus
+        service = HybridSearchService()
+        with patch.object(service, "determine_mode", return_value=SearchMode.KEYWORD):
+            results = service.search(word, limit=2, doc_type=None, facets=True)
+            assert len(results) == 2
+            assert service.last_facets is not None and service.last_facets.total == 5
+
+            # A cached repeat still reports facets; a plain search clears them
+            service.search(word, limit=2, doc_type=None, facets=True)
+            assert service.last_facets is not None and service.last_facets.total == 5
+            service.search(word, limit=2, doc_type=None)
+            assert service.last_facets is None
+
+    def test_facet_failure_keeps_results(self, corpus):
+        word, _, _ = corpus
+        service = HybridSearchService()
+        with (
+            patch.object(service, "determine_mode", return_value=SearchMode.KEYWORD),
+            patch(
+                "emdx.services.hybrid_search.search_facets",
+                side_effect=RuntimeError("facet query failed"),
+            ),
+        ):
+            results = service.search(word, limit=2, doc_type=None, facets=True)
+        assert len(results) == 2
+        assert service.last_facets is None
+
+    def test_search_error_not_masked_by_facet_error(self, corpus):
+        word, _, _ = corpus
+        service = HybridSearchService()
+        with (
+            patch.object(service, "_search_ranked", side_effect=ValueError("ranking failed")),
+            patch(
+                "emdx.services.hybrid_search.search_facets",
+                side_effect=RuntimeError("facet query failed"),
+            ),
+            pytest.raises(ValueError, match="ranking failed"),
+        ):
+            service.search(word, facets=True)
+
+
+class TestFindCommand:
+    def test_json_wraps_results_with_facets(self, corpus):
+        word, alpha, _ = corpus
+        result = runner.invoke(
+            app, ["find", word, "--mode", "keyword", "-n", "1", "--facets", "--json"]
+        )
+        assert result.exit_code == 0, result.stdout
+        data = json.loads(result.stdout)
+        assert len(data["results"]) == 1
+        assert data["facets"]["total"] == 5
+        assert data["facets"]["projects"][0] == {"value": alpha, "count": 3}
+
+    def test_tag_filters_apply_to_facets(self, corpus):
+        word, _, _ = corpus
+        result = runner.invoke(
+            app, ["find", word, "--tags", "red", "--all-types", "--facets", "--json"]
+        )
+        data = json.loads(result.stdout)
+        assert data["facets"]["total"] == 3
+        assert {r["id"] for r in data["results"]} and len(data["results"]) == 3
+
+    def test_human_output_summarizes_facets(self, corpus):
+        word, alpha, _ = corpus
+        result = runner.invoke(app, ["find", word, "--mode", "keyword", "--facets"])
+        assert result.exit_code == 0
+        output = _ANSI_RE.sub("", result.stdout)
+        assert "5 matches" in output
+        assert f"Projects: {alpha} 3" in output
+
+    def test_rejected_for_listings(self):
+        result = runner.invoke(app, ["find", "--all", "--facets"])
+        assert result.exit_code == 1
+
+
+class TestServe:
+    def test_find_search_facets(self, corpus):
+        word, _, _ = corpus
+        response = _handle_request(
+            {"id": 1, "method": "find.search", "params": {"query": word, "facets": True}}
+        )
+        assert response["result"]["facets"]["total"] == 4
+        assert len(response["result"]["results"]) == 4
+
+    def test_find_by_tags_page_with_facets(self, corpus):
+        _, alpha, _ = corpus
+        response = _handle_request(
+            {
+                "id": 1,
+                "method": "find.by_tags",
+                "params": {"tags": "green", "page_size": 1, "facets": True},
+            }
+        )
+        result = response["result"]
+        assert set(result) == {"results", "next_cursor", "facets"}
+        counts = {f["value"]: f["count"] for f in result["facets"]["projects"]}
+        assert counts[alpha] >= 1
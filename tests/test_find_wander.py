@@ -125,7 +125,7 @@ class TestFindWander:
 
         mock_service = _make_service_mock()
         mock_es_class.return_value = mock_service
-        mock_service.embed_text.return_value = seed_embedding
+        mock_service.embed_query.return_value = seed_embedding
 
         # Create mock DB rows with various similarities
         mock_rows = [
@@ -263,7 +263,7 @@ class TestFindWander:
 
         mock_service = _make_service_mock()
         mock_es_class.return_value = mock_service
-        mock_service.embed_text.return_value = seed_embedding
+        mock_service.embed_query.return_value = seed_embedding
 
         # All docs are too similar or too different
         mock_rows = [
@@ -307,7 +307,7 @@ class TestFindWander:
 
         mock_service = _make_service_mock()
         mock_es_class.return_value = mock_service
-        mock_service.embed_text.return_value = seed_embedding
+        mock_service.embed_query.return_value = seed_embedding
 
         # Create 10 docs in the Goldilocks band
         mock_rows = []
@@ -353,7 +353,7 @@ class TestFindWander:
 
         mock_service = _make_service_mock()
         mock_es_class.return_value = mock_service
-        mock_service.embed_text.return_value = seed_embedding
+        mock_service.embed_query.return_value = seed_embedding
 
         mock_rows = []
         for i in range(10):
@@ -397,7 +397,7 @@ class TestFindWander:
 
         mock_service = _make_service_mock()
         mock_es_class.return_value = mock_service
-        mock_service.embed_text.return_value = seed_embedding
+        mock_service.embed_query.return_value = seed_embedding
 
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
@@ -433,7 +433,7 @@ class TestFindWander:
 
         mock_service = _make_service_mock()
         mock_es_class.return_value = mock_service
-        mock_service.embed_text.return_value = seed_embedding
+        mock_service.embed_query.return_value = seed_embedding
 
         mock_rows = [
             (
@@ -1,7 +1,9 @@
 """Tests for the hybrid search service."""
 
+import time
 from unittest.mock import MagicMock, patch
 
+from emdx.database import db
 from emdx.services.hybrid_search import (
     RRF_K,
     HybridSearchResult,
@@ -339,3 +341,130 @@ class TestHybridMerging:
         # Rank 20 in both: 2/80 = 0.025
         # Both at rank 20 still wins because of two contributions
         assert rank20_both > rank1_one_list
+
+
+class TestFuzzySearchTitles:
+    """Fuzzy title lookup through the trigram title index."""
+
+    def _add(self, title: str, access_count: int = 0) -> int:
+        with db.get_connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO documents (title, content, access_count) VALUES (?, 'body', ?)",
+                (title, access_count),
+            )
+            conn.commit()
+            assert cursor.lastrowid is not None
+            return cursor.lastrowid
+
+    def setup_method(self):
+        with db.get_connection() as conn:
+            conn.execute("DELETE FROM documents")
+            conn.commit()
+
+    def test_matches_titles_beyond_most_accessed(self):
+        """Rarely accessed titles are still found (no top-1000 cut-off)."""
+        for i in range(1100):
+            self._add(f"Popular note {i}", access_count=10)
+        target = self._add("Kubernetes deployment checklist")
+
+        results = HybridSearchService().fuzzy_search_titles("kubernetes deploy", limit=5)
+        assert results[0].doc_id == target
+        assert results[0].source == "fuzzy"
+
+    def test_tolerates_typos(self):
+        target = self._add("Authentication refactor plan")
+        self._add("Grocery list")
+        results = HybridSearchService().fuzzy_search_titles("authentcation", threshold=0.3)
+        assert [r.doc_id for r in results] == [target]
+
+    def test_title_edits_and_deletes_tracked(self):
+        doc_id = self._add("Old title")
+        with db.get_connection() as conn:
+            conn.execute("UPDATE documents SET title = 'Quarterly roadmap' WHERE id = ?", (doc_id,))
+            conn.commit()
+        service = HybridSearchService()
+        assert [r.doc_id for r in service.fuzzy_search_titles("roadmap")] == [doc_id]
+
+        with db.get_connection() as conn:
+            conn.execute("UPDATE documents SET is_deleted = 1 WHERE id = ?", (doc_id,))
+            conn.commit()
+        assert service.fuzzy_search_titles("roadmap") == []
+
+    def test_short_query_substring(self):
+        target = self._add("Go tips")
+        self._add("Python notes")
+        results = HybridSearchService().fuzzy_search_titles("go", threshold=0.0)
+        assert [r.doc_id for r in results] == [target]
+
+    def test_exclude_ids(self):
+        doc_id = self._add("Release notes")
+        results = HybridSearchService().fuzzy_search_titles("release", exclude_ids={doc_id})
+        assert results == []
+
+
+class TestConcurrentLegs:
+    """Keyword and semantic legs run concurrently under per-leg budgets."""
+
+    def _result(self, doc_id: int, source: str) -> HybridSearchResult:
+        return HybridSearchResult(
+            doc_id=doc_id,
+            title=f"Doc {doc_id}",
+            project=None,
+            score=1.0,
+            keyword_score=1.0 if source == "keyword" else 0.0,
+            semantic_score=1.0 if source == "semantic" else 0.0,
+            source=source,
+            snippet="",
+        )
+
+    def _service(self, keyword_delay: float, semantic_delay: float, **budgets):
+        service = HybridSearchService(**budgets)
+
+        def keyword(*args, **kwargs):
+            time.sleep(keyword_delay)
+            return [self._result(1, "keyword"), self._result(2, "keyword")]
+
+        def semantic(*args, **kwargs):
+            time.sleep(semantic_delay)
+            return [self._result(2, "semantic"), self._result(3, "semantic")]
+
+        patch.object(service, "_search_keyword", side_effect=keyword).start()
+        patch.object(service, "_search_semantic", side_effect=semantic).start()
+        patch.object(service, "_populate_tags").start()
+        patch.object(service, "_populate_doc_types").start()
+        patch.object(service, "determine_mode", return_value=SearchMode.HYBRID).start()
+        return service
+
+    def teardown_method(self):
+        patch.stopall()
+
+    def test_legs_overlap(self):
+        service = self._service(0.2, 0.2)
+        started = time.perf_counter()
+        results = service.search("query", limit=5)
+        assert time.perf_counter() - started < 0.35
+        assert [r.doc_id for r in results][0] == 2
+        assert {r.source for r in results} == {"keyword", "hybrid", "semantic"}
+
+        report = service.last_report
+        assert report is not None and not report.degraded
+        assert set(report.timings_ms) == {"keyword", "semantic", "hydrate", "total"}
+        assert report.timings_ms["semantic"] >= 200
+
+    def test_slow_semantic_degrades_to_keyword(self):
+        service = self._service(0.0, 1.0, semantic_budget=0.05)
+        started = time.perf_counter()
+        results = service.search("query", limit=5)
+        assert time.perf_counter() - started < 0.5
+
+        assert [r.doc_id for r in results] == [1, 2]
+        assert all(r.source == "keyword" for r in results)
+        assert service.last_report is not None
+        assert service.last_report.degraded
+        assert service.last_report.timed_out == ["semantic"]
+
+    def test_single_mode_reports_timing(self):
+        service = self._service(0.0, 0.0)
+        service.determine_mode.return_value = SearchMode.KEYWORD
+        service.search("query")
+        assert set(service.last_report.timings_ms) == {"keyword", "total"}
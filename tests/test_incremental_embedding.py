@@ -0,0 +1,271 @@
+"""Tests for content-hash driven incremental re-embedding."""
+
+from __future__ import annotations
+
+import hashlib
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from emdx.database import db  # noqa: E402
+from emdx.services import embedding_service  # noqa: E402
+from emdx.services.embedding_service import EmbeddingService  # noqa: E402
+
+LONG_SECTION = "Sentence about a topic that keeps going for a while. " * 12
+
+
+class FakeModel:
+    """Deterministic stand-in for the embedding model that records inputs."""
+
+    def __init__(self) -> None:
+        self.encoded: list[str] = []
+
+    def encode(self, texts: str | list[str]) -> np.ndarray:
+        batch = [texts] if isinstance(texts, str) else texts
+        self.encoded.extend(batch)
+        rows = []
+        for text in batch:
+            seed = int(hashlib.sha256(text.encode()).hexdigest()[:8], 16)
+            rows.append(np.random.default_rng(seed).standard_normal(384).astype(np.float32))
+        return rows[0] if isinstance(texts, str) else np.stack(rows)
+
+
+@pytest.fixture
+def model(monkeypatch):
+    fake = FakeModel()
+    monkeypatch.setattr(embedding_service, "_get_model", lambda: fake)
+    with db.get_connection() as conn:
+        conn.execute("DELETE FROM document_embeddings")
+        conn.execute("DELETE FROM chunk_embeddings")
+        conn.execute("DELETE FROM documents")
+        conn.commit()
+    return fake
+
+
+def _add_doc(title: str, content: str) -> int:
+    with db.get_connection() as conn:
+        cursor = conn.execute(
+            "INSERT INTO documents (title, content) VALUES (?, ?)", (title, content)
+        )
+        conn.commit()
+        assert cursor.lastrowid is not None
+        return cursor.lastrowid
+
+
+def _edit(doc_id: int, content: str) -> None:
+    with db.get_connection() as conn:
+        conn.execute("UPDATE documents SET content = ? WHERE id = ?", (content, doc_id))
+        conn.commit()
+
+
+def _sections(*names: str) -> str:
+    return "\n\n".join(f"## {name}\n\n{name}: {LONG_SECTION}" for name in names)
+
+
+class TestDocumentIndex:
+    def test_only_edited_documents_reembedded(self, model):
+        service = EmbeddingService()
+        a = _add_doc("A", "alpha")
+        _add_doc("B", "beta")
+        assert service.index_all() == 2
+
+        model.encoded.clear()
+        assert service.index_all() == 0
+        assert model.encoded == []
+
+        _edit(a, "alpha, revised")
+        assert service.index_all() == 1
+        assert model.encoded == ["A\n\nalpha, revised"]
+
+    def test_force_reembeds_everything(self, model):
+        service = EmbeddingService()
+        _add_doc("A", "alpha")
+        _add_doc("B", "beta")
+        service.index_all()
+        assert service.index_all(force=True) == 2
+
+    def test_embed_document_refreshes_stale_cache(self, model):
+        service = EmbeddingService()
+        doc_id = _add_doc("A", "alpha")
+        first = service.embed_document(doc_id)
+        assert np.array_equal(service.embed_document(doc_id), first)
+        assert len(model.encoded) == 1
+
+        _edit(doc_id, "alpha, revised")
+        assert not np.array_equal(service.embed_document(doc_id), first)
+        assert len(model.encoded) == 2
+
+
+class TestChunkIndex:
+    def _chunks(self, doc_id: int) -> list[tuple[int, str, bytes]]:
+        with db.get_connection() as conn:
+            return conn.execute(
+                "SELECT chunk_index, heading_path, embedding FROM chunk_embeddings "
+                "WHERE document_id = ? ORDER BY chunk_index",
+                (doc_id,),
+            ).fetchall()
+
+    def test_unchanged_documents_skipped(self, model):
+        service = EmbeddingService()
+        _add_doc("Doc", _sections("One", "Two", "Three"))
+        assert service.index_chunks() == 3
+
+        model.encoded.clear()
+        assert service.index_chunks() == 0
+        assert model.encoded == []
+
+    def test_only_changed_chunks_reembedded(self, model):
+        service = EmbeddingService()
+        doc_id = _add_doc("Doc", _sections("One", "Two", "Three"))
+        service.index_chunks()
+        before = {path: blob for _, path, blob in self._chunks(doc_id)}
+
+        model.encoded.clear()
+        _edit(doc_id, _sections("One", "Two changed", "Three"))
+        assert service.index_chunks() == 1
+        assert len(model.encoded) == 1 and "Two changed" in model.encoded[0]
+
+        after = {path: blob for _, path, blob in self._chunks(doc_id)}
+        assert after["Doc > One"] == before["Doc > One"]
+        assert after["Doc > Three"] == before["Doc > Three"]
+        assert "Doc > Two" not in after
+
+    def test_quantized_chunks_keep_originals_of_live_text(self, model):
+        service = EmbeddingService()
+        service.set_storage_format("int8")
+        try:
+            doc_id = _add_doc("Doc", _sections("One", "Two", "Three"))
+            service.index_chunks()
+            _edit(doc_id, _sections("One", "Two changed", "Three"))
+            service.index_chunks()
+
+            with db.get_connection() as conn:
+                kept = dict(
+                    conn.execute(
+                        "SELECT content_hash, embedding FROM embedding_originals "
+                        "WHERE source = 'chunk_embeddings'"
+                    ).fetchall()
+                )
+                live = conn.execute(
+                    "SELECT content_hash, text FROM chunk_embeddings WHERE document_id = ?",
+                    (doc_id,),
+                ).fetchall()
+            # Reused chunks keep their original; the replaced chunk's is pruned
+            assert set(kept) == {content_hash for content_hash, _ in live}
+            for content_hash, text in live:
+                assert kept[content_hash] == model.encode([text])[0].tobytes()
+        finally:
+            service.set_storage_format("float32")
+
+    def test_inserted_chunk_reuses_shifted_vectors(self, model):
+        service = EmbeddingService()
+        doc_id = _add_doc("Doc", _sections("One", "Two"))
+        service.index_chunks()
+
+        model.encoded.clear()
+        _edit(doc_id, _sections("Zero", "One", "Two"))
+        assert service.index_chunks() == 1
+        assert [idx for idx, _, _ in self._chunks(doc_id)] == [0, 1, 2]
+
+    def test_removed_chunks_deleted(self, model):
+        service = EmbeddingService()
+        doc_id = _add_doc("Doc", _sections("One", "Two", "Three"))
+        service.index_chunks()
+
+        _edit(doc_id, _sections("One"))
+        assert service.index_chunks() == 0
+        assert [path for _, path, _ in self._chunks(doc_id)] == ["Doc > One"]
+
+
+class TestChunkPipeline:
+    def test_batches_span_documents(self, model):
+        service = EmbeddingService()
+        for i in range(10):
+            _add_doc(f"Note {i}", f"short note {i}")
+        calls = []
+        original = model.encode
+        model.encode = lambda texts: calls.append(len(texts)) or original(texts)
+
+        assert service.index_chunks(batch_size=4) == 10
+        assert calls == [4, 4, 2]
+
+    def test_process_pool_split(self, model, monkeypatch):
+        monkeypatch.setattr(embedding_service, "_CHUNK_POOL_MIN_DOCS", 0)
+        service = EmbeddingService()
+        doc_id = _add_doc("Doc", _sections("One", "Two"))
+        _add_doc("Other", "short")
+
+        assert service.index_chunks(workers=2) == 3
+        with db.get_connection() as conn:
+            paths = [
+                r[0]
+                for r in conn.execute(
+                    "SELECT heading_path FROM chunk_embeddings WHERE document_id = ? "
+                    "ORDER BY chunk_index",
+                    (doc_id,),
+                )
+            ]
+        assert paths == ["Doc > One", "Doc > Two"]
+
+    def test_progress_reports_documents(self, model):
+        service = EmbeddingService()
+        for i in range(3):
+            _add_doc(f"Note {i}", f"short note {i}")
+        seen = []
+        service.index_chunks(progress_callback=lambda done, total: seen.append((done, total)))
+        assert seen[-1] == (3, 3)
+
+    def test_forced_reindex_resumes_after_interrupt(self, model, monkeypatch):
+        monkeypatch.setattr(embedding_service, "_CHUNK_WRITE_ROWS", 1)
+        service = EmbeddingService()
+        for i in range(6):
+            _add_doc(f"Note {i}", f"short note {i}")
+        service.index_chunks()
+
+        original = model.encode
+        calls = 0
+
+        def flaky(texts):
+            nonlocal calls
+            calls += 1
+            if calls == 3:
+                raise KeyboardInterrupt
+            return original(texts)
+
+        model.encode = flaky
+        with pytest.raises(KeyboardInterrupt):
+            service.index_chunks(force=True, batch_size=2)
+
+        model.encode = original
+        model.encoded.clear()
+        # Documents committed before the interrupt are not re-embedded
+        assert service.index_chunks(force=True, batch_size=2) == 2
+        assert model.encoded == ["Note 4\n\nshort note 4", "Note 5\n\nshort note 5"]
+        assert service.index_chunks(force=True, batch_size=2) == 6
+
+    def test_completed_normal_pass_clears_forced_resume_point(self, model, monkeypatch):
+        monkeypatch.setattr(embedding_service, "_CHUNK_WRITE_ROWS", 1)
+        service = EmbeddingService()
+        for i in range(6):
+            _add_doc(f"Note {i}", f"short note {i}")
+        service.index_chunks()
+
+        original = model.encode
+        calls = 0
+
+        def flaky(texts):
+            nonlocal calls
+            calls += 1
+            if calls == 3:
+                raise KeyboardInterrupt
+            return original(texts)
+
+        model.encode = flaky
+        with pytest.raises(KeyboardInterrupt):
+            service.index_chunks(force=True, batch_size=2)
+        model.encode = original
+
+        service.index_chunks()
+        # A later forced run starts over instead of resuming the stale position
+        assert service.index_chunks(force=True, batch_size=2) == 6
@@ -0,0 +1,148 @@
+"""Tests for the blocked all-pairs kNN graph."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from emdx.database import db  # noqa: E402
+from emdx.services import knn_graph, link_service, vector_index  # noqa: E402
+from emdx.services.embedding_service import EmbeddingService, _content_hash  # noqa: E402
+from emdx.services.vector_index import (  # noqa: E402
+    EmbeddingMatrix,
+    encode_vector,
+    stack_blobs,
+)
+
+DIM = 8
+
+
+def _unit_rows(n: int, seed: int = 0) -> np.ndarray:
+    rows = np.random.default_rng(seed).standard_normal((n, DIM)).astype(np.float32)
+    return rows / np.linalg.norm(rows, axis=1, keepdims=True)
+
+
+def _matrix(vectors: np.ndarray) -> EmbeddingMatrix:
+    ids = np.arange(len(vectors), dtype=np.int64)
+    return EmbeddingMatrix(row_ids=ids, doc_ids=ids, vectors=vectors, generation=0)
+
+
+def _brute_force(vectors: np.ndarray, k: int, groups: np.ndarray | None = None) -> np.ndarray:
+    scores = vectors @ vectors.T
+    np.fill_diagonal(scores, -np.inf)
+    if groups is not None:
+        scores[(groups[:, None] >= 0) & (groups[:, None] != groups[None, :])] = -np.inf
+    return np.argsort(-scores, axis=1, kind="stable")[:, :k]
+
+
+@pytest.fixture
+def service():
+    with db.get_connection() as conn:
+        conn.execute("DELETE FROM document_embeddings")
+        conn.execute("DELETE FROM document_links")
+        conn.execute("DELETE FROM documents")
+        conn.commit()
+    vector_index.clear_cache()
+    yield EmbeddingService()
+    vector_index.clear_cache()
+
+
+def _add_doc(svc: EmbeddingService, vec: np.ndarray, project: str | None = None) -> int:
+    with db.get_connection() as conn:
+        cursor = conn.execute(
+            "INSERT INTO documents (title, content, project) VALUES ('Doc', 'Body', ?)",
+            (project,),
+        )
+        doc_id = cursor.lastrowid
+        assert doc_id is not None
+        conn.execute(
+            "INSERT INTO document_embeddings (document_id, model_name, embedding, dimension, "
+            "content_hash) VALUES (?, ?, ?, ?, ?)",
+            (doc_id, svc.MODEL_NAME, vec.tobytes(), DIM, _content_hash("Doc\n\nBody")),
+        )
+        conn.commit()
+        return doc_id
+
+
+class TestCompute:
+    def test_tiled_matches_brute_force(self):
+        vectors = _unit_rows(50)
+        positions, scores = knn_graph.compute(_matrix(vectors), k=5, block=7)
+        assert np.array_equal(positions, _brute_force(vectors, 5))
+        assert np.all(np.diff(scores, axis=1) <= 0)
+
+    def test_groups_restrict_neighbours(self):
+        vectors = _unit_rows(30, seed=1)
+        groups = np.array([0, 1, -1] * 10)
+        positions, _ = knn_graph.compute(_matrix(vectors), k=4, groups=groups, block=8)
+        assert np.array_equal(positions, _brute_force(vectors, 4, groups))
+
+    def test_small_group_pads_missing_slots(self):
+        groups = np.array([0, 0, 1, 1, 1])
+        positions, scores = knn_graph.compute(_matrix(_unit_rows(5)), k=3, groups=groups)
+        assert list(positions[0]) == [1, -1, -1]
+        assert np.isneginf(scores[0, 1:]).all()
+
+    def test_quantized_rows(self):
+        vectors = _unit_rows(40, seed=2)
+        codes, scales = stack_blobs([encode_vector(v, vector_index.INT8) for v in vectors], DIM)
+        matrix = _matrix(codes)
+        matrix.scales = scales
+        positions, _ = knn_graph.compute(matrix, k=1, block=16)
+        assert (positions[:, 0] == _brute_force(vectors, 1)[:, 0]).mean() > 0.9
+
+
+class TestPersistedGraph:
+    def test_graph_matches_find_similar(self, service):
+        ids = [_add_doc(service, v) for v in _unit_rows(12, seed=3)]
+        graph = service.neighbour_graph(k=3)
+        for doc_id in ids:
+            expected = [m.doc_id for m in service.find_similar(doc_id, limit=3)]
+            assert [n for n, _ in graph[doc_id]] == expected
+
+    def test_reused_until_embeddings_change(self, service):
+        vectors = _unit_rows(6, seed=4)
+        for v in vectors[:5]:
+            _add_doc(service, v)
+        service.neighbour_graph(k=2)
+
+        with patch.object(knn_graph, "build") as mock_build:
+            service.neighbour_graph(k=2)
+        mock_build.assert_not_called()
+
+        _add_doc(service, vectors[5])
+        assert len(service.neighbour_graph(k=2)) == 6
+
+    def test_project_scope(self, service):
+        vectors = _unit_rows(6, seed=5)
+        alpha = [_add_doc(service, v, "alpha") for v in vectors[:3]]
+        beta = [_add_doc(service, v, "beta") for v in vectors[3:]]
+        graph = service.neighbour_graph(k=5, by_project=True)
+        assert {n for n, _ in graph[alpha[0]]} == set(alpha[1:])
+        assert {n for n, _ in graph[beta[0]]} == set(beta[1:])
+
+        # Moving a document invalidates the project-scoped graph
+        with db.get_connection() as conn:
+            conn.execute("UPDATE documents SET project = 'alpha' WHERE id = ?", (beta[0],))
+            conn.commit()
+        graph = service.neighbour_graph(k=5, by_project=True)
+        assert {n for n, _ in graph[alpha[0]]} == set(alpha[1:]) | {beta[0]}
+
+    def test_auto_link_all_uses_graph(self, service):
+        base = _unit_rows(1, seed=6)[0]
+        first = _add_doc(service, base)
+        second = _add_doc(service, base)
+        _add_doc(service, -base)
+
+        with patch.object(EmbeddingService, "find_similar") as mock_find:
+            created = link_service.auto_link_all(threshold=0.9)
+        mock_find.assert_not_called()
+        assert created == 1
+        with db.get_connection() as conn:
+            links = conn.execute(
+                "SELECT source_doc_id, target_doc_id FROM document_links"
+            ).fetchall()
+        assert {tuple(sorted(link)) for link in links} == {(first, second)}
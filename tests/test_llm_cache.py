@@ -0,0 +1,175 @@
+"""Tests for the LLM response cache and the CLI calls that use it."""
+
+from __future__ import annotations
+
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from emdx.database import db
+from emdx.services import llm_cache
+from emdx.services.entity_service import _call_claude_for_entities
+from emdx.services.synthesis_service import _execute_prompt
+from emdx.services.wiki_clustering_service import TopicCluster, auto_label_cluster
+
+
+def _completed(stdout: str, returncode: int = 0) -> MagicMock:
+    return MagicMock(returncode=returncode, stdout=stdout, stderr="boom")
+
+
+def _age(key: str, days: float) -> None:
+    with db.get_connection() as conn:
+        conn.execute(
+            "UPDATE llm_response_cache SET last_used_at = ? WHERE key = ?",
+            (time.time() - days * 86400, key),
+        )
+        conn.commit()
+
+
+class TestCache:
+    def test_round_trip_and_stats(self):
+        key = llm_cache.make_key("sonnet", "system", "user")
+        before = llm_cache.stats()
+        assert llm_cache.get(key) is None
+
+        llm_cache.put(key, "sonnet", "answer")
+        assert llm_cache.get(key) == "answer"
+        assert llm_cache.get(key) == "answer"
+
+        stats = llm_cache.stats()
+        assert (stats.entries, stats.size_bytes, stats.total_hits) == (1, 6, 2)
+        assert (stats.hits - before.hits, stats.misses - before.misses) == (2, 1)
+
+    def test_key_covers_model_system_and_message(self):
+        base = llm_cache.make_key("sonnet", "system", "user")
+        assert base == llm_cache.make_key("sonnet", "system", "user")
+        assert base != llm_cache.make_key("opus", "system", "user")
+        assert base != llm_cache.make_key("sonnet", "other", "user")
+        assert base != llm_cache.make_key("sonnet", "system", "user!")
+        assert llm_cache.make_key(None, "", "x") == llm_cache.make_key("", "", "x")
+
+    def test_evicts_least_recently_used_beyond_size(self):
+        keys = [llm_cache.make_key(None, "", str(i)) for i in range(4)]
+        for i, key in enumerate(keys[:3]):
+            llm_cache.put(key, None, str(i), max_entries=3)
+            _age(key, 3 - i)
+        llm_cache.get(keys[0])  # now the most recently used
+
+        llm_cache.put(keys[3], None, "3", max_entries=3)
+        assert llm_cache.get(keys[1]) is None
+        assert [llm_cache.get(k) for k in (keys[0], keys[2], keys[3])] == ["0", "2", "3"]
+
+    def test_evicts_entries_unused_past_max_age(self):
+        old = llm_cache.make_key(None, "", "old")
+        llm_cache.put(old, None, "stale")
+        _age(old, 100)
+
+        llm_cache.put(llm_cache.make_key(None, "", "new"), None, "fresh", max_age_days=90)
+        assert llm_cache.get(old) is None
+        assert llm_cache.stats().entries == 1
+
+    def test_bypass_skips_lookup_but_stores(self):
+        key = llm_cache.make_key(None, "", "prompt")
+        llm_cache.put(key, None, "old")
+        with llm_cache.bypass():
+            assert llm_cache.get(key) is None
+            llm_cache.put(key, None, "new")
+        assert llm_cache.get(key) == "new"
+
+    def test_disabled_by_env(self, monkeypatch: pytest.MonkeyPatch):
+        key = llm_cache.make_key(None, "", "prompt")
+        monkeypatch.setenv(llm_cache.CACHE_ENV_VAR, "0")
+        llm_cache.put(key, None, "answer")
+        monkeypatch.delenv(llm_cache.CACHE_ENV_VAR)
+        assert llm_cache.get(key) is None
+
+    def test_clear(self):
+        llm_cache.put(llm_cache.make_key(None, "", "a"), None, "a")
+        assert llm_cache.clear() == 1
+        assert llm_cache.stats().entries == 0
+
+
+class TestCachedCalls:
+    @patch("emdx.services.synthesis_service.subprocess.run")
+    def test_execute_prompt_reuses_response(self, mock_run: MagicMock):
+        mock_run.return_value = _completed("  synthesized  ")
+        first = _execute_prompt("system", "sources", "Doc", model="sonnet")
+        second = _execute_prompt("system", "sources", "Doc", model="sonnet")
+
+        assert mock_run.call_count == 1
+        assert first.output_content == second.output_content == "synthesized"
+        assert second.success
+
+        _execute_prompt("system", "sources", "Doc", model="opus")
+        assert mock_run.call_count == 2
+
+    @patch("emdx.services.synthesis_service.subprocess.run")
+    def test_execute_prompt_does_not_cache_failures(self, mock_run: MagicMock):
+        mock_run.return_value = _completed("", returncode=1)
+        with pytest.raises(RuntimeError):
+            _execute_prompt("system", "sources", "Doc")
+        assert llm_cache.stats().entries == 0
+
+    @patch("emdx.services.entity_service.subprocess.run")
+    def test_entity_extraction_reuses_parsed_response(self, mock_run: MagicMock):
+        mock_run.return_value = _completed(
+            json.dumps(
+                {
+                    "entities": [
+                        {"name": "Cache Layer", "entity_type": "concept", "confidence": 0.9}
+                    ],
+                    "relationships": [],
+                }
+            )
+        )
+        first = _call_claude_for_entities("content", "Title")
+        second = _call_claude_for_entities("content", "Title")
+
+        assert mock_run.call_count == 1
+        assert first == second
+        assert len(second["entities"]) == 1
+
+    @patch("emdx.services.entity_service.subprocess.run")
+    def test_unparseable_entity_response_is_not_cached(self, mock_run: MagicMock):
+        mock_run.return_value = _completed("not json")
+        with pytest.raises(json.JSONDecodeError):
+            _call_claude_for_entities("content", "Title")
+        assert llm_cache.stats().entries == 0
+
+    @patch("emdx.services.wiki_clustering_service._has_claude_cli", return_value=True)
+    @patch("emdx.services.wiki_clustering_service.subprocess.run")
+    def test_cluster_label_reuses_response(self, mock_run: MagicMock, _cli: MagicMock):
+        mock_run.return_value = _completed('"Caching Strategy"\n')
+        cluster = TopicCluster(
+            cluster_id=1,
+            label="cache / llm",
+            slug="cache-llm",
+            doc_ids=[],
+            top_entities=[("cache", 1.0), ("llm", 0.5)],
+        )
+
+        assert auto_label_cluster(cluster) == "Caching Strategy"
+        assert auto_label_cluster(cluster) == "Caching Strategy"
+        assert mock_run.call_count == 1
+
+
+class TestLLMCacheCommand:
+    def test_stats_and_clear(self):
+        from typer.testing import CliRunner
+
+        from emdx.main import app
+
+        llm_cache.put(llm_cache.make_key(None, "", "a"), None, "abc")
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["maintain", "llm-cache", "--json"])
+        assert result.exit_code == 0, result.stdout
+        data = json.loads(result.stdout)
+        assert (data["enabled"], data["entries"], data["size_bytes"]) == (True, 1, 3)
+
+        result = runner.invoke(app, ["maintain", "llm-cache", "--clear"])
+        assert result.exit_code == 0
+        assert "Cleared 1" in result.stdout
+        assert llm_cache.stats().entries == 0
@@ -38,3 +38,14 @@ class TestMaintainCompact:
         assert data["size_before_bytes"] >= data["size_after_bytes"]
         assert data["reclaimed_bytes"] == data["size_before_bytes"] - data["size_after_bytes"]
         assert data["duration_seconds"] >= 0
+
+    def test_compact_optimizes_substring_index(self):
+        result = runner.invoke(app, ["maintain", "substring-index", "--json"])
+        assert result.exit_code == 0
+        assert json.loads(_out(result))["enabled"] is True
+        try:
+            result = runner.invoke(app, ["maintain", "compact", "--json"])
+            assert result.exit_code == 0
+        finally:
+            result = runner.invoke(app, ["maintain", "substring-index", "--disable"])
+        assert "dropped" in _out(result)
@@ -1,7 +1,9 @@
 """Tests for the migration system."""
 
 import sqlite3
+from unittest.mock import patch
 
+from emdx.database.connection import DatabaseConnection
 from emdx.database.migrations import (
     MIGRATIONS,
     _ensure_schema_migrations,
@@ -10,6 +12,8 @@ from emdx.database.migrations import (
     migration_054_set_based_migration_tracking,
     record_migration,
     run_migrations,
+    schema_fingerprint,
+    schema_is_current,
 )
 
 
@@ -208,3 +212,81 @@ class TestSimpleMigrations:
             assert version in applied, f"Timestamp migration {version} not recorded"
 
         conn.close()
+
+
+class TestSchemaFingerprint:
+    """The user_version fast path that lets startup skip migration discovery."""
+
+    def test_run_migrations_stamps_fingerprint(self, tmp_path):
+        db_path = tmp_path / "test.db"
+        run_migrations(db_path)
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == schema_fingerprint()
+        assert schema_is_current(conn)
+        conn.close()
+
+    def test_fingerprint_is_positive_and_nonzero(self):
+        assert 0 < schema_fingerprint() < 2**31
+
+    def test_fresh_database_is_not_current(self):
+        conn = sqlite3.connect(":memory:")
+        assert not schema_is_current(conn)
+        conn.close()
+
+    def test_new_migration_changes_fingerprint(self):
+        before = schema_fingerprint()
+        extra = MIGRATIONS + [("29991231_000000", "Future migration", lambda conn: None)]
+        with patch("emdx.database.migrations.MIGRATIONS", extra):
+            schema_fingerprint.cache_clear()
+            try:
+                assert schema_fingerprint() != before
+            finally:
+                schema_fingerprint.cache_clear()
+        assert schema_fingerprint() == before
+
+    def test_stale_fingerprint_runs_migrations(self, tmp_path):
+        db_path = tmp_path / "test.db"
+        run_migrations(db_path)
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA user_version = 0")
+        conn.commit()
+        conn.close()
+
+        with patch("emdx.database.migrations.run_migrations") as mock_run:
+            DatabaseConnection(db_path).ensure_schema()
+        mock_run.assert_called_once()
+
+    def test_ensure_schema_skips_migration_discovery(self, tmp_path):
+        """Guard: a current database never reads schema_migrations at startup."""
+        db_path = tmp_path / "test.db"
+        db = DatabaseConnection(db_path)
+        db.ensure_schema()
+
+        with (
+            patch("emdx.database.migrations.run_migrations") as mock_run,
+            patch("emdx.database.migrations.get_applied_migrations") as mock_applied,
+        ):
+            db.ensure_schema()
+        mock_run.assert_not_called()
+        mock_applied.assert_not_called()
+
+    def test_ensure_schema_fast_path_reads_only_user_version(self, tmp_path):
+        """Guard: the fast path is one PRAGMA read, with no schema or migration queries."""
+        db_path = tmp_path / "test.db"
+        db = DatabaseConnection(db_path)
+        db.ensure_schema()
+
+        statements: list[str] = []
+        # ensure_schema reuses this thread's pooled connection
+        with db.get_connection() as conn:
+            conn.set_trace_callback(statements.append)
+        try:
+            with patch("emdx.database.migrations.run_migrations") as mock_run:
+                db.ensure_schema()
+        finally:
+            with db.get_connection() as conn:
+                conn.set_trace_callback(None)
+
+        mock_run.assert_not_called()
+        assert statements == ["PRAGMA user_version"]
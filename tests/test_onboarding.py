@@ -55,6 +55,14 @@ def _make_test_db(db_path: Path) -> sqlite3.Connection:
             FOREIGN KEY (tag_id) REFERENCES tags(id) ON DELETE CASCADE
         )
     """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS document_stats (
+            document_id INTEGER PRIMARY KEY,
+            word_count INTEGER,
+            char_count INTEGER NOT NULL,
+            token_estimate INTEGER NOT NULL
+        )
+    """)
     conn.execute("""
         CREATE TABLE IF NOT EXISTS categories (
             key TEXT PRIMARY KEY,
@@ -0,0 +1,158 @@
+"""Tests for keyset pagination of find listings."""
+
+from __future__ import annotations
+
+import json
+import uuid
+
+import pytest
+from typer.testing import CliRunner
+
+from emdx.commands.serve import _handle_request
+from emdx.database.documents import list_documents_page
+from emdx.database.pagination import decode_cursor, encode_cursor, iter_pages, page_from_rows
+from emdx.database.search import search_documents_page
+from emdx.main import app
+from emdx.models.documents import save_document
+from emdx.models.tags import search_by_tags_page
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def corpus():
+    """Seven documents in a project of their own, tagged and searchable."""
+    project = f"paging-{uuid.uuid4().hex[:8]}"
+    ids = [
+        save_document(
+            f"Note {i}",
+            "pagination " * (i + 1) + f"marker{i}",
+            project,
+            tags=[project],
+            doc_type="user",
+        )
+        for i in range(7)
+    ]
+    return project, ids
+
+
+class TestCursor:
+    def test_round_trip(self):
+        assert decode_cursor(encode_cursor(-1.25, 42), 2) == [-1.25, 42]
+
+    @pytest.mark.parametrize("bad", ["not base64!", encode_cursor(1), encode_cursor("a", [1])])
+    def test_rejects_foreign_or_malformed(self, bad):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(bad, 2)
+
+    @pytest.mark.parametrize("page_size", [0, -5])
+    def test_page_from_rows_rejects_empty_pages(self, page_size):
+        with pytest.raises(ValueError, match="page_size must be at least 1"):
+            page_from_rows([1, 2, 3], page_size, lambda row: (row,))
+
+
+class TestPages:
+    def test_search_pages_cover_every_hit_once(self, corpus):
+        project, ids = corpus
+        first = search_documents_page("pagination", project=project, page_size=3)
+        assert len(first.items) == 3 and first.next_cursor is not None
+
+        walked = list(
+            iter_pages(
+                lambda c: search_documents_page(
+                    "pagination", project=project, page_size=3, cursor=c
+                )
+            )
+        )
+        assert sorted(hit.id for hit in walked) == sorted(ids)
+        assert [hit.rank for hit in walked] == sorted(hit.rank for hit in walked)
+
+    def test_date_only_search_pages_newest_first(self, corpus):
+        project, ids = corpus
+        walked = list(
+            iter_pages(lambda c: search_documents_page("*", project=project, page_size=2, cursor=c))
+        )
+        assert [hit.id for hit in walked] == sorted(ids, reverse=True)
+
+    def test_listing_and_tag_pages(self, corpus):
+        project, ids = corpus
+        listed = list(iter_pages(lambda c: list_documents_page(project, page_size=4, cursor=c)))
+        assert [doc.id for doc in listed] == sorted(ids, reverse=True)
+
+        tagged = list(iter_pages(lambda c: search_by_tags_page([project], page_size=4, cursor=c)))
+        assert [doc["id"] for doc in tagged] == sorted(ids, reverse=True)
+
+    def test_last_page_has_no_cursor(self, corpus):
+        project, _ = corpus
+        assert list_documents_page(project, page_size=7).next_cursor is None
+
+
+class TestFindCommand:
+    def test_page_size_json_returns_next_cursor(self, corpus):
+        project, ids = corpus
+        args = ["find", "--all", "-p", project, "--page-size", "5", "--json"]
+        first = json.loads(runner.invoke(app, args).stdout)
+        assert [r["id"] for r in first["results"]] == sorted(ids, reverse=True)[:5]
+
+        second = json.loads(runner.invoke(app, [*args, "--cursor", first["next_cursor"]]).stdout)
+        assert [r["id"] for r in second["results"]] == sorted(ids, reverse=True)[5:]
+        assert second["next_cursor"] is None
+
+    def test_stream_prints_every_match_as_ndjson(self, corpus):
+        project, ids = corpus
+        result = runner.invoke(app, ["find", "pagination", "-p", project, "--stream"])
+        assert result.exit_code == 0
+        rows = [json.loads(line) for line in result.stdout.splitlines()]
+        assert sorted(r["id"] for r in rows) == sorted(ids)
+        assert all(project in r["tags"] for r in rows)
+
+    def test_stream_honours_explicit_limit(self, corpus):
+        project, _ = corpus
+        result = runner.invoke(
+            app,
+            ["find", "--tags", project, "--stream", "--page-size", "2", "-n", "3", "--ids-only"],
+        )
+        assert len(result.stdout.split()) == 3
+
+    def test_invalid_cursor_is_an_error(self, corpus):
+        project, _ = corpus
+        result = runner.invoke(app, ["find", "pagination", "-p", project, "--cursor", "bogus"])
+        assert result.exit_code == 1
+        assert "Invalid cursor" in result.stdout
+
+    def test_rejected_for_unpaged_modes(self):
+        result = runner.invoke(app, ["find", "--recent", "5", "--stream"])
+        assert result.exit_code == 1
+
+
+class TestServe:
+    def test_find_all_pages(self, corpus):
+        project, ids = corpus
+        response = _handle_request(
+            {"id": 1, "method": "find.all", "params": {"project": project, "page_size": 4}}
+        )
+        page = response["result"]
+        assert [r["id"] for r in page["results"]] == sorted(ids, reverse=True)[:4]
+        assert page["next_cursor"] is not None
+
+    def test_find_search_stays_a_list_without_paging_params(self, corpus):
+        response = _handle_request(
+            {"id": 1, "method": "find.search", "params": {"query": "pagination"}}
+        )
+        assert isinstance(response["result"], list)
+
+        response = _handle_request(
+            {"id": 2, "method": "find.search", "params": {"query": "pagination", "page_size": 2}}
+        )
+        assert set(response["result"]) == {"results", "next_cursor"}
+
+    @pytest.mark.parametrize("method", ["find.all", "find.search", "find.by_tags"])
+    @pytest.mark.parametrize("page_size", [0, -5, "10", 2.5, True])
+    def test_invalid_page_size_is_an_error(self, corpus, method, page_size):
+        project, _ = corpus
+        params = {"query": "pagination", "tags": [project], "project": project}
+        response = _handle_request(
+            {"id": 1, "method": method, "params": {**params, "page_size": page_size}}
+        )
+        assert "result" not in response
+        assert "page_size must be an integer of at least 1" in response["error"]["message"]
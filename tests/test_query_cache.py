@@ -0,0 +1,70 @@
+"""Tests for the on-disk query embedding cache."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from emdx.database import db  # noqa: E402
+from emdx.services import embedding_service, query_cache  # noqa: E402
+from emdx.services.embedding_service import EmbeddingService  # noqa: E402
+
+
+class FakeModel:
+    def __init__(self) -> None:
+        self.encoded: list[str] = []
+
+    def encode(self, texts: str | list[str]) -> np.ndarray:
+        self.encoded.append(texts)
+        return np.array([len(texts), 1.0, 0.0, 0.0], dtype=np.float32)
+
+
+@pytest.fixture
+def model(monkeypatch):
+    fake = FakeModel()
+    monkeypatch.setattr(embedding_service, "_get_model", lambda: fake)
+    query_cache.clear()
+    yield fake
+    query_cache.clear()
+
+
+def test_normalize():
+    assert query_cache.normalize("  How do\tI   Deploy?\n") == "how do i deploy?"
+
+
+def test_repeated_query_skips_model(model):
+    service = EmbeddingService()
+    first = service.embed_query("Deploy steps")
+    second = service.embed_query("  deploy   STEPS ")
+
+    assert model.encoded == ["deploy steps"]
+    assert np.array_equal(first, second)
+    assert second.dtype == np.float32
+
+
+def test_keyed_by_model(model, monkeypatch):
+    service = EmbeddingService()
+    service.embed_query("deploy")
+    monkeypatch.setattr(EmbeddingService, "MODEL_NAME", "other-model")
+    service.embed_query("deploy")
+    assert model.encoded == ["deploy", "deploy"]
+
+
+def test_evicts_least_recently_used(model):
+    for query in ("a", "b", "c"):
+        query_cache.put(query, "m", np.ones(4, dtype=np.float32), max_entries=3)
+    # Touch "a" so "b" becomes the oldest entry
+    assert query_cache.get("a", "m") is not None
+    query_cache.put("d", "m", np.ones(4, dtype=np.float32), max_entries=3)
+
+    with db.get_connection() as conn:
+        cached = {row[0] for row in conn.execute("SELECT query FROM query_embeddings")}
+    assert cached == {"a", "c", "d"}
+
+
+def test_search_uses_cache(model):
+    service = EmbeddingService()
+    service.search("where is the config")
+    service.search_chunks("Where is the   config")
+    assert model.encoded == ["where is the config"]
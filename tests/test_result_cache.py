@@ -0,0 +1,167 @@
+"""Tests for the on-disk find/ask result cache."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from emdx.database import db
+from emdx.models.tags import add_tags_to_document
+from emdx.services import result_cache
+from emdx.services.ask_service import AskService
+from emdx.services.hybrid_search import HybridSearchResult, HybridSearchService, SearchMode
+
+
+def _add_doc(title: str, content: str) -> int:
+    with db.get_connection() as conn:
+        cursor = conn.execute(
+            "INSERT INTO documents (title, content) VALUES (?, ?)", (title, content)
+        )
+        conn.commit()
+        assert cursor.lastrowid is not None
+        return cursor.lastrowid
+
+
+def _execute(sql: str, *params: object) -> None:
+    with db.get_connection() as conn:
+        conn.execute(sql, params)
+        conn.commit()
+
+
+class TestCacheTable:
+    def test_key_normalizes_query_and_orders_filters(self):
+        assert result_cache.make_key("find", "  Deploy\tSteps ", a=1, b=2) == (
+            result_cache.make_key("find", "deploy steps", b=2, a=1)
+        )
+        assert result_cache.make_key("find", "deploy", a=1) != result_cache.make_key(
+            "find", "deploy", a=2
+        )
+
+    def test_round_trip_until_write(self):
+        stamp, cached = result_cache.get("k")
+        assert stamp is not None and cached is None
+        result_cache.put("k", stamp, [1, 2])
+        assert result_cache.get("k") == (stamp, [1, 2])
+
+        _add_doc("New", "body")
+        new_stamp, cached = result_cache.get("k")
+        assert new_stamp != stamp and cached is None
+
+    def test_results_from_before_a_write_are_not_stored(self):
+        stamp, _ = result_cache.get("k")
+        _add_doc("Concurrent", "write")
+        result_cache.put("k", stamp, [1])
+        assert result_cache.get("k")[1] is None
+
+    def test_view_counts_do_not_invalidate(self):
+        doc_id = _add_doc("Viewed", "body")
+        stamp, _ = result_cache.get("k")
+        result_cache.put("k", stamp, [doc_id])
+        _execute(
+            "UPDATE documents SET access_count = access_count + 1, "
+            "accessed_at = CURRENT_TIMESTAMP WHERE id = ?",
+            doc_id,
+        )
+        assert result_cache.get("k")[1] == [doc_id]
+
+    def test_tag_changes_invalidate(self):
+        doc_id = _add_doc("Tagged", "body")
+        stamp, _ = result_cache.get("k")
+        result_cache.put("k", stamp, [doc_id])
+        add_tags_to_document(doc_id, ["cache-invalidation"])
+        assert result_cache.get("k")[1] is None
+
+    def test_evicts_least_recently_used(self):
+        stamp, _ = result_cache.get("a")
+        result_cache.put("a", stamp, 1, max_entries=2)
+        result_cache.put("b", stamp, 2, max_entries=2)
+        result_cache.get("a")
+        result_cache.put("c", stamp, 3, max_entries=2)
+        assert result_cache.get("a")[1] == 1
+        assert result_cache.get("b")[1] is None
+        assert result_cache.get("c")[1] == 3
+
+
+class TestFindCache:
+    @pytest.fixture
+    def service(self):
+        service = HybridSearchService()
+        result = HybridSearchResult(
+            doc_id=7,
+            title="Deploy",
+            project=None,
+            score=0.9,
+            keyword_score=0.9,
+            semantic_score=0.0,
+            source="keyword",
+            snippet="<b>deploy</b>",
+            tags=["ops"],
+            created_at=datetime(2026, 1, 2, 3, 4, 5),
+        )
+        with (
+            patch.object(service, "determine_mode", return_value=SearchMode.KEYWORD),
+            patch.object(service, "_search_keyword", return_value=[result]) as keyword,
+        ):
+            yield service, keyword
+
+    def test_repeat_served_from_cache(self, service):
+        service, keyword = service
+        first = service.search("Deploy steps", limit=5)
+        second = service.search("deploy  steps", limit=5)
+
+        assert keyword.call_count == 1
+        assert second == first
+        assert second[0].created_at == datetime(2026, 1, 2, 3, 4, 5)
+        assert service.last_report is not None
+        assert set(service.last_report.timings_ms) == {"cache", "total"}
+
+    def test_filters_are_part_of_key(self, service):
+        service, keyword = service
+        service.search("deploy", limit=5)
+        service.search("deploy", limit=5, project="other")
+        service.search("deploy", limit=10)
+        assert keyword.call_count == 3
+
+    def test_write_invalidates(self, service):
+        service, keyword = service
+        service.search("deploy", limit=5)
+        _add_doc("Another", "deploy notes")
+        service.search("deploy", limit=5)
+        assert keyword.call_count == 2
+
+    def test_degraded_results_not_cached(self):
+        service = HybridSearchService(semantic_budget=0.01)
+        with (
+            patch.object(service, "determine_mode", return_value=SearchMode.HYBRID),
+            patch.object(service, "_search_keyword", return_value=[]) as keyword,
+            patch.object(service, "_search_semantic", side_effect=lambda *a, **k: time.sleep(0.2)),
+        ):
+            service.search("deploy", limit=5)
+            service.search("deploy", limit=5)
+        assert service.last_report is not None and service.last_report.degraded
+        assert keyword.call_count == 2
+
+
+class TestAskCache:
+    def test_repeat_rereads_documents(self):
+        doc_id = _add_doc("Runbook", "How to rotate the signing keys")
+        service = AskService()
+        with patch.object(service, "_retrieve_keyword", wraps=service._retrieve_keyword) as kw:
+            first = service._retrieve("rotate signing keys", 5, force_keyword=True)
+            _execute("UPDATE documents SET access_count = 3 WHERE id = ?", doc_id)
+            second = service._retrieve("Rotate  signing keys", 5, force_keyword=True)
+
+        assert kw.call_count == 1
+        assert [tuple(d) for d in first[0]] == second[0]
+        assert second == ([(doc_id, "Runbook", "How to rotate the signing keys")], "keyword")
+
+    def test_recent_days_bypasses_cache(self):
+        _add_doc("Runbook", "How to rotate the signing keys")
+        service = AskService()
+        with patch.object(service, "_retrieve_keyword", wraps=service._retrieve_keyword) as kw:
+            service._retrieve("rotate keys", 5, force_keyword=True, recent_days=7)
+            service._retrieve("rotate keys", 5, force_keyword=True, recent_days=7)
+        assert kw.call_count == 2
@@ -6,7 +6,15 @@ from unittest.mock import patch
 
 import pytest
 
-from emdx.database.search import escape_fts5_query, search_documents
+from emdx.database import db as emdx_db
+from emdx.database.search import (
+    disable_substring_index,
+    enable_substring_index,
+    escape_fts5_query,
+    has_substring_index,
+    search_documents,
+    search_substring,
+)
 
 
 class FTS5TestDatabase:
@@ -67,6 +75,16 @@ class FTS5TestDatabase:
             END
         """)
 
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS search_snippet_cache (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                document_id INTEGER NOT NULL,
+                terms TEXT NOT NULL,
+                snippet TEXT NOT NULL,
+                UNIQUE (terms, document_id)
+            )
+        """)
+
         self.conn.commit()
 
     def save_document(
@@ -747,3 +765,69 @@ class TestDocTypeFilter:
         results = search_documents("Python", project="project1", doc_type="user")
         assert len(results) == 1
         assert results[0].title == "User P1"
+
+
+class TestSubstringSearch:
+    """Substring lookups with and without the trigram index."""
+
+    @pytest.fixture(params=[False, True], ids=["scan", "indexed"])
+    def indexed(self, request):
+        with emdx_db.get_connection() as conn:
+            conn.execute("DELETE FROM documents")
+            conn.commit()
+        if request.param:
+            assert enable_substring_index()
+        yield request.param
+        disable_substring_index()
+
+    def _add(self, title, content, project=None):
+        with emdx_db.get_connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO documents (title, content, project) VALUES (?, ?, ?)",
+                (title, content, project),
+            )
+            conn.commit()
+            return cursor.lastrowid
+
+    def test_finds_ticket_reference(self, indexed):
+        hit = self._add("Fix", "Resolved in ABC-123 yesterday")
+        self._add("Other", "Mentions ABC-1234 and ABC-12 only")
+        ids = [row[0] for row in search_substring("ABC-123 ")]
+        assert ids == [hit]
+
+    def test_case_insensitive(self, indexed):
+        hit = self._add("Code", "call parse_config() here")
+        assert [row[0] for row in search_substring("PARSE_CONFIG")] == [hit]
+
+    def test_project_filter_and_newest_first(self, indexed):
+        old = self._add("Old", "needle", "p1")
+        self._add("Elsewhere", "needle", "p2")
+        new = self._add("New", "needle again", "p1")
+        assert [row[0] for row in search_substring("needle", project="p1")] == [new, old]
+
+    def test_short_needle_and_like_wildcards(self, indexed):
+        hit = self._add("Pct", "100% sure, x_y")
+        self._add("Plain", "100 percent, xay")
+        assert [row[0] for row in search_substring("0%")] == [hit]
+        assert [row[0] for row in search_substring("x_y")] == [hit]
+
+    def test_index_follows_edits_and_deletes(self, indexed):
+        doc_id = self._add("Doc", "before text")
+        with emdx_db.get_connection() as conn:
+            conn.execute("UPDATE documents SET content = 'after text' WHERE id = ?", (doc_id,))
+            conn.commit()
+        assert search_substring("before") == []
+        assert [row[0] for row in search_substring("after")] == [doc_id]
+
+        with emdx_db.get_connection() as conn:
+            conn.execute("UPDATE documents SET is_deleted = 1 WHERE id = ?", (doc_id,))
+            conn.commit()
+        assert search_substring("after") == []
+
+    def test_enable_is_idempotent_and_disable_drops(self, indexed):
+        with emdx_db.get_connection() as conn:
+            assert has_substring_index(conn) is indexed
+        assert enable_substring_index()
+        assert disable_substring_index()
+        with emdx_db.get_connection() as conn:
+            assert not has_substring_index(conn)
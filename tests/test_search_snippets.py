@@ -0,0 +1,108 @@
+"""Tests for cached FTS5 snippets, stored lead snippets and lazy chunk text."""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from emdx.database import db
+from emdx.database.search import search_documents, search_documents_page
+from emdx.models.documents import save_document, update_document
+from emdx.services.embedding_service import ChunkMatch
+from emdx.services.hybrid_search import HybridSearchService, SearchMode
+
+
+@pytest.fixture
+def word() -> str:
+    return f"snip{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def cache_all():
+    """Cache the snippets of short test documents too."""
+    with patch("emdx.database.search.SEARCH_SNIPPET_CACHE_MIN_CHARS", 0):
+        yield
+
+
+def _cached(doc_id: int) -> list[tuple[str, str]]:
+    with db.get_connection() as conn:
+        return [
+            tuple(row)
+            for row in conn.execute(
+                "SELECT terms, snippet FROM search_snippet_cache WHERE document_id = ?",
+                (doc_id,),
+            )
+        ]
+
+
+class TestSnippetCache:
+    def test_snippet_cached_and_reused(self, word, cache_all):
+        doc_id = save_document("Notes", f"intro text then {word} appears here")
+
+        (hit,) = search_documents(word)
+        assert hit.snippet is not None and f"<b>{word}</b>" in hit.snippet
+        assert _cached(doc_id) == [(f'"{word}"', hit.snippet)]
+
+        with db.get_connection() as conn:
+            conn.execute(
+                "UPDATE search_snippet_cache SET snippet = 'cached' WHERE document_id = ?",
+                (doc_id,),
+            )
+            conn.commit()
+        assert search_documents(word)[0].snippet == "cached"
+        assert search_documents_page(word).items[0].snippet == "cached"
+
+    def test_content_change_drops_cached_snippets(self, word, cache_all):
+        doc_id = save_document("Notes", f"{word} first version")
+        search_documents(word)
+        assert _cached(doc_id)
+
+        update_document(doc_id, "Notes", f"{word} second version")
+        assert _cached(doc_id) == []
+        assert "second" in (search_documents(word)[0].snippet or "")
+
+    def test_only_long_documents_cached(self, word):
+        short_id = save_document("Short", f"{word} short")
+        long_id = save_document("Long", f"{word} " + "filler " * 3000)
+
+        assert len(search_documents(word)) == 2
+        assert _cached(short_id) == []
+        assert len(_cached(long_id)) == 1
+
+
+class TestLeadSnippets:
+    def test_lead_maintained_on_save_and_update(self):
+        lead_sql = "SELECT lead FROM document_leads WHERE document_id = ?"
+        doc_id = save_document("Lead", "line one\nline two")
+        with db.get_connection() as conn:
+            assert conn.execute(lead_sql, (doc_id,)).fetchone()[0] == "line one line two..."
+
+        update_document(doc_id, "Lead", "x" * 400)
+        with db.get_connection() as conn:
+            assert conn.execute(lead_sql, (doc_id,)).fetchone()[0] == "x" * 150 + "..."
+
+
+class TestLazyChunkText:
+    def test_chunk_text_read_for_merged_page_only(self, word):
+        ids = [save_document(f"Doc {i}", f"{word} number {i}") for i in range(4)]
+        embedder = MagicMock()
+        embedder.search_chunks.return_value = [
+            ChunkMatch(doc_id, f"Doc {i}", None, 0, "Intro", 0.9 - i / 10, "")
+            for i, doc_id in enumerate(ids)
+        ]
+        embedder.chunk_texts.side_effect = lambda keys: {key: f"chunk of {key[0]}" for key in keys}
+        service = HybridSearchService()
+        service._embedding_service = embedder
+
+        with (
+            patch.object(service, "determine_mode", return_value=SearchMode.HYBRID),
+            patch.object(service, "has_chunk_index", return_value=True),
+        ):
+            results = service.search(word, limit=2, extract=True)
+
+        assert embedder.search_chunks.call_args.kwargs["with_text"] is False
+        (keys,) = embedder.chunk_texts.call_args.args
+        assert sorted(keys) == sorted((r.doc_id, 0) for r in results)
+        assert all(r.snippet == r.chunk_text == f"chunk of {r.doc_id}" for r in results)
@@ -305,23 +305,18 @@ class TestHistoryJsonOutput:
 class TestWikiGenerateDryRunDefault:
     """Verify that wiki generate --dry-run without --all defaults to all topics."""
 
-    @patch("emdx.services.wiki_synthesis_service.complete_wiki_run")
     @patch("emdx.services.wiki_synthesis_service.generate_article")
-    @patch("emdx.services.wiki_synthesis_service.create_wiki_run")
     @patch("emdx.services.wiki_clustering_service.get_topics")
     def test_dry_run_without_all_defaults_to_all(
         self,
         mock_get_topics: MagicMock,
-        mock_create_run: MagicMock,
         mock_generate: MagicMock,
-        mock_complete: MagicMock,
     ) -> None:
         """--dry-run alone (without --all or topic_id) should process all topics."""
         mock_get_topics.return_value = [
             {"id": 1, "label": "Topic A"},
             {"id": 2, "label": "Topic B"},
         ]
-        mock_create_run.return_value = 1
 
         # Simulate dry-run article results
         article_result = MagicMock()
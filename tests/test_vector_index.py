@@ -0,0 +1,407 @@
+"""Tests for the in-memory embedding matrix behind semantic search."""
+
+from __future__ import annotations
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from emdx.database import db  # noqa: E402
+from emdx.services import query_cache, vector_index  # noqa: E402
+from emdx.services.embedding_service import EmbeddingService, _content_hash  # noqa: E402
+from emdx.services.vector_index import (  # noqa: E402
+    CHUNK_EMBEDDINGS,
+    DOCUMENT_EMBEDDINGS,
+    FLOAT16,
+    FLOAT32,
+    INT8,
+    EmbeddingMatrix,
+    blob_format,
+    decode_blob,
+    encode_vector,
+    get_generation,
+    get_storage_format,
+    load_matrix,
+    prune_originals,
+    set_storage_format,
+)
+
+DIM = 8
+
+
+def _unit(seed: int) -> np.ndarray:
+    vec = np.random.default_rng(seed).standard_normal(DIM).astype(np.float32)
+    return vec / np.linalg.norm(vec)
+
+
+@pytest.fixture
+def service():
+    with db.get_connection() as conn:
+        conn.execute("DELETE FROM document_embeddings")
+        conn.execute("DELETE FROM chunk_embeddings")
+        conn.execute("DELETE FROM documents")
+        conn.commit()
+    vector_index.clear_cache()
+    query_cache.clear()
+    yield EmbeddingService()
+    with db.get_connection() as conn:
+        conn.execute("DELETE FROM schema_flags WHERE key LIKE 'embedding_format:%'")
+        conn.commit()
+    vector_index.clear_cache()
+
+
+def _add_doc(svc: EmbeddingService, title: str, vec: np.ndarray, project: str | None = None) -> int:
+    with db.get_connection() as conn:
+        cursor = conn.execute(
+            "INSERT INTO documents (title, content, project) VALUES (?, ?, ?)",
+            (title, f"Body of {title}", project),
+        )
+        doc_id = cursor.lastrowid
+        assert doc_id is not None
+        conn.execute(
+            "INSERT INTO document_embeddings (document_id, model_name, embedding, dimension, "
+            "content_hash) VALUES (?, ?, ?, ?, ?)",
+            (
+                doc_id,
+                svc.MODEL_NAME,
+                vec.tobytes(),
+                DIM,
+                _content_hash(f"{title}\n\nBody of {title}"),
+            ),
+        )
+        conn.execute(
+            "INSERT INTO chunk_embeddings (document_id, chunk_index, heading_path, text, "
+            "model_name, embedding, dimension, content_hash) "
+            "VALUES (?, 0, 'Intro', ?, ?, ?, ?, ?)",
+            (
+                doc_id,
+                f"Chunk of {title}",
+                svc.MODEL_NAME,
+                vec.tobytes(),
+                DIM,
+                _content_hash(f"Chunk of {title}"),
+            ),
+        )
+        conn.commit()
+    return doc_id
+
+
+class TestEmbeddingMatrix:
+    def test_top_k_orders_by_score(self):
+        vectors = np.eye(4, dtype=np.float32)
+        matrix = EmbeddingMatrix(
+            row_ids=np.arange(4, dtype=np.int64),
+            doc_ids=np.arange(10, 14, dtype=np.int64),
+            vectors=vectors,
+            generation=0,
+        )
+        query = np.array([0.1, 0.9, 0.5, 0.0], dtype=np.float32)
+        positions, scores = matrix.top_k(query, 2)
+        assert list(positions) == [1, 2]
+        assert scores[0] == pytest.approx(0.9)
+
+    def test_top_k_threshold_and_mask(self):
+        vectors = np.eye(3, dtype=np.float32)
+        matrix = EmbeddingMatrix(
+            row_ids=np.arange(3, dtype=np.int64),
+            doc_ids=np.arange(3, dtype=np.int64),
+            vectors=vectors,
+            generation=0,
+        )
+        query = np.array([0.9, 0.8, 0.1], dtype=np.float32)
+        positions, _ = matrix.top_k(query, 5, threshold=0.5)
+        assert list(positions) == [0, 1]
+        positions, _ = matrix.top_k(query, 5, mask=np.array([False, True, True]))
+        assert list(positions) == [1, 2]
+
+    def test_empty_matrix(self):
+        matrix = EmbeddingMatrix(
+            row_ids=np.empty(0, dtype=np.int64),
+            doc_ids=np.empty(0, dtype=np.int64),
+            vectors=np.empty((0, 0), dtype=np.float32),
+            generation=0,
+        )
+        positions, scores = matrix.top_k(np.ones(DIM, dtype=np.float32), 3)
+        assert len(positions) == 0 and len(scores) == 0
+
+
+class TestGenerationInvalidation:
+    def test_writes_bump_generation(self, service):
+        with db.get_connection() as conn:
+            before = get_generation(conn, DOCUMENT_EMBEDDINGS)
+        _add_doc(service, "A", _unit(1))
+        with db.get_connection() as conn:
+            assert get_generation(conn, DOCUMENT_EMBEDDINGS) > before
+
+    def test_matrix_cached_until_write(self, service):
+        _add_doc(service, "A", _unit(1))
+        first = load_matrix(DOCUMENT_EMBEDDINGS, service.MODEL_NAME)
+        assert load_matrix(DOCUMENT_EMBEDDINGS, service.MODEL_NAME) is first
+
+        _add_doc(service, "B", _unit(2))
+        second = load_matrix(DOCUMENT_EMBEDDINGS, service.MODEL_NAME)
+        assert second is not first
+        assert len(second) == 2
+
+    def test_soft_delete_invalidates(self, service):
+        doc_id = _add_doc(service, "A", _unit(1))
+        _add_doc(service, "B", _unit(2))
+        assert len(load_matrix(CHUNK_EMBEDDINGS, service.MODEL_NAME)) == 2
+
+        with db.get_connection() as conn:
+            conn.execute("UPDATE documents SET is_deleted = 1 WHERE id = ?", (doc_id,))
+            conn.commit()
+        matrix = load_matrix(CHUNK_EMBEDDINGS, service.MODEL_NAME)
+        assert list(matrix.doc_ids) != [] and doc_id not in matrix.doc_ids
+
+    def test_sidecar_reused_across_processes(self, service):
+        _add_doc(service, "A", _unit(1))
+        load_matrix(DOCUMENT_EMBEDDINGS, service.MODEL_NAME)
+        vector_index.clear_cache()  # simulate a fresh CLI process
+
+        with patch.object(vector_index, "_build_matrix") as mock_build:
+            matrix = load_matrix(DOCUMENT_EMBEDDINGS, service.MODEL_NAME)
+        mock_build.assert_not_called()
+        assert len(matrix) == 1
+
+    def test_restored_database_never_reuses_sidecar(self, service):
+        """A rolled-back counter reaching an old generation gets a new token."""
+        _add_doc(service, "A", _unit(1))
+        snapshot = sqlite3.connect(":memory:")
+        with db.get_connection() as conn:
+            conn.backup(snapshot)
+        b = _add_doc(service, "B", _unit(2))
+        before = load_matrix(DOCUMENT_EMBEDDINGS, service.MODEL_NAME)
+
+        with db.get_connection() as conn:
+            snapshot.backup(conn)
+        snapshot.close()
+        vector_index.clear_cache()  # simulate a fresh CLI process after the restore
+        c = _add_doc(service, "C", _unit(3))
+
+        after = load_matrix(DOCUMENT_EMBEDDINGS, service.MODEL_NAME)
+        assert after.generation == before.generation
+        assert after.token != before.token
+        # The restored database hands B's id to C, with C's vector
+        assert c == b
+        np.testing.assert_allclose(after.rows(after.doc_ids == c)[0], _unit(3), atol=1e-6)
+
+
+class TestServiceSearch:
+    def test_search_ranks_and_hydrates(self, service):
+        target = _unit(7)
+        best = _add_doc(service, "Best", target, project="p")
+        _add_doc(service, "Other", _unit(8))
+
+        with patch.object(service, "embed_text", return_value=target):
+            matches = service.search("anything", limit=5, threshold=0.9)
+
+        assert [m.doc_id for m in matches] == [best]
+        assert matches[0].title == "Best"
+        assert matches[0].project == "p"
+        assert matches[0].similarity == pytest.approx(1.0, abs=1e-5)
+        assert matches[0].snippet.startswith("Body of Best")
+
+    def test_find_similar_excludes_self_and_filters_project(self, service):
+        base = _unit(3)
+        near = base + 0.1 * _unit(4)
+        near /= np.linalg.norm(near)
+        src = _add_doc(service, "Src", base, project="p")
+        same_project = _add_doc(service, "Near", near, project="p")
+        _add_doc(service, "Elsewhere", base, project="q")
+
+        matches = service.find_similar(src, limit=5, project="p")
+        assert [m.doc_id for m in matches] == [same_project]
+
+        matches = service.find_similar(src, limit=5)
+        assert src not in [m.doc_id for m in matches]
+        assert len(matches) == 2
+
+    def test_search_chunks_returns_chunk_text(self, service):
+        target = _unit(11)
+        doc_id = _add_doc(service, "Chunky", target)
+        _add_doc(service, "Other", _unit(12))
+
+        with patch.object(service, "embed_text", return_value=target):
+            matches = service.search_chunks("q", limit=1, threshold=0.0)
+
+        assert len(matches) == 1
+        assert matches[0].doc_id == doc_id
+        assert matches[0].chunk_text == "Chunk of Chunky"
+        assert matches[0].heading_path == "Intro"
+
+    def test_search_chunks_defers_text(self, service):
+        target = _unit(11)
+        doc_id = _add_doc(service, "Chunky", target)
+
+        with patch.object(service, "embed_text", return_value=target):
+            matches = service.search_chunks("q", limit=1, threshold=0.0, with_text=False)
+
+        assert matches[0].chunk_text == ""
+        assert service.chunk_texts([(doc_id, 0), (doc_id, 7)]) == {(doc_id, 0): "Chunk of Chunky"}
+
+    def test_similar_documents_show_stored_lead(self, service):
+        src = _add_doc(service, "Source", _unit(1))
+        other = _add_doc(service, "Other", _unit(1))
+        with db.get_connection() as conn:
+            conn.execute("UPDATE documents SET content = ? WHERE id = ?", ("a\nb" * 100, other))
+            conn.commit()
+
+        (match,) = service.find_similar(src, limit=1)
+        assert match.snippet == ("a b" * 50) + "..."
+
+
+class TestQuantizedStorage:
+    @pytest.mark.parametrize("fmt", [FLOAT32, FLOAT16, INT8])
+    def test_encode_decode_roundtrip(self, fmt):
+        vec = _unit(5)
+        blob = encode_vector(vec, fmt)
+        assert blob_format(blob, DIM) == fmt
+        decoded = decode_blob(blob, DIM)
+        assert decoded.dtype == np.float32
+        np.testing.assert_allclose(decoded, vec, atol=0.01)
+
+    def test_blob_sizes(self):
+        vec = _unit(5)
+        assert len(encode_vector(vec, FLOAT32)) == 4 * DIM
+        assert len(encode_vector(vec, FLOAT16)) == 2 * DIM
+        assert len(encode_vector(vec, INT8)) == DIM + 4
+
+    def test_unknown_format_rejected(self, service):
+        with db.get_connection() as conn, pytest.raises(ValueError, match="Unknown storage"):
+            set_storage_format(conn, CHUNK_EMBEDDINGS, service.MODEL_NAME, "int4")
+
+    @pytest.mark.parametrize("fmt", [FLOAT16, INT8])
+    def test_conversion_keeps_ranking(self, service, fmt):
+        vectors = [_unit(seed) for seed in range(40)]
+        for i, vec in enumerate(vectors):
+            _add_doc(service, f"D{i}", vec)
+        query = _unit(1000)
+        exact = load_matrix(CHUNK_EMBEDDINGS, service.MODEL_NAME)
+        expected, _ = exact.top_k(query, 5)
+
+        with db.get_connection() as conn:
+            assert set_storage_format(conn, CHUNK_EMBEDDINGS, service.MODEL_NAME, fmt) == 40
+            conn.commit()
+            assert get_storage_format(conn, CHUNK_EMBEDDINGS, service.MODEL_NAME) == fmt
+
+        matrix = load_matrix(CHUNK_EMBEDDINGS, service.MODEL_NAME)
+        # Both formats scan as int8 codes and rescore against the originals
+        assert matrix.quantized
+        positions, scores = matrix.top_k(query, 5)
+        assert list(matrix.row_ids[positions]) == list(exact.row_ids[expected])
+        np.testing.assert_allclose(scores, exact.top_k(query, 5)[1], atol=1e-6)
+
+    def test_switching_back_to_float32_restores_originals(self, service):
+        vec = _unit(3)
+        doc_id = _add_doc(service, "A", vec)
+        with db.get_connection() as conn:
+            set_storage_format(conn, DOCUMENT_EMBEDDINGS, service.MODEL_NAME, INT8)
+            set_storage_format(conn, DOCUMENT_EMBEDDINGS, service.MODEL_NAME, FLOAT32)
+            conn.commit()
+            blob = conn.execute(
+                "SELECT embedding FROM document_embeddings WHERE document_id = ?", (doc_id,)
+            ).fetchone()[0]
+            kept = conn.execute(
+                "SELECT COUNT(*) FROM embedding_originals WHERE source = ?",
+                (DOCUMENT_EMBEDDINGS,),
+            ).fetchone()[0]
+        assert blob == vec.tobytes()
+        assert kept == 0
+
+    def test_unreferenced_originals_pruned(self, service):
+        doc_id = _add_doc(service, "A", _unit(1))
+        _add_doc(service, "B", _unit(2))
+        with db.get_connection() as conn:
+            set_storage_format(conn, DOCUMENT_EMBEDDINGS, service.MODEL_NAME, INT8)
+            conn.execute("DELETE FROM document_embeddings WHERE document_id = ?", (doc_id,))
+            assert prune_originals(conn, DOCUMENT_EMBEDDINGS, service.MODEL_NAME) == 1
+            conn.commit()
+
+    def test_rows_without_originals_fall_back_to_codes(self, service):
+        vectors = [_unit(seed) for seed in range(10)]
+        for i, vec in enumerate(vectors):
+            _add_doc(service, f"D{i}", vec)
+        with db.get_connection() as conn:
+            set_storage_format(conn, DOCUMENT_EMBEDDINGS, service.MODEL_NAME, INT8)
+            conn.execute("DELETE FROM embedding_originals")
+            conn.commit()
+
+        matrix = load_matrix(DOCUMENT_EMBEDDINGS, service.MODEL_NAME)
+        positions, scores = matrix.top_k(vectors[4], 1)
+        assert scores[0] == pytest.approx(1.0, abs=0.02)
+        assert matrix.doc_ids[positions[0]] == matrix.doc_ids[4]
+
+    def test_quantized_sidecar_roundtrip(self, service):
+        _add_doc(service, "A", _unit(1))
+        with db.get_connection() as conn:
+            set_storage_format(conn, DOCUMENT_EMBEDDINGS, service.MODEL_NAME, INT8)
+            conn.commit()
+        built = load_matrix(DOCUMENT_EMBEDDINGS, service.MODEL_NAME)
+        vector_index.clear_cache()
+
+        with patch.object(vector_index, "_build_matrix") as mock_build:
+            loaded = load_matrix(DOCUMENT_EMBEDDINGS, service.MODEL_NAME)
+        mock_build.assert_not_called()
+        assert loaded.scales is not None
+        np.testing.assert_array_equal(loaded.scales, built.scales)
+
+    @pytest.mark.parametrize("fmt", [FLOAT16, INT8])
+    def test_recall_against_float32(self, service, fmt):
+        """Rescoring against the originals keeps the float32 top-10 intact."""
+        dim, k = 384, 10
+        rng = np.random.default_rng(0)
+        centers = rng.standard_normal((50, dim)).astype(np.float32)
+        data = centers[rng.integers(0, 50, 3020)] + 1.5 * rng.standard_normal((3020, dim))
+        data = (data / np.linalg.norm(data, axis=1, keepdims=True)).astype(np.float32)
+        corpus, queries = data[:3000], data[3000:]
+        with db.get_connection() as conn:
+            conn.executemany(
+                "INSERT INTO documents (id, title, content) VALUES (?, ?, ?)",
+                [(i, f"R{i}", "recall") for i in range(1, len(corpus) + 1)],
+            )
+            conn.executemany(
+                "INSERT INTO document_embeddings (document_id, model_name, embedding, "
+                "dimension, content_hash) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (i, service.MODEL_NAME, vec.tobytes(), dim, f"hash-{i}")
+                    for i, vec in enumerate(corpus, 1)
+                ],
+            )
+            conn.commit()
+        exact = load_matrix(DOCUMENT_EMBEDDINGS, service.MODEL_NAME)
+        with db.get_connection() as conn:
+            set_storage_format(conn, DOCUMENT_EMBEDDINGS, service.MODEL_NAME, fmt)
+            conn.commit()
+        matrix = load_matrix(DOCUMENT_EMBEDDINGS, service.MODEL_NAME)
+        assert matrix.vectors.dtype == np.int8
+
+        hits = 0
+        for query in queries:
+            truth, _ = exact.top_k(query, k)
+            found, scores = matrix.top_k(query, k)
+            hits += len(set(exact.doc_ids[truth].tolist()) & set(matrix.doc_ids[found].tolist()))
+            np.testing.assert_allclose(scores, corpus[matrix.doc_ids[found] - 1] @ query, atol=1e-5)
+        assert hits / (k * len(queries)) >= 0.99
+
+    def test_new_embeddings_use_selected_format(self, service):
+        doc_id = _add_doc(service, "A", _unit(1))
+        service.set_storage_format(INT8)
+        with patch.object(service, "embed_text", return_value=_unit(2)):
+            service.embed_document(doc_id, force=True)
+        with db.get_connection() as conn:
+            blob = conn.execute(
+                "SELECT embedding FROM document_embeddings WHERE document_id = ?", (doc_id,)
+            ).fetchone()[0]
+        assert len(blob) == DIM + 4
+        with db.get_connection() as conn:
+            original = conn.execute(
+                "SELECT o.embedding FROM embedding_originals o "
+                "JOIN document_embeddings e ON o.content_hash = e.content_hash "
+                "WHERE o.source = ? AND e.document_id = ?",
+                (DOCUMENT_EMBEDDINGS, doc_id),
+            ).fetchone()[0]
+        assert original == _unit(2).tobytes()
@@ -16,6 +16,8 @@ def clean_standing_queries_and_docs(
     from emdx.database.connection import db_connection
 
     with db_connection.get_connection() as conn:
+        conn.execute("DELETE FROM standing_query_matches")
+        conn.execute("DELETE FROM standing_query_queue")
         conn.execute("DELETE FROM standing_queries")
         conn.execute("DELETE FROM document_tags")
         conn.execute("DELETE FROM documents")
@@ -24,6 +26,8 @@ def clean_standing_queries_and_docs(
     yield
 
     with db_connection.get_connection() as conn:
+        conn.execute("DELETE FROM standing_query_matches")
+        conn.execute("DELETE FROM standing_query_queue")
         conn.execute("DELETE FROM standing_queries")
         conn.execute("DELETE FROM document_tags")
         conn.execute("DELETE FROM documents")
@@ -345,6 +349,77 @@ class TestCheckStandingQueries:
         assert titles == {"Python Guide", "Docker Guide"}
 
 
+class TestSaveTimeMatching:
+    """Test that documents are matched against standing queries when saved."""
+
+    def _pending(self) -> list[tuple[int, int]]:
+        from emdx.database.connection import db_connection
+
+        with db_connection.get_connection() as conn:
+            return [
+                tuple(row)
+                for row in conn.execute("SELECT query_id, document_id FROM standing_query_matches")
+            ]
+
+    def test_match_recorded_on_save(self) -> None:
+        from emdx.commands._watch import create_standing_query
+        from emdx.database.documents import save_document
+
+        sq_id = create_standing_query("python")
+        doc_id = save_document("Python Guide", "Learn python programming")
+        save_document("Docker Guide", "Learn docker containers")
+
+        assert self._pending() == [(sq_id, doc_id)]
+
+    def test_stemmed_terms_match(self) -> None:
+        from emdx.commands._watch import check_standing_queries, create_standing_query
+        from emdx.database.documents import save_document
+
+        create_standing_query("deploy")
+        save_document("Rollout", "Notes on deploying the gateway")
+
+        matches = check_standing_queries()
+        assert [m["doc_title"] for m in matches] == ["Rollout"]
+
+    def test_tag_added_after_save_matches(self) -> None:
+        from emdx.commands._watch import check_standing_queries, create_standing_query
+        from emdx.database.documents import save_document
+        from emdx.models.tags import add_tags_to_document
+
+        create_standing_query("python", tags="urgent")
+        doc_id = save_document("Python Guide", "Learn python programming")
+        assert self._pending() == []
+
+        add_tags_to_document(doc_id, ["urgent"])
+        matches = check_standing_queries()
+        assert [m["doc_id"] for m in matches] == [doc_id]
+
+    def test_edit_of_existing_doc_matches_new_query_only_if_newer(self) -> None:
+        from emdx.commands._watch import check_standing_queries, create_standing_query
+        from emdx.database.documents import save_document, update_document
+
+        doc_id = save_document("Old Notes", "nothing yet")
+        time.sleep(1.1)
+        create_standing_query("python")
+
+        # Created before the query was last checked: never alerted
+        update_document(doc_id, "Old Notes", "now about python")
+        assert check_standing_queries() == []
+
+    def test_removed_query_drops_its_terms_and_matches(self) -> None:
+        from emdx.commands._watch import create_standing_query, remove_standing_query
+        from emdx.database.connection import db_connection
+        from emdx.database.documents import save_document
+
+        sq_id = create_standing_query("python")
+        save_document("Python Guide", "Learn python programming")
+        assert remove_standing_query(sq_id)
+
+        assert self._pending() == []
+        with db_connection.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM standing_query_terms").fetchone()[0] == 0
+
+
 # =========================================================================
 # Display Helpers
 # =========================================================================
@@ -0,0 +1,115 @@
+"""Tests for parallel hierarchical wiki synthesis and the shared LLM call limit."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import patch
+
+from emdx.services.synthesis_service import PromptResult
+from emdx.services.wiki_synthesis_service import (
+    HIERARCHICAL_CHUNK_WORKERS,
+    ArticleSource,
+    SynthesisOutline,
+    _llm_limiter,
+    _synthesize_hierarchical,
+    llm_concurrency,
+)
+
+
+class _FakeLLM:
+    """Stands in for _execute_prompt, tracking how many calls overlap."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.titles: list[str] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, system_prompt: str, user_message: str, title: str, model: str | None = None):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.titles.append(title)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        first_source = user_message.split("\n", 1)[0]
+        return PromptResult(True, f"summary of {first_source}", input_tokens=10, output_tokens=5)
+
+
+def _outline() -> SynthesisOutline:
+    return SynthesisOutline(
+        topic_label="Topic",
+        topic_slug="topic",
+        suggested_title="Topic",
+        section_hints=[],
+        entity_focus=[],
+        strategy="hierarchical",
+    )
+
+
+def _sources(n: int) -> list[ArticleSource]:
+    return [
+        ArticleSource(doc_id=i, title=f"Doc {i}", content="body", content_hash="", char_count=4)
+        for i in range(1, n + 1)
+    ]
+
+
+class TestHierarchicalSynthesis:
+    def test_chunks_summarized_in_parallel_then_merged_in_order(self):
+        fake = _FakeLLM()
+        with patch("emdx.services.synthesis_service._execute_prompt", fake):
+            content, input_tokens, output_tokens, _ = _synthesize_hierarchical(
+                _outline(), _sources(40)
+            )
+
+        # 8 chunk summaries plus the merge
+        assert len(fake.titles) == 9
+        assert fake.titles[-1] == "Wiki: Topic"
+        assert 1 < fake.peak <= HIERARCHICAL_CHUNK_WORKERS
+        assert (input_tokens, output_tokens) == (90, 45)
+        assert content.startswith("summary of ")
+
+    def test_merge_sees_summaries_in_chunk_order(self):
+        fake = _FakeLLM()
+        with patch("emdx.services.synthesis_service._execute_prompt", fake):
+            with patch(
+                "emdx.services.wiki_synthesis_service._synthesize_article",
+                return_value=("article", 0, 0, 0.0),
+            ) as merge:
+                _synthesize_hierarchical(_outline(), _sources(12))
+
+        merge_sources = merge.call_args.args[1]
+        assert [s.content for s in merge_sources] == [
+            "summary of ### Source #1: Doc 1",
+            "summary of ### Source #6: Doc 6",
+            "summary of ### Source #11: Doc 11",
+        ]
+
+
+class TestLLMConcurrency:
+    def test_nested_pools_share_one_limit(self):
+        fake = _FakeLLM(delay=0.02)
+        with patch("emdx.services.synthesis_service._execute_prompt", fake):
+            with llm_concurrency(HIERARCHICAL_CHUNK_WORKERS + 1):
+                threads = [
+                    threading.Thread(
+                        target=_synthesize_hierarchical, args=(_outline(), _sources(30))
+                    )
+                    for _ in range(4)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+        assert len(fake.titles) == 4 * 7
+        assert HIERARCHICAL_CHUNK_WORKERS < fake.peak <= HIERARCHICAL_CHUNK_WORKERS + 1
+
+    def test_limit_restored_after_batch(self):
+        before = _llm_limiter._limit
+        with llm_concurrency(16):
+            assert _llm_limiter._limit == 16
+        assert _llm_limiter._limit == before
@@ -0,0 +1,294 @@
+"""Tests for checkpointed, resumable wiki generation runs."""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from emdx.database import db
+from emdx.main import app
+from emdx.services.wiki_synthesis_service import (
+    WIKI_RUN_CLAIM_TIMEOUT,
+    WikiArticleResult,
+    claim_run_topic,
+    complete_wiki_run,
+    create_wiki_run,
+    find_active_wiki_run,
+    generate_wiki,
+    get_wiki_run,
+    list_wiki_runs,
+    process_wiki_run,
+)
+
+runner = CliRunner()
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+def _plain(text: str) -> str:
+    """Console output without ANSI codes or line wrapping."""
+    return " ".join(_ANSI_RE.sub("", text).split())
+
+
+def _result(topic_id: int, skipped: bool = False) -> WikiArticleResult:
+    return WikiArticleResult(
+        topic_id=topic_id,
+        topic_label=f"Topic {topic_id}",
+        document_id=0,
+        article_id=0,
+        input_tokens=10,
+        output_tokens=5,
+        cost_usd=0.01,
+        model="test",
+        skipped=skipped,
+        skip_reason="Article up to date (source hash unchanged)" if skipped else "",
+    )
+
+
+class _FakeGenerate:
+    """Stands in for generate_article, recording topics and failing on request."""
+
+    def __init__(self, fail: set[int] | None = None, delay: float = 0.0) -> None:
+        self.fail = fail or set()
+        self.delay = delay
+        self.topics: list[int] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, topic_id: int, **kwargs: object) -> WikiArticleResult:
+        with self._lock:
+            self.topics.append(topic_id)
+        time.sleep(self.delay)
+        if topic_id in self.fail:
+            raise RuntimeError(f"synthesis failed for {topic_id}")
+        return _result(topic_id, skipped=topic_id % 5 == 0)
+
+
+def _statuses(run_id: int) -> dict[int, str]:
+    with db.get_connection() as conn:
+        rows = conn.execute(
+            "SELECT topic_id, status FROM wiki_run_topics WHERE run_id = ?", (run_id,)
+        ).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+def _set_claim(run_id: int, topic_id: int, claimed_by: str, claimed_at: float) -> None:
+    with db.get_connection() as conn:
+        conn.execute(
+            "UPDATE wiki_run_topics SET status = 'in_flight', claimed_by = ?, claimed_at = ? "
+            "WHERE run_id = ? AND topic_id = ?",
+            (claimed_by, claimed_at, run_id, topic_id),
+        )
+        conn.commit()
+
+
+class TestCheckpoints:
+    def test_topics_claimed_in_order_once(self):
+        run_id = create_wiki_run("test", topic_ids=[7, 3, 9])
+        assert [claim_run_topic(run_id, "w") for _ in range(4)] == [7, 3, 9, None]
+        assert set(_statuses(run_id).values()) == {"in_flight"}
+
+    def test_concurrent_claimers_never_share_a_topic(self):
+        run_id = create_wiki_run("test", topic_ids=list(range(1, 201)))
+        claimed: list[int] = []
+        lock = threading.Lock()
+
+        def _claim_all(worker: str) -> None:
+            while (topic_id := claim_run_topic(run_id, worker)) is not None:
+                with lock:
+                    claimed.append(topic_id)
+
+        threads = [threading.Thread(target=_claim_all, args=(f"w{i}",)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(claimed) == list(range(1, 201))
+
+    def test_abandoned_claims_are_taken_over(self):
+        run_id = create_wiki_run("test", topic_ids=[1, 2, 3])
+        now = time.time()
+        _set_claim(run_id, 1, "elsewhere:1", now)  # live, another host
+        _set_claim(run_id, 2, "elsewhere:2", now - WIKI_RUN_CLAIM_TIMEOUT - 1)  # timed out
+        _set_claim(run_id, 3, "dead-host:3", now)
+
+        with patch("emdx.services.wiki_synthesis_service.socket.gethostname") as host:
+            host.return_value = "dead-host"
+            with patch("emdx.services.wiki_synthesis_service._pid_alive", return_value=False):
+                assert claim_run_topic(run_id, "w") == 2
+                assert claim_run_topic(run_id, "w") == 3
+                assert claim_run_topic(run_id, "w") is None
+
+    def test_complete_totals_checkpoints(self):
+        fake = _FakeGenerate(fail={2})
+        run_id = create_wiki_run("test", topic_ids=[1, 2, 5])
+        with patch("emdx.services.wiki_synthesis_service.generate_article", fake):
+            batch = process_wiki_run(run_id, "team", None, dry_run=False)
+
+        assert (batch.articles_generated, batch.articles_skipped, batch.articles_failed) == (
+            1,
+            1,
+            1,
+        )
+        assert _statuses(run_id) == {1: "done", 2: "failed", 5: "done"}
+        (run,) = [r for r in list_wiki_runs() if r["id"] == run_id]
+        assert run["topics_attempted"] == 3 and run["topics_total"] == 3
+        assert (run["articles_generated"], run["articles_skipped"], run["topics_failed"]) == (
+            1,
+            1,
+            1,
+        )
+        assert run["total_input_tokens"] == 20
+        assert run["completed_at"] is not None
+
+    def test_interrupted_topic_returns_to_pending(self):
+        run_id = create_wiki_run("test", topic_ids=[1, 2])
+        with patch(
+            "emdx.services.wiki_synthesis_service.generate_article",
+            side_effect=KeyboardInterrupt,
+        ):
+            with pytest.raises(KeyboardInterrupt):
+                process_wiki_run(run_id, "team", None, dry_run=False)
+
+        assert _statuses(run_id) == {1: "pending", 2: "pending"}
+        run = get_wiki_run(run_id)
+        assert run is not None and run["completed_at"] is None and run["pending"] == 2
+
+    def test_interrupted_concurrent_run_stops_claiming(self):
+        run_id = create_wiki_run("test", topic_ids=list(range(1, 7)))
+        generating = threading.Barrier(3)  # both workers plus the waiting thread
+        finish = threading.Event()
+        topics: list[int] = []
+        pools: list[ThreadPoolExecutor] = []
+
+        def _generate(topic_id: int, **kwargs: object) -> WikiArticleResult:
+            topics.append(topic_id)
+            if len(topics) <= 2:
+                generating.wait(timeout=5)
+            finish.wait(timeout=5)
+            return _result(topic_id)
+
+        def _ctrl_c(timeout: float | None = None) -> None:
+            generating.wait(timeout=5)
+            raise KeyboardInterrupt
+
+        class _CtrlCPool(ThreadPoolExecutor):
+            """Delivers Ctrl-C to the waiting thread once both workers are generating."""
+
+            def __init__(self, *args: object, **kwargs: object) -> None:
+                super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+                pools.append(self)
+
+            def submit(self, fn, /, *args, **kwargs):  # type: ignore[no-untyped-def]
+                future = super().submit(fn, *args, **kwargs)
+                future.result = _ctrl_c  # type: ignore[method-assign]
+                return future
+
+        with (
+            patch("emdx.services.wiki_synthesis_service.generate_article", _generate),
+            patch("emdx.services.wiki_synthesis_service.ThreadPoolExecutor", _CtrlCPool),
+        ):
+            with pytest.raises(KeyboardInterrupt):
+                process_wiki_run(run_id, "team", None, dry_run=False, concurrency=2)
+            assert _statuses(run_id) == dict.fromkeys(range(1, 7), "pending")
+
+            finish.set()
+            for pool in pools:
+                pool.shutdown(wait=True)
+
+        assert sorted(topics) == [1, 2]
+        assert _statuses(run_id) == dict.fromkeys(range(1, 7), "pending")
+        run = get_wiki_run(run_id)
+        assert run is not None and run["completed_at"] is None
+
+
+class TestResume:
+    def test_resume_finishes_remaining_and_retries_failed(self):
+        first = _FakeGenerate(fail={2})
+        with patch("emdx.services.wiki_synthesis_service.get_topics") as topics:
+            topics.return_value = [{"id": i, "label": f"T{i}"} for i in (1, 2, 3, 4)]
+            with patch("emdx.services.wiki_synthesis_service.generate_article", first):
+                generate_wiki(limit=4)
+        (run,) = list_wiki_runs(limit=1)
+        run_id = int(str(run["id"]))
+
+        # Simulate a crash before topic 4 finished
+        with db.get_connection() as conn:
+            conn.execute(
+                "UPDATE wiki_run_topics SET status = 'pending' WHERE run_id = ? AND topic_id = 4",
+                (run_id,),
+            )
+            conn.execute("UPDATE wiki_runs SET completed_at = NULL WHERE id = ?", (run_id,))
+            conn.commit()
+
+        second = _FakeGenerate()
+        with patch("emdx.services.wiki_synthesis_service.generate_article", second):
+            batch = generate_wiki(run_id=run_id)
+
+        assert sorted(second.topics) == [2, 4]
+        assert batch.articles_generated == 2
+        assert set(_statuses(run_id).values()) == {"done"}
+
+    def test_concurrent_invocations_split_the_backlog(self):
+        fake = _FakeGenerate(delay=0.01)
+        run_id = create_wiki_run("test", topic_ids=list(range(1, 41)))
+        with patch("emdx.services.wiki_synthesis_service.generate_article", fake):
+            threads = [
+                threading.Thread(
+                    target=process_wiki_run,
+                    args=(run_id, "team", None, False),
+                    kwargs={"concurrency": 2},
+                )
+                for _ in range(2)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert sorted(fake.topics) == list(range(1, 41))
+
+    def test_find_active_run_needs_a_live_claim(self):
+        run_id = create_wiki_run("active-model", topic_ids=[1, 2], audience="me")
+        assert find_active_wiki_run("active-model", "me") is None
+
+        _set_claim(run_id, 1, "elsewhere:1", time.time())
+        assert find_active_wiki_run("active-model", "me") == run_id
+        assert find_active_wiki_run("active-model", "team") is None
+        assert find_active_wiki_run("other-model", "me") is None
+
+        complete_wiki_run(run_id)  # still pending work, so stays open
+        assert find_active_wiki_run("active-model", "me") == run_id
+
+
+class TestGenerateCommand:
+    def test_resume_unknown_run(self):
+        result = runner.invoke(app, ["wiki", "generate", "--resume", "99999"])
+        assert result.exit_code == 1
+        assert "not found" in _plain(result.stdout)
+
+    def test_resume_uses_run_settings(self):
+        run_id = create_wiki_run("claude-test", topic_ids=[1, 2], audience="me")
+        fake = _FakeGenerate(fail={2})
+        calls: list[dict[str, object]] = []
+
+        def _generate(topic_id: int, **kwargs: object) -> WikiArticleResult:
+            calls.append(kwargs)
+            return fake(topic_id)
+
+        with patch("emdx.services.wiki_synthesis_service.generate_article", _generate):
+            result = runner.invoke(app, ["wiki", "generate", "--resume", str(run_id)])
+
+        output = _plain(result.stdout)
+        assert result.exit_code == 0, output
+        assert f"Resuming run #{run_id}" in output
+        assert "Failed: topic 2" in output
+        assert f"--resume {run_id}" in output
+        assert all(c["audience"] == "me" and c["model"] == "claude-test" for c in calls)
+        assert _statuses(run_id) == {1: "done", 2: "failed"}
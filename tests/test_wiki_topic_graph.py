@@ -0,0 +1,76 @@
+"""Tests for the entity similarity graph behind wiki topic discovery."""
+
+from __future__ import annotations
+
+import random
+
+from emdx.services.wiki_clustering_service import (
+    MIN_EDGE_WEIGHT,
+    _build_similarity_graph,
+    _compute_idf_weighted_jaccard,
+    _filter_entities,
+)
+
+
+def _all_pairs(
+    doc_entities: dict[int, dict[str, float]], entity_idf: dict[str, float]
+) -> tuple[list[tuple[int, int]], list[float]]:
+    """Reference: score every pair of documents."""
+    doc_ids = sorted(doc_entities)
+    edges, weights = [], []
+    for i in range(len(doc_ids)):
+        for j in range(i + 1, len(doc_ids)):
+            sim = _compute_idf_weighted_jaccard(
+                doc_entities[doc_ids[i]], doc_entities[doc_ids[j]], entity_idf
+            )
+            if sim >= MIN_EDGE_WEIGHT:
+                edges.append((i, j))
+                weights.append(sim)
+    return edges, weights
+
+
+def _random_kb(docs: int, seed: int) -> tuple[dict[int, dict[str, float]], dict[str, float]]:
+    rng = random.Random(seed)
+    vocab = [f"entity-{k}" for k in range(docs // 2)]
+    raw = {
+        doc_id: {e: round(rng.uniform(0.3, 1.0), 2) for e in rng.sample(vocab, rng.randint(1, 8))}
+        for doc_id in rng.sample(range(1, docs * 3), docs)
+    }
+    freq: dict[str, int] = {}
+    for entities in raw.values():
+        for entity in entities:
+            freq[entity] = freq.get(entity, 0) + 1
+    return _filter_entities(raw, freq, len(raw))
+
+
+class TestBuildSimilarityGraph:
+    def test_matches_all_pairs_scan(self):
+        for seed in range(5):
+            doc_entities, entity_idf = _random_kb(300, seed)
+            doc_ids, edges, weights = _build_similarity_graph(doc_entities, entity_idf)
+
+            assert doc_ids == sorted(doc_entities)
+            assert edges  # the comparison is not vacuous
+            assert (edges, weights) == _all_pairs(doc_entities, entity_idf)
+
+    def test_documents_without_shared_entities_are_unlinked(self):
+        doc_entities = {1: {"a": 1.0, "b": 1.0}, 2: {"a": 0.9}, 3: {"c": 1.0}}
+        entity_idf = {"a": 1.0, "b": 1.0, "c": 1.0}
+        doc_ids, edges, weights = _build_similarity_graph(doc_entities, entity_idf)
+        assert doc_ids == [1, 2, 3]
+        assert edges == [(0, 1)]
+        assert weights == [0.5]
+
+    def test_empty(self):
+        assert _build_similarity_graph({}, {}) == ([], [], [])
+
+
+class TestFilterEntities:
+    def test_drops_rare_and_ubiquitous_entities(self):
+        raw = {d: {"everywhere": 1.0, f"only-{d}": 1.0} for d in range(1, 41)}
+        raw[1]["pair"] = raw[2]["pair"] = 1.0
+        freq = {"everywhere": 40, "pair": 2, **{f"only-{d}": 1 for d in range(1, 41)}}
+
+        doc_entities, entity_idf = _filter_entities(raw, freq, 40)
+        assert doc_entities == {1: {"pair": 1.0}, 2: {"pair": 1.0}}
+        assert set(entity_idf) == {"pair"}
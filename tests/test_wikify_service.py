@@ -13,7 +13,8 @@ from emdx.database.document_links import (
     link_exists,
 )
 from emdx.services.wikify_service import (
-    _build_title_pattern,
+    TitleCandidate,
+    TitleMatcher,
     _normalize_title,
     title_match_wikify,
     wikify_all,
@@ -51,45 +52,81 @@ class TestNormalizeTitle:
         assert _normalize_title("User's Guide") == "user's guide"
 
 
-class TestBuildTitlePattern:
-    """Test word-boundary pattern building."""
+def _matcher(*titles: str) -> TitleMatcher:
+    return TitleMatcher(
+        [TitleCandidate(doc_id=i, title=t, normalized=t) for i, t in enumerate(titles, 1)]
+    )
+
+
+class TestTitleMatcherBoundaries:
+    """Test word-boundary matching of a single title."""
 
     def test_matches_exact(self) -> None:
-        pattern = _build_title_pattern("auth module")
-        assert pattern.search("auth module")
+        assert _matcher("auth module").find("auth module")
 
     def test_matches_in_sentence(self) -> None:
-        pattern = _build_title_pattern("auth module")
-        assert pattern.search("the auth module broke yesterday")
+        assert _matcher("auth module").find("the auth module broke yesterday")
 
     def test_no_match_partial_word(self) -> None:
-        pattern = _build_title_pattern("auth")
-        assert not pattern.search("authorization failed")
+        assert not _matcher("auth").find("authorization failed")
 
     def test_matches_at_start(self) -> None:
-        pattern = _build_title_pattern("auth module")
-        assert pattern.search("auth module is broken")
+        assert _matcher("auth module").find("auth module is broken")
 
     def test_matches_at_end(self) -> None:
-        pattern = _build_title_pattern("auth module")
-        assert pattern.search("we fixed the auth module")
+        assert _matcher("auth module").find("we fixed the auth module")
 
-    def test_case_insensitive(self) -> None:
-        pattern = _build_title_pattern("auth module")
-        assert pattern.search("The Auth Module works")
+    def test_case_insensitive_after_lowercasing(self) -> None:
+        assert _matcher("auth module").find("The Auth Module works".lower())
 
-    def test_special_regex_chars_escaped(self) -> None:
-        pattern = _build_title_pattern("c++ guide")
-        assert pattern.search("read the c++ guide")
-        assert not pattern.search("cppp guide")
+    def test_special_regex_chars_literal(self) -> None:
+        matcher = _matcher("c++ guide")
+        assert matcher.find("read the c++ guide")
+        assert not matcher.find("cppp guide")
 
     def test_hyphenated_title(self) -> None:
-        pattern = _build_title_pattern("session-handling")
-        assert pattern.search("the session-handling code")
+        assert _matcher("session-handling").find("the session-handling code")
 
     def test_no_match_different_word(self) -> None:
-        pattern = _build_title_pattern("auth module")
-        assert not pattern.search("authentication module")
+        assert not _matcher("auth module").find("authentication module")
+
+
+class TestTitleMatcher:
+    """Test matching many titles in one pass."""
+
+    def test_finds_every_title_in_candidate_order(self) -> None:
+        matcher = _matcher("session handling", "auth module", "redis")
+        hits = matcher.find("the auth module calls redis for session handling")
+        assert [c.doc_id for c in hits] == [1, 2, 3]
+
+    def test_overlapping_and_nested_titles(self) -> None:
+        matcher = _matcher("auth module", "module loader", "auth")
+        assert [c.doc_id for c in matcher.find("the auth module loader")] == [1, 2, 3]
+        assert [c.doc_id for c in matcher.find("authorization module loader")] == [2]
+
+    def test_boundary_checked_per_occurrence(self) -> None:
+        matcher = _matcher("auth")
+        assert matcher.find("authz and then auth.")
+        assert not matcher.find("authz oauth auth_token")
+
+    def test_duplicate_titles_all_match(self) -> None:
+        matcher = _matcher("deploy guide", "deploy guide")
+        assert [c.doc_id for c in matcher.find("see the deploy guide")] == [1, 2]
+
+    def test_agrees_with_word_boundary_regex(self) -> None:
+        import random
+        import re
+
+        rng = random.Random(7)
+        words = ["auth", "module", "c++", "x_y", "a-b", "redis", "café", "on"]
+        titles = sorted({" ".join(rng.sample(words, rng.randint(1, 2))) for _ in range(30)})
+        matcher = _matcher(*titles)
+        for _ in range(200):
+            text = rng.choice(["", " ", "_", "-"]).join(rng.choices(words + ["s", "."], k=12))
+            expected = [
+                t for t in titles if re.search(r"\b" + re.escape(t) + r"\b", text, re.IGNORECASE)
+            ]
+            assert [c.normalized for c in matcher.find(text)] == expected, text
 
 
 class TestTitleMatchWikify:
@@ -371,3 +408,28 @@ class TestWikifyAll:
         # But no actual links should have been created
         assert get_link_count(5210) == before_5210
         assert get_link_count(5211) == before_5211
+
+    def test_wikify_all_skips_reverse_of_new_links(self, isolate_test_database: Any) -> None:
+        from emdx.database import db
+
+        with db.get_connection() as conn:
+            _create_doc(conn, 5220, "Narwhal Scheduler", "Uses the tapir cache.")
+            _create_doc(conn, 5221, "Tapir Cache", "Feeds the narwhal scheduler.")
+
+        wikify_all()
+        assert link_exists(5220, 5221)
+        # One link between the pair, not one in each direction
+        assert get_link_count(5220) == 1
+        assert get_link_count(5221) == 1
+
+    def test_wikify_all_respects_existing_links(self, isolate_test_database: Any) -> None:
+        from emdx.database import db
+
+        with db.get_connection() as conn:
+            _create_doc(conn, 5230, "Okapi Gateway", "Standalone.")
+            _create_doc(conn, 5231, "Okapi Notes", "About the okapi gateway.")
+
+        first, _ = wikify_all()
+        assert first >= 1
+        assert wikify_all(dry_run=True)[0] == 0
+        assert wikify_all()[0] == 0